@@ -6,11 +6,18 @@ capabilities including smart area detection, text recognition
 enhancement, and intelligent translation optimization.
 """
 
-from .smart_area_detection import (
-    DetectionConfig,
-    DetectionMethod,
-    SmartAreaDetector,
-    TextRegion,
+from src.utils.lazy_import import lazy_exports
+
+# Submodules (and OpenCV/numpy) are imported on first attribute access
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DetectionCache": ".detection_cache",
+        "DetectionConfig": ".smart_area_detection",
+        "DetectionMethod": ".smart_area_detection",
+        "SmartAreaDetector": ".smart_area_detection",
+        "TextRegion": ".smart_area_detection",
+    },
 )
 
 __all__ = [
@@ -18,4 +25,5 @@ __all__ = [
     "TextRegion",
     "DetectionMethod",
     "DetectionConfig",
+    "DetectionCache",
 ]
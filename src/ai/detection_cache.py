@@ -0,0 +1,150 @@
+"""
+Detection result cache for SmartAreaDetector.
+
+Frames are keyed by a fingerprint: a grid of pixels sampled through a
+strided view, so building a key reads a few thousand pixels instead of
+hashing (and copying) the whole frame. Besides exact fingerprint matches,
+a frame whose samples differ from a cached frame's in only a small
+fraction of positions (a blinking cursor, a clock) reuses its regions.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+
+class FrameKey(NamedTuple):
+    """Cache key of a frame for one detection method."""
+
+    digest: str
+    group: Tuple[Any, ...]  # Only frames in the same group are compared
+    samples: Any  # Sampled pixels as a small contiguous array
+
+
+def frame_samples(image: "np.ndarray", grid: int = 96) -> "np.ndarray":
+    """
+    Sample a frame on a grid of at most grid x grid pixels.
+
+    The grid is taken through a strided view (offset by half a step so
+    samples fall inside their cells); only the samples are copied.
+    """
+    height, width = image.shape[:2]
+    step_y = max(height // grid, 1)
+    step_x = max(width // grid, 1)
+    view = image[step_y // 2 :: step_y, step_x // 2 :: step_x]
+    return np.ascontiguousarray(view[:grid, :grid])
+
+
+class DetectionCache:
+    """Thread-safe LRU cache of detected regions with expiry."""
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        ttl_seconds: float = 30.0,
+        max_diff: float = 0.01,
+        pixel_tolerance: int = 8,
+        grid: int = 96,
+    ):
+        """
+        Args:
+            max_entries: Maximum number of cached frames
+            ttl_seconds: Age after which cached regions are dropped
+            max_diff: Fraction of samples that may differ for a near-duplicate
+                match (0 disables near-duplicate matching)
+            pixel_tolerance: Per-channel difference a sample may have and
+                still count as unchanged
+            grid: Samples per side of the fingerprint grid
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_diff = max_diff
+        self.pixel_tolerance = pixel_tolerance
+        self.grid = grid
+        self._entries: "OrderedDict[str, Tuple[float, FrameKey, List[Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    def key(self, image: "np.ndarray", method: Any = None) -> FrameKey:
+        """Build the cache key of a frame for a detection method."""
+        samples = frame_samples(image, self.grid)
+        group = (method, image.shape, str(image.dtype))
+        digest = hashlib.blake2b(samples.tobytes(), digest_size=16)
+        digest.update(repr(group).encode())
+        return FrameKey(digest.hexdigest(), group, samples)
+
+    def get(self, key: FrameKey) -> Optional[List[Any]]:
+        """Get cached regions of the same or a nearly identical frame."""
+        with self._lock:
+            entry = self._entries.get(key.digest)
+            if entry is not None and not self._expired(entry[0]):
+                self._entries.move_to_end(key.digest)
+                self.hits += 1
+                return list(entry[2])
+
+            digest = self._find_near_duplicate(key) if self.max_diff > 0 else None
+            if digest is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.near_hits += 1
+            return list(self._entries[digest][2])
+
+    def put(self, key: FrameKey, regions: List[Any]) -> None:
+        """Cache the regions detected in a frame."""
+        with self._lock:
+            self._entries[key.digest] = (time.monotonic(), key, list(regions))
+            self._entries.move_to_end(key.digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached regions."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.near_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "near_hits": self.near_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.near_hits) / lookups if lookups else 0.0,
+            }
+
+    def _find_near_duplicate(self, key: FrameKey) -> Optional[str]:
+        """Most recent live entry whose samples nearly match; drops expired entries."""
+        allowed = self.max_diff * key.samples.shape[0] * key.samples.shape[1]
+        samples = key.samples.astype(np.int16)
+        expired = []
+        found = None
+        for digest, (stored_at, stored, _) in reversed(self._entries.items()):
+            if self._expired(stored_at):
+                expired.append(digest)
+            elif stored.group == key.group and found is None:
+                changed = np.abs(samples - stored.samples) > self.pixel_tolerance
+                if changed.ndim == 3:
+                    changed = changed.any(axis=2)
+                if np.count_nonzero(changed) <= allowed:
+                    found = digest
+        for digest in expired:
+            del self._entries[digest]
+        return found
+
+    def _expired(self, stored_at: float) -> bool:
+        return time.monotonic() - stored_at > self.ttl_seconds
@@ -1,19 +1,23 @@
 """Smart area detection using AI/ML for automatic text region identification."""
 
+from __future__ import annotations
+
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    import cv2
-except ImportError:
-    print("OpenCV не доступен в данной среде")
-    cv2 = None
-import numpy as np
-
+from src.ai.detection_cache import DetectionCache
+from src.utils import box_ops
+from src.utils.lazy_import import lazy_import
 from src.utils.logger import logger
 
+# Heavy dependencies are loaded on first use
+cv2 = lazy_import("cv2")
+if cv2 is None:
+    print("OpenCV не доступен в данной среде")
+np = lazy_import("numpy")
+
 
 class DetectionMethod(Enum):
     """Available detection methods."""
@@ -25,6 +29,11 @@ class DetectionMethod(Enum):
     HYBRID = "hybrid"
 
 
+# MSER needs glyph-level resolution, which a downscaled frame lacks; its
+# coarse candidates come from edge detection instead
+_COARSE_PROPOSAL_METHODS = {DetectionMethod.TEXT_DETECTION: DetectionMethod.EDGE_DETECTION}
+
+
 @dataclass
 class TextRegion:
     """Detected text region information."""
@@ -104,6 +113,8 @@ class DetectionConfig:
     # Text detection
     text_confidence_threshold: float = 0.5
     text_nms_threshold: float = 0.4
+    mser_min_area: int = 60  # OpenCV defaults
+    mser_max_area: int = 14400
 
     # Region filtering
     min_region_size: int = 400  # Minimum region area
@@ -114,6 +125,16 @@ class DetectionConfig:
     # Performance
     max_processing_time: float = 2.0  # seconds
     enable_caching: bool = True
+    cache_max_entries: int = 32
+    cache_ttl_seconds: float = 30.0
+    cache_max_diff: float = 0.01  # Share of fingerprint samples a reused frame may change
+
+    # Coarse-to-fine detection for large frames: find candidates on a
+    # downscaled copy, then refine inside padded candidate ROIs at full size
+    coarse_to_fine: bool = True
+    coarse_scale: float = 0.25
+    coarse_min_pixels: int = 3_000_000  # Frames smaller than this run at full size
+    roi_padding: int = 16  # Full-size pixels around each candidate
 
     def __post_init__(self):
         """Set default fallback methods."""
@@ -128,15 +149,14 @@ class SmartAreaDetector:
         self.config = config or DetectionConfig()
 
         # Detection cache
-        self.detection_cache: Dict[str, List[TextRegion]] = {}
-        self.cache_timestamps: Dict[str, float] = {}
-        self.cache_max_age = 30.0  # seconds
+        self.detection_cache = self._create_cache()
 
         # Performance metrics
         self.detection_times: List[float] = []
         self.detection_counts: Dict[DetectionMethod, int] = {
             method: 0 for method in DetectionMethod
         }
+        self.budget_overruns = 0
 
         # Try to load advanced detection models
         self.text_detector = None
@@ -169,41 +189,37 @@ class SmartAreaDetector:
         start_time = time.time()
 
         try:
-            # Check cache if enabled
-            cache_key = self._generate_cache_key(image)
-            if self.config.enable_caching and cache_key in self.detection_cache:
-                if time.time() - self.cache_timestamps[cache_key] < self.cache_max_age:
-                    logger.debug("Using cached detection results")
-                    return self.detection_cache[cache_key]
-
             # Use specified method or config default
             detection_method = method or self.config.primary_method
 
-            # Preprocess image
-            processed_image = self._preprocess_image(image)
+            # Check cache if enabled
+            cache_key = None
+            if self.config.enable_caching:
+                cache_key = self.detection_cache.key(image, detection_method)
+                cached = self.detection_cache.get(cache_key)
+                if cached is not None:
+                    logger.debug("Using cached detection results")
+                    return cached
 
-            # Detect regions using primary method
-            regions = self._detect_with_method(processed_image, detection_method)
+            deadline = start_time + self.config.max_processing_time
 
-            # If primary method fails or returns few results, try fallback methods
-            if len(regions) < 2 and detection_method != DetectionMethod.HYBRID:
-                for fallback_method in self.config.fallback_methods:
-                    if fallback_method != detection_method:
-                        fallback_regions = self._detect_with_method(
-                            processed_image, fallback_method
-                        )
-                        regions.extend(fallback_regions)
-                        if len(regions) >= 3:  # Enough regions found
-                            break
+            if self._use_coarse_to_fine(image):
+                regions = self._detect_coarse_to_fine(image, detection_method, deadline)
+            else:
+                processed_image = self._preprocess_image(image)
+                regions = self._detect_with_fallbacks(
+                    processed_image, detection_method, self.config, deadline
+                )
 
             # Post-process regions
             regions = self._post_process_regions(regions)
 
-            # Cache results
-            if self.config.enable_caching:
-                self.detection_cache[cache_key] = regions
-                self.cache_timestamps[cache_key] = time.time()
-                self._cleanup_cache()
+            # Best-so-far results from an exhausted time budget are not cached
+            timed_out = time.time() >= deadline
+            if timed_out:
+                self.budget_overruns += 1
+            if cache_key is not None and not timed_out:
+                self.detection_cache.put(cache_key, regions)
 
             # Update metrics
             detection_time = time.time() - start_time
@@ -219,47 +235,218 @@ class SmartAreaDetector:
             logger.error(f"Text region detection failed: {e}")
             return []
 
-    def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
-        """Preprocess image for better detection."""
-        processed = image.copy()
+    def _preprocess_image(self, image: np.ndarray, scale: Optional[float] = None) -> np.ndarray:
+        """
+        Preprocess image for better detection.
 
-        # Resize if needed
-        if self.config.resize_factor != 1.0:
-            height, width = processed.shape[:2]
-            new_height = int(height * self.config.resize_factor)
-            new_width = int(width * self.config.resize_factor)
-            processed = (cv2.resize if cv2 else None)(processed, (new_width, new_height))
+        Every step returns a new array, so the input is never modified and is
+        not copied up front.
+
+        Args:
+            image: Input image
+            scale: Resize factor (None for config resize_factor)
+        """
+        processed = image
+        scale = self.config.resize_factor if scale is None else scale
 
-        # Convert to grayscale if needed
+        # Convert to grayscale first, so resizing handles a single channel
         if len(processed.shape) == 3:
             processed = (cv2.cvtColor if cv2 else None)(
                 processed, (cv2.COLOR_BGR2GRAY if cv2 else None)
             )
 
+        # Resize if needed
+        if scale != 1.0:
+            height, width = processed.shape[:2]
+            new_height = max(int(height * scale), 1)
+            new_width = max(int(width * scale), 1)
+            # Area averaging keeps thin glyph strokes visible when shrinking
+            interpolation = cv2.INTER_AREA if scale < 1.0 else cv2.INTER_LINEAR
+            processed = (cv2.resize if cv2 else None)(
+                processed, (new_width, new_height), interpolation=interpolation
+            )
+
         # Apply noise reduction
         if self.config.apply_noise_reduction:
             processed = (cv2.medianBlur if cv2 else None)(processed, self.config.blur_kernel_size)
 
         return processed
 
-    def _detect_with_method(self, image: np.ndarray, method: DetectionMethod) -> List[TextRegion]:
+    def _detect_with_fallbacks(
+        self,
+        image: np.ndarray,
+        method: DetectionMethod,
+        config: DetectionConfig,
+        deadline: float,
+    ) -> List[TextRegion]:
+        """Detect with a method, trying fallback methods if it finds too little."""
+        regions = self._detect_with_method(image, method, config, deadline)
+
+        # If primary method fails or returns few results, try fallback methods
+        if len(regions) < 2 and method != DetectionMethod.HYBRID:
+            for fallback_method in config.fallback_methods:
+                if time.time() >= deadline:
+                    break
+                if fallback_method != method:
+                    regions.extend(self._detect_with_method(image, fallback_method, config))
+                    if len(regions) >= 3:  # Enough regions found
+                        break
+
+        return regions
+
+    def _use_coarse_to_fine(self, image: np.ndarray) -> bool:
+        """Check whether a frame is large enough for coarse-to-fine detection."""
+        height, width = image.shape[:2]
+        return (
+            self.config.coarse_to_fine
+            and 0 < self.config.coarse_scale < 1
+            and height * width >= self.config.coarse_min_pixels
+        )
+
+    def _detect_coarse_to_fine(
+        self, image: np.ndarray, method: DetectionMethod, deadline: float
+    ) -> List[TextRegion]:
+        """
+        Detect candidates on a downscaled frame and refine them at full size.
+
+        Candidate ROIs are refined by descending confidence. When the time
+        budget runs out, the remaining ROIs keep their upscaled coarse
+        regions, so the result is the best found so far.
+
+        Args:
+            image: Full-size input image
+            method: Detection method
+            deadline: time.time() value by which detection should finish
+
+        Returns:
+            Regions in full-size image coordinates
+        """
+        config = self.config
+        scale = config.coarse_scale
+        height, width = image.shape[:2]
+
+        # Area thresholds shrink with the square of the scale
+        area_scale = scale * scale
+        coarse_config = replace(
+            config,
+            min_region_size=max(int(config.min_region_size * area_scale), 1),
+            contour_min_area=max(int(config.contour_min_area * area_scale), 1),
+            contour_max_area=max(int(config.contour_max_area * area_scale), 1),
+            mser_min_area=max(int(config.mser_min_area * area_scale), 1),
+            mser_max_area=max(int(config.mser_max_area * area_scale), 1),
+        )
+        small = self._preprocess_image(image, scale)
+        proposal_method = _COARSE_PROPOSAL_METHODS.get(method, method)
+        candidates = self._detect_with_fallbacks(small, proposal_method, coarse_config, deadline)
+        if not candidates:
+            return []
+
+        # Candidate boxes in full-size coordinates, padded into ROIs; ROIs that
+        # touch are refined together
+        scale_x = width / small.shape[1]
+        scale_y = height / small.shape[0]
+        boxes = self._region_boxes(candidates) * (scale_x, scale_y, scale_x, scale_y)
+        padding = config.roi_padding
+        rois = np.clip(
+            np.floor(boxes) + (-padding, -padding, padding, padding),
+            0,
+            (width, height, width, height),
+        )
+        i, j = box_ops.intersecting_pairs(rois)
+        labels = box_ops.connected_components(len(candidates), i, j)
+        rois = box_ops.merge_groups(rois, labels).astype(int)
+        roi_confidence = box_ops.group_max(
+            np.array([region.confidence for region in candidates]), labels
+        )
+
+        regions: List[TextRegion] = []
+        refined = np.zeros(len(rois), dtype=bool)
+        for roi in np.argsort(-roi_confidence, kind="stable").tolist():
+            if time.time() >= deadline:
+                logger.debug(
+                    f"Refined {refined.sum()}/{len(rois)} candidate areas: time budget spent"
+                )
+                break
+            x1, y1, x2, y2 = rois[roi].tolist()
+            crop = self._preprocess_image(image[y1:y2, x1:x2], 1.0)
+            found = self._refine_roi(
+                crop, self._roi_methods(candidates, labels, roi, method), deadline
+            )
+            for region in found:
+                region.x += x1
+                region.y += y1
+            regions.extend(found)
+            refined[roi] = bool(found)
+
+        # Unrefined ROIs (out of time, or nothing found at full size) keep
+        # their coarse candidates
+        for index in np.flatnonzero(~refined[labels]).tolist():
+            x1, y1, x2, y2 = np.rint(boxes[index]).astype(int).tolist()
+            regions.append(replace(candidates[index], x=x1, y=y1, width=x2 - x1, height=y2 - y1))
+        return regions
+
+    def _refine_roi(
+        self, crop: np.ndarray, methods: List[DetectionMethod], deadline: float
+    ) -> List[TextRegion]:
+        """Detect regions in a full-size ROI crop, trying fallbacks if none are found."""
+        height, width = crop.shape[:2]
+        tried = set()
+        found: List[TextRegion] = []
+        for method in methods + list(self.config.fallback_methods):
+            if found or (tried and time.time() >= deadline):
+                break
+            if method in tried:
+                continue
+            tried.add(method)
+            # A region covering the whole crop is the background around the text
+            found = [
+                region
+                for region in self._detect_with_method(crop, method, self.config, deadline)
+                if (region.width, region.height) != (width, height)
+            ]
+        return found
+
+    @staticmethod
+    def _roi_methods(
+        candidates: List[TextRegion], labels: np.ndarray, roi: int, method: DetectionMethod
+    ) -> List[DetectionMethod]:
+        """Methods to refine an ROI with: those that found its candidates."""
+        proposal_method = _COARSE_PROPOSAL_METHODS.get(method, method)
+        methods = {candidates[index].method_used for index in np.flatnonzero(labels == roi)}
+        if proposal_method in methods:
+            methods.discard(proposal_method)
+            methods.add(method)
+        if DetectionMethod.HYBRID in methods:
+            return [DetectionMethod.HYBRID]
+        return sorted(methods, key=lambda item: item.value)
+
+    def _detect_with_method(
+        self,
+        image: np.ndarray,
+        method: DetectionMethod,
+        config: Optional[DetectionConfig] = None,
+        deadline: Optional[float] = None,
+    ) -> List[TextRegion]:
         """Detect regions using specific method."""
         if method == DetectionMethod.CONTOUR_BASED:
-            return self._detect_contour_based(image)
+            return self._detect_contour_based(image, config)
         elif method == DetectionMethod.EDGE_DETECTION:
-            return self._detect_edge_based(image)
+            return self._detect_edge_based(image, config)
         elif method == DetectionMethod.TEXT_DETECTION:
-            return self._detect_text_based(image)
+            return self._detect_text_based(image, config)
         elif method == DetectionMethod.ML_BASED:
             return self._detect_ml_based(image)
         elif method == DetectionMethod.HYBRID:
-            return self._detect_hybrid(image)
+            return self._detect_hybrid(image, config, deadline)
         else:
             logger.warning(f"Unknown detection method: {method}")
             return []
 
-    def _detect_contour_based(self, image: np.ndarray) -> List[TextRegion]:
+    def _detect_contour_based(
+        self, image: np.ndarray, config: Optional[DetectionConfig] = None
+    ) -> List[TextRegion]:
         """Detect text regions using contour analysis."""
+        config = config or self.config
         regions = []
 
         try:
@@ -286,10 +473,10 @@ class SmartAreaDetector:
 
                 # Filter by size and aspect ratio
                 if (
-                    self.config.contour_min_area <= area <= self.config.contour_max_area
-                    and self.config.contour_aspect_ratio_min
+                    config.contour_min_area <= area <= config.contour_max_area
+                    and config.contour_aspect_ratio_min
                     <= aspect_ratio
-                    <= self.config.contour_aspect_ratio_max
+                    <= config.contour_aspect_ratio_max
                 ):
 
                     # Calculate text density (simplified)
@@ -313,20 +500,23 @@ class SmartAreaDetector:
 
         return regions
 
-    def _detect_edge_based(self, image: np.ndarray) -> List[TextRegion]:
+    def _detect_edge_based(
+        self, image: np.ndarray, config: Optional[DetectionConfig] = None
+    ) -> List[TextRegion]:
         """Detect text regions using edge detection."""
+        config = config or self.config
         regions = []
 
         try:
             # Apply Canny edge detection
             edges = (cv2.Canny if cv2 else None)(
-                image, self.config.canny_low_threshold, self.config.canny_high_threshold
+                image, config.canny_low_threshold, config.canny_high_threshold
             )
 
             # Dilate edges to connect nearby text
             kernel = np.ones((3, 3), np.uint8)
             edges = (cv2.dilate if cv2 else None)(
-                edges, kernel, iterations=self.config.edge_dilation_iterations
+                edges, kernel, iterations=config.edge_dilation_iterations
             )
 
             # Find contours in edge image
@@ -340,7 +530,7 @@ class SmartAreaDetector:
                 x, y, w, h = (cv2.boundingRect if cv2 else None)(contour)
                 area = w * h
 
-                if area >= self.config.min_region_size:
+                if area >= config.min_region_size:
                     # Calculate edge density
                     roi_edges = edges[y : y + h, x : x + w]
                     edge_density = np.sum(roi_edges > 0) / (w * h) if w * h > 0 else 0
@@ -361,21 +551,25 @@ class SmartAreaDetector:
 
         return regions
 
-    def _detect_text_based(self, image: np.ndarray) -> List[TextRegion]:
+    def _detect_text_based(
+        self, image: np.ndarray, config: Optional[DetectionConfig] = None
+    ) -> List[TextRegion]:
         """Detect text regions using text-specific algorithms."""
+        config = config or self.config
         regions = []
 
         try:
             # Use MSER (Maximally Stable Extremal Regions) for text detection
-            mser = (cv2.MSER_create if cv2 else None)()
-            regions_mser, _ = mser.detectRegions(image)
+            mser = (cv2.MSER_create if cv2 else None)(
+                min_area=config.mser_min_area, max_area=config.mser_max_area
+            )
+            regions_mser, bboxes = mser.detectRegions(image)
 
-            for region_points in regions_mser:
-                # Get bounding rectangle
-                x, y, w, h = (cv2.boundingRect if cv2 else None)(region_points)
+            for region_points, (x, y, w, h) in zip(regions_mser, bboxes):
+                x, y, w, h = int(x), int(y), int(w), int(h)
                 area = w * h
 
-                if area >= self.config.min_region_size:
+                if area >= config.min_region_size:
                     # Simple confidence based on region stability
                     confidence = min(len(region_points) / 1000, 1.0)
 
@@ -390,6 +584,15 @@ class SmartAreaDetector:
                     )
                     regions.append(region)
 
+            # MSER reports nested, nearly identical regions for each glyph
+            if len(regions) > 1:
+                keep = box_ops.non_max_suppression(
+                    self._region_boxes(regions),
+                    np.array([region.confidence for region in regions]),
+                    config.text_nms_threshold,
+                )
+                regions = [regions[index] for index in keep]
+
         except Exception as e:
             logger.error(f"Text-based detection failed: {e}")
 
@@ -405,7 +608,12 @@ class SmartAreaDetector:
 
         return regions
 
-    def _detect_hybrid(self, image: np.ndarray) -> List[TextRegion]:
+    def _detect_hybrid(
+        self,
+        image: np.ndarray,
+        config: Optional[DetectionConfig] = None,
+        deadline: Optional[float] = None,
+    ) -> List[TextRegion]:
         """Detect text regions using multiple methods combined."""
         all_regions = []
 
@@ -417,7 +625,11 @@ class SmartAreaDetector:
         ]
 
         for method in methods:
-            method_regions = self._detect_with_method(image, method)
+            # Keep what earlier methods found once the time budget is spent
+            if all_regions and deadline is not None and time.time() >= deadline:
+                logger.debug(f"Hybrid detection stopped before {method.value}: time budget spent")
+                break
+            method_regions = self._detect_with_method(image, method, config)
             all_regions.extend(method_regions)
 
         # Merge and deduplicate regions
@@ -443,104 +655,92 @@ class SmartAreaDetector:
 
         return filtered_regions
 
-    def _merge_overlapping_regions(self, regions: List[TextRegion]) -> List[TextRegion]:
-        """Merge overlapping regions."""
-        if len(regions) <= 1:
-            return regions
+    @staticmethod
+    def _region_boxes(regions: List[TextRegion]) -> np.ndarray:
+        """Stack region coordinates into an (N, 4) box array."""
+        return box_ops.as_boxes([region.coordinates for region in regions])
+
+    @staticmethod
+    def _merge_groups(
+        regions: List[TextRegion],
+        boxes: np.ndarray,
+        labels: np.ndarray,
+        confidences: np.ndarray,
+    ) -> List[TextRegion]:
+        """Build one region per label group; single-member groups stay as they are."""
+        sizes = np.bincount(labels)
+        first = np.unique(labels, return_index=True)[1]
+        merged_boxes = box_ops.merge_groups(boxes, labels)
+        densities = box_ops.group_mean(
+            np.array([region.text_density for region in regions]), labels
+        )
 
         merged = []
-        used = set()
-
-        for i, region1 in enumerate(regions):
-            if i in used:
+        for label, size in enumerate(sizes.tolist()):
+            if size == 1:
+                merged.append(regions[first[label]])
                 continue
+            x1, y1, x2, y2 = (int(v) for v in merged_boxes[label])
+            merged.append(
+                TextRegion(
+                    x=x1,
+                    y=y1,
+                    width=x2 - x1,
+                    height=y2 - y1,
+                    confidence=float(confidences[label]),
+                    text_density=float(densities[label]),
+                    method_used=DetectionMethod.HYBRID,
+                )
+            )
+        return merged
 
-            merged_region = region1
-            merged_with = [i]
-
-            for j, region2 in enumerate(regions[i + 1 :], i + 1):
-                if j in used:
-                    continue
-
-                if region1.overlaps_with(region2, self.config.overlap_threshold):
-                    # Merge regions
-                    x1 = min(merged_region.x, region2.x)
-                    y1 = min(merged_region.y, region2.y)
-                    x2 = max(merged_region.x + merged_region.width, region2.x + region2.width)
-                    y2 = max(merged_region.y + merged_region.height, region2.y + region2.height)
-
-                    merged_region = TextRegion(
-                        x=x1,
-                        y=y1,
-                        width=x2 - x1,
-                        height=y2 - y1,
-                        confidence=max(merged_region.confidence, region2.confidence),
-                        text_density=(merged_region.text_density + region2.text_density) / 2,
-                        method_used=DetectionMethod.HYBRID,
-                    )
-                    merged_with.append(j)
-
-            for idx in merged_with:
-                used.add(idx)
-
-            merged.append(merged_region)
+    def _merge_overlapping_regions(self, regions: List[TextRegion]) -> List[TextRegion]:
+        """Merge overlapping regions (connected components of the overlap graph)."""
+        if len(regions) <= 1:
+            return regions
 
-        return merged
+        boxes = self._region_boxes(regions)
+        i, j = box_ops.overlap_graph(boxes, self.config.overlap_threshold)
+        labels = box_ops.connected_components(len(regions), i, j)
+        confidences = box_ops.group_max(
+            np.array([region.confidence for region in regions]), labels
+        )
+        return self._merge_groups(regions, boxes, labels, confidences)
 
     def _merge_similar_regions(self, regions: List[TextRegion]) -> List[TextRegion]:
         """Merge similar regions from different detection methods."""
         if len(regions) <= 1:
             return regions
 
-        # Group similar regions
-        groups = []
-        used = set()
-
-        for i, region1 in enumerate(regions):
-            if i in used:
-                continue
-
-            group = [region1]
-            used.add(i)
-
-            for j, region2 in enumerate(regions[i + 1 :], i + 1):
-                if j in used:
-                    continue
-
-                # Check if regions are similar (overlapping or very close)
-                if self._are_regions_similar(region1, region2):
-                    group.append(region2)
-                    used.add(j)
-
-            groups.append(group)
-
-        # Merge each group into single region
-        merged_regions = []
-        for group in groups:
-            if len(group) == 1:
-                merged_regions.append(group[0])
-            else:
-                # Create merged region from group
-                min_x = min(r.x for r in group)
-                min_y = min(r.y for r in group)
-                max_x = max(r.x + r.width for r in group)
-                max_y = max(r.y + r.height for r in group)
-
-                avg_confidence = sum(r.confidence for r in group) / len(group)
-                avg_text_density = sum(r.text_density for r in group) / len(group)
-
-                merged_region = TextRegion(
-                    x=min_x,
-                    y=min_y,
-                    width=max_x - min_x,
-                    height=max_y - min_y,
-                    confidence=avg_confidence,
-                    text_density=avg_text_density,
-                    method_used=DetectionMethod.HYBRID,
-                )
-                merged_regions.append(merged_region)
+        boxes = self._region_boxes(regions)
+        widths = boxes[:, 2] - boxes[:, 0]
+        heights = boxes[:, 3] - boxes[:, 1]
+        centers_x = boxes[:, 0] + widths // 2
+        centers_y = boxes[:, 1] + heights // 2
+        sizes = np.maximum(widths, heights)
+
+        # Close regions (see _are_regions_similar) have the smaller one's center
+        # within half the larger size of the other's center, so both boxes grown
+        # by a square of side max(w, h) around their center intersect
+        reach = np.column_stack(
+            [
+                np.minimum(boxes[:, 0], centers_x - sizes / 2),
+                np.minimum(boxes[:, 1], centers_y - sizes / 2),
+                np.maximum(boxes[:, 2], centers_x + sizes / 2),
+                np.maximum(boxes[:, 3], centers_y + sizes / 2),
+            ]
+        )
+        i, j = box_ops.intersecting_pairs(reach)
+        distance = np.hypot(centers_x[i] - centers_x[j], centers_y[i] - centers_y[j])
+        similar = (box_ops.pair_overlap(boxes, i, j) >= 0.2) | (
+            distance < np.maximum(sizes[i], sizes[j]) * 0.5
+        )
 
-        return merged_regions
+        labels = box_ops.connected_components(len(regions), i[similar], j[similar])
+        confidences = box_ops.group_mean(
+            np.array([region.confidence for region in regions]), labels
+        )
+        return self._merge_groups(regions, boxes, labels, confidences)
 
     def _are_regions_similar(
         self, region1: TextRegion, region2: TextRegion, threshold: float = 0.2
@@ -562,26 +762,13 @@ class SmartAreaDetector:
         # Regions are similar if they're close and similar size
         return distance < max_dimension * 0.5
 
-    def _generate_cache_key(self, image: np.ndarray) -> str:
-        """Generate cache key for image."""
-        # Use image hash for caching (SHA256 is more secure than MD5)
-        import hashlib
-
-        image_bytes = image.tobytes()
-        return hashlib.sha256(image_bytes, usedforsecurity=False).hexdigest()[:16]
-
-    def _cleanup_cache(self) -> None:
-        """Clean up old cache entries."""
-        current_time = time.time()
-        expired_keys = []
-
-        for key, timestamp in self.cache_timestamps.items():
-            if current_time - timestamp > self.cache_max_age:
-                expired_keys.append(key)
-
-        for key in expired_keys:
-            del self.detection_cache[key]
-            del self.cache_timestamps[key]
+    def _create_cache(self) -> DetectionCache:
+        """Create the detection cache for the current configuration."""
+        return DetectionCache(
+            max_entries=self.config.cache_max_entries,
+            ttl_seconds=self.config.cache_ttl_seconds,
+            max_diff=self.config.cache_max_diff,
+        )
 
     def get_best_region(self, regions: List[TextRegion]) -> Optional[TextRegion]:
         """Get the best text region based on confidence and size."""
@@ -615,6 +802,8 @@ class SmartAreaDetector:
             "average_time_seconds": avg_time,
             "method_usage": dict(self.detection_counts),
             "cache_size": len(self.detection_cache),
+            "cache": self.detection_cache.get_stats(),
+            "budget_overruns": self.budget_overruns,
             "config": {
                 "primary_method": self.config.primary_method.value,
                 "min_region_size": self.config.min_region_size,
@@ -625,11 +814,11 @@ class SmartAreaDetector:
     def clear_cache(self) -> None:
         """Clear detection cache."""
         self.detection_cache.clear()
-        self.cache_timestamps.clear()
         logger.info("Detection cache cleared")
 
     def update_config(self, config: DetectionConfig) -> None:
         """Update detection configuration."""
         self.config = config
-        self.clear_cache()  # Clear cache as detection parameters changed
+        # Detection parameters changed, and cache settings may have
+        self.detection_cache = self._create_cache()
         logger.info("Detection configuration updated")
@@ -30,6 +30,7 @@ except ImportError:
         AIOHTTP_AVAILABLE = False
 
 from src.plugins.plugin_manager import PluginManager
+from src.services.capability_registry import get_capability_registry
 from src.services.container import DIContainer
 from src.services.ocr_service import OCRService
 from src.services.translation_service import TranslationService
@@ -271,10 +272,17 @@ class WebAPIServer:
 
             return await handler(request)
 
+        async def service_scope_middleware(request, handler):
+            # Scoped services live for one request
+            with self.container.create_scope() as scope:
+                request["scope"] = scope
+                return await handler(request)
+
         # Add middleware in reverse order (they wrap each other)
         self.app.middlewares.append(request_logging_middleware)
         self.app.middlewares.append(rate_limiting_middleware)
         self.app.middlewares.append(auth_middleware)
+        self.app.middlewares.append(service_scope_middleware)
 
     def _setup_routes(self) -> None:
         """Setup API routes."""
@@ -414,6 +422,8 @@ class WebAPIServer:
                         "ocr": self.ocr_service is not None,
                         "plugins": self.plugin_manager is not None,
                     },
+                    # Cached probe results; stale entries are re-probed in the background
+                    "capabilities": get_capability_registry().snapshot(),
                 }
             )
         )
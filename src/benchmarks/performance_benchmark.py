@@ -5,8 +5,14 @@ Performance Benchmarks - Screen Translator v2.0
 """
 
 import json
+import logging
+import os
+import queue
+import secrets
+import tempfile
 import threading
 import time
+from datetime import datetime
 from typing import Any, Dict, List
 
 from src.services.container import DIContainer
@@ -14,6 +20,8 @@ from src.services.container import DIContainer
 # Импорт компонентов для тестирования
 from src.services.task_queue import TaskPriority, TaskQueue
 from src.services.translation_cache import TranslationCache
+from src.utils.logger import logger
+from src.utils.translation_archive import ArchiveReader, ArchiveWriter
 
 
 class PerformanceBenchmark:
@@ -60,17 +68,9 @@ class PerformanceBenchmark:
             "ops_per_sec": 1000 / submit_time,
         }
 
-        # Тест 2: Скорость выполнения задач
+        # Тест 2: Скорость выполнения задач (ожидание через futures, без опроса)
         start = time.perf_counter()
-        completed = 0
-        timeout = 10  # 10 секунд максимум
-
-        while completed < len(task_ids) and (time.perf_counter() - start) < timeout:
-            for task_id in task_ids:
-                if queue.get_task_status(task_id) == "completed":
-                    completed += 1
-            time.sleep(0.01)
-
+        completed = sum(1 for task_id in task_ids if queue.wait_for_task(task_id, timeout=10))
         execution_time = time.perf_counter() - start
 
         self.results["task_queue_execute_1000"] = {
@@ -78,12 +78,94 @@ class PerformanceBenchmark:
             "ops_per_sec": completed / execution_time,
         }
 
+        # Тест 3: Задержка синхронного ожидания одной задачи
+        start = time.perf_counter()
+        for i in range(200):
+            queue.wait_for_task(queue.submit(dummy_task, args=(i,)), timeout=1.0)
+        roundtrip_time = time.perf_counter() - start
+
+        self.results["task_queue_roundtrip_200"] = {
+            "duration": roundtrip_time,
+            "ops_per_sec": 200 / roundtrip_time,
+        }
+
+        # Тест 4: Микро-батчинг однотипных задач
+        batch_calls = []
+
+        def batch_task(items):
+            batch_calls.append(len(items))
+            return [x * 2 for (x,) in items]
+
+        queue.register_batch_handler("dummy_batch", batch_task, window=0.002)
+        start = time.perf_counter()
+        batch_futures = [
+            queue.submit_future(dummy_task, args=(i,), name="dummy_batch") for i in range(100)
+        ]
+        for future in batch_futures:
+            future.result(timeout=10)
+        batching_time = time.perf_counter() - start
+
+        self.results["task_queue_batched_100"] = {
+            "duration": batching_time,
+            "ops_per_sec": 100 / batching_time,
+            "batch_calls": len(batch_calls),
+        }
+
         queue.stop()
 
         print(f"   ✅ Submit 1000 tasks: {submit_time:.3f}s ({1000/submit_time:.1f} ops/sec)")
         print(
-            f"   ✅ Execute {completed} tasks: {execution_time:.3f}s ({completed/execution_time:.1f} ops/sec)"
+            f"   ✅ Execute {completed} tasks: {execution_time:.3f}s "
+            f"({completed/execution_time:.1f} ops/sec)"
         )
+        print(
+            f"   ✅ Submit+wait x200: {roundtrip_time:.3f}s "
+            f"({roundtrip_time/200*1000:.2f} ms/task)"
+        )
+        print(f"   ✅ 100 batchable tasks in {len(batch_calls)} batch calls: {batching_time:.3f}s")
+
+    def benchmark_task_lanes(self):
+        """Бенчмарк задержки интерактивных задач под пакетной нагрузкой"""
+        print("\n🔍 Benchmarking TaskQueue lanes (interactive p95 under batch load)...")
+
+        def batch_item():
+            time.sleep(0.05)
+
+        def interactive_task(submitted_at):
+            return time.perf_counter() - submitted_at
+
+        def measure(interactive_workers: int) -> float:
+            task_queue = TaskQueue(
+                num_workers=2, max_queue_size=1000, interactive_workers=interactive_workers
+            )
+            task_queue.start()
+
+            # Две конкурирующие пакетные задачи
+            for i in range(40):
+                task_queue.submit(batch_item, group=f"job-{i % 2}")
+
+            latencies = []
+            for _ in range(20):
+                future = task_queue.submit_future(
+                    interactive_task, args=(time.perf_counter(),), priority=TaskPriority.HIGH
+                )
+                latencies.append(future.result(timeout=10))
+                time.sleep(0.02)
+
+            task_queue.stop(wait=False)
+            latencies.sort()
+            return latencies[int(len(latencies) * 0.95) - 1]
+
+        shared_p95 = measure(interactive_workers=0)
+        reserved_p95 = measure(interactive_workers=1)
+
+        self.results["task_lanes_interactive_p95"] = {
+            "duration": reserved_p95,
+            "shared_workers_p95": shared_p95,
+        }
+
+        print(f"   ✅ Interactive p95 without reserved worker: {shared_p95 * 1000:.1f}ms")
+        print(f"   ✅ Interactive p95 with reserved worker: {reserved_p95 * 1000:.1f}ms")
 
     def benchmark_di_container(self):
         """Бенчмарк DI Container"""
@@ -119,6 +201,77 @@ class PerformanceBenchmark:
         )
         print(f"   ✅ Get 1000 services: {get_time:.3f}s ({1000/get_time:.1f} ops/sec)")
 
+        # Тест разрешения с внедрением зависимостей через конструктор
+        class Repository:
+            pass
+
+        class Handler:
+            def __init__(self, repository: Repository, retries: int = 3):
+                self.repository = repository
+
+        container.register_singleton(Repository, Repository)
+        container.register_transient(Handler, Handler)
+
+        iterations = 100000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            container.get(Repository)
+        singleton_time = time.perf_counter() - start
+
+        self.results["di_resolve_singleton_100k"] = {
+            "duration": singleton_time,
+            "ops_per_sec": iterations / singleton_time,
+        }
+
+        iterations = 10000
+        start = time.perf_counter()
+        for _ in range(iterations):
+            container.get(Handler)
+        injected_time = time.perf_counter() - start
+
+        self.results["di_resolve_injected_10k"] = {
+            "duration": injected_time,
+            "ops_per_sec": iterations / injected_time,
+        }
+
+        # Тест конкурентного создания синглтона
+        created = []
+
+        class SlowService:
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.01)
+
+        container.register_singleton(SlowService, SlowService)
+        barrier = threading.Barrier(8)
+
+        def resolve_concurrently():
+            barrier.wait()
+            container.get(SlowService)
+
+        threads = [threading.Thread(target=resolve_concurrently) for _ in range(8)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        concurrent_time = time.perf_counter() - start
+
+        self.results["di_concurrent_singleton"] = {
+            "duration": concurrent_time,
+            "instances_created": len(created),
+        }
+
+        print(
+            f"   ✅ Resolve singleton x100k: {singleton_time:.3f}s "
+            f"({100000/singleton_time:.0f} ops/sec)"
+        )
+        print(
+            f"   ✅ Resolve injected transient x10k: {injected_time:.3f}s "
+            f"({10000/injected_time:.0f} ops/sec)"
+        )
+        print(f"   ✅ Concurrent singleton: {len(created)} instance(s) for 8 threads")
+
     def benchmark_translation_cache(self):
         """Бенчмарк Translation Cache"""
         print("\n🔍 Benchmarking Translation Cache...")
@@ -152,6 +305,81 @@ class PerformanceBenchmark:
         print(f"   ✅ Lookup 1000 entries: {lookup_time:.3f}s ({1000/lookup_time:.1f} ops/sec)")
         print(f"   ✅ Cache hit rate: {hits/10:.1f}%")
 
+    def benchmark_translation_archive(self):
+        """Бенчмарк колоночного архива истории против JSON"""
+        print("\n🔍 Benchmarking translation archive vs JSON...")
+
+        base_time = time.time()
+        records = [
+            {
+                "timestamp": datetime.fromtimestamp(base_time + i),
+                "original_text": f"Hello world number {i}",
+                "translated_text": f"Привет мир номер {i}",
+                "source_language": "en",
+                "target_language": "ru",
+                "confidence": 0.9,
+            }
+            for i in range(20000)
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_path = os.path.join(tmp_dir, "history.json")
+            archive_path = os.path.join(tmp_dir, "history.stra")
+
+            start = time.perf_counter()
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False, indent=2, default=str)
+            json_write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with open(json_path, "r", encoding="utf-8") as f:
+                json.load(f)
+            json_read = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ArchiveWriter(archive_path) as writer:
+                writer.write_many(records)
+            archive_write = time.perf_counter() - start
+
+            start = time.perf_counter()
+            with ArchiveReader(archive_path) as reader:
+                count = sum(1 for _ in reader.iter_records())
+            archive_read = time.perf_counter() - start
+
+            # Случайный доступ: декодируется только один блок
+            start = time.perf_counter()
+            with ArchiveReader(archive_path) as reader:
+                reader.get(15000)
+            random_access = time.perf_counter() - start
+
+            json_size = os.path.getsize(json_path)
+            archive_size = os.path.getsize(archive_path)
+
+        self.results["archive_write_20000"] = {
+            "duration": archive_write,
+            "json_duration": json_write,
+        }
+        self.results["archive_read_20000"] = {
+            "duration": archive_read,
+            "json_duration": json_read,
+            "records": count,
+        }
+        self.results["archive_random_access"] = {"duration": random_access}
+        self.results["archive_size_ratio"] = {
+            "duration": 0,
+            "json_bytes": json_size,
+            "archive_bytes": archive_size,
+            "ratio": json_size / archive_size,
+        }
+
+        print(f"   ✅ Write 20000: archive {archive_write:.3f}s vs JSON {json_write:.3f}s")
+        print(f"   ✅ Read 20000: archive {archive_read:.3f}s vs JSON {json_read:.3f}s")
+        print(f"   ✅ Random access to one record: {random_access * 1000:.1f}ms")
+        print(
+            f"   ✅ Size: archive {archive_size / 1024:.0f}KB vs JSON {json_size / 1024:.0f}KB "
+            f"({json_size / archive_size:.0f}x smaller)"
+        )
+
     def benchmark_threading(self):
         """Бенчмарк многопоточности"""
         print("\n🔍 Benchmarking Threading...")
@@ -214,15 +442,420 @@ class PerformanceBenchmark:
         )
         print(f"   ✅ Speedup: {single_thread_time/multi_thread_time:.2f}x")
 
+    def benchmark_disabled_logging(self):
+        """Бенчмарк накладных расходов логирования при отключенном уровне DEBUG"""
+        print("\n🔍 Benchmarking Disabled Logging...")
+
+        iterations = 100000
+        key = "0123456789abcdef" * 4
+        previous_level = logger.logger.level
+        logger.logger.setLevel(logging.INFO)
+
+        try:
+            # Старый стиль: f-строка форматируется до проверки уровня
+            start = time.perf_counter()
+            for i in range(iterations):
+                logger.debug(f"Cache hit for key: {key[:8]}... (hits: {i})")
+            eager_time = time.perf_counter() - start
+
+            # Отложенные аргументы: форматирование только при включенном уровне
+            start = time.perf_counter()
+            for i in range(iterations):
+                logger.debug("Cache hit for key: %.8s... (hits: %d)", key, i)
+            lazy_time = time.perf_counter() - start
+
+            # Структурированные поля
+            start = time.perf_counter()
+            for i in range(iterations):
+                logger.debug("Cache hit", key=key, hits=i)
+            kwargs_time = time.perf_counter() - start
+        finally:
+            logger.logger.setLevel(previous_level)
+
+        for name, duration in (
+            ("logging_disabled_eager_100k", eager_time),
+            ("logging_disabled_lazy_100k", lazy_time),
+            ("logging_disabled_kwargs_100k", kwargs_time),
+        ):
+            self.results[name] = {
+                "duration": duration,
+                "ops_per_sec": iterations / duration,
+                "ns_per_call": duration / iterations * 1e9,
+            }
+
+        print(f"   ✅ Eager f-string: {eager_time / iterations * 1e9:.0f} ns/call")
+        print(f"   ✅ Lazy arguments: {lazy_time / iterations * 1e9:.0f} ns/call")
+        print(f"   ✅ Key/value fields: {kwargs_time / iterations * 1e9:.0f} ns/call")
+
+    def benchmark_api_key_validation(self):
+        """Бенчмарк проверки API ключей (10k ключей)"""
+        print("\n🔍 Benchmarking API Key Validation...")
+
+        from src.security.auth import APIKey, AuthenticationManager
+
+        num_keys = 10000
+        calls = 20000
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            manager = AuthenticationManager(data_dir=temp_dir, usage_flush_interval=1.0)
+
+            # Массовое заполнение без перезаписи файла на каждый ключ
+            api_keys = []
+            for i in range(num_keys):
+                api_key = f"st_{secrets.token_urlsafe(32)}"
+                key_hash = manager._hash_api_key(api_key)
+                key_id = f"bench_{i}"
+                manager.api_keys[key_id] = APIKey(
+                    key_id=key_id, key_hash=key_hash, name=key_id, created_at=time.time()
+                )
+                manager._key_hash_index[key_hash] = key_id
+                api_keys.append(api_key)
+            manager._save_api_keys()
+
+            # Аудит пишет в файл на каждый вызов - измеряем саму проверку
+            manager.audit_logger.log_api_access = lambda *args, **kwargs: None
+
+            latencies = []
+            start = time.perf_counter()
+            for i in range(calls):
+                call_start = time.perf_counter()
+                manager.validate_api_key(api_keys[(i * 7919) % num_keys])
+                latencies.append(time.perf_counter() - call_start)
+            validate_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            manager.flush_api_key_usage()
+            flush_time = time.perf_counter() - start
+            manager.shutdown()
+
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2]
+        p99 = latencies[int(len(latencies) * 0.99)]
+
+        self.results["api_key_validate_20000"] = {
+            "duration": validate_time,
+            "ops_per_sec": calls / validate_time,
+            "p50_us": p50 * 1e6,
+            "p99_us": p99 * 1e6,
+        }
+        self.results["api_key_usage_flush_10k"] = {
+            "duration": flush_time,
+            "ops_per_sec": 1 / flush_time if flush_time > 0 else float("inf"),
+        }
+
+        print(
+            f"   ✅ Validate {calls} calls: {validate_time:.3f}s "
+            f"({calls/validate_time:.0f} ops/sec)"
+        )
+        print(f"   ✅ Latency p50: {p50 * 1e6:.1f} µs, p99: {p99 * 1e6:.1f} µs")
+        print(f"   ✅ Usage flush ({num_keys} keys): {flush_time:.3f}s")
+
+    def benchmark_data_sanitizer(self):
+        """Бенчмарк санитизации больших OCR текстов и потока логов"""
+        print("\n🔍 Benchmarking Data Sanitizer...")
+
+        from src.security.sanitizer import DataSanitizer
+
+        sanitizer = DataSanitizer()
+
+        # OCR текст: в основном обычные строки, изредка чувствительные данные
+        ocr_lines = [
+            "The quick brown fox jumps over the lazy dog.",
+            "Menu  File  Edit  View  Help",
+            "Ошибка загрузки файла, повторите попытку",
+            "Total: 12 items",
+        ]
+        lines = [ocr_lines[i % len(ocr_lines)] for i in range(5000)]
+        for i in range(0, len(lines), 250):
+            lines[i] = f"Contact user{i}@example.com or 555-123-{i % 10000:04d}"
+        ocr_text = "\n".join(lines)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            sanitizer.sanitize_ocr_output(ocr_text)
+        ocr_time = (time.perf_counter() - start) / 5
+
+        # Поток логов: короткие строки
+        log_lines = [
+            f"2024-01-01 INFO request {i} handled in {i % 50}ms for user {i % 97}"
+            for i in range(10000)
+        ]
+        start = time.perf_counter()
+        for line in log_lines:
+            sanitizer.sanitize_log_message(line)
+        log_time = time.perf_counter() - start
+
+        self.results["sanitize_ocr_text"] = {
+            "duration": ocr_time,
+            "chars": len(ocr_text),
+            "mb_per_sec": len(ocr_text) / ocr_time / 1e6,
+        }
+        self.results["sanitize_log_10000"] = {
+            "duration": log_time,
+            "ops_per_sec": len(log_lines) / log_time,
+        }
+
+        print(
+            f"   ✅ OCR text ({len(ocr_text) // 1024} KB): {ocr_time * 1000:.1f}ms "
+            f"({len(ocr_text) / ocr_time / 1e6:.1f} MB/s)"
+        )
+        print(
+            f"   ✅ Log lines (10000): {log_time:.3f}s "
+            f"({len(log_lines) / log_time:.0f} lines/sec)"
+        )
+
+    def benchmark_box_merging(self):
+        """Бенчмарк слияния областей текста и NMS на 100, 1k и 10k рамках"""
+        print("\n🔍 Benchmarking Box Merging...")
+
+        import numpy as np
+
+        from src.ai.smart_area_detection import DetectionMethod, SmartAreaDetector, TextRegion
+        from src.utils import box_ops
+
+        detector = SmartAreaDetector()
+        rng = np.random.default_rng(0)
+
+        for count in (100, 1000, 10000):
+            # Рамки размером со слово на экране 1920x1080
+            corners = rng.integers(0, (1920, 1080), size=(count, 2))
+            sizes = rng.integers((20, 10), (120, 30), size=(count, 2))
+            boxes = np.hstack([corners, corners + sizes]).astype(float)
+            scores = rng.random(count)
+            regions = [
+                TextRegion(x1, y1, x2 - x1, y2 - y1, score, 0.5, DetectionMethod.CONTOUR_BASED)
+                for (x1, y1, x2, y2), score in zip(boxes.astype(int).tolist(), scores.tolist())
+            ]
+
+            start = time.perf_counter()
+            merged = detector._merge_overlapping_regions(regions)
+            merge_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            kept = box_ops.non_max_suppression(boxes, scores, 0.4)
+            nms_time = time.perf_counter() - start
+
+            result = {
+                "duration": merge_time,
+                "merged_regions": len(merged),
+                "nms_duration": nms_time,
+                "nms_kept": len(kept),
+            }
+
+            # Попарная проверка (прежний O(n^2) подход) - только для малых N
+            if count <= 1000:
+                start = time.perf_counter()
+                for i, region in enumerate(regions):
+                    for other in regions[i + 1 :]:
+                        region.overlaps_with(other, detector.config.overlap_threshold)
+                result["pairwise_duration"] = time.perf_counter() - start
+
+            self.results[f"box_merge_{count}"] = result
+
+            line = (
+                f"   ✅ {count} boxes: merge {merge_time * 1000:.1f}ms, "
+                f"NMS {nms_time * 1000:.1f}ms"
+            )
+            if "pairwise_duration" in result:
+                line += f" (pairwise checks {result['pairwise_duration'] * 1000:.1f}ms)"
+            print(line)
+
+    def benchmark_area_detection(self):
+        """Бенчмарк поиска областей текста на кадре 4K: полный размер и coarse-to-fine"""
+        print("\n🔍 Benchmarking Area Detection (4K)...")
+
+        import cv2
+        import numpy as np
+
+        from src.ai.smart_area_detection import DetectionConfig, DetectionMethod, SmartAreaDetector
+
+        frame = np.full((2160, 3840, 3), 235, dtype=np.uint8)
+        rng = np.random.default_rng(0)
+        for line in range(40):
+            x, y = int(rng.integers(50, 3300)), int(rng.integers(60, 2100))
+            cv2.putText(
+                frame, f"Sample text {line}", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (20, 20, 20), 2
+            )
+
+        timings = {}
+        for name, coarse_to_fine in (("full", False), ("coarse_to_fine", True)):
+            detector = SmartAreaDetector(
+                DetectionConfig(coarse_to_fine=coarse_to_fine, enable_caching=False)
+            )
+            detector.detect_text_regions(frame, DetectionMethod.HYBRID)  # прогрев
+            start = time.perf_counter()
+            for _ in range(3):
+                regions = detector.detect_text_regions(frame, DetectionMethod.HYBRID)
+            timings[name] = (time.perf_counter() - start) / 3
+            print(f"   ✅ {name}: {timings[name] * 1000:.1f}ms, {len(regions)} regions")
+
+        self.results["area_detection_4k_full"] = {"duration": timings["full"]}
+        self.results["area_detection_4k"] = {
+            "duration": timings["coarse_to_fine"],
+            "speedup": timings["full"] / timings["coarse_to_fine"],
+        }
+        print(f"   ✅ Speedup: {timings['full'] / timings['coarse_to_fine']:.1f}x")
+
+    def benchmark_detection_cache_key(self):
+        """Бенчмарк построения ключа кэша детекции на кадрах 1080p и 4K"""
+        print("\n🔍 Benchmarking Detection Cache Keys...")
+
+        import hashlib
+
+        import numpy as np
+
+        from src.ai.detection_cache import DetectionCache
+
+        cache = DetectionCache()
+        rng = np.random.default_rng(0)
+        for name, shape in (("1080p", (1080, 1920, 3)), ("4k", (2160, 3840, 3))):
+            frame = rng.integers(0, 256, size=shape, dtype=np.uint8)
+            runs = 20
+
+            # Прежний ключ: SHA-256 по копии всего буфера кадра
+            start = time.perf_counter()
+            for _ in range(runs):
+                hashlib.sha256(frame.tobytes()).hexdigest()
+            full_hash_time = (time.perf_counter() - start) / runs
+
+            start = time.perf_counter()
+            for _ in range(runs):
+                cache.key(frame, "hybrid")
+            key_time = (time.perf_counter() - start) / runs
+
+            self.results[f"detection_cache_key_{name}"] = {
+                "duration": key_time,
+                "full_hash_duration": full_hash_time,
+                "speedup": full_hash_time / key_time,
+            }
+            print(
+                f"   ✅ {name}: fingerprint {key_time * 1e6:.0f} µs, "
+                f"full SHA-256 {full_hash_time * 1000:.1f}ms ({full_hash_time / key_time:.0f}x)"
+            )
+
+    def benchmark_plugin_startup(self):
+        """Бенчмарк запуска плагинов: жадная загрузка против кэша манифестов"""
+        print("\n🔍 Benchmarking Plugin Startup...")
+
+        import subprocess
+        import sys
+
+        # Каждый замер в отдельном процессе, чтобы импорты не были уже в sys.modules
+        script = """
+import json, resource, sys, time
+start = time.perf_counter()
+from src.plugins.plugin_manager import PluginManager
+manager = PluginManager(manifest_cache_path=sys.argv[2])
+if sys.argv[1] == "eager":
+    for plugin in manager.discover_plugins():
+        manager.register_plugin(plugin)
+else:
+    manager.load_all_plugins()
+print(json.dumps({
+    "duration": time.perf_counter() - start,
+    "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "modules": len(sys.modules),
+}))
+"""
+
+        def run(mode, cache_path):
+            output = subprocess.run(
+                [sys.executable, "-c", script, mode, cache_path],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            return json.loads(output.strip().splitlines()[-1])
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_path = os.path.join(temp_dir, "plugin_manifests.json")
+            eager = run("eager", cache_path)
+            run("lazy", cache_path)  # Прогрев кэша манифестов
+            lazy = run("lazy", cache_path)
+
+        self.results["plugin_startup_eager"] = eager
+        self.results["plugin_startup_lazy"] = lazy
+
+        for label, result in (("Eager", eager), ("Lazy (cached)", lazy)):
+            print(
+                f"   ✅ {label}: {result['duration'] * 1000:.1f}ms, "
+                f"RSS {result['max_rss_kb'] / 1024:.1f} MB, {result['modules']} modules"
+            )
+
+    def benchmark_startup_imports(self):
+        """Бенчмарк импортов при запуске (python -X importtime) с бюджетом"""
+        print("\n🔍 Benchmarking Startup Imports...")
+
+        import subprocess
+        import sys
+
+        # Импорты main.py перед созданием приложения
+        startup_imports = "\n".join(
+            [
+                "from src.core.application import ScreenTranslatorApp",
+                "from src.services.container import container, setup_default_services",
+                "from src.services.config_manager import ConfigManager",
+                "from src.services.notification_service import initialize_notifications",
+                "from src.services.hotkey_service import initialize_hotkeys",
+            ]
+        )
+        # Тяжелые зависимости, которые не должны загружаться при старте
+        deferred_modules = {"cv2", "numpy", "PIL.Image", "pytesseract", "pyttsx3", "torch"}
+
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", startup_imports],
+            capture_output=True,
+            text=True,
+        )
+
+        total_us = 0
+        modules = {}
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            _, cumulative_us, name = line.split("|")
+            modules[name.strip()] = int(cumulative_us)
+            # Вложенные импорты имеют отступ, считаем только верхний уровень
+            if not name.startswith("   "):
+                total_us += int(cumulative_us)
+
+        eager_heavy = sorted(deferred_modules & set(modules))
+        slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+
+        self.results["startup_imports"] = {
+            "duration": total_us / 1e6,
+            "modules": len(modules),
+            "eager_heavy_modules": eager_heavy,
+            "import_ok": completed.returncode == 0,
+        }
+
+        print(f"   ✅ Startup imports: {total_us / 1000:.1f}ms, {len(modules)} modules")
+        for module, cumulative_us in slowest:
+            print(f"      {module}: {cumulative_us / 1000:.1f}ms")
+        if eager_heavy:
+            print(f"   ⚠️ Heavy modules imported at startup: {', '.join(eager_heavy)}")
+        if completed.returncode != 0:
+            print("   ⚠️ Startup imports failed (missing dependencies?)")
+
     def run_all_benchmarks(self):
         """Запустить все бенчмарки"""
         print("🚀 RUNNING PERFORMANCE BENCHMARKS")
         print("=" * 60)
 
         self.benchmark_task_queue()
+        self.benchmark_task_lanes()
         self.benchmark_di_container()
         self.benchmark_translation_cache()
+        self.benchmark_translation_archive()
         self.benchmark_threading()
+        self.benchmark_disabled_logging()
+        self.benchmark_api_key_validation()
+        self.benchmark_data_sanitizer()
+        self.benchmark_box_merging()
+        self.benchmark_area_detection()
+        self.benchmark_detection_cache_key()
+        self.benchmark_plugin_startup()
+        self.benchmark_startup_imports()
 
         # Сохранение результатов
         with open("benchmark_results.json", "w") as f:
@@ -236,8 +869,19 @@ class PerformanceBenchmark:
 
         critical_thresholds = {
             "task_queue_submit_1000": 1.0,  # Должно быть < 1 секунды
+            "task_queue_roundtrip_200": 0.2,  # < 1ms на submit+wait
+            "task_lanes_interactive_p95": 0.02,  # p95 < 20ms под пакетной нагрузкой
             "di_get_1000": 0.1,  # Должно быть < 100ms
+            "di_resolve_singleton_100k": 0.2,  # < 2 мкс на разрешение
             "cache_lookup_1000": 0.01,  # Должно быть < 10ms
+            "archive_random_access": 0.02,  # Чтение одной записи без загрузки файла
+            "logging_disabled_lazy_100k": 0.1,  # < 1 мкс на вызов
+            "api_key_validate_20000": 0.5,  # < 25 мкс на проверку
+            "sanitize_log_10000": 0.5,  # < 50 мкс на строку
+            "box_merge_10000": 0.2,  # Слияние 10k рамок без попарного перебора
+            "area_detection_4k": 0.25,  # HYBRID на кадре 4K
+            "detection_cache_key_4k": 0.001,  # Ключ кэша без хэширования всего кадра
+            "startup_imports": 0.5,  # Бюджет импортов при запуске
         }
 
         issues = []
@@ -247,6 +891,13 @@ class PerformanceBenchmark:
                 if duration > threshold:
                     issues.append(f"{metric}: {duration:.3f}s (threshold: {threshold}s)")
 
+        if self.results.get("di_concurrent_singleton", {}).get("instances_created", 1) != 1:
+            issues.append("di_concurrent_singleton: singleton created more than once")
+
+        eager_heavy = self.results.get("startup_imports", {}).get("eager_heavy_modules")
+        if eager_heavy:
+            issues.append(f"startup imports heavy modules: {', '.join(eager_heavy)}")
+
         if issues:
             print("⚠️ Performance issues detected:")
             for issue in issues:
@@ -1,27 +1,30 @@
-import pytesseract
-
-from src.core.ocr_engine import TesseractOCR
-
 """
 AI-powered OCR engine for Screen Translator v2.0.
 Provides advanced text detection and recognition using machine learning approaches.
 """
 
+from __future__ import annotations
+
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    import cv2
-except ImportError:
-    print("OpenCV не доступен в данной среде")
-    cv2 = None
-import numpy as np
-from PIL import Image
-
+from src.core.ocr_engine import TesseractOCR
 from src.plugins.base_plugin import OCRPlugin, PluginMetadata, PluginType
+from src.utils import box_ops
+from src.utils.lazy_import import lazy_import
 from src.utils.logger import logger
 
+# Heavy dependencies are loaded on first use
+pytesseract = lazy_import("pytesseract")
+cv2 = lazy_import("cv2")
+if cv2 is None:
+    print("OpenCV не доступен в данной среде")
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+
 
 @dataclass
 class TextRegion:
@@ -246,59 +249,35 @@ class TextDetector:
         if not regions:
             return []
 
-        # Sort by confidence
-        sorted_regions = sorted(regions, key=lambda r: r.confidence, reverse=True)
+        # Regions overlapping by more than 30% of the smaller one are merged,
+        # transitively, into groups kept if their best confidence passes
+        boxes = box_ops.as_boxes([region.bbox for region in regions])
+        i, j = box_ops.overlap_graph(boxes, 0.3, metric="min", strict=True)
+        labels = box_ops.connected_components(len(regions), i, j)
+        confidences = box_ops.group_max(
+            np.array([region.confidence for region in regions]), labels
+        )
+        merged_boxes = box_ops.merge_groups(boxes, labels)
+        sizes = np.bincount(labels)
+        first = np.unique(labels, return_index=True)[1]
 
         merged = []
-        for current in sorted_regions:
-            should_merge = False
-
-            for i, existing in enumerate(merged):
-                if self._regions_overlap(current.bbox, existing.bbox):
-                    # Merge with existing region
-                    merged_bbox = self._merge_bboxes(current.bbox, existing.bbox)
-                    merged_confidence = max(current.confidence, existing.confidence)
-
-                    merged[i] = TextRegion(
-                        bbox=merged_bbox, text="", confidence=merged_confidence, language="unknown"
-                    )
-                    should_merge = True
-                    break
-
-            if not should_merge and current.confidence >= self.confidence_threshold:
-                merged.append(current)
-
+        for label in np.argsort(-confidences, kind="stable").tolist():
+            if confidences[label] < self.confidence_threshold:
+                break
+            if sizes[label] == 1:
+                merged.append(regions[first[label]])
+                continue
+            merged.append(
+                TextRegion(
+                    bbox=tuple(int(v) for v in merged_boxes[label]),
+                    text="",
+                    confidence=float(confidences[label]),
+                    language="unknown",
+                )
+            )
         return merged
 
-    def _regions_overlap(
-        self, bbox1: Tuple[int, int, int, int], bbox2: Tuple[int, int, int, int]
-    ) -> bool:
-        """Check if two bounding boxes overlap significantly."""
-        x1_1, y1_1, x2_1, y2_1 = bbox1
-        x1_2, y1_2, x2_2, y2_2 = bbox2
-
-        # Calculate intersection
-        x_overlap = max(0, min(x2_1, x2_2) - max(x1_1, x1_2))
-        y_overlap = max(0, min(y2_1, y2_2) - max(y1_1, y1_2))
-        intersection = x_overlap * y_overlap
-
-        # Calculate areas
-        area1 = (x2_1 - x1_1) * (y2_1 - y1_1)
-        area2 = (x2_2 - x1_2) * (y2_2 - y1_2)
-
-        # Check if overlap is significant (>30% of smaller region)
-        min_area = min(area1, area2)
-        return intersection > 0.3 * min_area
-
-    def _merge_bboxes(
-        self, bbox1: Tuple[int, int, int, int], bbox2: Tuple[int, int, int, int]
-    ) -> Tuple[int, int, int, int]:
-        """Merge two bounding boxes into one that contains both."""
-        x1_1, y1_1, x2_1, y2_1 = bbox1
-        x1_2, y1_2, x2_2, y2_2 = bbox2
-
-        return (min(x1_1, x1_2), min(y1_1, y1_2), max(x2_1, x2_2), max(y2_1, y2_2))
-
 
 class ImageEnhancer:
     """Advanced image enhancement for better OCR results."""
@@ -533,6 +512,81 @@ class ImageEnhancer:
             return image
 
 
+# Regions up to this size are OCR'd together, stacked on one canvas
+TINY_REGION_HEIGHT = 32
+TINY_REGION_WIDTH = 320
+MAX_REGIONS_PER_CANVAS = 8
+CANVAS_PADDING = 8
+
+
+def sort_reading_order(regions: List[TextRegion]) -> List[TextRegion]:
+    """
+    Sort regions top-to-bottom, left-to-right.
+
+    A region whose vertical center lies within the previous line's extent
+    belongs to that line.
+    """
+    lines: List[List[TextRegion]] = []
+    top = bottom = 0
+    for region in sorted(regions, key=lambda r: (r.bbox[1], r.bbox[0])):
+        _, y1, _, y2 = region.bbox
+        if lines and top <= (y1 + y2) / 2 <= bottom:
+            lines[-1].append(region)
+            bottom = max(bottom, y2)
+        else:
+            lines.append([region])
+            top, bottom = y1, y2
+    return [region for line in lines for region in sorted(line, key=lambda r: r.bbox[0])]
+
+
+def _is_tiny(region: TextRegion) -> bool:
+    x1, y1, x2, y2 = region.bbox
+    return y2 - y1 <= TINY_REGION_HEIGHT and x2 - x1 <= TINY_REGION_WIDTH
+
+
+def plan_region_batches(
+    regions: List[TextRegion], max_batch: int = MAX_REGIONS_PER_CANVAS
+) -> List[List[TextRegion]]:
+    """Group consecutive tiny regions (in reading order) into batches for one OCR call."""
+    batches: List[List[TextRegion]] = []
+    for region in regions:
+        last = batches[-1] if batches else None
+        if last and len(last) < max_batch and _is_tiny(region) and _is_tiny(last[0]):
+            last.append(region)
+        else:
+            batches.append([region])
+    return batches
+
+
+def stitch_regions(
+    image: np.ndarray, regions: List[TextRegion], padding: int = CANVAS_PADDING
+) -> Optional[np.ndarray]:
+    """
+    Stack region crops vertically on one canvas, one region per text line.
+
+    The canvas is filled with the median border color of the crops so the
+    padding looks like background to the OCR engine.
+    """
+    crops = [image[y1:y2, x1:x2] for x1, y1, x2, y2 in (r.bbox for r in regions)]
+    crops = [crop for crop in crops if crop.size]
+    if not crops:
+        return None
+
+    borders = np.concatenate(
+        [np.concatenate([c[0], c[-1], c[:, 0], c[:, -1]]) for c in crops]
+    )
+    width = max(crop.shape[1] for crop in crops) + 2 * padding
+    height = sum(crop.shape[0] for crop in crops) + padding * (len(crops) + 1)
+    canvas = np.empty((height, width) + image.shape[2:], dtype=image.dtype)
+    canvas[...] = np.median(borders, axis=0).astype(image.dtype)
+
+    y = padding
+    for crop in crops:
+        canvas[y : y + crop.shape[0], padding : padding + crop.shape[1]] = crop
+        y += crop.shape[0] + padding
+    return canvas
+
+
 class AIEnhancedOCRPlugin(OCRPlugin):
     """AI-enhanced OCR plugin with advanced text detection and image processing."""
 
@@ -541,6 +595,8 @@ class AIEnhancedOCRPlugin(OCRPlugin):
         self.text_detector = TextDetector()
         self.image_enhancer = ImageEnhancer()
         self.base_ocr = None  # Will be set to fallback OCR engine
+        self.region_workers = min(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     @property
     def metadata(self) -> PluginMetadata:
@@ -576,6 +632,13 @@ class AIEnhancedOCRPlugin(OCRPlugin):
                     "description": "Fallback OCR engine",
                     "default": "tesseract",
                 },
+                "region_workers": {
+                    "type": "integer",
+                    "description": "Parallel OCR calls for detected text regions",
+                    "default": 4,
+                    "min": 1,
+                    "max": 32,
+                },
             },
         )
 
@@ -598,6 +661,7 @@ class AIEnhancedOCRPlugin(OCRPlugin):
             # Configure text detector
             confidence_threshold = config.get("confidence_threshold", 0.5)
             self.text_detector.confidence_threshold = confidence_threshold
+            self.region_workers = config.get("region_workers", self.region_workers)
 
             # Try to initialize fallback OCR
             fallback_name = config.get("fallback_ocr", "tesseract")
@@ -620,6 +684,9 @@ class AIEnhancedOCRPlugin(OCRPlugin):
 
     def cleanup(self) -> None:
         """Cleanup plugin resources."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
         self.text_detector = None
         self.image_enhancer = None
         self.base_ocr = None
@@ -669,43 +736,24 @@ class AIEnhancedOCRPlugin(OCRPlugin):
     def _extract_from_regions(
         self, image: np.ndarray, regions: List[TextRegion], languages: List[str]
     ) -> Tuple[str, float]:
-        """Extract text from detected regions."""
-        all_text = []
-        all_confidences = []
-
-        for region in regions:
-            try:
-                # Extract region from image
-                x1, y1, x2, y2 = region.bbox
-                region_image = image[y1:y2, x1:x2]
-
-                if region_image.size == 0:
-                    continue
-
-                # Convert to PIL for OCR
-                region_pil = Image.fromarray(region_image)
-                region_bytes = io.BytesIO()
-                region_pil.save(region_bytes, format="PNG")
-                region_bytes.seek(0)
+        """Extract text from detected regions in parallel, combined in reading order."""
+        batches = plan_region_batches(sort_reading_order(regions))
 
-                # Extract text from region
-                if self.base_ocr:
-                    text, confidence = self.base_ocr.extract_text(region_pil, languages)
-                else:
-                    # Simple fallback
-                    text, confidence = self._simple_ocr_fallback(region_pil, languages)
+        def extract(batch: List[TextRegion]) -> Tuple[str, float]:
+            return self._extract_from_batch(image, batch, languages)
 
-                if text.strip():
-                    all_text.append(text.strip())
-                    all_confidences.append(confidence)
-
-                    # Update region with extracted text
-                    region.text = text.strip()
-                    region.confidence = confidence
+        if len(batches) > 1 and self.region_workers > 1:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.region_workers, thread_name_prefix="ai-ocr"
+                )
+            # Tesseract runs as a subprocess per call, so threads use all cores
+            results = list(self._executor.map(extract, batches))
+        else:
+            results = [extract(batch) for batch in batches]
 
-            except Exception as e:
-                logger.debug(f"Failed to extract text from region: {e}")
-                continue
+        all_text = [text for text, _ in results if text]
+        all_confidences = [confidence for text, confidence in results if text]
 
         # Combine results
         if all_text:
@@ -713,12 +761,59 @@ class AIEnhancedOCRPlugin(OCRPlugin):
             avg_confidence = sum(all_confidences) / len(all_confidences)
 
             logger.debug(
-                f"AI OCR extracted from {len(all_text)} regions with avg confidence {avg_confidence:.2f}"
+                f"AI OCR extracted from {len(all_text)} of {len(batches)} region batches "
+                f"with avg confidence {avg_confidence:.2f}"
             )
             return combined_text, avg_confidence
 
         return "", 0.0
 
+    def _extract_from_batch(
+        self, image: np.ndarray, batch: List[TextRegion], languages: List[str]
+    ) -> Tuple[str, float]:
+        """OCR one region, or several tiny regions stitched onto one canvas."""
+        try:
+            if len(batch) == 1:
+                x1, y1, x2, y2 = batch[0].bbox
+                region_image = image[y1:y2, x1:x2]
+            else:
+                region_image = stitch_regions(image, batch)
+
+            if region_image is None or region_image.size == 0:
+                return "", 0.0
+
+            # Convert to PIL for OCR
+            region_pil = Image.fromarray(region_image)
+
+            # Extract text from region
+            if self.base_ocr:
+                text, confidence = self.base_ocr.extract_text(region_pil, languages)
+            else:
+                # Simple fallback
+                text, confidence = self._simple_ocr_fallback(region_pil, languages)
+
+            text = text.strip()
+            if not text:
+                return "", 0.0
+            confidence = confidence or 0.0
+
+            # Update regions with extracted text; stitched regions come back one per line
+            if len(batch) == 1:
+                parts = [text]
+            else:
+                lines = [line.strip() for line in text.splitlines() if line.strip()]
+                parts = lines if len(lines) == len(batch) else []
+                text = " ".join(lines)
+            for region, part in zip(batch, parts):
+                region.text = part
+                region.confidence = confidence
+
+            return text, confidence
+
+        except Exception as e:
+            logger.debug(f"Failed to extract text from region: {e}")
+            return "", 0.0
+
     def _extract_from_full_image(
         self, image: np.ndarray, languages: List[str]
     ) -> Tuple[str, float]:
@@ -1,5 +1,6 @@
 """Batch processing engine for handling multiple screenshots and OCR operations."""
 
+import queue
 import threading
 import time
 from dataclasses import dataclass, field
@@ -9,7 +10,7 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from src.models.screenshot_data import ScreenshotData
 from src.models.translation import Translation
-from src.services.task_queue import TaskPriority, get_task_queue
+from src.services.task_queue import TaskLane, TaskPriority, get_task_queue
 from src.utils.logger import logger
 
 
@@ -56,10 +57,9 @@ class BatchJob:
     @property
     def success_rate(self) -> float:
         """Calculate success rate as percentage"""
-        with self._lock:
-            if self.total_items == 0:
-                return 0.0
-            return ((self.completed_items) / self.total_items) * 100
+        if self.total_items == 0:
+            return 0.0
+        return ((self.completed_items) / self.total_items) * 100
 
     @property
     def is_finished(self) -> bool:
@@ -71,30 +71,23 @@ class BatchProcessor:
     """Engine for batch processing screenshots and OCR operations"""
 
     def __init__(self, ocr_processor, translation_processor, max_concurrent: int = 3):
-        with self._lock:
-            self.ocr_processor = ocr_processor
-        with self._lock:
-            self.translation_processor = translation_processor
-        with self._lock:
-            self.max_concurrent = max_concurrent
+        self.ocr_processor = ocr_processor
+        self.translation_processor = translation_processor
+        self.max_concurrent = max_concurrent
 
         # Job management
         self.jobs: Dict[str, BatchJob] = {}
         self.current_jobs: Set[str] = set()  # Track active job IDs
-        with self._lock:
-            self.current_jobs_lock = threading.Lock()
-        with self._lock:
-            self.max_batch_jobs = 10  # Limit concurrent batch jobs
-        with self._lock:
-            self.task_queue = get_task_queue()
+        self._next_item: Dict[str, int] = {}  # Index of the next item to submit per job
+        self._remaining_items: Dict[str, int] = {}  # Items not yet finished per job
+        self.current_jobs_lock = threading.Lock()
+        self.max_batch_jobs = 10  # Limit concurrent batch jobs
+        self.task_queue = get_task_queue()
 
         # Thread management
-        with self._lock:
-            self._processing_lock = threading.Lock()
-        with self._lock:
-            self._job_counter = 0
-        with self._lock:
-            self._item_counter = 0
+        self._processing_lock = threading.Lock()
+        self._job_counter = 0
+        self._item_counter = 0
 
         logger.info(f"Batch processor initialized with {max_concurrent} concurrent workers")
 
@@ -157,14 +150,17 @@ class BatchProcessor:
         job.status = BatchStatus.PROCESSING
         job.started_at = datetime.now()
 
-        # Submit batch processing task
-        with self._lock:
-            self.task_queue.submit(
-                func=self._process_batch_job,
-                args=(job_id, progress_callback, completion_callback),
-                name=f"batch_job_{job_id}",
-                priority=TaskPriority.NORMAL,
-            )
+        # Items run as separate tasks grouped by job, at most max_concurrent
+        # of them queued at a time; each finished item submits the next one
+        if not job.items:
+            self._finish_batch_job(job_id, completion_callback)
+            return True
+
+        with self._processing_lock:
+            self._next_item[job_id] = 0
+            self._remaining_items[job_id] = job.total_items
+        for _ in range(min(self.max_concurrent, job.total_items)):
+            self._submit_next_item(job_id, progress_callback, completion_callback)
 
         logger.info(f"Started batch job: {job_id}")
         return True
@@ -205,37 +201,65 @@ class BatchProcessor:
             if item.result and item.status == BatchStatus.COMPLETED
         ]
 
-    def _process_batch_job(
+    def _submit_next_item(
         self,
         job_id: str,
         progress_callback: Optional[Callable[[str, int, str], None]],
         completion_callback: Optional[Callable[[str, BatchJob], None]],
     ) -> None:
-        """Process all items in a batch job"""
-        try:
-            job = self.jobs[job_id]
-            logger.info(f"Processing batch job {job_id} with {job.total_items} items")
-
-            # Process items with controlled concurrency
-            semaphore = threading.Semaphore(self.max_concurrent)
-            threads = []
-
-            for item in job.items:
-                if job.status == BatchStatus.CANCELLED:
-                    break
-
-                # Create worker thread for each item
-                thread = threading.Thread(
-                    target=self._process_batch_item,
-                    args=(job_id, item, semaphore, progress_callback),
-                    daemon=True,
-                )
-                thread.start()
-                threads.append(thread)
+        """Submit the next unsubmitted item of a job to the batch lane"""
+        job = self.jobs[job_id]
+        while True:
+            with self._processing_lock:
+                index = self._next_item.get(job_id, job.total_items)
+                if index >= job.total_items:
+                    return
+                self._next_item[job_id] = index + 1
+            item = job.items[index]
+
+            if job.status != BatchStatus.CANCELLED:
+                try:
+                    self.task_queue.submit(
+                        func=self._process_batch_item,
+                        args=(job_id, item, progress_callback, completion_callback),
+                        name=f"batch_item_{item.id}",
+                        priority=TaskPriority.NORMAL,
+                        lane=TaskLane.BATCH,
+                        group=job_id,
+                    )
+                    return
+                except queue.Full:
+                    item.error = "Task queue full"
+                    item.status = BatchStatus.FAILED
+                    logger.error(f"Batch item {item.id} failed: {item.error}")
+
+            # Cancelled or not queued: count the item and move on
+            if self._count_item(job, item):
+                self._finish_batch_job(job_id, completion_callback)
+                return
 
-            # Wait for all items to complete
-            for thread in threads:
-                thread.join()
+    def _count_item(self, job: BatchJob, item: BatchItem) -> bool:
+        """Record a finished item. Returns True if it was the last one of its job."""
+        with self._processing_lock:
+            if item.status == BatchStatus.COMPLETED:
+                job.completed_items += 1
+            elif item.status == BatchStatus.FAILED:
+                job.failed_items += 1
+            job.progress = int((job.completed_items + job.failed_items) / job.total_items * 100)
+            self._remaining_items[job.id] -= 1
+            return self._remaining_items[job.id] == 0
+
+    def _finish_batch_job(
+        self,
+        job_id: str,
+        completion_callback: Optional[Callable[[str, BatchJob], None]],
+    ) -> None:
+        """Set the final status of a batch job once all its items are done"""
+        job = self.jobs[job_id]
+        try:
+            with self._processing_lock:
+                self._next_item.pop(job_id, None)
+                self._remaining_items.pop(job_id, None)
 
             # Update final job status
             if job.status == BatchStatus.CANCELLED:
@@ -263,45 +287,34 @@ class BatchProcessor:
                 completion_callback(job_id, job)
 
         except Exception as e:
-            logger.error(f"Error processing batch job {job_id}", error=e)
-            job.status = BatchStatus.FAILED
-            # Remove from active jobs
-            with self.current_jobs_lock:
-                self.current_jobs.discard(job_id)
-            if completion_callback:
-                completion_callback(job_id, job)
+            logger.error(f"Error finishing batch job {job_id}", error=e)
 
     def _process_batch_item(
         self,
         job_id: str,
         item: BatchItem,
-        semaphore: threading.Semaphore,
         progress_callback: Optional[Callable[[str, int, str], None]],
+        completion_callback: Optional[Callable[[str, BatchJob], None]],
     ) -> None:
         """Process a single item in the batch"""
-        semaphore.acquire()
+        job = self.jobs[job_id]
+        start_time = time.time()
 
         try:
-            job = self.jobs[job_id]
             if job.status == BatchStatus.CANCELLED:
                 return
 
-            start_time = time.time()
             logger.debug(f"Processing batch item: {item.id}")
 
             # Extract text using OCR
             if hasattr(self.ocr_processor, "extract_text"):
                 # Plugin interface
-                with self._lock:
-                    text, confidence = self.ocr_processor.extract_text(
-                        item.screenshot_data.image_bytes
-                    )
+                text, confidence = self.ocr_processor.extract_text(item.screenshot_data.image_bytes)
             else:
                 # Direct processor
-                with self._lock:
-                    text, confidence = self.ocr_processor.extract_text_from_image(
-                        item.screenshot_data.image
-                    )
+                text, confidence = self.ocr_processor.extract_text_from_image(
+                    item.screenshot_data.image
+                )
 
             if not text or not text.strip():
                 raise ValueError("No text found in image")
@@ -309,14 +322,12 @@ class BatchProcessor:
             # Translate text
             if hasattr(self.translation_processor, "translate"):
                 # Plugin interface
-                with self._lock:
-                    translation = self.translation_processor.translate(
-                        text, "auto", "en"  # Default to auto-detect -> English
-                    )
+                translation = self.translation_processor.translate(
+                    text, "auto", "en"  # Default to auto-detect -> English
+                )
             else:
                 # Direct processor
-                with self._lock:
-                    translation = self.translation_processor.translate_text(text, "en")
+                translation = self.translation_processor.translate_text(text, "en")
 
             if not translation:
                 raise ValueError("Translation failed")
@@ -336,11 +347,6 @@ class BatchProcessor:
             item.status = BatchStatus.COMPLETED
             item.processing_time = time.time() - start_time
 
-            # Update job progress
-            with self._processing_lock:
-                job.completed_items += 1
-                job.progress = int((job.completed_items + job.failed_items) / job.total_items * 100)
-
             logger.debug(f"Batch item {item.id} completed successfully")
 
         except Exception as e:
@@ -349,19 +355,19 @@ class BatchProcessor:
             item.status = BatchStatus.FAILED
             item.processing_time = time.time() - start_time
 
-            # Update job progress
-            with self._processing_lock:
-                job.failed_items += 1
-                job.progress = int((job.completed_items + job.failed_items) / job.total_items * 100)
-
             logger.error(f"Batch item {item.id} failed: {e}")
 
         finally:
+            last = self._count_item(job, item)
+
             # Call progress callback
             if progress_callback:
                 progress_callback(job_id, job.progress, f"Processed item {item.id}")
 
-            semaphore.release()
+            if last:
+                self._finish_batch_job(job_id, completion_callback)
+            else:
+                self._submit_next_item(job_id, progress_callback, completion_callback)
 
     def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
         """Clean up old completed jobs"""
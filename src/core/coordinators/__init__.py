@@ -13,12 +13,20 @@ Components:
 - SystemIntegration: System-level operations and cleanup
 """
 
-from .application_controller import ApplicationController
-from .batch_export_manager import BatchExportManager
-from .capture_orchestrator import CaptureOrchestrator
-from .system_integration import SystemIntegration
-from .translation_workflow import TranslationWorkflow
-from .ui_coordinator import UICoordinator
+from src.utils.lazy_import import lazy_exports
+
+# Coordinators are imported on first attribute access
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ApplicationController": ".application_controller",
+        "BatchExportManager": ".batch_export_manager",
+        "CaptureOrchestrator": ".capture_orchestrator",
+        "SystemIntegration": ".system_integration",
+        "TranslationWorkflow": ".translation_workflow",
+        "UICoordinator": ".ui_coordinator",
+    },
+)
 
 __all__ = [
     "ApplicationController",
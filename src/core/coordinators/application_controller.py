@@ -249,6 +249,8 @@ class ApplicationController(ConfigObserver):
 
     def shutdown(self) -> None:
         """Shutdown application"""
+        if hasattr(self.translation_processor, "save_memory"):
+            self.translation_processor.save_memory()
         self.system_integration.shutdown()
 
     # ConfigObserver implementation
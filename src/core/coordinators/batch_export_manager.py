@@ -15,7 +15,7 @@ import queue
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # Import filedialog only when needed to avoid tkinter dependency
 try:
@@ -44,6 +44,7 @@ except ImportError:
 from src.utils.export_manager import ExportManager
 from src.utils.logger import logger
 from src.utils.performance_monitor import get_performance_monitor
+from src.utils.streaming_export import get_stream_writer
 
 if TYPE_CHECKING:
     from src.ui.progress_indicator import ProgressInfo, ProgressManager
@@ -155,32 +156,18 @@ class BatchExportManager:
         return export_data
 
     def _write_export_file(self, data, format_type, output_path):
-        """Write export data to file."""
+        """Write export data to file (streamed; xlsx is written without pandas)."""
         try:
             if format_type == "json":
-                import json
-
-                with open(output_path, "w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=2)
-            elif format_type == "csv":
-                import csv
-
-                if data:
-                    with open(output_path, "w", newline="", encoding="utf-8") as f:
-                        writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(data)
-            elif format_type == "xlsx":
-                try:
-                    import pandas as pd
-
-                    df = pd.DataFrame(data)
-                    df.to_excel(output_path, index=False)
-                except ImportError:
-                    # Fallback to CSV if pandas not available
-                    csv_path = output_path.replace(".xlsx", ".csv")
-                    return self._write_export_file(data, "csv", csv_path)
+                writer = get_stream_writer("json", array_key=None, record_factory=dict)
+            elif data:
+                writer = get_stream_writer(
+                    format_type, columns=list(data[0].keys()), labels=None, record_factory=dict
+                )
+            else:
+                return True, f"Export completed: {output_path}"
 
+            writer.write(data, output_path)
             return True, f"Export completed: {output_path}"
 
         except Exception as e:
@@ -262,6 +249,7 @@ class BatchExportManager:
 
         # Export manager
         self.export_manager = ExportManager()
+        self._history_export_cancel: Optional[threading.Event] = None
 
         # Performance monitoring
         self.performance_monitor = get_performance_monitor()
@@ -380,11 +368,27 @@ class BatchExportManager:
         logger.info(f"Batch job {job_id} completed with status: {job.status}")
 
     def export_translation_history(
-        self, history: List[Translation], format_type: str = "json"
+        self,
+        history: Iterable[Translation],
+        format_type: str = "json",
+        total: Optional[int] = None,
     ) -> Optional[str]:
-        """Export translation history to file"""
+        """
+        Export translation history to file in the background.
+
+        Records are streamed to the file by a worker thread that reports
+        progress and stops when cancel_history_export() is called.
+
+        Args:
+            history: Translations to export (a list or a repository iterator)
+            format_type: Default format; the extension of the chosen file wins
+            total: Number of records for progress when history has no len()
+
+        Returns:
+            Target file path if the export was started
+        """
         try:
-            if not history:
+            if hasattr(history, "__len__") and len(history) == 0:
                 self.progress_manager.show_warning("No translation history to export")
                 return None
 
@@ -423,13 +427,25 @@ class BatchExportManager:
             else:
                 format_type = "json"
 
-            # Export
-            if self.export_manager.export_translations(history, file_path, format_type):
-                self.progress_manager.show_success(f"History exported to {Path(file_path).name}")
-                return file_path
-            else:
-                self.progress_manager.show_error("Export failed")
-                return None
+            cancel_event = threading.Event()
+            with self._lock:
+                if self._history_export_cancel is not None:
+                    self.progress_manager.show_warning("History export already running")
+                    return None
+                self._history_export_cancel = cancel_event
+                self.progress_manager.show_progress(
+                    title="Exporting History",
+                    message=f"Exporting to {Path(file_path).name}...",
+                    is_indeterminate=total is None and not hasattr(history, "__len__"),
+                )
+
+            threading.Thread(
+                target=self._run_history_export,
+                args=(history, file_path, format_type, total, cancel_event),
+                name="history_export",
+                daemon=True,
+            ).start()
+            return file_path
 
         except Exception as e:
             logger.error("Error exporting translation history", error=e)
@@ -437,6 +453,63 @@ class BatchExportManager:
                 self.progress_manager.show_error(f"Export failed: {str(e)}")
             return None
 
+    def cancel_history_export(self) -> bool:
+        """Stop a running history export; the partial file is removed"""
+        with self._lock:
+            if self._history_export_cancel is None:
+                return False
+            self._history_export_cancel.set()
+            return True
+
+    def _run_history_export(
+        self,
+        history: Iterable[Translation],
+        file_path: str,
+        format_type: str,
+        total: Optional[int],
+        cancel_event: threading.Event,
+    ) -> None:
+        """Stream the history to file on the export thread"""
+
+        def on_progress(written: int, expected: Optional[int]) -> None:
+            expected = expected or total
+            if expected:
+                self._on_batch_progress(
+                    "history_export",
+                    min(100, written * 100 // expected),
+                    f"Exported {written}/{expected} translations",
+                )
+
+        try:
+            exported = self.export_manager.export_translations(
+                history,
+                file_path,
+                format_type,
+                progress_callback=on_progress,
+                cancel_event=cancel_event,
+            )
+        finally:
+            with self._lock:
+                self._history_export_cancel = None
+                self.progress_manager.hide_progress()
+
+        with self._lock:
+            if exported:
+                self.progress_manager.show_success(f"History exported to {Path(file_path).name}")
+            elif cancel_event.is_set():
+                self.progress_manager.show_warning("History export cancelled")
+            else:
+                self.progress_manager.show_error("Export failed")
+
+    def _show_save_dialog(
+        self, file_types: List[Tuple[str, str]], initial_name: str
+    ) -> Optional[str]:
+        """Ask for an export file path (None without tkinter or if cancelled)"""
+        if filedialog is None:
+            logger.warning("File dialog not available")
+            return None
+        return filedialog.asksaveasfilename(filetypes=file_types, initialfile=initial_name) or None
+
     def export_batch_results(self, job_id: str, format_type: str = "html") -> Optional[str]:
         """Export batch job results to file"""
         try:
@@ -24,13 +24,17 @@ from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
 from src.core.events import EventType, publish_event
 from src.core.screenshot_engine import ScreenshotEngine
-from src.services.task_queue import TaskPriority, get_task_queue
+from src.services.task_queue import TaskLane, TaskPriority, get_task_queue
 from src.utils.exceptions import ScreenshotCaptureError
 from src.utils.logger import logger
 
 if TYPE_CHECKING:
     from src.ui.progress_indicator import ProgressManager
 
+# Hotkey captures that could not start within this many seconds are dropped:
+# the screen has likely changed and the user is no longer waiting for them
+INTERACTIVE_DEADLINE = 5.0
+
 
 class CaptureOrchestrator:
     """Coordinates screenshot capture and area selection operations"""
@@ -121,6 +125,8 @@ class CaptureOrchestrator:
                 args=(x1, y1, x2, y2),
                 name="process_area_capture",
                 priority=TaskPriority.HIGH,
+                lane=TaskLane.INTERACTIVE,
+                deadline=INTERACTIVE_DEADLINE,
                 callback=self._on_capture_success,
                 error_callback=self._on_capture_error_callback,
             )
@@ -156,6 +162,8 @@ class CaptureOrchestrator:
                 args=(screen_width, screen_height),
                 name="quick_translate_center",
                 priority=TaskPriority.HIGH,
+                lane=TaskLane.INTERACTIVE,
+                deadline=INTERACTIVE_DEADLINE,
                 callback=self._on_capture_success,
                 error_callback=self._on_capture_error_callback,
             )
@@ -180,6 +188,8 @@ class CaptureOrchestrator:
                 args=(screen_width, screen_height),
                 name="quick_translate_bottom",
                 priority=TaskPriority.HIGH,
+                lane=TaskLane.INTERACTIVE,
+                deadline=INTERACTIVE_DEADLINE,
                 callback=self._on_capture_success,
                 error_callback=self._on_capture_error_callback,
             )
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 import asyncio
 import io
 import os
@@ -5,17 +7,6 @@ import time
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 
-try:
-    from PIL import Image, ImageEnhance
-
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
-    from unittest.mock import Mock
-
-    Image = Mock()
-    ImageEnhance = Mock()
-
 from src.models.config import ImageProcessingConfig
 from src.models.screenshot_data import ScreenshotData
 from src.services.circuit_breaker import (
@@ -23,8 +14,25 @@ from src.services.circuit_breaker import (
     CircuitBreakerError,
     get_circuit_breaker_manager,
 )
+from src.services.capability_registry import (
+    binary_version,
+    get_capability_registry,
+    package_version,
+)
+from src.utils.lazy_import import lazy_import
 from src.utils.logger import logger
 
+# PIL is loaded on first use
+Image = lazy_import("PIL.Image")
+ImageEnhance = lazy_import("PIL.ImageEnhance")
+PIL_AVAILABLE = Image is not None
+
+if not PIL_AVAILABLE:
+    from unittest.mock import Mock
+
+    Image = Mock()
+    ImageEnhance = Mock()
+
 
 class OCREngine(ABC):
     """Abstract base class for OCR engines"""
@@ -51,6 +59,15 @@ class TesseractOCR(OCREngine):
         manager = get_circuit_breaker_manager()
         self.circuit_breaker = manager.create_circuit_breaker("tesseract_ocr", OCR_SERVICE_CONFIG)
 
+        # Probe results are cached per tesseract binary and pytesseract version
+        self.capabilities = get_capability_registry()
+        self.capabilities.register(
+            "tesseract_ocr",
+            self._probe,
+            version=f"{binary_version(self.tesseract_cmd)}|{package_version('pytesseract')}",
+        )
+
+        # Probes only when there is no cached result for this binary/package version
         if self.is_available():
             logger.info(
                 f"Tesseract OCR initialized with circuit breaker protection: {self.tesseract_cmd}"
@@ -83,10 +100,14 @@ class TesseractOCR(OCREngine):
                 logger.error("pytesseract module not available")
 
     def is_available(self) -> bool:
-        """Check if Tesseract is available"""
+        """Check if Tesseract is available (probed once, then cached)"""
         if not self.tesseract_cmd:
             return False
 
+        return self.capabilities.check("tesseract_ocr")
+
+    def _probe(self) -> bool:
+        """Run a test recognition to verify Tesseract works"""
         try:
             import pytesseract
 
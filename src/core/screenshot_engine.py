@@ -3,12 +3,14 @@ import time
 from datetime import datetime
 from typing import Optional, Tuple
 
-try:
-    from PIL import Image, ImageGrab
+from src.utils.lazy_import import lazy_import
 
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# PIL is loaded on first capture
+Image = lazy_import("PIL.Image")
+ImageGrab = lazy_import("PIL.ImageGrab")
+PIL_AVAILABLE = Image is not None and ImageGrab is not None
+
+if not PIL_AVAILABLE:
     from unittest.mock import Mock
 
     # Mock objects for when PIL is not available
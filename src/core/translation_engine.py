@@ -1,4 +1,5 @@
 import asyncio
+import os
 import time
 from abc import ABC, abstractmethod
 from datetime import datetime
@@ -6,11 +7,14 @@ from typing import List, Optional
 
 from src.models.translation import Translation
 from src.services.cache_service import TranslationCache
+from src.services.capability_registry import get_capability_registry
+from src.services.chunked_translation import ChunkedTranslator
 from src.services.circuit_breaker import (
     TRANSLATION_SERVICE_CONFIG,
     CircuitBreakerError,
     get_circuit_breaker_manager,
 )
+from src.services.translation_memory import TranslationMemory
 from src.utils.exceptions import (
     TranslationEngineNotAvailableError,
     TranslationFailedError,
@@ -50,6 +54,11 @@ class GoogleTranslationEngine(TranslationEngine):
         self.circuit_breaker = manager.create_circuit_breaker(
             "google_translate", TRANSLATION_SERVICE_CONFIG
         )
+        self.chunker = ChunkedTranslator(self._translate_chunk)
+
+        get_capability_registry().record(
+            "google_translate", self.is_available(), version=self.translator_type
+        )
 
         if self.is_available():
             logger.info("Google Translation Engine initialized with circuit breaker protection")
@@ -115,18 +124,27 @@ class GoogleTranslationEngine(TranslationEngine):
         self, text: str, target_language: str, source_language: str
     ) -> Optional[str]:
         """Execute the actual translation with circuit breaker protection."""
-
-        async def _translate():
-            return self._perform_translation(text, target_language, source_language)
-
-        # Run the protected translation
+        # Run the protected translation; long texts are split into chunks
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
         try:
-            return loop.run_until_complete(self.circuit_breaker.call(_translate))
+            return loop.run_until_complete(
+                self.chunker.translate(text, target_language, source_language)
+            )
         finally:
             loop.close()
 
+    async def _translate_chunk(self, text: str, target_language: str, source_language: str) -> str:
+        """Translate one request of packed chunks through the circuit breaker."""
+
+        async def _translate():
+            # Blocking client call; run in a thread so chunks overlap
+            return await asyncio.get_running_loop().run_in_executor(
+                None, self._perform_translation, text, target_language, source_language
+            )
+
+        return await self.circuit_breaker.call(_translate)
+
     def _perform_translation(self, text: str, target_language: str, source_language: str) -> str:
         """Perform translation using the appropriate translator library."""
         if self.translator_type == "googletrans":
@@ -167,12 +185,25 @@ class GoogleTranslationEngine(TranslationEngine):
 class TranslationProcessor:
     """Main translation processing class with caching"""
 
-    def __init__(self, cache_enabled: bool = True):
+    # Fuzzy memory matches are suggestions; their confidence is scaled down
+    SUGGESTION_CONFIDENCE_FACTOR = 0.5
+
+    def __init__(
+        self,
+        cache_enabled: bool = True,
+        fuzzy_threshold: Optional[float] = None,
+        memory_path: Optional[str] = None,
+    ):
         self.engines = [GoogleTranslationEngine()]  # Can add more engines
         self.active_engine = self._get_available_engine()
         self.cache = TranslationCache() if cache_enabled else None
         self.cache_enabled = cache_enabled
 
+        # Sentence-level translation memory consulted after the exact cache
+        self.fuzzy_threshold = fuzzy_threshold
+        self.memory_path = memory_path
+        self.memory = self._create_memory() if cache_enabled else None
+
         if self.active_engine:
             logger.info(
                 f"Translation processor initialized with {type(self.active_engine).__name__}"
@@ -180,6 +211,28 @@ class TranslationProcessor:
         else:
             logger.error("No translation engines available")
 
+    def _create_memory(self) -> TranslationMemory:
+        """Create the translation memory, restoring saved segments if any"""
+        memory = TranslationMemory(fuzzy_threshold=self.fuzzy_threshold)
+        if self.memory_path:
+            loaded = memory.load(self.memory_path)
+            if loaded:
+                logger.info(f"Loaded {loaded} translation memory segments")
+        return memory
+
+    def save_memory(self) -> int:
+        """Save the translation memory to memory_path; returns the number of segments"""
+        if self.memory is None or not self.memory_path:
+            return 0
+        try:
+            directory = os.path.dirname(self.memory_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            return self.memory.save(self.memory_path)
+        except OSError as e:
+            logger.warning(f"Failed to save translation memory: {e}")
+            return 0
+
     def _get_available_engine(self) -> Optional[TranslationEngine]:
         """Get first available translation engine"""
         for engine in self.engines:
@@ -212,6 +265,38 @@ class TranslationProcessor:
                 )
                 return cached_translation
 
+        # Then the translation memory (sentences, numbers, near matches)
+        if self.memory is not None:
+            match = self.memory.lookup(text, target_language, source_language)
+            if match:
+                confidence = match.score
+                metadata = {"memory_match": match.kind}
+                if match.suggestion:
+                    confidence *= self.SUGGESTION_CONFIDENCE_FACTOR
+                    metadata.update(suggestion=True, similarity=match.score)
+                translation = Translation(
+                    original_text=text,
+                    translated_text=match.translated_text,
+                    source_language=source_language,
+                    target_language=target_language,
+                    timestamp=datetime.now(),
+                    confidence=confidence,
+                    cached=True,
+                    metadata=metadata,
+                )
+                # Suggestions are not cached as if they were translations of text
+                if self.cache and not match.suggestion:
+                    self.cache.set(text, target_language, translation)
+                logger.log_translation(
+                    original=text,
+                    translated=match.translated_text,
+                    source_lang=source_language,
+                    target_lang=target_language,
+                    duration=time.time() - start_time,
+                    cached=True,
+                )
+                return translation
+
         # Perform translation
         try:
             translated_text = self.active_engine.translate(text, target_language, source_language)
@@ -232,6 +317,8 @@ class TranslationProcessor:
             # Cache the translation
             if self.cache:
                 self.cache.set(text, target_language, translation)
+            if self.memory is not None:
+                self.memory.add(text, translated_text, source_language, target_language)
 
             duration = time.time() - start_time
             logger.log_translation(
@@ -268,6 +355,9 @@ class TranslationProcessor:
 
     def clear_cache(self) -> bool:
         """Clear translation cache"""
+        if self.memory is not None:
+            self.memory.clear()
+            self.save_memory()
         if self.cache:
             self.cache.clear()
             logger.info("Translation cache cleared")
@@ -277,7 +367,10 @@ class TranslationProcessor:
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
         if self.cache:
-            return self.cache.get_stats()
+            stats = self.cache.get_stats()
+            if self.memory is not None:
+                stats["memory"] = self.memory.get_stats()
+            return stats
         return {"cache_enabled": False}
 
     def enable_cache(self, enabled: bool = True):
@@ -289,6 +382,13 @@ class TranslationProcessor:
             self.cache = None
             logger.info("Translation cache disabled")
 
+        # The translation memory is a cache too
+        if enabled and self.memory is None:
+            self.memory = self._create_memory()
+        elif not enabled and self.memory is not None:
+            self.save_memory()
+            self.memory = None
+
         self.cache_enabled = enabled
 
     def get_engine_info(self) -> dict:
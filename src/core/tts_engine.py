@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from src.models.config import TTSConfig
+from src.services.capability_registry import get_capability_registry
 from src.utils.logger import logger
 
 
@@ -53,6 +54,7 @@ class PyttsxEngine(TTSEngine):
             self.engine = None
             self.is_speaking = False
         self._initialize()
+        get_capability_registry().record("pyttsx3_tts", self.is_available())
 
         if self.is_available():
             logger.info("pyttsx3 TTS Engine initialized")
@@ -12,6 +12,7 @@ from .command_handlers import (
     TranslationCommandHandler,
     TTSCommandHandler,
 )
+from .query_cache import QueryCache
 from .query_handlers import (
     ConfigQueryHandler,
     PerformanceQueryHandler,
@@ -28,4 +29,5 @@ __all__ = [
     "TranslationQueryHandler",
     "PerformanceQueryHandler",
     "ConfigQueryHandler",
+    "QueryCache",
 ]
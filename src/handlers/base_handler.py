@@ -5,12 +5,15 @@ Base handler classes for CQRS architecture.
 import asyncio  # noqa: F401
 import time
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
 from src.commands.base_command import Command, CommandResult
 from src.queries.base_query import Query, QueryResult
 from src.utils.logger import logger
 
+if TYPE_CHECKING:
+    from src.handlers.query_cache import QueryCache
+
 # Type variables for generic handlers
 TCommand = TypeVar("TCommand", bound=Command)
 TCommandResult = TypeVar("TCommandResult")
@@ -118,16 +121,17 @@ class CommandHandler(ABC, Generic[TCommand, TCommandResult]):
 class QueryHandler(ABC, Generic[TQuery, TQueryResult]):
     """Base class for query handlers."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, cache: Optional["QueryCache"] = None):
         self.name = name
+        self.cache = cache
         self.execution_count = 0
         self.error_count = 0
         self.total_execution_time = 0.0
         self.cache_hits = 0
 
     async def handle(self, query: TQuery) -> QueryResult[TQueryResult]:
-        """Handle query execution with timing and error handling."""
-        start_time = time.time()
+        """Handle query execution with caching, timing and error handling."""
+        start_time = time.perf_counter()
 
         try:
             # Validate query
@@ -143,17 +147,32 @@ class QueryHandler(ABC, Generic[TQuery, TQueryResult]):
                 handler=self.name,
             )
 
+            # Serve equivalent queries from cache until the data changes
+            cacheable = self.cache is not None and self._is_cacheable(query)
+            if cacheable:
+                cached = self.cache.get(query)
+                if cached is not None:
+                    execution_time = (time.perf_counter() - start_time) * 1000
+                    cached.execution_time_ms = execution_time
+                    self.execution_count += 1
+                    self.cache_hits += 1
+                    self.total_execution_time += execution_time
+                    return cached
+                generation = self.cache.generation
+
             # Execute query
             result = await self._execute(query)
 
             # Update metrics
-            execution_time = (time.time() - start_time) * 1000  # Convert to ms
+            execution_time = (time.perf_counter() - start_time) * 1000  # Convert to ms
             result.execution_time_ms = execution_time
 
             self.execution_count += 1
             self.total_execution_time += execution_time
 
             if result.success:
+                if cacheable:
+                    self.cache.put(query, result, generation)
                 logger.debug(
                     f"Query executed successfully: {query.get_query_type()}",
                     query_id=query.query_id,
@@ -172,7 +191,7 @@ class QueryHandler(ABC, Generic[TQuery, TQueryResult]):
             return result
 
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter() - start_time) * 1000
             self.error_count += 1
             self.execution_count += 1
             self.total_execution_time += execution_time
@@ -195,6 +214,10 @@ class QueryHandler(ABC, Generic[TQuery, TQueryResult]):
         """Execute the specific query logic."""
         pass
 
+    def _is_cacheable(self, query: TQuery) -> bool:
+        """Check if results may be cached; override for data without write events."""
+        return True
+
     def get_metrics(self) -> dict:
         """Get handler performance metrics."""
         avg_execution_time = (
@@ -215,4 +238,5 @@ class QueryHandler(ABC, Generic[TQuery, TQueryResult]):
             "avg_execution_time_ms": avg_execution_time,
             "cache_hits": self.cache_hits,
             "cache_hit_rate": cache_hit_rate,
+            "cache": self.cache.get_stats() if self.cache is not None else None,
         }
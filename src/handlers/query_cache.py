@@ -0,0 +1,122 @@
+"""
+Query result cache for CQRS query handlers.
+
+Results are keyed by a fingerprint of the query parameters (query_id and
+timestamp excluded) and dropped as soon as a watched repository reports a
+write.
+"""
+
+import dataclasses
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from src.queries.base_query import Query, QueryResult
+from src.utils.logger import logger
+
+# Fields that differ between otherwise identical queries
+_VOLATILE_FIELDS = ("query_id", "timestamp")
+
+
+class QueryCache:
+    """Thread-safe LRU cache of successful query results."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_entries: Maximum number of cached results
+            ttl_seconds: Optional expiry, for data not covered by write events
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, QueryResult]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def fingerprint(query: Query) -> str:
+        """Stable hash of the query type and parameters."""
+        params = dataclasses.asdict(query)
+        for name in _VOLATILE_FIELDS:
+            params.pop(name, None)
+        payload = json.dumps(
+            [query.get_query_type(), params], sort_keys=True, default=str, ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+    def get(self, query: Query) -> Optional[QueryResult]:
+        """Get a copy of the cached result for an equivalent query."""
+        key = self.fingerprint(query)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or self._expired(entry[0]):
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            result = entry[1]
+
+        data = list(result.data) if isinstance(result.data, list) else result.data
+        return dataclasses.replace(
+            result,
+            data=data,
+            timestamp=datetime.now(),
+            metadata={**result.metadata, "cache_hit": True},
+        )
+
+    def put(self, query: Query, result: QueryResult, generation: Optional[int] = None) -> None:
+        """
+        Cache a result.
+
+        Args:
+            query: Executed query
+            result: Its result
+            generation: self.generation read before executing; the result is
+                dropped if a write happened meanwhile
+        """
+        key = self.fingerprint(query)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, action: str = "", entity_id: Optional[str] = None) -> None:
+        """Drop all results; signature matches repository change listeners."""
+        with self._lock:
+            self.generation += 1
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+        logger.debug(f"Query cache invalidated ({action or 'manual'})")
+
+    def watch(self, repository: Any) -> None:
+        """Invalidate on every write to the repository."""
+        repository.add_change_listener(self.invalidate)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "invalidations": self.invalidations,
+            }
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds
@@ -1,31 +1,295 @@
 """Query handlers for CQRS pattern."""
 
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
 from src.handlers.base_handler import QueryHandler
+from src.handlers.query_cache import QueryCache
+from src.models.translation import Translation
 from src.queries.base_query import Query, QueryResult
+from src.queries.performance_queries import GetPerformanceMetricsQuery, GetUsageStatsQuery
+from src.queries.translation_queries import GetTranslationHistoryQuery, SearchTranslationsQuery
+from src.repositories.translation_repository import (
+    SORT_KEYS,
+    FileTranslationRepository,
+    SortKey,
+)
+from src.utils.metrics_core import LatencyHistogram
+
+if TYPE_CHECKING:
+    from src.utils.performance_monitor import PerformanceMonitor
+
+# search_in -> index fields
+SEARCH_FIELDS = {
+    "original": ("original",),
+    "translated": ("translated",),
+    "both": ("original", "translated"),
+}
+
+# GetPerformanceMetricsQuery metric types -> PerformanceMonitor operations
+METRIC_OPERATIONS = {
+    "ocr": "ocr_extraction",
+    "translation": "translation",
+    "tts": "tts",
+    "screenshot": "screenshot_capture",
+}
+
+
+def encode_cursor(key: SortKey) -> str:
+    """Encode the sort key of a page's last item as an opaque cursor."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    """Decode a cursor produced by encode_cursor()."""
+    try:
+        value, translation_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return float(value), str(translation_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+class RepositoryQueryHandler(QueryHandler):
+    """Query handler reading from a translation repository."""
+
+    def __init__(
+        self,
+        name: str,
+        repository: Optional[FileTranslationRepository] = None,
+        cache: Optional[QueryCache] = None,
+    ):
+        super().__init__(name, cache if cache is not None else QueryCache())
+        self._repository = repository
+        if repository is not None:
+            self.cache.watch(repository)
 
+    @property
+    def repository(self) -> FileTranslationRepository:
+        """Repository, resolved from the service container on first use."""
+        if self._repository is None:
+            from src.repositories import TranslationRepository
+            from src.services.container import container
 
-class TranslationQueryHandler(QueryHandler):
+            try:
+                self._repository = container.get(TranslationRepository)
+            except ValueError:
+                self._repository = FileTranslationRepository()
+            self.cache.watch(self._repository)
+        return self._repository
+
+    async def handle(self, query: Query) -> QueryResult:
+        """Pick up writes made by other repository instances before serving a query."""
+        self.repository.reload_if_changed()
+        return await super().handle(query)
+
+
+class TranslationQueryHandler(RepositoryQueryHandler):
     """Handler for translation-related queries."""
 
-    def __init__(self):
-        super().__init__("TranslationQueryHandler")
+    def __init__(
+        self,
+        repository: Optional[FileTranslationRepository] = None,
+        cache: Optional[QueryCache] = None,
+    ):
+        super().__init__("TranslationQueryHandler", repository, cache)
 
     async def _execute(self, query: Query) -> QueryResult:
         """Execute translation queries."""
-        # Mock implementation for testing
-        return QueryResult.success_result(data=[{"translation": "data"}], total_count=1)
+        if isinstance(query, GetTranslationHistoryQuery):
+            criteria = {}
+            if query.language_filter:
+                criteria["target_language"] = query.language_filter
+            # Failed translations are never persisted, so include_failed has no effect
+            return await self._run(query, criteria=criteria)
+
+        if isinstance(query, SearchTranslationsQuery):
+            return await self._search(query)
+
+        return QueryResult.error_result(f"Unsupported query: {query.get_query_type()}")
+
+    async def _search(self, query: SearchTranslationsQuery) -> QueryResult:
+        fields = SEARCH_FIELDS[query.search_in]
+        checks: List[Callable[[Translation], bool]] = []
+
+        # The index is case- and accent-insensitive; stricter modes are checked per candidate
+        if query.exact_match or query.case_sensitive:
+            needle = query.normalized_search_text
+            texts = {"original": "original_text", "translated": "translated_text"}
+
+            def contains(t: Translation) -> bool:
+                for field in fields:
+                    text = getattr(t, texts[field])
+                    if not query.case_sensitive:
+                        text = text.lower()
+                    if needle in text:
+                        return True
+                return False
+
+            checks.append(contains)
 
+        if query.min_confidence is not None:
+            min_confidence = query.min_confidence
+            checks.append(lambda t: t.confidence is not None and t.confidence >= min_confidence)
 
-class PerformanceQueryHandler(QueryHandler):
+        predicate = (lambda t: all(check(t) for check in checks)) if checks else None
+        return await self._run(
+            query,
+            text=query.search_text,
+            fields=fields,
+            exact=query.exact_match,
+            predicate=predicate,
+        )
+
+    async def _run(self, query: Query, **search: Any) -> QueryResult:
+        """Push filtering, sorting and pagination of a query down to the repository."""
+        criteria: Dict[str, Any] = dict(search.pop("criteria", None) or {})
+        since = until = None
+        if query.filtering:
+            criteria.update(query.filtering.filters)
+            since, until = query.filtering.date_from, query.filtering.date_to
+
+        sort_field, descending = "timestamp", True
+        if query.sorting:
+            sort_field = query.sorting.field
+            descending = query.sorting.direction == "desc"
+            if sort_field not in SORT_KEYS:
+                return QueryResult.error_result(f"Unsupported sort field: {sort_field}")
+
+        offset, limit, after = 0, getattr(query, "limit", None), None
+        if query.pagination:
+            limit = query.pagination.limit
+            if query.pagination.cursor:
+                try:
+                    after = decode_cursor(query.pagination.cursor)
+                except ValueError as e:
+                    return QueryResult.error_result(str(e))
+            else:
+                offset = query.pagination.offset
+
+        page, total = await self.repository.query(
+            criteria=criteria,
+            since=since,
+            until=until,
+            sort_field=sort_field,
+            descending=descending,
+            limit=limit,
+            offset=offset,
+            after=after,
+            **search,
+        )
+
+        metadata: Dict[str, Any] = {"cache_hit": False}
+        if query.pagination:
+            metadata["has_more"] = total > offset + len(page)
+            if page and metadata["has_more"]:
+                last = page[-1]
+                metadata["next_cursor"] = encode_cursor((SORT_KEYS[sort_field](last), last.id))
+        return QueryResult.success_result(
+            data=[translation.to_dict() for translation in page],
+            total_count=total,
+            metadata=metadata,
+        )
+
+
+class PerformanceQueryHandler(RepositoryQueryHandler):
     """Handler for performance-related queries."""
 
-    def __init__(self):
-        super().__init__("PerformanceQueryHandler")
+    def __init__(
+        self,
+        repository: Optional[FileTranslationRepository] = None,
+        cache: Optional[QueryCache] = None,
+        monitor: Optional["PerformanceMonitor"] = None,
+    ):
+        super().__init__("PerformanceQueryHandler", repository, cache)
+        self._monitor = monitor
+
+    @property
+    def monitor(self) -> "PerformanceMonitor":
+        """Performance monitor, the global one unless given."""
+        if self._monitor is None:
+            from src.utils.performance_monitor import get_performance_monitor
+
+            self._monitor = get_performance_monitor()
+        return self._monitor
 
     async def _execute(self, query: Query) -> QueryResult:
         """Execute performance queries."""
-        # Mock implementation for testing
-        return QueryResult.success_result(data=[{"performance": "metrics"}], total_count=1)
+        if isinstance(query, GetUsageStatsQuery):
+            return await self._usage_stats(query)
+
+        if isinstance(query, GetPerformanceMetricsQuery):
+            return await self._performance_metrics(query)
+
+        return QueryResult.error_result(f"Unsupported query: {query.get_query_type()}")
+
+    def _is_cacheable(self, query: Query) -> bool:
+        # Monitor metrics change without repository write events
+        return not isinstance(query, GetPerformanceMetricsQuery)
+
+    async def _usage_stats(self, query: GetUsageStatsQuery) -> QueryResult:
+        since = datetime.now() - timedelta(days=query.time_range_days)
+        rollups = self.repository.usage_rollups()
+        total = rollups.summary("translations", since).count
+
+        data: Dict[str, Any] = {
+            "time_range_days": query.time_range_days,
+            "group_by": query.group_by,
+            "total_translations": total,
+            "periods": [
+                {"period": label, "translations": h.count, "characters": int(h.total)}
+                for label, h in rollups.timeline("translations", since, group_by=query.group_by)
+            ],
+            "language_pairs": {
+                pair: h.count
+                for pair, h in sorted(
+                    rollups.breakdown("translations", since).items(),
+                    key=lambda item: item[1].count,
+                    reverse=True,
+                )
+                if h.count
+            },
+        }
+        if query.include_features:
+            data["features"] = {
+                feature: rollups.summary(feature, since).count
+                for feature in ("cached", "with_confidence")
+            }
+        return QueryResult.success_result(data=data, total_count=total)
+
+    async def _performance_metrics(self, query: GetPerformanceMetricsQuery) -> QueryResult:
+        since = datetime.now() - timedelta(days=query.time_range_days)
+        rollups = self.monitor.rollups
+        recorded = rollups.operations()
+
+        data: Dict[str, Any] = {}
+        for metric_type in query.metric_types or []:
+            if metric_type == "overall":
+                operations = recorded
+            else:
+                operations = [METRIC_OPERATIONS[metric_type]]
+
+            merged = LatencyHistogram()
+            for operation in operations:
+                merged.merge(rollups.summary(operation, since))
+            metric = merged.summary()
+
+            if query.include_breakdown and metric_type != "overall":
+                operation = operations[0]
+                metric["daily"] = [
+                    {"period": label, **h.summary()}
+                    for label, h in rollups.timeline(operation, since, group_by="day")
+                ]
+                metric["language_pairs"] = {
+                    pair: h.summary()
+                    for pair, h in rollups.breakdown(operation, since).items()
+                    if pair is not None and h.count
+                }
+            data[metric_type] = metric
+
+        return QueryResult.success_result(data=data, total_count=len(data))
 
 
 class ConfigQueryHandler(QueryHandler):
@@ -42,10 +42,10 @@ class TranslationCacheIntegration:
 
                 # Check if entry is expired
                 if time.time() - entry["timestamp"] < self.ttl_seconds:
-                    logger.debug(f"Cache hit for translation: {cache_key}")
+                    logger.debug("Cache hit for translation: %s", cache_key)
                     return entry["translation"]
                 else:
-                    logger.debug(f"Cache entry expired: {cache_key}")
+                    logger.debug("Cache entry expired: %s", cache_key)
 
             return None
 
@@ -77,7 +77,7 @@ class TranslationCacheIntegration:
             with open(self.cache_path, "w", encoding="utf-8") as f:
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
 
-            logger.debug(f"Translation cached: {cache_key}")
+            logger.debug("Translation cached: %s", cache_key)
 
         except Exception as e:
             logger.error(f"Cache storage failed: {e}")
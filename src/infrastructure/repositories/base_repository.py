@@ -5,8 +5,11 @@ Base repository implementation.
 import json
 import sqlite3
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from ...utils.translation_archive import ArchiveReader, ArchiveWriter, Schema
 
 
 class BaseRepository(ABC):
@@ -42,3 +45,23 @@ class BaseRepository(ABC):
                 return json.load(f)
         except Exception:
             return []
+
+    def _save_to_archive(
+        self, filename: str, records: Iterable[Dict[str, Any]], schema: Schema
+    ) -> int:
+        """Save records to a compact columnar archive."""
+        with ArchiveWriter(str(self.storage_path / filename), schema) as writer:
+            return writer.write_many(records)
+
+    def _iter_archive(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """Iterate over archive records block by block, timestamps as ISO strings."""
+        file_path = self.storage_path / filename
+        if not file_path.exists():
+            return
+
+        with ArchiveReader(str(file_path)) as reader:
+            for record in reader.iter_records():
+                for key, value in record.items():
+                    if isinstance(value, datetime):
+                        record[key] = value.isoformat()
+                yield record
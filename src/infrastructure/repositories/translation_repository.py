@@ -5,14 +5,29 @@ Translation repository implementation.
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from ...domain.entities.translation import Translation
 from ...domain.protocols.repositories import TranslationRepository
 from ...domain.value_objects.language import Language, LanguagePair
 from ...domain.value_objects.text import Text, TranslatedText
+from ...utils.search_index import TranslationSearchIndex
+from ...utils.translation_archive import ColumnType
 from .base_repository import BaseRepository
 
+# Archive columns of stored translation records
+ARCHIVE_SCHEMA = (
+    ("id", ColumnType.STRING),
+    ("original", ColumnType.STRING),
+    ("translated", ColumnType.STRING),
+    ("source_language", ColumnType.DICT),
+    ("target_language", ColumnType.DICT),
+    ("timestamp", ColumnType.TIMESTAMP),
+    ("duration_ms", ColumnType.FLOAT),
+    ("cached", ColumnType.BOOL),
+    ("confidence", ColumnType.FLOAT),
+)
+
 
 class JsonTranslationRepository(BaseRepository, TranslationRepository):
     """JSON-based translation repository."""
@@ -20,6 +35,9 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
     def __init__(self, storage_path: Optional[Path] = None):
         super().__init__(storage_path)
         self._translations_file = "translations.json"
+        self._index = TranslationSearchIndex()
+        self._records: Dict[str, dict] = {}
+        self._index_mtime: Optional[float] = None
 
     async def save(self, translation: Translation) -> None:
         """Save translation to storage."""
@@ -51,11 +69,20 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
             translations.append(translation_dict)
 
         # Keep only last 1000 translations
+        dropped: List[dict] = []
         if len(translations) > 1000:
+            dropped = translations[:-1000]
             translations = translations[-1000:]
 
+        index_current = self._index_is_current()
         self._save_to_json(self._translations_file, translations)
 
+        if index_current:
+            for old_dict in dropped:
+                self._unindex(old_dict.get("id"))
+            self._index_record(translation_dict)
+            self._index_mtime = self._file_mtime()
+
     async def get_by_id(self, translation_id: str) -> Optional[Translation]:
         """Get translation by ID."""
         translations = self._load_translations()
@@ -89,26 +116,48 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
 
     async def search(self, text: str, limit: int = 50) -> List[Translation]:
         """Search translations by text."""
-        translations = self._load_translations()
-        search_text = text.lower()
+        self._ensure_index()
 
         matches = []
-        for translation_dict in translations:
-            original = translation_dict.get("original", "").lower()
-            translated = translation_dict.get("translated", "").lower()
+        for translation_id in self._index.search(text, prefix=True):
+            try:
+                translation = self._dict_to_translation(self._records[translation_id])
+                if translation:
+                    matches.append(translation)
+            except Exception:
+                continue
+            if len(matches) >= limit:
+                break
 
-            if search_text in original or search_text in translated:
-                try:
-                    translation = self._dict_to_translation(translation_dict)
-                    if translation:
-                        matches.append(translation)
-                except Exception:
-                    continue
+        return matches
 
-        # Sort by timestamp (most recent first)
-        matches.sort(key=lambda x: x.timestamp, reverse=True)
+    def iter_all(self) -> Iterator[Translation]:
+        """
+        Iterate over all stored translations in storage order.
+
+        Entities are created lazily, one at a time, so streaming exporters
+        never hold a second full copy of the history.
+        """
+        for translation_dict in self._load_translations():
+            translation = self._dict_to_translation(translation_dict)
+            if translation:
+                yield translation
+
+    def save_archive(self, filename: str = "translations.stra") -> int:
+        """
+        Write the stored history to a compact archive in the storage directory.
+
+        Returns:
+            Number of archived translations
+        """
+        return self._save_to_archive(filename, self._load_translations(), ARCHIVE_SCHEMA)
 
-        return matches[:limit]
+    def iter_archive(self, filename: str = "translations.stra") -> Iterator[Translation]:
+        """Iterate over translations of an archive without loading it whole."""
+        for translation_dict in self._iter_archive(filename):
+            translation = self._dict_to_translation(translation_dict)
+            if translation:
+                yield translation
 
     async def clear_all(self) -> int:
         """Clear all translations."""
@@ -116,6 +165,9 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
         count = len(translations)
 
         self._save_to_json(self._translations_file, [])
+        self._index.clear()
+        self._records.clear()
+        self._index_mtime = self._file_mtime()
 
         return count
 
@@ -123,6 +175,56 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
         """Load translations from storage."""
         return self._load_from_json(self._translations_file)
 
+    def _file_mtime(self) -> Optional[float]:
+        """Get modification time of the translations file."""
+        try:
+            return (self.storage_path / self._translations_file).stat().st_mtime
+        except OSError:
+            return None
+
+    def _index_is_current(self) -> bool:
+        """Check whether the search index reflects the file on disk."""
+        return self._index_mtime is not None and self._index_mtime == self._file_mtime()
+
+    def _ensure_index(self) -> None:
+        """(Re)build the search index if the file changed outside this instance."""
+        if self._index_is_current():
+            return
+
+        self._index.clear()
+        self._records.clear()
+        for translation_dict in self._load_translations():
+            self._index_record(translation_dict)
+        self._index_mtime = self._file_mtime()
+
+    def _index_record(self, translation_dict: dict) -> None:
+        """Add a stored translation record to the search index."""
+        if not translation_dict.get("id"):
+            return
+        translation_id = str(translation_dict["id"])
+
+        timestamp_str = translation_dict.get("timestamp")
+        try:
+            timestamp = datetime.fromisoformat(timestamp_str) if timestamp_str else None
+        except ValueError:
+            timestamp = None
+
+        self._records[translation_id] = {**translation_dict, "id": translation_id}
+        self._index.add(
+            translation_id,
+            translation_dict.get("original", ""),
+            translation_dict.get("translated", ""),
+            translation_dict.get("source_language", ""),
+            translation_dict.get("target_language", ""),
+            timestamp,
+        )
+
+    def _unindex(self, translation_id: Optional[str]) -> None:
+        """Remove a translation record from the search index."""
+        if translation_id:
+            self._records.pop(str(translation_id), None)
+            self._index.remove(str(translation_id))
+
     def _dict_to_translation(self, translation_dict: dict) -> Optional[Translation]:
         """Convert dictionary to Translation entity."""
         try:
@@ -138,7 +240,7 @@ class JsonTranslationRepository(BaseRepository, TranslationRepository):
             # Create texts
             original = Text(translation_dict["original"])
             confidence = translation_dict.get("confidence")
-            translated = TranslatedText(translation_dict["translated"], confidence)
+            translated = TranslatedText(translation_dict["translated"], confidence=confidence)
 
             # Create translation
             translation = Translation(
@@ -1,7 +1,7 @@
 import json
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 
 @dataclass
@@ -33,6 +33,7 @@ class FeaturesConfig:
     copy_to_clipboard: bool = True
     cache_translations: bool = True
     save_debug_screenshots: bool = False
+    translation_memory_fuzzy_threshold: Optional[float] = None  # None disables fuzzy matches
 
 
 @dataclass
@@ -0,0 +1,231 @@
+"""
+Plugin manifest cache for Screen Translator v2.0.
+Records plugin metadata per source file so plugins can be listed and selected
+without importing their modules.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.plugins.base_plugin import PluginMetadata, PluginType
+from src.utils.logger import logger
+
+MANIFEST_CACHE_VERSION = 1
+
+
+@dataclass
+class PluginManifest:
+    """Import-free description of a plugin found on disk."""
+
+    name: str
+    version: str
+    description: str
+    author: str
+    plugin_type: PluginType
+    class_name: str
+    module_name: str
+    source_path: str
+    dependencies: List[str] = field(default_factory=list)
+    config_schema: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_metadata(
+        cls, metadata: PluginMetadata, class_name: str, module_name: str, source_path: str
+    ) -> "PluginManifest":
+        """Create manifest from the metadata of a loaded plugin."""
+        return cls(
+            name=metadata.name,
+            version=metadata.version,
+            description=metadata.description,
+            author=metadata.author,
+            plugin_type=metadata.plugin_type,
+            class_name=class_name,
+            module_name=module_name,
+            source_path=source_path,
+            dependencies=list(metadata.dependencies or []),
+            config_schema=dict(metadata.config_schema or {}),
+        )
+
+    def to_metadata(self) -> PluginMetadata:
+        """Convert manifest back to plugin metadata."""
+        return PluginMetadata(
+            name=self.name,
+            version=self.version,
+            description=self.description,
+            author=self.author,
+            plugin_type=self.plugin_type,
+            dependencies=list(self.dependencies),
+            config_schema=dict(self.config_schema),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert manifest to a JSON-serializable dictionary."""
+        data = asdict(self)
+        data["plugin_type"] = self.plugin_type.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PluginManifest":
+        """Create manifest from dictionary."""
+        data = dict(data)
+        data["plugin_type"] = PluginType(data["plugin_type"])
+        return cls(**data)
+
+
+def plugin_source_files(plugin_path: str) -> List[str]:
+    """
+    Get the source files of a plugin.
+
+    Args:
+        plugin_path: Plugin path as found by discovery (module path without
+            ``.py`` or package directory)
+
+    Returns:
+        Sorted list of Python source files
+    """
+    if os.path.isdir(plugin_path):
+        files = []
+        for root, dirs, names in os.walk(plugin_path):
+            dirs[:] = [d for d in dirs if not d.startswith((".", "__pycache__"))]
+            files.extend(os.path.join(root, name) for name in names if name.endswith(".py"))
+        return sorted(files)
+    return [plugin_path + ".py"]
+
+
+def source_fingerprint(files: List[str]) -> List[List[Any]]:
+    """Get cheap ``[path, mtime_ns, size]`` fingerprint of source files."""
+    fingerprint = []
+    for path in files:
+        stat = os.stat(path)
+        fingerprint.append([path, stat.st_mtime_ns, stat.st_size])
+    return fingerprint
+
+
+def source_hash(files: List[str]) -> str:
+    """Get SHA-256 over the contents of source files."""
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(os.path.basename(path).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+class PluginManifestCache:
+    """
+    Persistent manifest cache keyed by plugin path.
+
+    Entries are validated by file mtime and size. When those changed, the
+    content hash decides whether the plugin really changed, so touching
+    a file or checking it out again does not force a re-import.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None):
+        """
+        Initialize manifest cache.
+
+        Args:
+            cache_path: JSON file to persist manifests in; None keeps the cache in memory
+        """
+        self.cache_path = cache_path
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self._load()
+
+    def get(self, plugin_path: str) -> Optional[PluginManifest]:
+        """
+        Get cached manifest if the plugin sources did not change.
+
+        Args:
+            plugin_path: Plugin path as found by discovery
+
+        Returns:
+            Cached manifest or None if missing or stale
+        """
+        entry = self._entries.get(plugin_path)
+        if entry is None:
+            return None
+
+        try:
+            files = plugin_source_files(plugin_path)
+            fingerprint = source_fingerprint(files)
+            if fingerprint != entry["fingerprint"]:
+                if source_hash(files) != entry["hash"]:
+                    return None
+                # Same content with new timestamps
+                entry["fingerprint"] = fingerprint
+                self._dirty = True
+
+            return PluginManifest.from_dict(entry["manifest"])
+
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+    def put(self, plugin_path: str, manifest: PluginManifest) -> None:
+        """Store manifest for a plugin path with the current source fingerprint."""
+        try:
+            files = plugin_source_files(plugin_path)
+            self._entries[plugin_path] = {
+                "fingerprint": source_fingerprint(files),
+                "hash": source_hash(files),
+                "manifest": manifest.to_dict(),
+            }
+            self._dirty = True
+        except OSError as e:
+            logger.warning(f"Could not fingerprint plugin {plugin_path}: {e}")
+
+    def invalidate(self, plugin_path: str) -> None:
+        """Drop the cached manifest of a plugin path."""
+        if self._entries.pop(plugin_path, None) is not None:
+            self._dirty = True
+
+    def retain(self, plugin_paths: List[str]) -> None:
+        """Drop entries of plugins that no longer exist."""
+        keep = set(plugin_paths)
+        for plugin_path in [p for p in self._entries if p not in keep]:
+            del self._entries[plugin_path]
+            self._dirty = True
+
+    def save(self) -> bool:
+        """Persist cache if it changed. Returns True if written."""
+        if not self._dirty or not self.cache_path:
+            return False
+
+        try:
+            directory = os.path.dirname(self.cache_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{self.cache_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_CACHE_VERSION, "plugins": self._entries}, f)
+            os.replace(temp_path, self.cache_path)
+
+            self._dirty = False
+            return True
+
+        except OSError as e:
+            logger.warning(f"Failed to save plugin manifest cache: {e}")
+            return False
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _load(self) -> None:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            if data.get("version") == MANIFEST_CACHE_VERSION:
+                self._entries = data.get("plugins", {})
+            else:
+                logger.info("Plugin manifest cache version changed, rebuilding")
+
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load plugin manifest cache: {e}")
@@ -8,7 +8,8 @@ import importlib.util
 import json
 import os
 import sys
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from src.plugins.base_plugin import (
     BasePlugin,
@@ -16,18 +17,30 @@ from src.plugins.base_plugin import (
     PluginInitializationError,
     PluginType,
 )
+from src.plugins.manifest_cache import PluginManifest, PluginManifestCache
 from src.utils.logger import logger
 
+# Default location of the persistent plugin manifest cache, in the project data
+# directory regardless of the working directory
+DEFAULT_MANIFEST_CACHE = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "cache", "plugin_manifests.json")
+)
+
 
 class PluginManager:
     """Manages plugin loading, registration, and lifecycle."""
 
-    def __init__(self, plugin_directories: Optional[List[str]] = None):
+    def __init__(
+        self,
+        plugin_directories: Optional[List[str]] = None,
+        manifest_cache_path: Optional[str] = DEFAULT_MANIFEST_CACHE,
+    ):
         """
         Initialize plugin manager.
 
         Args:
             plugin_directories: List of directories to search for plugins
+            manifest_cache_path: File for the plugin manifest cache; None keeps it in memory
         """
         self.plugin_directories = plugin_directories or []
         self.registered_plugins: Dict[str, BasePlugin] = {}
@@ -36,6 +49,15 @@ class PluginManager:
         }
         self.plugin_configs: Dict[str, Dict[str, Any]] = {}
 
+        # Lazy loading: manifests are known without importing plugin modules
+        self.manifest_cache = PluginManifestCache(manifest_cache_path)
+        self.manifests: Dict[str, PluginManifest] = {}
+        self._pending: Dict[str, PluginManifest] = {}
+        self._disabled_pending: Set[str] = set()
+        self._failed: Set[str] = set()
+        self._instances: Dict[str, BasePlugin] = {}
+        self._activation_lock = threading.RLock()
+
         # Add default plugin directory
         default_plugin_dir = os.path.join(os.path.dirname(__file__), "builtin")
         if default_plugin_dir not in self.plugin_directories:
@@ -43,14 +65,8 @@ class PluginManager:
 
         logger.info(f"Plugin manager initialized with directories: {self.plugin_directories}")
 
-    def discover_plugins(self) -> List[BasePlugin]:
-        """
-        Discover and load available plugins in plugin directories.
-
-        Returns:
-            List of loaded plugin instances
-        """
-        discovered_plugins = []
+    def _find_plugin_paths(self) -> List[str]:
+        """Find plugin modules and packages in plugin directories (no imports)."""
         plugin_paths = []
 
         for plugin_dir in self.plugin_directories:
@@ -58,10 +74,10 @@ class PluginManager:
                 logger.warning(f"Plugin directory does not exist: {plugin_dir}")
                 continue
 
-            logger.debug(f"Scanning plugin directory: {plugin_dir}")
+            logger.debug("Scanning plugin directory: %s", plugin_dir)
 
             # Look for Python files and packages
-            for item in os.listdir(plugin_dir):
+            for item in sorted(os.listdir(plugin_dir)):
                 item_path = os.path.join(plugin_dir, item)
 
                 # Skip __pycache__ and other non-plugin directories
@@ -72,18 +88,62 @@ class PluginManager:
                     # Single file plugin
                     plugin_name = item[:-3]  # Remove .py extension
                     plugin_paths.append(os.path.join(plugin_dir, plugin_name))
-                    logger.debug(f"Found plugin file: {plugin_name}")
+                    logger.debug("Found plugin file: %s", plugin_name)
 
                 elif os.path.isdir(item_path):
                     # Package plugin
                     init_file = os.path.join(item_path, "__init__.py")
                     if os.path.exists(init_file):
                         plugin_paths.append(item_path)
-                        logger.debug(f"Found plugin package: {item}")
+                        logger.debug("Found plugin package: %s", item)
+
+        return plugin_paths
+
+    def scan_plugins(self) -> List[PluginManifest]:
+        """
+        Find available plugins without importing them.
+
+        Manifests come from the manifest cache; only new or changed plugins
+        are imported once to read their metadata.
+
+        Returns:
+            List of plugin manifests
+        """
+        plugin_paths = self._find_plugin_paths()
+        manifests = []
+        cache_hits = 0
 
-        # Load discovered plugins
         for plugin_path in plugin_paths:
-            plugin = self.load_plugin(plugin_path)
+            manifest = self.manifest_cache.get(plugin_path)
+            if manifest is not None:
+                cache_hits += 1
+            else:
+                manifest = self._build_manifest(plugin_path)
+                if manifest is None:
+                    continue
+            manifests.append(manifest)
+
+        self.manifest_cache.retain(plugin_paths)
+        self.manifest_cache.save()
+
+        self.manifests = {manifest.name: manifest for manifest in manifests}
+        logger.info(
+            f"Found {len(manifests)} plugins ({cache_hits} from manifest cache, "
+            f"{len(manifests) - cache_hits} imported)"
+        )
+        return manifests
+
+    def discover_plugins(self) -> List[BasePlugin]:
+        """
+        Discover and load available plugins in plugin directories.
+
+        Returns:
+            List of loaded plugin instances
+        """
+        discovered_plugins = []
+
+        for manifest in self.scan_plugins():
+            plugin = self._instantiate(manifest)
             if plugin is not None:
                 discovered_plugins.append(plugin)
 
@@ -101,32 +161,69 @@ class PluginManager:
             Loaded plugin instance or None if failed
         """
         try:
-            # Determine module name
-            if os.path.isfile(plugin_path + ".py"):
-                # Single file plugin
-                module_name = os.path.basename(plugin_path)
-                spec = importlib.util.spec_from_file_location(module_name, plugin_path + ".py")
-            elif os.path.isdir(plugin_path):
-                # Package plugin
-                module_name = os.path.basename(plugin_path)
-                spec = importlib.util.spec_from_file_location(
-                    module_name, os.path.join(plugin_path, "__init__.py")
-                )
-            else:
-                logger.error(f"Invalid plugin path: {plugin_path}")
+            loaded = self._load_plugin_class(plugin_path)
+            if loaded is None:
                 return None
 
-            if spec is None or spec.loader is None:
-                logger.error(f"Could not create module spec for: {plugin_path}")
+            plugin_class, _ = loaded
+
+            # Instantiate plugin
+            plugin_instance = plugin_class()
+
+            # Validate plugin
+            if not isinstance(plugin_instance, BasePlugin):
+                logger.error(f"Plugin class does not inherit from BasePlugin: {plugin_class}")
                 return None
 
-            # Load the module
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
+            logger.info(f"Successfully loaded plugin: {plugin_instance.metadata.name}")
+            return plugin_instance
+
+        except Exception as e:
+            logger.error(f"Failed to load plugin from {plugin_path}", error=e)
+            return None
+
+    def _load_plugin_class(
+        self, plugin_path: str, class_name: Optional[str] = None
+    ) -> Optional[Tuple[type, str]]:
+        """
+        Import a plugin module and find its plugin class.
+
+        Args:
+            plugin_path: Path to plugin file (without ``.py``) or package directory
+            class_name: Known class name (from the manifest) to skip the class search
+
+        Returns:
+            Tuple of (plugin class, module name) or None if not found
+        """
+        # Determine module name
+        if os.path.isfile(plugin_path + ".py"):
+            # Single file plugin
+            module_name = os.path.basename(plugin_path)
+            spec = importlib.util.spec_from_file_location(module_name, plugin_path + ".py")
+        elif os.path.isdir(plugin_path):
+            # Package plugin
+            module_name = os.path.basename(plugin_path)
+            spec = importlib.util.spec_from_file_location(
+                module_name, os.path.join(plugin_path, "__init__.py")
+            )
+        else:
+            logger.error(f"Invalid plugin path: {plugin_path}")
+            return None
 
-            # Find plugin class in module
-            plugin_class = None
+        if spec is None or spec.loader is None:
+            logger.error(f"Could not create module spec for: {plugin_path}")
+            return None
+
+        # Load the module
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+
+        # Find plugin class in module
+        plugin_class = None
+        if class_name is not None:
+            plugin_class = getattr(module, class_name, None)
+        else:
             for attr_name in dir(module):
                 attr = getattr(module, attr_name)
                 if (
@@ -138,25 +235,91 @@ class PluginManager:
                     plugin_class = attr
                     break
 
-            if plugin_class is None:
-                logger.error(f"No plugin class found in: {plugin_path}")
-                return None
+        if plugin_class is None:
+            logger.error(f"No plugin class found in: {plugin_path}")
+            return None
 
-            # Instantiate plugin
-            plugin_instance = plugin_class()
+        return plugin_class, module_name
 
-            # Validate plugin
-            if not isinstance(plugin_instance, BasePlugin):
+    def _build_manifest(self, plugin_path: str) -> Optional[PluginManifest]:
+        """Import a plugin once to record its manifest."""
+        plugin = self.load_plugin(plugin_path)
+        if plugin is None:
+            self.manifest_cache.invalidate(plugin_path)
+            return None
+
+        try:
+            plugin_class = type(plugin)
+            manifest = PluginManifest.from_metadata(
+                plugin.metadata, plugin_class.__name__, plugin_class.__module__, plugin_path
+            )
+        except Exception as e:
+            logger.error(f"Invalid plugin metadata in {plugin_path}", error=e)
+            return None
+
+        self.manifest_cache.put(plugin_path, manifest)
+        # Keep the instance so first use does not import the module again
+        self._instances[manifest.name] = plugin
+        return manifest
+
+    def _instantiate(self, manifest: PluginManifest) -> Optional[BasePlugin]:
+        """Get plugin instance for a manifest, importing the module if needed."""
+        plugin = self._instances.pop(manifest.name, None)
+        if plugin is not None:
+            return plugin
+
+        try:
+            loaded = self._load_plugin_class(manifest.source_path, manifest.class_name)
+            if loaded is None:
+                self.manifest_cache.invalidate(manifest.source_path)
+                return None
+
+            plugin_class, _ = loaded
+            plugin = plugin_class()
+            if not isinstance(plugin, BasePlugin):
                 logger.error(f"Plugin class does not inherit from BasePlugin: {plugin_class}")
                 return None
 
-            logger.info(f"Successfully loaded plugin: {plugin_instance.metadata.name}")
-            return plugin_instance
+            logger.info(f"Successfully loaded plugin: {manifest.name}")
+            return plugin
 
         except Exception as e:
-            logger.error(f"Failed to load plugin from {plugin_path}", error=e)
+            logger.error(f"Failed to load plugin {manifest.name}", error=e)
+            self.manifest_cache.invalidate(manifest.source_path)
             return None
 
+    def activate_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
+        """
+        Import, initialize and register a lazily loaded plugin.
+
+        Args:
+            plugin_name: Name of the plugin
+
+        Returns:
+            Registered plugin instance or None if unknown or failed
+        """
+        with self._activation_lock:
+            plugin = self.registered_plugins.get(plugin_name)
+            if plugin is not None:
+                return plugin
+
+            manifest = self._pending.pop(plugin_name, None)
+            if manifest is None:
+                return None
+
+            plugin = self._instantiate(manifest)
+            if plugin is None or not self.register_plugin(
+                plugin, self.plugin_configs.get(plugin_name)
+            ):
+                self._failed.add(plugin_name)
+                return None
+
+            if plugin_name in self._disabled_pending:
+                self._disabled_pending.discard(plugin_name)
+                plugin.disable()
+
+            return plugin
+
     def register_plugin(self, plugin: BasePlugin, config: Optional[Dict[str, Any]] = None) -> bool:
         """
         Register a plugin with the manager.
@@ -242,28 +405,99 @@ class PluginManager:
         """
         Get all registered plugins of a specific type.
 
+        Lazily loaded plugins of the type are activated first.
+
         Args:
             plugin_type: Type of plugins to retrieve
 
         Returns:
             List of plugins of the specified type
         """
-        return [p for p in self.plugins_by_type[plugin_type] if p.enabled]
+        return list(self.iter_plugins_by_type(plugin_type))
+
+    def iter_plugins_by_type(self, plugin_type: PluginType) -> Iterator[BasePlugin]:
+        """
+        Iterate enabled plugins of a type, activating lazy plugins one at a time.
+
+        Stopping the iteration early leaves the remaining plugins unimported.
+
+        Args:
+            plugin_type: Type of plugins to retrieve
+
+        Yields:
+            Enabled plugins of the specified type
+        """
+        for plugin in list(self.plugins_by_type[plugin_type]):
+            if plugin.enabled:
+                yield plugin
+
+        pending = [
+            name
+            for name, manifest in list(self._pending.items())
+            if manifest.plugin_type == plugin_type and name not in self._disabled_pending
+        ]
+        for plugin_name in pending:
+            plugin = self.activate_plugin(plugin_name)
+            if plugin is not None and plugin.enabled:
+                yield plugin
+
+    def list_plugins(self, plugin_type: Optional[PluginType] = None) -> List[PluginManifest]:
+        """
+        List registered and lazily loaded plugins without importing them.
+
+        Args:
+            plugin_type: Only list plugins of this type
+
+        Returns:
+            List of plugin manifests
+        """
+        manifests = []
+        for plugin_name, plugin in self.registered_plugins.items():
+            manifest = self.manifests.get(plugin_name)
+            if manifest is None:
+                plugin_class = type(plugin)
+                manifest = PluginManifest.from_metadata(
+                    plugin.metadata, plugin_class.__name__, plugin_class.__module__, ""
+                )
+            manifests.append(manifest)
+        manifests.extend(self._pending.values())
+
+        if plugin_type is not None:
+            manifests = [m for m in manifests if m.plugin_type == plugin_type]
+        return manifests
 
     def get_plugin(self, plugin_name: str) -> Optional[BasePlugin]:
         """
         Get a specific plugin by name.
 
+        Lazily loaded plugins are imported and initialized on first access.
+
         Args:
             plugin_name: Name of the plugin
 
         Returns:
             Plugin instance or None if not found
         """
-        return self.registered_plugins.get(plugin_name)
+        plugin = self.registered_plugins.get(plugin_name)
+        if plugin is None and plugin_name in self._pending:
+            plugin = self.activate_plugin(plugin_name)
+        return plugin
+
+    def is_plugin_enabled(self, plugin_name: str) -> bool:
+        """Check if a plugin is enabled without importing lazily loaded plugins."""
+        if plugin_name in self._pending:
+            return plugin_name not in self._disabled_pending
+
+        plugin = self.registered_plugins.get(plugin_name)
+        return plugin is not None and plugin.enabled
 
     def enable_plugin(self, plugin_name: str) -> bool:
         """Enable a plugin."""
+        if plugin_name in self._pending:
+            self._disabled_pending.discard(plugin_name)
+            logger.info(f"Enabled plugin: {plugin_name}")
+            return True
+
         plugin = self.get_plugin(plugin_name)
         if plugin:
             plugin.enable()
@@ -273,6 +507,12 @@ class PluginManager:
 
     def disable_plugin(self, plugin_name: str) -> bool:
         """Disable a plugin."""
+        if plugin_name in self._pending:
+            # Not imported yet - remember the state for activation
+            self._disabled_pending.add(plugin_name)
+            logger.info(f"Disabled plugin: {plugin_name}")
+            return True
+
         plugin = self.get_plugin(plugin_name)
         if plugin:
             plugin.disable()
@@ -307,23 +547,29 @@ class PluginManager:
 
     def load_all_plugins(self) -> int:
         """
-        Discover and load all available plugins.
+        Discover all available plugins for lazy loading.
+
+        Plugin modules are imported and initialized on first use
+        (``get_plugin``, ``get_plugins_by_type``, ``iter_plugins_by_type``).
 
         Returns:
-            Number of successfully loaded plugins
+            Number of available plugins
         """
-        discovered = self.discover_plugins()
-        loaded_count = 0
-
-        for plugin_path in discovered:
-            plugin = self.load_plugin(plugin_path)
-            if plugin:
-                # Try to register with default config
-                if self.register_plugin(plugin):
-                    loaded_count += 1
-
-        logger.info(f"Loaded {loaded_count} plugins out of {len(discovered)} discovered")
-        return loaded_count
+        manifests = self.scan_plugins()
+        available_count = 0
+
+        for manifest in manifests:
+            if manifest.name in self.registered_plugins:
+                available_count += 1
+            elif manifest.name not in self._failed:
+                self._pending[manifest.name] = manifest
+                available_count += 1
+
+        logger.info(
+            f"{available_count} plugins available out of {len(manifests)} discovered "
+            "(loaded on first use)"
+        )
+        return available_count
 
     def get_plugin_info(self) -> List[Dict[str, Any]]:
         """
@@ -345,6 +591,22 @@ class PluginManager:
                     "enabled": plugin.enabled,
                     "initialized": plugin.initialized,
                     "dependencies": metadata.dependencies,
+                    "loaded": True,
+                }
+            )
+
+        for manifest in self._pending.values():
+            info.append(
+                {
+                    "name": manifest.name,
+                    "version": manifest.version,
+                    "description": manifest.description,
+                    "author": manifest.author,
+                    "type": manifest.plugin_type.value,
+                    "enabled": manifest.name not in self._disabled_pending,
+                    "initialized": False,
+                    "dependencies": manifest.dependencies,
+                    "loaded": False,
                 }
             )
 
@@ -396,6 +658,13 @@ class PluginManager:
                     "config": self.plugin_configs.get(plugin_name, {}),
                 }
 
+            # Plugins that were never used keep their stored state
+            for plugin_name in self._pending:
+                config_data["plugins"][plugin_name] = {
+                    "enabled": plugin_name not in self._disabled_pending,
+                    "config": self.plugin_configs.get(plugin_name, {}),
+                }
+
             with open(config_path, "w") as f:
                 json.dump(config_data, f, indent=2)
 
@@ -427,7 +696,16 @@ class PluginManager:
             plugins_config = config_data.get("plugins", {})
 
             for plugin_name, plugin_data in plugins_config.items():
-                plugin = self.get_plugin(plugin_name)
+                if plugin_name not in self.registered_plugins:
+                    # Applied when the plugin is activated
+                    self.plugin_configs[plugin_name] = plugin_data.get("config", {})
+                    if plugin_data.get("enabled", True):
+                        self._disabled_pending.discard(plugin_name)
+                    else:
+                        self._disabled_pending.add(plugin_name)
+                    continue
+
+                plugin = self.registered_plugins[plugin_name]
                 if plugin:
                     # Update enabled state
                     if plugin_data.get("enabled", True):
@@ -46,6 +46,7 @@ class PaginationParams:
     page: int = 1
     page_size: int = 50
     max_page_size: int = 1000
+    cursor: Optional[str] = None  # Keyset cursor from a previous result (replaces page)
 
     def validate(self) -> bool:
         """Validate pagination parameters."""
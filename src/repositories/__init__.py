@@ -6,12 +6,14 @@ data persistence operations, following the Repository pattern.
 """
 
 from .base_repository import BaseRepository
+from .blob_store import ContentAddressedBlobStore
 from .screenshot_repository import FileScreenshotRepository, ScreenshotRepository
 from .translation_repository import FileTranslationRepository, TranslationRepository
 from .unit_of_work import FileUnitOfWork, RepositoryManager, UnitOfWork, get_repository_manager
 
 __all__ = [
     "BaseRepository",
+    "ContentAddressedBlobStore",
     "TranslationRepository",
     "FileTranslationRepository",
     "ScreenshotRepository",
@@ -6,15 +6,42 @@ and common repository operations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Optional, TypeVar
+
+from src.utils.logger import logger
 
 # Generic type for entity
 T = TypeVar("T")
 
+# listener(action, entity_id) - action is "save", "delete", "clear" or "reload"
+ChangeListener = Callable[[str, Optional[str]], None]
+
 
 class BaseRepository(ABC, Generic[T]):
     """Abstract base repository class."""
 
+    # Incremented on every write; lets readers detect stale derived data
+    write_version = 0
+
+    def add_change_listener(self, listener: ChangeListener) -> None:
+        """Subscribe to write events (e.g. to invalidate cached query results)."""
+        vars(self).setdefault("_change_listeners", []).append(listener)
+
+    def remove_change_listener(self, listener: ChangeListener) -> None:
+        """Unsubscribe from write events."""
+        listeners = vars(self).get("_change_listeners", [])
+        if listener in listeners:
+            listeners.remove(listener)
+
+    def _notify_change(self, action: str, entity_id: Optional[str] = None) -> None:
+        """Publish a write event; listener errors are logged, not raised."""
+        self.write_version += 1
+        for listener in list(vars(self).get("_change_listeners", [])):
+            try:
+                listener(action, entity_id)
+            except Exception as e:
+                logger.warning(f"Repository change listener failed: {e}")
+
     @abstractmethod
     async def save(self, entity: T) -> str:
         """
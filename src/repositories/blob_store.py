@@ -0,0 +1,451 @@
+"""
+Content-addressed blob storage.
+
+This module provides a deduplicating blob store keyed by content hash with
+reference counting. Large blobs are stored as individual files, small ones
+are appended to pack files to avoid one inode per blob. The blob index is an
+append-only log that is compacted during garbage collection.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from src.utils.logger import logger
+
+# Perceptual hashes are 64-bit; split into bands for candidate lookup
+_PHASH_BANDS = 4
+_PHASH_BAND_BITS = 64 // _PHASH_BANDS
+
+
+@dataclass
+class BlobEntry:
+    """Index entry for a stored blob."""
+
+    digest: str
+    size: int
+    refs: int = 0
+    pack: Optional[str] = None  # Pack file name, None for loose blobs
+    offset: int = 0
+    phash: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "op": "put",
+            "hash": self.digest,
+            "size": self.size,
+            "refs": self.refs,
+            "pack": self.pack,
+            "offset": self.offset,
+            "phash": self.phash,
+        }
+
+
+class ContentAddressedBlobStore:
+    """Deduplicating, reference-counted blob store."""
+
+    INDEX_FILE = "index.jsonl"
+    COMPACT_MIN_RECORDS = 1000
+
+    def __init__(
+        self,
+        root: Path,
+        pack_threshold: int = 64 * 1024,
+        max_pack_size: int = 16 * 1024 * 1024,
+        auto_gc_bytes: int = 32 * 1024 * 1024,
+    ):
+        """
+        Initialize blob store.
+
+        Args:
+            root: Storage directory
+            pack_threshold: Blobs smaller than this are stored in pack files
+            max_pack_size: Size at which a new pack file is started
+            auto_gc_bytes: Run garbage collection once this many bytes are unreferenced
+        """
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.packs_dir = self.root / "packs"
+        self.index_file = self.root / self.INDEX_FILE
+        self.pack_threshold = pack_threshold
+        self.max_pack_size = max_pack_size
+        self.auto_gc_bytes = auto_gc_bytes
+
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.packs_dir.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._entries: Dict[str, BlobEntry] = {}
+        self._phash_bands: Dict[tuple, Set[str]] = {}
+        self._pack_sizes: Dict[str, int] = {}
+        self._current_pack: Optional[str] = None
+        self._pack_counter = 0
+        self._index_records = 0
+        self._stored_bytes = 0
+        self._logical_bytes = 0
+        self._garbage_bytes = 0
+        self._load_index()
+
+    # Public API
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """Compute the content address of data."""
+        return hashlib.sha256(data).hexdigest()
+
+    def put(self, data: bytes, phash: Optional[int] = None) -> str:
+        """
+        Store data (once) and add a reference to it.
+
+        Args:
+            data: Blob content
+            phash: Optional perceptual hash recorded for similarity lookups
+
+        Returns:
+            Content hash of the blob
+        """
+        digest = self.hash_bytes(data)
+        with self._lock:
+            if digest in self._entries:
+                self._add_ref(digest, 1)
+                return digest
+
+            entry = BlobEntry(digest=digest, size=len(data), phash=phash)
+            if len(data) < self.pack_threshold:
+                entry.pack, entry.offset = self._append_to_pack(data)
+            else:
+                self._write_loose(digest, data)
+
+            self._entries[digest] = entry
+            self._stored_bytes += entry.size
+            self._index_phash(entry)
+            self._append_index(entry.to_dict())
+            self._add_ref(digest, 1)
+            return digest
+
+    def get(self, digest: str) -> Optional[bytes]:
+        """Read a blob by its content hash."""
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return None
+
+            try:
+                if entry.pack is None:
+                    return self._loose_path(digest).read_bytes()
+                with open(self.packs_dir / entry.pack, "rb") as f:
+                    f.seek(entry.offset)
+                    return f.read(entry.size)
+            except OSError as e:
+                logger.warning(f"Failed to read blob {digest[:12]}: {e}")
+                return None
+
+    def contains(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return digest in self._entries
+
+    def size(self, digest: str) -> int:
+        """Get blob size in bytes (0 if unknown)."""
+        entry = self._entries.get(digest)
+        return entry.size if entry else 0
+
+    def ref_count(self, digest: str) -> int:
+        """Get number of references to a blob."""
+        entry = self._entries.get(digest)
+        return entry.refs if entry else 0
+
+    def add_ref(self, digest: str) -> bool:
+        """Add a reference to an existing blob."""
+        with self._lock:
+            if digest not in self._entries:
+                return False
+            self._add_ref(digest, 1)
+            return True
+
+    def release(self, digest: str) -> int:
+        """
+        Drop a reference to a blob.
+
+        Unreferenced blobs are removed by the next garbage collection.
+
+        Returns:
+            Remaining reference count
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None or entry.refs <= 0:
+                return 0
+            self._add_ref(digest, -1)
+            remaining = entry.refs
+
+        if self.auto_gc_bytes and self._garbage_bytes >= self.auto_gc_bytes:
+            self.gc()
+        return remaining
+
+    def find_similar(self, phash: int, max_distance: int = 4) -> Optional[str]:
+        """
+        Find a referenced blob with a perceptual hash within ``max_distance`` bits.
+
+        Returns:
+            Content hash of the closest blob, or None
+        """
+        with self._lock:
+            if max_distance < _PHASH_BANDS:
+                # Pigeonhole: a close hash shares at least one exact band
+                candidates: Set[str] = set()
+                for key in self._phash_band_keys(phash):
+                    candidates |= self._phash_bands.get(key, set())
+            else:
+                candidates = {d for d, e in self._entries.items() if e.phash is not None}
+
+            best, best_distance = None, max_distance + 1
+            for digest in candidates:
+                entry = self._entries[digest]
+                if entry.refs <= 0:
+                    continue
+                distance = bin(entry.phash ^ phash).count("1")
+                if distance < best_distance:
+                    best, best_distance = digest, distance
+            return best
+
+    def gc(self, repack_ratio: float = 0.5) -> Dict[str, int]:
+        """
+        Free unreferenced blobs.
+
+        Loose blobs are deleted directly; pack files whose dead fraction exceeds
+        ``repack_ratio`` are rewritten with their live blobs only. The index log
+        is compacted afterwards.
+
+        Returns:
+            GC statistics
+        """
+        with self._lock:
+            dead = [entry for entry in self._entries.values() if entry.refs <= 0]
+            freed_bytes = 0
+            for entry in dead:
+                if entry.pack is None:
+                    try:
+                        self._loose_path(entry.digest).unlink()
+                    except OSError:
+                        pass
+                del self._entries[entry.digest]
+                self._unindex_phash(entry)
+                freed_bytes += entry.size
+
+            obsolete_packs = self._repack(repack_ratio)
+            self._stored_bytes -= freed_bytes
+            self._garbage_bytes = 0
+
+            # Old packs are only removed once the index points to the new ones
+            self._compact_index()
+            for pack in obsolete_packs:
+                try:
+                    (self.packs_dir / pack).unlink()
+                except OSError:
+                    pass
+
+            if dead:
+                logger.info(
+                    f"Blob GC freed {len(dead)} blobs ({freed_bytes} bytes), "
+                    f"rewrote {len(obsolete_packs)} packs"
+                )
+            return {
+                "blobs_freed": len(dead),
+                "bytes_freed": freed_bytes,
+                "packs_rewritten": len(obsolete_packs),
+            }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get storage statistics without touching the filesystem."""
+        with self._lock:
+            blobs = len(self._entries)
+            packed = sum(1 for entry in self._entries.values() if entry.pack is not None)
+            references = sum(entry.refs for entry in self._entries.values())
+            return {
+                "blobs": blobs,
+                "packed_blobs": packed,
+                "loose_blobs": blobs - packed,
+                "packs": len(self._pack_sizes),
+                "references": references,
+                "stored_bytes": self._stored_bytes,
+                "logical_bytes": self._logical_bytes,
+                "garbage_bytes": self._garbage_bytes,
+                "dedup_ratio": (
+                    self._logical_bytes / self._stored_bytes if self._stored_bytes else 1.0
+                ),
+            }
+
+    # Index log
+
+    def _load_index(self) -> None:
+        """Replay the append-only index log."""
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply_record(json.loads(line))
+                        except (ValueError, KeyError) as e:
+                            # Torn last line after a crash
+                            logger.warning(f"Skipping corrupt blob index record: {e}")
+                        self._index_records += 1
+            except OSError as e:
+                logger.error(f"Failed to load blob index: {e}")
+
+        for pack_file in self.packs_dir.glob("pack-*.dat"):
+            self._pack_sizes[pack_file.name] = pack_file.stat().st_size
+        if self._pack_sizes:
+            self._current_pack = max(self._pack_sizes)
+            self._pack_counter = int(self._current_pack[5:-4])
+
+        for entry in self._entries.values():
+            self._stored_bytes += entry.size
+            self._logical_bytes += entry.size * max(entry.refs, 0)
+            if entry.refs <= 0:
+                self._garbage_bytes += entry.size
+            self._index_phash(entry)
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        op = record["op"]
+        digest = record["hash"]
+        if op == "put":
+            self._entries[digest] = BlobEntry(
+                digest=digest,
+                size=record["size"],
+                refs=record.get("refs", 0),
+                pack=record.get("pack"),
+                offset=record.get("offset", 0),
+                phash=record.get("phash"),
+            )
+        elif op == "ref":
+            entry = self._entries.get(digest)
+            if entry is not None:
+                entry.refs += record["delta"]
+
+    def _append_index(self, record: Dict[str, Any]) -> None:
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._index_records += 1
+
+        # Reference updates accumulate; fold them into one record per blob
+        if self._index_records > self.COMPACT_MIN_RECORDS + 4 * len(self._entries):
+            self._compact_index()
+
+    def _compact_index(self) -> None:
+        """Rewrite the index log as one record per live blob."""
+        temp_file = self.index_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry.to_dict(), separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        temp_file.replace(self.index_file)
+        self._index_records = len(self._entries)
+
+    def _add_ref(self, digest: str, delta: int) -> None:
+        entry = self._entries[digest]
+        was_garbage = entry.refs <= 0
+        entry.refs += delta
+        self._logical_bytes += entry.size * delta
+        if was_garbage and entry.refs > 0:
+            self._garbage_bytes -= entry.size
+        elif not was_garbage and entry.refs <= 0:
+            self._garbage_bytes += entry.size
+        self._append_index({"op": "ref", "hash": digest, "delta": delta})
+
+    # Blob files
+
+    def _loose_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest[2:]
+
+    def _write_loose(self, digest: str, data: bytes) -> None:
+        path = self._loose_path(digest)
+        path.parent.mkdir(exist_ok=True)
+        temp_file = path.with_suffix(".tmp")
+        with open(temp_file, "wb") as f:
+            f.write(data)
+        temp_file.replace(path)
+
+    def _next_pack_name(self) -> str:
+        # Names are never reused so a pack being rewritten cannot be overwritten
+        self._pack_counter += 1
+        return f"pack-{self._pack_counter:06d}.dat"
+
+    def _append_to_pack(self, data: bytes) -> tuple:
+        """Append data to the current pack file and return (pack name, offset)."""
+        pack = self._current_pack
+        if pack is None or self._pack_sizes[pack] + len(data) > self.max_pack_size:
+            pack = self._current_pack = self._next_pack_name()
+            self._pack_sizes[pack] = 0
+
+        offset = self._pack_sizes[pack]
+        with open(self.packs_dir / pack, "ab") as f:
+            f.write(data)
+        self._pack_sizes[pack] = offset + len(data)
+        return pack, offset
+
+    def _repack(self, repack_ratio: float) -> List[str]:
+        """
+        Copy live blobs out of pack files that are mostly dead space.
+
+        Returns:
+            Names of packs that are no longer referenced
+        """
+        live_by_pack: Dict[str, List[BlobEntry]] = {}
+        for entry in self._entries.values():
+            if entry.pack is not None:
+                live_by_pack.setdefault(entry.pack, []).append(entry)
+
+        obsolete: List[str] = []
+        for pack, pack_size in list(self._pack_sizes.items()):
+            live = live_by_pack.get(pack, [])
+            live_bytes = sum(entry.size for entry in live)
+            if pack_size == 0 or (pack_size - live_bytes) / pack_size <= repack_ratio:
+                continue
+
+            blobs = [(entry, self.get(entry.digest)) for entry in live]
+            # Moved blobs go to a new pack: appending to an existing one would
+            # make its live set above stale if it is repacked later in the loop
+            self._current_pack = None
+            del self._pack_sizes[pack]
+            for entry, data in blobs:
+                if data is not None:
+                    entry.pack, entry.offset = self._append_to_pack(data)
+            obsolete.append(pack)
+
+        if obsolete and self._current_pack is not None:
+            with open(self.packs_dir / self._current_pack, "ab") as f:
+                os.fsync(f.fileno())
+        return obsolete
+
+    # Perceptual hash lookup
+
+    @staticmethod
+    def _phash_band_keys(phash: int) -> List[tuple]:
+        mask = (1 << _PHASH_BAND_BITS) - 1
+        return [
+            (band, (phash >> (band * _PHASH_BAND_BITS)) & mask) for band in range(_PHASH_BANDS)
+        ]
+
+    def _index_phash(self, entry: BlobEntry) -> None:
+        if entry.phash is None:
+            return
+        for key in self._phash_band_keys(entry.phash):
+            self._phash_bands.setdefault(key, set()).add(entry.digest)
+
+    def _unindex_phash(self, entry: BlobEntry) -> None:
+        if entry.phash is None:
+            return
+        for key in self._phash_band_keys(entry.phash):
+            digests = self._phash_bands.get(key)
+            if digests is not None:
+                digests.discard(entry.digest)
+                if not digests:
+                    del self._phash_bands[key]
@@ -12,6 +12,7 @@ from uuid import uuid4
 
 from src.models.screenshot_data import ScreenshotData
 from src.repositories.base_repository import BaseRepository
+from src.repositories.blob_store import ContentAddressedBlobStore
 from src.utils.logger import logger
 
 
@@ -37,32 +38,91 @@ class ScreenshotRepository(BaseRepository[ScreenshotData]):
         return await self.search(criteria)
 
 
-class FileScreenshotRepository(ScreenshotRepository):
-    """File-based implementation of screenshot repository."""
+def compute_dhash(image: Any) -> Optional[int]:
+    """
+    Compute a 64-bit difference hash (perceptual hash) of a PIL image.
+
+    Returns:
+        Hash value, or None if the image cannot be processed
+    """
+    try:
+        small = image.convert("L").resize((9, 8))
+        pixels = list(small.getdata())
+    except Exception:
+        return None
+
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (1 if left > right else 0)
+    return value
+
 
-    def __init__(self, data_dir: str = "data"):
+class FileScreenshotRepository(ScreenshotRepository):
+    """
+    File-based implementation of screenshot repository.
+
+    Image bytes go to a content-addressed blob store, so identical captures
+    are stored once. Metadata changes are appended to a log that is folded
+    into the ``screenshots.json`` snapshot when it grows too long.
+    """
+
+    COMPACT_MIN_RECORDS = 100
+
+    def __init__(
+        self,
+        data_dir: str = "data",
+        dedupe_similar: bool = False,
+        similarity_threshold: int = 2,
+    ):
+        """
+        Initialize repository.
+
+        Args:
+            data_dir: Storage directory
+            dedupe_similar: Reuse a stored image whose perceptual hash is within
+                ``similarity_threshold`` bits instead of storing a new one
+            similarity_threshold: Maximum perceptual hash distance in bits
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         self.screenshots_file = self.data_dir / "screenshots.json"
-        self.images_dir = self.data_dir / "images"
-        self.images_dir.mkdir(exist_ok=True)
+        self.log_file = self.data_dir / "screenshots.log"
+        self.images_dir = self.data_dir / "images"  # Legacy per-screenshot files
+        self.blob_store = ContentAddressedBlobStore(self.data_dir / "blobs")
+        self.dedupe_similar = dedupe_similar
+        self.similarity_threshold = similarity_threshold
         self._cache: Dict[str, ScreenshotData] = {}
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._log_records = 0
+        self._total_size = 0
         self._load_data()
 
     def _load_data(self) -> None:
-        """Load screenshots from file into cache."""
+        """Load snapshot and replay the metadata log."""
         try:
             if self.screenshots_file.exists():
                 with open(self.screenshots_file, "r", encoding="utf-8") as f:
                     data = json.load(f)
 
                 for item in data.get("screenshots", []):
-                    try:
-                        screenshot = self._dict_to_screenshot(item)
-                        self._cache[screenshot.id] = screenshot
-                    except Exception as e:
-                        logger.warning(f"Failed to load screenshot: {e}")
-
+                    self._apply_record({"op": "save", "screenshot": item})
+
+            if self.log_file.exists():
+                with open(self.log_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply_record(json.loads(line))
+                        except ValueError as e:
+                            logger.warning(f"Skipping corrupt screenshot log record: {e}")
+                        self._log_records += 1
+
+            if self.screenshots_file.exists() or self.log_file.exists():
                 logger.info(f"Loaded {len(self._cache)} screenshots from file")
             else:
                 logger.info("No existing screenshots file found, starting fresh")
@@ -70,103 +130,188 @@ class FileScreenshotRepository(ScreenshotRepository):
         except Exception as e:
             logger.error(f"Failed to load screenshots: {e}")
             self._cache = {}
+            self._records = {}
+            self._total_size = 0
+
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply a metadata log record to the in-memory state."""
+        op = record.get("op")
+        if op == "save":
+            try:
+                item = record["screenshot"]
+                screenshot = self._dict_to_screenshot(item)
+            except Exception as e:
+                logger.warning(f"Failed to load screenshot: {e}")
+                return
+            self._forget(screenshot.id)
+            self._remember(screenshot, item)
+        elif op == "delete":
+            self._forget(record.get("id"))
+        elif op == "clear":
+            self._cache.clear()
+            self._records.clear()
+            self._total_size = 0
+
+    def _remember(self, screenshot: ScreenshotData, record: Dict[str, Any]) -> None:
+        self._cache[screenshot.id] = screenshot
+        self._records[screenshot.id] = record
+        self._total_size += record.get("size_bytes", 0)
+
+    def _forget(self, screenshot_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        record = self._records.pop(screenshot_id, None)
+        if record is not None:
+            self._cache.pop(screenshot_id, None)
+            self._total_size -= record.get("size_bytes", 0)
+        return record
+
+    def _append_log(self, record: Dict[str, Any]) -> None:
+        """Append a metadata change instead of rewriting the whole file."""
+        try:
+            with open(self.log_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log_records += 1
+        except Exception as e:
+            logger.error(f"Failed to append screenshot log: {e}")
+            return
+
+        if self._log_records > self.COMPACT_MIN_RECORDS + 2 * len(self._records):
+            self._save_data()
 
     def _save_data(self) -> None:
-        """Save screenshots from cache to file."""
+        """Write a full snapshot and truncate the metadata log."""
         try:
             data = {
-                "version": "2.0",
+                "version": "2.1",
                 "exported_at": datetime.now().isoformat(),
-                "screenshots": [
-                    self._screenshot_to_dict(screenshot) for screenshot in self._cache.values()
-                ],
+                "screenshots": list(self._records.values()),
             }
 
             # Write to temp file first, then rename (atomic operation)
             temp_file = self.screenshots_file.with_suffix(".tmp")
             with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, ensure_ascii=False)
 
             temp_file.replace(self.screenshots_file)
-            logger.debug(f"Saved {len(self._cache)} screenshots to file")
+            self.log_file.unlink(missing_ok=True)
+            self._log_records = 0
+            logger.debug(f"Saved {len(self._records)} screenshots to file")
 
         except Exception as e:
             logger.error(f"Failed to save screenshots: {e}")
 
-    def _screenshot_to_dict(self, screenshot: ScreenshotData) -> Dict[str, Any]:
+    def _screenshot_to_dict(
+        self, screenshot: ScreenshotData, blob_hash: Optional[str], size_bytes: int
+    ) -> Dict[str, Any]:
         """Convert ScreenshotData object to dictionary."""
         return {
             "id": screenshot.id,
-            "coordinates": screenshot.coordinates,
+            "coordinates": list(screenshot.coordinates),
             "timestamp": screenshot.timestamp.isoformat(),
             "image_path": screenshot.image_path,
-            "size_bytes": len(screenshot.image_bytes) if screenshot.image_bytes else 0,
+            "blob_hash": blob_hash,
+            "size_bytes": size_bytes,
+            "dpi_scale": screenshot.dpi_scale,
             "metadata": screenshot.metadata or {},
         }
 
     def _dict_to_screenshot(self, data: Dict[str, Any]) -> ScreenshotData:
-        """Convert dictionary to ScreenshotData object."""
-        # Load image bytes from file if path exists
-        image_bytes = None
-        image_path = data.get("image_path")
-        if image_path:
-            full_path = self.images_dir / image_path
-            if full_path.exists():
-                try:
-                    with open(full_path, "rb") as f:
-                        image_bytes = f.read()
-                except Exception as e:
-                    logger.warning(f"Failed to load image {image_path}: {e}")
-
+        """Convert dictionary to ScreenshotData object (image bytes are loaded lazily)."""
         return ScreenshotData(
             id=data.get("id", str(uuid4())),
+            image=None,
+            image_data=b"",
             coordinates=tuple(data["coordinates"]),
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            image_path=image_path,
-            image_bytes=image_bytes,
+            dpi_scale=data.get("dpi_scale", 1.0),
+            image_path=data.get("image_path"),
             metadata=data.get("metadata", {}),
         )
 
-    def _save_image(self, screenshot: ScreenshotData) -> Optional[str]:
-        """Save image bytes to file and return relative path."""
-        if not screenshot.image_bytes:
+    def _hydrate(self, screenshot: ScreenshotData) -> ScreenshotData:
+        """Load image bytes for a screenshot on first access."""
+        if screenshot.image_data or screenshot.image is not None:
+            return screenshot
+
+        record = self._records.get(screenshot.id, {})
+        blob_hash = record.get("blob_hash")
+        image_bytes = None
+        if blob_hash:
+            image_bytes = self.blob_store.get(blob_hash)
+        elif screenshot.image_path:
+            full_path = self.images_dir / screenshot.image_path
+            try:
+                image_bytes = full_path.read_bytes()
+            except OSError as e:
+                logger.warning(f"Failed to load image {screenshot.image_path}: {e}")
+
+        if image_bytes:
+            screenshot.image_data = image_bytes
+        return screenshot
+
+    def _store_image(self, screenshot: ScreenshotData) -> Optional[str]:
+        """Store image bytes in the blob store and return their content hash."""
+        image_bytes = screenshot.image_bytes
+        if not image_bytes:
             return None
 
         try:
-            # Generate unique filename
-            timestamp = screenshot.timestamp.strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}_{screenshot.id[:8]}.png"
-            file_path = self.images_dir / filename
+            phash = compute_dhash(screenshot.image) if screenshot.image is not None else None
+            if phash is not None and self.dedupe_similar:
+                similar = self.blob_store.find_similar(phash, self.similarity_threshold)
+                if similar is not None and self.blob_store.add_ref(similar):
+                    logger.debug(f"Reusing similar screenshot image: {similar[:12]}")
+                    return similar
 
-            # Save image bytes
-            with open(file_path, "wb") as f:
-                f.write(screenshot.image_bytes)
-
-            logger.debug(f"Saved screenshot image: {filename}")
-            return filename
+            return self.blob_store.put(image_bytes, phash=phash)
 
         except Exception as e:
             logger.error(f"Failed to save screenshot image: {e}")
             return None
 
+    def _release_image(self, record: Optional[Dict[str, Any]]) -> None:
+        """Drop the reference a metadata record holds on its image."""
+        if not record:
+            return
+
+        if record.get("blob_hash"):
+            self.blob_store.release(record["blob_hash"])
+        elif record.get("image_path"):
+            image_file = self.images_dir / record["image_path"]
+            try:
+                if image_file.exists():
+                    image_file.unlink()
+                    logger.debug(f"Deleted image file: {record['image_path']}")
+            except Exception as e:
+                logger.warning(f"Failed to delete image file {record['image_path']}: {e}")
+
     async def save(self, screenshot: ScreenshotData) -> str:
         """Save a screenshot."""
         if not screenshot.id:
             screenshot.id = str(uuid4())
 
-        # Save image bytes to file
-        if screenshot.image_bytes and not screenshot.image_path:
-            screenshot.image_path = self._save_image(screenshot)
-
-        self._cache[screenshot.id] = screenshot
-        self._save_data()
+        previous = self._records.get(screenshot.id)
+        if previous is not None and screenshot.image_data == b"" and screenshot.image is None:
+            # Metadata-only update of a stored screenshot
+            blob_hash = previous.get("blob_hash")
+            size_bytes = previous.get("size_bytes", 0)
+            if blob_hash:
+                self.blob_store.add_ref(blob_hash)
+        else:
+            blob_hash = self._store_image(screenshot)
+            size_bytes = len(screenshot.image_bytes) if blob_hash else 0
+
+        record = self._screenshot_to_dict(screenshot, blob_hash, size_bytes)
+        self._release_image(self._forget(screenshot.id))
+        self._remember(screenshot, record)
+        self._append_log({"op": "save", "screenshot": record})
 
         logger.debug(f"Saved screenshot: {screenshot.id}")
         return screenshot.id
 
     async def find_by_id(self, screenshot_id: str) -> Optional[ScreenshotData]:
         """Find screenshot by ID."""
-        return self._cache.get(screenshot_id)
+        screenshot = self._cache.get(screenshot_id)
+        return self._hydrate(screenshot) if screenshot else None
 
     async def find_all(self, limit: Optional[int] = None, offset: int = 0) -> List[ScreenshotData]:
         """Find all screenshots with pagination."""
@@ -178,28 +323,18 @@ class FileScreenshotRepository(ScreenshotRepository):
         # Apply pagination
         start = offset
         end = start + limit if limit else None
-        return screenshots[start:end]
+        return [self._hydrate(s) for s in screenshots[start:end]]
 
     async def delete(self, screenshot_id: str) -> bool:
         """Delete a screenshot."""
-        if screenshot_id in self._cache:
-            screenshot = self._cache[screenshot_id]
-
-            # Delete image file if exists
-            if screenshot.image_path:
-                image_file = self.images_dir / screenshot.image_path
-                try:
-                    if image_file.exists():
-                        image_file.unlink()
-                        logger.debug(f"Deleted image file: {screenshot.image_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete image file {screenshot.image_path}: {e}")
-
-            del self._cache[screenshot_id]
-            self._save_data()
-            logger.debug(f"Deleted screenshot: {screenshot_id}")
-            return True
-        return False
+        record = self._forget(screenshot_id)
+        if record is None:
+            return False
+
+        self._release_image(record)
+        self._append_log({"op": "delete", "id": screenshot_id})
+        logger.debug(f"Deleted screenshot: {screenshot_id}")
+        return True
 
     async def exists(self, screenshot_id: str) -> bool:
         """Check if screenshot exists."""
@@ -219,7 +354,7 @@ class FileScreenshotRepository(ScreenshotRepository):
 
         # Sort by timestamp descending
         results.sort(key=lambda s: s.timestamp, reverse=True)
-        return results
+        return [self._hydrate(s) for s in results]
 
     def _matches_criteria(self, screenshot: ScreenshotData, criteria: Dict[str, Any]) -> bool:
         """Check if screenshot matches search criteria."""
@@ -246,39 +381,36 @@ class FileScreenshotRepository(ScreenshotRepository):
         return getattr(screenshot, field, None) == value
 
     def _get_image_size(self, screenshot: ScreenshotData) -> int:
-        """Get the size of the screenshot image data."""
-        return len(screenshot.image_bytes) if screenshot.image_bytes else 0
+        """Get the size of the screenshot image data (from metadata, no file access)."""
+        record = self._records.get(screenshot.id)
+        return record.get("size_bytes", 0) if record else 0
 
     async def clear_all(self) -> int:
         """Clear all screenshots."""
         count = len(self._cache)
 
-        # Delete all image files
-        for screenshot in self._cache.values():
-            if screenshot.image_path:
-                image_file = self.images_dir / screenshot.image_path
-                try:
-                    if image_file.exists():
-                        image_file.unlink()
-                except Exception as e:
-                    logger.warning(f"Failed to delete image file {screenshot.image_path}: {e}")
+        for record in self._records.values():
+            self._release_image(record)
 
         self._cache.clear()
+        self._records.clear()
+        self._total_size = 0
         self._save_data()
+        self.blob_store.gc()
         logger.info(f"Cleared {count} screenshots")
         return count
 
+    async def collect_garbage(self) -> Dict[str, int]:
+        """Free image blobs that are no longer referenced by any screenshot."""
+        return self.blob_store.gc()
+
     async def get_statistics(self) -> Dict[str, Any]:
         """Get repository statistics."""
         if not self._cache:
             return {"total": 0}
 
         screenshots = list(self._cache.values())
-
-        # Size statistics
-        sizes = [len(s.image_bytes) if s.image_bytes else 0 for s in screenshots]
-        total_size = sum(sizes)
-        avg_size = total_size / len(sizes) if sizes else 0
+        total = len(screenshots)
 
         # Time-based statistics
         now = datetime.now()
@@ -287,11 +419,15 @@ class FileScreenshotRepository(ScreenshotRepository):
         # Coordinate statistics
         unique_coordinates = len(set(s.coordinates for s in screenshots))
 
+        blob_stats = self.blob_store.get_statistics()
         return {
-            "total": len(screenshots),
+            "total": total,
             "recent_week": recent_count,
-            "total_size_bytes": total_size,
-            "average_size_bytes": int(avg_size),
+            "total_size_bytes": self._total_size,
+            "average_size_bytes": int(self._total_size / total),
+            "stored_size_bytes": blob_stats["stored_bytes"],
+            "unique_images": blob_stats["blobs"],
+            "dedup_ratio": blob_stats["dedup_ratio"],
             "unique_coordinates": unique_coordinates,
             "oldest": min(s.timestamp for s in screenshots),
             "newest": max(s.timestamp for s in screenshots),
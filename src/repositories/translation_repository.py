@@ -4,15 +4,29 @@ Translation repository implementations.
 This module provides repository implementations for translation data persistence.
 """
 
+import heapq
 import json
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from uuid import uuid4
 
 from src.models.translation import Translation
 from src.repositories.base_repository import BaseRepository
 from src.utils.logger import logger
+from src.utils.metrics_rollup import RollupStore, language_pair_label
+from src.utils.search_index import FIELDS, TranslationSearchIndex
+
+# Sort keys for query(); results are ordered by (key, id)
+SORT_KEYS: Dict[str, Callable[[Translation], float]] = {
+    "timestamp": lambda t: t.timestamp.timestamp(),
+    "confidence": lambda t: t.confidence if t.confidence is not None else -1.0,
+    "duration": lambda t: float((t.metadata or {}).get("duration_ms") or 0.0),
+    "text_length": lambda t: float(len(t.original_text)),
+}
+
+SortKey = Tuple[float, str]
 
 
 class TranslationRepository(BaseRepository[Translation]):
@@ -45,10 +59,41 @@ class FileTranslationRepository(TranslationRepository):
         self.data_dir.mkdir(exist_ok=True)
         self.translations_file = self.data_dir / "translations.json"
         self._cache: Dict[str, Translation] = {}
+        self._index = TranslationSearchIndex()
+        self._usage = RollupStore()
+        self._usage_stale = True
+        self._file_stamp: Optional[Tuple[int, int]] = None
+        self._load_data()
+
+    def _read_file_stamp(self) -> Optional[Tuple[int, int]]:
+        """Modification time and size of the translations file (None if missing)."""
+        try:
+            stat = self.translations_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload translations if the file was written by another instance.
+
+        Returns:
+            True if the file changed since it was last loaded or saved here
+        """
+        if self._read_file_stamp() == self._file_stamp:
+            return False
+
+        self._cache = {}
+        self._index.clear()
+        self._usage_stale = True
         self._load_data()
+        self._notify_change("reload")
+        return True
 
     def _load_data(self) -> None:
         """Load translations from file into cache."""
+        # Taken before reading, so a write racing the load is seen as a change
+        self._file_stamp = self._read_file_stamp()
         try:
             if self.translations_file.exists():
                 with open(self.translations_file, "r", encoding="utf-8") as f:
@@ -61,6 +106,8 @@ class FileTranslationRepository(TranslationRepository):
                     except Exception as e:
                         logger.warning(f"Failed to load translation: {e}")
 
+                self._index.rebuild(self._cache.values())
+
                 logger.info(f"Loaded {len(self._cache)} translations from file")
             else:
                 logger.info("No existing translations file found, starting fresh")
@@ -68,6 +115,7 @@ class FileTranslationRepository(TranslationRepository):
         except Exception as e:
             logger.error(f"Failed to load translations: {e}")
             self._cache = {}
+            self._index.clear()
 
     def _save_data(self) -> None:
         """Save translations from cache to file."""
@@ -86,6 +134,7 @@ class FileTranslationRepository(TranslationRepository):
                 json.dump(data, f, indent=2, ensure_ascii=False)
 
             temp_file.replace(self.translations_file)
+            self._file_stamp = self._read_file_stamp()
             logger.debug(f"Saved {len(self._cache)} translations to file")
 
         except Exception as e:
@@ -124,8 +173,16 @@ class FileTranslationRepository(TranslationRepository):
         if not translation.id:
             translation.id = str(uuid4())
 
+        # Rollups can only grow: replacing a translation forces a rebuild
+        if translation.id in self._cache:
+            self._usage_stale = True
+        elif not self._usage_stale:
+            self._record_usage(translation)
+
         self._cache[translation.id] = translation
+        self._index.add_translation(translation)
         self._save_data()
+        self._notify_change("save", translation.id)
 
         logger.debug(f"Saved translation: {translation.id}")
         return translation.id
@@ -135,22 +192,157 @@ class FileTranslationRepository(TranslationRepository):
         return self._cache.get(translation_id)
 
     async def find_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Translation]:
-        """Find all translations with pagination."""
-        translations = list(self._cache.values())
+        """Find all translations with pagination, most recent first."""
+        # The index keeps documents ordered by time: only offset + limit IDs are read
+        ids = self._index.search(limit=offset + limit if limit else None)
+        return [self._cache[translation_id] for translation_id in ids[offset:]]
 
-        # Sort by timestamp descending
-        translations.sort(key=lambda t: t.timestamp, reverse=True)
+    async def find_recent(self, limit: int = 100) -> List[Translation]:
+        """Find recent translations ordered by timestamp."""
+        return await self.find_all(limit=limit)
+
+    def iter_all(self) -> Iterator[Translation]:
+        """
+        Iterate over all translations in storage order.
+
+        Used by streaming exports; iterates a snapshot of references, so
+        saves during the export do not affect it.
+        """
+        yield from list(self._cache.values())
+
+    async def query(
+        self,
+        text: str = "",
+        fields: Sequence[str] = FIELDS,
+        exact: bool = False,
+        criteria: Optional[Dict[str, Any]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        sort_field: str = "timestamp",
+        descending: bool = True,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        after: Optional[SortKey] = None,
+        predicate: Optional[Callable[[Translation], bool]] = None,
+    ) -> Tuple[List[Translation], int]:
+        """
+        Filtered, sorted and paginated read pushed down to the search index.
+
+        Text, language and date filters are answered by the index; other
+        criteria and ``predicate`` are checked on the candidates only. Results
+        are ordered by ``(SORT_KEYS[sort_field], id)`` and only
+        ``offset + limit`` of them are kept in a top-k heap.
+
+        Args:
+            text: Index query (prefix terms; a phrase if exact)
+            fields: Text fields searched by ``text``
+            exact: Match ``text`` as a phrase
+            criteria: Field criteria as in search()
+            since: Only translations at or after this time
+            until: Only translations at or before this time
+            sort_field: Key of SORT_KEYS
+            descending: Sort direction
+            limit: Page size (None for all)
+            offset: Items to skip
+            after: Keyset cursor - sort key of the last item of the previous page
+            predicate: Extra filter applied after the index lookup
+
+        Returns:
+            (page, total) where total counts all matches past the cursor,
+            ignoring offset and limit
+        """
+        criteria = dict(criteria or {})
+        index_args = {
+            key: criteria.pop(key)
+            for key in ("source_language", "target_language")
+            if key in criteria
+        }
+
+        low = since.timestamp() if since is not None else None
+        high = until.timestamp() if until is not None else None
 
-        # Apply pagination
-        start = offset
-        end = start + limit if limit else None
-        return translations[start:end]
+        # A time-keyed cursor narrows the index range scan (epochs compare exactly)
+        if after is not None and sort_field == "timestamp":
+            if descending:
+                high = after[0] if high is None else min(high, after[0])
+            else:
+                low = after[0] if low is None else max(low, after[0])
+
+        ids = self._index.search(
+            query=text,
+            fields=fields,
+            prefix=not exact,
+            phrase=exact,
+            since=low,
+            until=high,
+            **index_args,
+        )
+        end = offset + limit if limit is not None else None
+
+        # Fast path: index order is the requested order and nothing is left to check
+        if sort_field == "timestamp" and after is None and not criteria and predicate is None:
+            ordered = ids if descending else ids[::-1]
+            page = [self._cache[translation_id] for translation_id in ordered[offset:end]]
+            return page, len(ids)
+
+        sort_key = SORT_KEYS[sort_field]
+        total = 0
+
+        def keyed() -> Iterator[Tuple[SortKey, Translation]]:
+            nonlocal total
+            for translation_id in ids:
+                translation = self._cache.get(translation_id)
+                if translation is None or not self._matches_criteria(translation, criteria):
+                    continue
+                if predicate is not None and not predicate(translation):
+                    continue
+                key = (sort_key(translation), translation.id)
+                if after is None or (key < after if descending else key > after):
+                    total += 1
+                    yield key, translation
+
+        if end is None:
+            ranked = sorted(keyed(), key=itemgetter(0), reverse=descending)
+        elif descending:
+            ranked = heapq.nlargest(end, keyed(), key=itemgetter(0))
+        else:
+            ranked = heapq.nsmallest(end, keyed(), key=itemgetter(0))
+
+        # nlargest/nsmallest consume every candidate, so total is complete here
+        return [translation for _, translation in ranked[offset:]], total
+
+    def usage_rollups(self) -> RollupStore:
+        """
+        Minute/hour/day rollups of stored translations.
+
+        Series (each labelled with the language pair): "translations" with the
+        original text length as value, plus "cached" and "with_confidence".
+        Rollups are maintained on save and rebuilt after deletes or updates.
+        """
+        if self._usage_stale:
+            self._usage.clear()
+            for translation in self._cache.values():
+                self._record_usage(translation)
+            self._usage_stale = False
+        return self._usage
+
+    def _record_usage(self, translation: Translation) -> None:
+        pair = language_pair_label(translation.source_language, translation.target_language)
+        timestamp = translation.timestamp
+        self._usage.record("translations", len(translation.original_text), timestamp, True, pair)
+        if translation.cached:
+            self._usage.record("cached", 1, timestamp, True, pair)
+        if translation.confidence is not None:
+            self._usage.record("with_confidence", 1, timestamp, True, pair)
 
     async def delete(self, translation_id: str) -> bool:
         """Delete a translation."""
         if translation_id in self._cache:
             del self._cache[translation_id]
+            self._index.remove(translation_id)
+            self._usage_stale = True
             self._save_data()
+            self._notify_change("delete", translation_id)
             logger.debug(f"Deleted translation: {translation_id}")
             return True
         return False
@@ -164,15 +356,52 @@ class FileTranslationRepository(TranslationRepository):
         return len(self._cache)
 
     async def search(self, criteria: Dict[str, Any]) -> List[Translation]:
-        """Search translations by criteria."""
-        results = []
+        """
+        Search translations by criteria.
+
+        Text and language criteria, as well as ``query`` (free-text query over
+        both fields), ``since`` and ``until``, are answered by the search index;
+        remaining criteria are checked against the candidates.
+        """
+        criteria = dict(criteria)
+        index_args = {
+            key: criteria.pop(key)
+            for key in ("source_language", "target_language", "since", "until")
+            if key in criteria
+        }
 
-        for translation in self._cache.values():
-            if self._matches_criteria(translation, criteria):
-                results.append(translation)
+        text_searches = []
+        if "query" in criteria:
+            text_searches.append({"query": criteria.pop("query"), "prefix": True})
+        for key, field in (("original_text", "original"), ("translated_text", "translated")):
+            if key in criteria:
+                text_searches.append(
+                    {
+                        "query": criteria.pop(key),
+                        "fields": (field,),
+                        "phrase": True,
+                        "prefix": True,
+                    }
+                )
+
+        if not text_searches:
+            text_searches.append({})
+
+        ids: Optional[List[str]] = None
+        for text_search in text_searches:
+            found = self._index.search(**index_args, **text_search)
+            if ids is None:
+                ids = found
+            else:
+                found_set = set(found)
+                ids = [translation_id for translation_id in ids if translation_id in found_set]
 
-        # Sort by timestamp descending
-        results.sort(key=lambda t: t.timestamp, reverse=True)
+        # Index results are already sorted by timestamp descending
+        results = []
+        for translation_id in ids or []:
+            translation = self._cache.get(translation_id)
+            if translation is not None and self._matches_criteria(translation, criteria):
+                results.append(translation)
         return results
 
     def _matches_criteria(self, translation: Translation, criteria: Dict[str, Any]) -> bool:
@@ -203,7 +432,11 @@ class FileTranslationRepository(TranslationRepository):
         """Clear all translations."""
         count = len(self._cache)
         self._cache.clear()
+        self._index.clear()
+        self._usage.clear()
+        self._usage_stale = False
         self._save_data()
+        self._notify_change("clear")
         logger.info(f"Cleared {count} translations")
         return count
 
@@ -2,15 +2,20 @@
 Basic authentication manager for application security.
 """
 
+import atexit
 import hashlib
+import json
+import os
 import secrets
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Optional, Set, Tuple
 
-from src.security.audit import SecurityEventType, get_audit_logger
+from src.security.audit import SecurityEvent, SecurityEventType, get_audit_logger
 from src.security.encryption import get_encryption_manager
 from src.utils.logger import logger
 
@@ -92,7 +97,22 @@ class APIKey:
 class AuthenticationManager:
     """Basic authentication manager for Screen Translator."""
 
-    def __init__(self, data_dir: str = "data"):
+    def __init__(
+        self,
+        data_dir: str = "data",
+        validation_cache_ttl: float = 30.0,
+        validation_cache_size: int = 1024,
+        usage_flush_interval: float = 5.0,
+    ):
+        """
+        Initialize authentication manager.
+
+        Args:
+            data_dir: Directory for users and API key files
+            validation_cache_ttl: Seconds a validated API key is served from cache
+            validation_cache_size: Maximum number of cached validated keys
+            usage_flush_interval: Seconds between background writes of API key usage stats
+        """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
 
@@ -103,6 +123,20 @@ class AuthenticationManager:
         # API key management
         self.api_keys: Dict[str, APIKey] = {}
         self.api_keys_file = self.data_dir / "api_keys.json"
+        self._api_keys_lock = threading.RLock()
+        self._api_keys_write_lock = threading.Lock()  # Orders snapshots and file writes
+        self._key_hash_index: Dict[str, str] = {}  # key hash -> key_id
+
+        # Recently validated keys: key hash -> (cache deadline, record)
+        self.validation_cache_ttl = validation_cache_ttl
+        self.validation_cache_size = validation_cache_size
+        self._validation_cache: "OrderedDict[str, Tuple[float, APIKey]]" = OrderedDict()
+
+        # Usage stats are kept in memory and written by a background thread
+        self.usage_flush_interval = usage_flush_interval
+        self._usage_dirty = False
+        self._usage_writer: Optional[threading.Thread] = None
+        self._usage_writer_stop = threading.Event()
 
         # Simple user storage (for demo purposes)
         self.users: Dict[str, Dict] = {}
@@ -113,14 +147,14 @@ class AuthenticationManager:
         self.login_attempt_window = 300  # 5 minutes
         self.login_attempts: Dict[str, list] = {}  # ip -> [timestamps]
 
+        # Get dependencies (needed to decrypt stored data)
+        self.encryption_manager = get_encryption_manager()
+        self.audit_logger = get_audit_logger()
+
         # Load existing data
         self._load_users()
         self._load_api_keys()
 
-        # Get dependencies
-        self.encryption_manager = get_encryption_manager()
-        self.audit_logger = get_audit_logger()
-
         # Create default admin user if none exists
         if not self.users:
             self._create_default_admin()
@@ -174,7 +208,7 @@ class AuthenticationManager:
 
         # Log audit event
         self.audit_logger.log_event(
-            self.audit_logger.SecurityEvent(
+            SecurityEvent(
                 event_type=SecurityEventType.AUTH_LOGIN_SUCCESS,
                 description=f"User created: {user_id}",
                 user_id=user_id,
@@ -259,7 +293,7 @@ class AuthenticationManager:
 
         # Log logout
         self.audit_logger.log_event(
-            self.audit_logger.SecurityEvent(
+            SecurityEvent(
                 event_type=SecurityEventType.AUTH_LOGOUT,
                 description="User logged out",
                 user_id=session.user_id,
@@ -305,12 +339,14 @@ class AuthenticationManager:
             expires_at=expires_at,
         )
 
-        self.api_keys[key_id] = api_key_record
+        with self._api_keys_lock:
+            self.api_keys[key_id] = api_key_record
+            self._key_hash_index[key_hash] = key_id
         self._save_api_keys()
 
         # Log API key creation
         self.audit_logger.log_event(
-            self.audit_logger.SecurityEvent(
+            SecurityEvent(
                 event_type=SecurityEventType.API_KEY_CREATED,
                 description=f"API key created: {name}",
                 user_id=user_id,
@@ -323,36 +359,44 @@ class AuthenticationManager:
 
     def validate_api_key(self, api_key: str) -> Optional[APIKey]:
         """Validate API key and return key info if valid."""
+        now = time.time()
         key_hash = self._hash_api_key(api_key)
+        key_record = self._get_cached_api_key(key_hash, now)
+
+        if key_record is None:
+            with self._api_keys_lock:
+                key_id = self._key_hash_index.get(key_hash)
+                key_record = self.api_keys.get(key_id) if key_id else None
 
-        for key_record in self.api_keys.values():
-            if key_record.key_hash == key_hash:
-                if not key_record.is_active or key_record.is_expired():
-                    return None
+            if key_record is None or not key_record.is_active or key_record.is_expired():
+                return None
 
-                # Update usage stats
-                key_record.last_used = time.time()
-                key_record.usage_count += 1
-                self._save_api_keys()
+            self._cache_api_key(key_hash, key_record, now)
 
-                # Log API key usage
-                self.audit_logger.log_api_access(key_record.key_id, "api_call", True)
+        # Update usage stats in memory; persisted by the background writer
+        with self._api_keys_lock:
+            key_record.last_used = now
+            key_record.usage_count += 1
+        self._mark_usage_dirty()
 
-                return key_record
+        # Log API key usage
+        self.audit_logger.log_api_access(key_record.key_id, "api_call", True)
 
-        return None
+        return key_record
 
     def revoke_api_key(self, key_id: str) -> bool:
         """Revoke API key."""
-        if key_id not in self.api_keys:
-            return False
+        with self._api_keys_lock:
+            if key_id not in self.api_keys:
+                return False
 
-        self.api_keys[key_id].is_active = False
+            self.api_keys[key_id].is_active = False
+            self._invalidate_cached_api_key(key_id)
         self._save_api_keys()
 
         # Log API key revocation
         self.audit_logger.log_event(
-            self.audit_logger.SecurityEvent(
+            SecurityEvent(
                 event_type=SecurityEventType.API_KEY_REVOKED,
                 description=f"API key revoked: {key_id}",
                 metadata={"key_id": key_id},
@@ -362,6 +406,90 @@ class AuthenticationManager:
         logger.info(f"API key revoked: {key_id}")
         return True
 
+    def flush_api_key_usage(self) -> bool:
+        """
+        Persist pending API key usage stats.
+
+        Returns:
+            True if there was anything to write
+        """
+        with self._api_keys_lock:
+            if not self._usage_dirty:
+                return False
+            self._usage_dirty = False
+        if not self._save_api_keys():
+            # Keep the stats pending for the next attempt
+            self._usage_dirty = True
+        return True
+
+    def shutdown(self) -> None:
+        """Stop the usage writer and persist pending usage stats."""
+        atexit.unregister(self.shutdown)
+        self._usage_writer_stop.set()
+        if self._usage_writer is not None:
+            self._usage_writer.join(timeout=self.usage_flush_interval + 1.0)
+            self._usage_writer = None
+        self.flush_api_key_usage()
+
+    def _get_cached_api_key(self, key_hash: str, now: float) -> Optional[APIKey]:
+        """Get a recently validated key record, if still fresh."""
+        with self._api_keys_lock:
+            cached = self._validation_cache.get(key_hash)
+            if cached is None:
+                return None
+            deadline, key_record = cached
+            if now >= deadline or not key_record.is_active:
+                del self._validation_cache[key_hash]
+                return None
+            self._validation_cache.move_to_end(key_hash)
+            return key_record
+
+    def _cache_api_key(self, key_hash: str, key_record: APIKey, now: float) -> None:
+        """Remember a validated key; entries never outlive the key's expiry."""
+        if self.validation_cache_ttl <= 0:
+            return
+
+        deadline = now + self.validation_cache_ttl
+        if key_record.expires_at is not None:
+            deadline = min(deadline, key_record.expires_at)
+
+        with self._api_keys_lock:
+            self._validation_cache[key_hash] = (deadline, key_record)
+            self._validation_cache.move_to_end(key_hash)
+            while len(self._validation_cache) > self.validation_cache_size:
+                self._validation_cache.popitem(last=False)
+
+    def _invalidate_cached_api_key(self, key_id: str) -> None:
+        """Drop cached validations of a key."""
+        with self._api_keys_lock:
+            stale = [k for k, (_, rec) in self._validation_cache.items() if rec.key_id == key_id]
+            for key_hash in stale:
+                del self._validation_cache[key_hash]
+
+    def _mark_usage_dirty(self) -> None:
+        """Schedule a background write of usage stats."""
+        self._usage_dirty = True
+        if self._usage_writer is None or not self._usage_writer.is_alive():
+            with self._api_keys_lock:
+                if self._usage_writer is None or not self._usage_writer.is_alive():
+                    # Pending stats are also written when the interpreter exits;
+                    # registering again replaces the previous hook
+                    atexit.unregister(self.shutdown)
+                    atexit.register(self.shutdown)
+                    self._usage_writer_stop.clear()
+                    self._usage_writer = threading.Thread(
+                        target=self._usage_writer_loop, name="APIKeyUsageWriter", daemon=True
+                    )
+                    self._usage_writer.start()
+
+    def _usage_writer_loop(self) -> None:
+        """Periodically persist usage stats until stopped."""
+        while not self._usage_writer_stop.wait(self.usage_flush_interval):
+            try:
+                self.flush_api_key_usage()
+            except Exception as e:
+                logger.error(f"Failed to flush API key usage: {e}")
+
     def change_user_password(self, user_id: str, old_password: str, new_password: str) -> bool:
         """Change user password."""
         user = self.users.get(user_id)
@@ -379,7 +507,7 @@ class AuthenticationManager:
 
         # Log password change
         self.audit_logger.log_event(
-            self.audit_logger.SecurityEvent(
+            SecurityEvent(
                 event_type=SecurityEventType.CONFIG_CHANGE,
                 description="Password changed",
                 user_id=user_id,
@@ -447,8 +575,6 @@ class AuthenticationManager:
             return
 
         try:
-            import json
-
             with open(self.users_file, "r", encoding="utf-8") as f:
                 encrypted_data = json.load(f)
                 decrypted_data = self.encryption_manager.decrypt_dict(encrypted_data)
@@ -460,8 +586,6 @@ class AuthenticationManager:
     def _save_users(self) -> None:
         """Save users to file."""
         try:
-            import json
-
             data_to_encrypt = {"users": json.dumps(self.users)}
             encrypted_data = self.encryption_manager.encrypt_dict(data_to_encrypt)
 
@@ -476,8 +600,6 @@ class AuthenticationManager:
             return
 
         try:
-            import json
-
             with open(self.api_keys_file, "r", encoding="utf-8") as f:
                 encrypted_data = json.load(f)
                 decrypted_data = self.encryption_manager.decrypt_dict(encrypted_data)
@@ -485,6 +607,7 @@ class AuthenticationManager:
 
                 # Convert to APIKey objects
                 for key_id, key_data in api_keys_data.items():
+                    self._key_hash_index[key_data["key_hash"]] = key_id
                     self.api_keys[key_id] = APIKey(
                         key_id=key_data["key_id"],
                         key_hash=key_data["key_hash"],
@@ -500,33 +623,48 @@ class AuthenticationManager:
         except Exception as e:
             logger.error(f"Failed to load API keys: {e}")
 
-    def _save_api_keys(self) -> None:
-        """Save API keys to file."""
-        try:
-            import json
-
-            api_keys_data = {}
-
-            for key_id, key_record in self.api_keys.items():
-                api_keys_data[key_id] = {
-                    "key_id": key_record.key_id,
-                    "key_hash": key_record.key_hash,
-                    "name": key_record.name,
-                    "created_at": key_record.created_at,
-                    "last_used": key_record.last_used,
-                    "usage_count": key_record.usage_count,
-                    "is_active": key_record.is_active,
-                    "permissions": list(key_record.permissions),
-                    "expires_at": key_record.expires_at,
-                }
-
-            data_to_encrypt = {"api_keys": json.dumps(api_keys_data)}
-            encrypted_data = self.encryption_manager.encrypt_dict(data_to_encrypt)
+    def _save_api_keys(self) -> bool:
+        """Save API keys to file. Returns True on success."""
+        with self._api_keys_write_lock:
+            try:
+                with self._api_keys_lock:
+                    api_keys_data = {
+                        key_id: self._api_key_to_dict(key_record)
+                        for key_id, key_record in self.api_keys.items()
+                    }
+
+                data_to_encrypt = {"api_keys": json.dumps(api_keys_data)}
+                encrypted_data = self.encryption_manager.encrypt_dict(data_to_encrypt)
+                self._atomic_write_json(self.api_keys_file, encrypted_data)
+                return True
+            except Exception as e:
+                logger.error(f"Failed to save API keys: {e}")
+                return False
+
+    @staticmethod
+    def _api_key_to_dict(key_record: APIKey) -> Dict:
+        """Convert API key record to a serializable dictionary."""
+        return {
+            "key_id": key_record.key_id,
+            "key_hash": key_record.key_hash,
+            "name": key_record.name,
+            "created_at": key_record.created_at,
+            "last_used": key_record.last_used,
+            "usage_count": key_record.usage_count,
+            "is_active": key_record.is_active,
+            "permissions": list(key_record.permissions),
+            "expires_at": key_record.expires_at,
+        }
 
-            with open(self.api_keys_file, "w", encoding="utf-8") as f:
-                json.dump(encrypted_data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save API keys: {e}")
+    @staticmethod
+    def _atomic_write_json(path: Path, data: Dict) -> None:
+        """Write JSON via temp file, fsync and rename so a crash never truncates the file."""
+        temp_file = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
 
     def cleanup_expired_sessions(self) -> int:
         """Clean up expired sessions. Returns number of sessions cleaned."""
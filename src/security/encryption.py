@@ -3,11 +3,24 @@
 import base64
 import hashlib
 import os
+import struct
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Dict, Iterable, List, Optional
 
 from src.utils.logger import logger
 
+# Version prefix of string tokens. Version 2 tokens carry the Fernet token as
+# is; unprefixed (legacy) tokens wrap it in an extra urlsafe base64 layer.
+TOKEN_PREFIX_V2 = "v2:"
+
+# Encrypted file format: magic header followed by one line per chunk
+FILE_MAGIC = b"STENC2\n"
+FILE_CHUNK_SIZE = 64 * 1024
+
+# Per-chunk header inside the encrypted payload: chunk index and final flag,
+# so reordered, dropped or truncated chunks are detected on decryption
+_CHUNK_HEADER = struct.Struct(">QB")
+
 
 class EncryptionManager:
     """Manager for encrypting and decrypting sensitive data."""
@@ -16,6 +29,7 @@ class EncryptionManager:
         self.key_file = Path(key_file) if key_file else Path("data/.encryption_key")
         self._key: Optional[bytes] = None
         self._salt: Optional[bytes] = None
+        self._fernet = None
         self._setup_encryption()
 
     def _setup_encryption(self) -> None:
@@ -37,6 +51,10 @@ class EncryptionManager:
             else:
                 self._generate_key()
 
+            # Fernet instances are immutable and safe to share between threads
+            if self._fernet_available and self._key:
+                self._fernet = Fernet(self._key)
+
             logger.info("Encryption manager initialized with Fernet encryption")
 
         except ImportError:
@@ -98,62 +116,198 @@ class EncryptionManager:
             return ""
 
         try:
-            if self._fernet_available and self._key:
-                fernet = self._Fernet(self._key)
-                encrypted_bytes = fernet.encrypt(plaintext.encode("utf-8"))
-                return base64.urlsafe_b64encode(encrypted_bytes).decode("utf-8")
-            else:
-                # Fallback: simple base64 encoding (NOT secure!)
-                encoded = base64.b64encode(plaintext.encode("utf-8"))
-                return encoded.decode("utf-8")
-
+            return self._encrypt_text(plaintext)
         except Exception as e:
             logger.error(f"Encryption failed: {e}")
             return plaintext  # Return original if encryption fails
 
     def decrypt_string(self, encrypted_text: str) -> str:
-        """Decrypt string data."""
+        """Decrypt string data (current and legacy token formats)."""
         if not encrypted_text:
             return ""
 
         try:
-            if self._fernet_available and self._key:
-                fernet = self._Fernet(self._key)
-                encrypted_bytes = base64.urlsafe_b64decode(encrypted_text.encode("utf-8"))
-                decrypted_bytes = fernet.decrypt(encrypted_bytes)
-                return decrypted_bytes.decode("utf-8")
-            else:
-                # Fallback: simple base64 decoding
-                decoded = base64.b64decode(encrypted_text.encode("utf-8"))
-                return decoded.decode("utf-8")
-
+            return self._decrypt_text(encrypted_text)
         except Exception as e:
             logger.error(f"Decryption failed: {e}")
             return encrypted_text  # Return original if decryption fails
 
-    def encrypt_dict(self, data: Dict[str, Any]) -> Dict[str, str]:
-        """Encrypt dictionary values."""
-        encrypted_dict = {}
-
-        for key, value in data.items():
-            if isinstance(value, str):
-                encrypted_dict[key] = self.encrypt_string(value)
-            elif isinstance(value, (int, float, bool)):
-                encrypted_dict[key] = self.encrypt_string(str(value))
+    def _encrypt_text(self, plaintext: str) -> str:
+        if self._fernet is not None:
+            token = self._fernet.encrypt(plaintext.encode("utf-8"))
+            return TOKEN_PREFIX_V2 + token.decode("ascii")
+
+        # Fallback: simple base64 encoding (NOT secure!)
+        return base64.b64encode(plaintext.encode("utf-8")).decode("utf-8")
+
+    def _decrypt_text(self, encrypted_text: str) -> str:
+        if self._fernet is not None:
+            if encrypted_text.startswith(TOKEN_PREFIX_V2):
+                token = encrypted_text[len(TOKEN_PREFIX_V2) :].encode("ascii")
             else:
-                # For complex types, convert to string first
-                encrypted_dict[key] = self.encrypt_string(str(value))
+                # Legacy token: Fernet token wrapped in a second base64 layer
+                token = base64.urlsafe_b64decode(encrypted_text.encode("utf-8"))
+            return self._fernet.decrypt(token).decode("utf-8")
+
+        # Fallback: simple base64 decoding
+        return base64.b64decode(encrypted_text.encode("utf-8")).decode("utf-8")
+
+    def encrypt_many(self, values: Iterable[str]) -> List[str]:
+        """
+        Encrypt many strings with the shared cipher.
+
+        Args:
+            values: Strings to encrypt
+
+        Returns:
+            Tokens in input order; values that fail to encrypt are returned as is
+        """
+        encrypt = self._encrypt_text
+        results = []
+        failures = 0
+        for value in values:
+            if not value:
+                results.append("")
+                continue
+            try:
+                results.append(encrypt(value))
+            except Exception:
+                failures += 1
+                results.append(value)
+
+        if failures:
+            logger.error(f"Encryption failed for {failures} values")
+        return results
+
+    def decrypt_many(self, tokens: Iterable[str]) -> List[str]:
+        """
+        Decrypt many tokens with the shared cipher.
+
+        Args:
+            tokens: Tokens to decrypt (current or legacy format)
+
+        Returns:
+            Plaintexts in input order; tokens that fail to decrypt are returned as is
+        """
+        decrypt = self._decrypt_text
+        results = []
+        failures = 0
+        for token in tokens:
+            if not token:
+                results.append("")
+                continue
+            try:
+                results.append(decrypt(token))
+            except Exception:
+                failures += 1
+                results.append(token)
 
-        return encrypted_dict
+        if failures:
+            logger.error(f"Decryption failed for {failures} values")
+        return results
+
+    def encrypt_dict(self, data: Dict[str, Any]) -> Dict[str, str]:
+        """Encrypt dictionary values (non-string values are converted to strings)."""
+        values = [value if isinstance(value, str) else str(value) for value in data.values()]
+        return dict(zip(data.keys(), self.encrypt_many(values)))
 
     def decrypt_dict(self, encrypted_data: Dict[str, str]) -> Dict[str, str]:
         """Decrypt dictionary values."""
-        decrypted_dict = {}
-
-        for key, encrypted_value in encrypted_data.items():
-            decrypted_dict[key] = self.decrypt_string(encrypted_value)
-
-        return decrypted_dict
+        return dict(zip(encrypted_data.keys(), self.decrypt_many(encrypted_data.values())))
+
+    def encrypt_stream(
+        self, source: BinaryIO, target: BinaryIO, chunk_size: int = FILE_CHUNK_SIZE
+    ) -> int:
+        """
+        Encrypt a binary stream chunk by chunk.
+
+        Memory use is bounded by the chunk size regardless of the stream length.
+
+        Args:
+            source: Readable binary stream
+            target: Writable binary stream
+            chunk_size: Plaintext bytes per encrypted chunk
+
+        Returns:
+            Number of plaintext bytes encrypted
+        """
+        target.write(FILE_MAGIC)
+
+        total = 0
+        index = 0
+        chunk = source.read(chunk_size)
+        while True:
+            next_chunk = source.read(chunk_size) if chunk else b""
+            final = not next_chunk
+            target.write(self._encrypt_chunk(index, final, chunk) + b"\n")
+            total += len(chunk)
+            if final:
+                return total
+            chunk = next_chunk
+            index += 1
+
+    def decrypt_stream(self, source: BinaryIO, target: BinaryIO) -> int:
+        """
+        Decrypt a binary stream written by encrypt_stream.
+
+        Args:
+            source: Readable binary stream
+            target: Writable binary stream
+
+        Returns:
+            Number of plaintext bytes written
+
+        Raises:
+            ValueError: If the stream is not an encrypted stream or is corrupted
+        """
+        if source.read(len(FILE_MAGIC)) != FILE_MAGIC:
+            raise ValueError("Not an encrypted stream")
+
+        total = 0
+        expected_index = 0
+        for line in source:
+            try:
+                payload = self._decrypt_chunk(line.rstrip(b"\n"))
+                index, final = _CHUNK_HEADER.unpack_from(payload)
+            except Exception as e:
+                raise ValueError(f"Corrupted chunk {expected_index}: {e}") from e
+
+            if index != expected_index:
+                raise ValueError(f"Unexpected chunk {index}, expected {expected_index}")
+
+            data = payload[_CHUNK_HEADER.size :]
+            target.write(data)
+            total += len(data)
+            if final:
+                return total
+            expected_index += 1
+
+        raise ValueError("Encrypted stream is truncated")
+
+    def encrypt_file(
+        self, source_path: str, target_path: str, chunk_size: int = FILE_CHUNK_SIZE
+    ) -> int:
+        """Encrypt a file in chunks. Returns number of plaintext bytes."""
+        with open(source_path, "rb") as source, open(target_path, "wb") as target:
+            return self.encrypt_stream(source, target, chunk_size)
+
+    def decrypt_file(self, source_path: str, target_path: str) -> int:
+        """Decrypt a file written by encrypt_file. Returns number of plaintext bytes."""
+        with open(source_path, "rb") as source, open(target_path, "wb") as target:
+            return self.decrypt_stream(source, target)
+
+    def _encrypt_chunk(self, index: int, final: bool, data: bytes) -> bytes:
+        payload = _CHUNK_HEADER.pack(index, 1 if final else 0) + data
+        if self._fernet is not None:
+            return self._fernet.encrypt(payload)
+
+        # Fallback: simple base64 encoding (NOT secure!)
+        return base64.b64encode(payload)
+
+    def _decrypt_chunk(self, token: bytes) -> bytes:
+        if self._fernet is not None:
+            return self._fernet.decrypt(token)
+        return base64.b64decode(token, validate=True)
 
     def hash_password(self, password: str) -> str:
         """Hash password for secure storage."""
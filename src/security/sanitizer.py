@@ -3,11 +3,102 @@ Data sanitization for privacy and security.
 """
 
 import re
+from bisect import bisect_right
 from enum import Enum
 from typing import Dict, List, Optional, Set, Tuple
 
 from src.utils.logger import logger
 
+# Trigger patterns: every match of the sanitization pattern contains a match of
+# its trigger. Triggers start with a literal or a character class, which the
+# regex engine scans for without attempting a full match at every position,
+# so lines without a trigger are never handed to the (much slower) pattern.
+_DIGIT_RUN = re.compile(r"\d{3}")
+_PATTERN_TRIGGERS: Dict[str, re.Pattern] = {
+    "email": re.compile("@"),
+    "phone": _DIGIT_RUN,
+    "ssn": _DIGIT_RUN,
+    "credit_card": _DIGIT_RUN,
+    "ipv4": re.compile(r"\d\.\d"),
+    "ipv6": re.compile(r"[0-9a-fA-F]:[0-9a-fA-F]"),
+    "mac_address": re.compile(r"[0-9A-Fa-f][:-][0-9A-Fa-f]"),
+    "url": re.compile("://"),
+    "domain": re.compile(r"\.[a-zA-Z]{2}"),
+    "api_key": re.compile(r"[A-Za-z0-9]{32}"),
+    "jwt_token": re.compile("eyJ"),
+    "windows_path": re.compile(r":\\"),
+    "unix_path": re.compile(r"\w/"),
+    "connection_string": re.compile("://"),
+    "password_field": re.compile(r"pass|pwd", re.IGNORECASE),
+}
+
+# Texts up to this length are checked for triggers as a whole, not per line
+_WINDOWED_MIN_LENGTH = 512
+
+# Patterns with unbounded whitespace can span any number of lines, so line
+# windows would cut their matches; they scan the whole text once triggered
+_WHOLE_TEXT_PATTERNS = frozenset({"password_field"})
+
+# Patterns applied to OCR output after the main scan
+_MASKED_CARD_NUMBER = re.compile(r"\b\d{4}[\s-]?\*+[\s-]?\*+[\s-]?\d{4}\b")
+_ACCOUNT_NUMBER = re.compile(r"\b(?:Account|Acct)[\s#:]*\d+\b", re.IGNORECASE)
+
+
+class _TriggerWindows:
+    """
+    Line windows of a text that contain a trigger.
+
+    Windows are unions of triggered lines extended by one line on each side,
+    so matches spanning a line break are still found. Results are cached per
+    trigger, so patterns sharing a trigger scan the text once.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._line_starts: Optional[List[int]] = None
+        self._cache: Dict[re.Pattern, List[Tuple[int, int]]] = {}
+
+    def get(self, trigger: Optional[re.Pattern]) -> List[Tuple[int, int]]:
+        """Get ``(start, end)`` windows for a trigger (whole text if None)."""
+        if trigger is None:
+            return [(0, len(self.text))]
+
+        windows = self._cache.get(trigger)
+        if windows is None:
+            windows = self._cache[trigger] = self._find(trigger)
+        return windows
+
+    def _find(self, trigger: re.Pattern) -> List[Tuple[int, int]]:
+        text = self.text
+        if "\n" not in text:
+            return [(0, len(text))] if trigger.search(text) else []
+
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer("\n", text)]
+        starts = self._line_starts
+        last_line = len(starts) - 1
+
+        windows: List[Tuple[int, int]] = []
+        pos = 0
+        while True:
+            match = trigger.search(text, pos)
+            if match is None:
+                break
+            line = bisect_right(starts, match.start()) - 1
+            first = max(0, line - 1)
+            after = line + 2  # Line index after the window
+            start = starts[first]
+            end = starts[after] if after <= last_line else len(text)
+            if windows and start <= windows[-1][1]:
+                windows[-1] = (windows[-1][0], end)
+            else:
+                windows.append((start, end))
+            # Continue with the next line; this one is already covered
+            if line + 1 > last_line:
+                break
+            pos = starts[line + 1]
+        return windows
+
 
 class SanitizationLevel(Enum):
     """Data sanitization levels."""
@@ -49,9 +140,9 @@ class DataSanitizer:
             "connection_string": re.compile(
                 r'(?:mongodb|mysql|postgresql|sqlite)://[^\s<>"{}|\\^`\[\]]+'
             ),
-            # Passwords in common formats
+            # Passwords in common formats (the key is kept, the value is redacted)
             "password_field": re.compile(
-                r'(?i)(?:password|passwd|pwd)\s*[:=]\s*[\'"]?([^\s\'"]+)', re.IGNORECASE
+                r'((?:password|passwd|pwd)\s*[:=]\s*[\'"]?)[^\s\'"]+', re.IGNORECASE
             ),
         }
 
@@ -73,9 +164,11 @@ class DataSanitizer:
 
         # Custom sanitization rules
         self.custom_rules: List[Tuple[re.Pattern, str]] = []
+        self._rules_cache: Dict[bool, List[Tuple[str, re.Pattern, str, re.Pattern]]] = {}
 
         # Statistics
         self.sanitization_stats = {pattern_name: 0 for pattern_name in self.patterns.keys()}
+        self.custom_rule_stats: Dict[str, int] = {}
         self.total_sanitizations = 0
 
         logger.info("Data sanitizer initialized")
@@ -100,28 +193,15 @@ class DataSanitizer:
         if not text:
             return text
 
-        sanitized = text
-        replacements_made = 0
-
-        # Apply built-in patterns
-        for pattern_name, pattern in self.patterns.items():
-            if pattern_name in ["domain", "url"] and not aggressive:
-                # Skip domain/URL sanitization unless aggressive mode
-                continue
+        matches = self._find_matches(text, aggressive)
+        sanitized = self._replace_matches(text, matches)
 
-            matches = pattern.findall(sanitized)
-            if matches:
-                replacement = self._get_replacement(pattern_name, aggressive)
-                sanitized = pattern.sub(replacement, sanitized)
-                replacements_made += len(matches)
-                self.sanitization_stats[pattern_name] += len(matches)
-
-        # Apply custom rules
-        for custom_pattern, replacement in self.custom_rules:
-            matches = custom_pattern.findall(sanitized)
-            if matches:
-                sanitized = custom_pattern.sub(replacement, sanitized)
-                replacements_made += len(matches)
+        replacements_made = len(matches)
+        for name, _, _ in matches:
+            if name in self.sanitization_stats:
+                self.sanitization_stats[name] += 1
+            else:
+                self.custom_rule_stats[name] = self.custom_rule_stats.get(name, 0) + 1
 
         # Additional aggressive sanitization
         if aggressive:
@@ -129,10 +209,95 @@ class DataSanitizer:
 
         if replacements_made > 0:
             self.total_sanitizations += replacements_made
-            logger.debug(f"Sanitized {replacements_made} sensitive items from text")
+            logger.debug("Sanitized %d sensitive items from text", replacements_made)
 
         return sanitized
 
+    def _find_matches(self, text: str, aggressive: bool) -> List[Tuple[str, re.Match, str]]:
+        """
+        Find non-overlapping matches of all patterns and custom rules.
+
+        Patterns are skipped when their trigger is absent; in longer texts
+        each pattern only scans the line windows that contain its trigger.
+        Overlaps are resolved leftmost-first; at the same position the pattern
+        listed first wins (built-in patterns before custom rules).
+
+        Returns:
+            Sorted list of (pattern name, match, replacement template)
+        """
+        windows = _TriggerWindows(text) if len(text) > _WINDOWED_MIN_LENGTH else None
+        whole_text = [(0, len(text))]
+        fired: Dict[re.Pattern, bool] = {}
+        candidates = []
+
+        rules = self._get_rules(aggressive)
+        if self.custom_rules:
+            rules = rules + [
+                (custom_pattern.pattern, custom_pattern, replacement, None)
+                for custom_pattern, replacement in self.custom_rules
+            ]
+
+        for priority, (name, pattern, replacement, trigger) in enumerate(rules):
+            if windows is not None and name in _WHOLE_TEXT_PATTERNS:
+                spans = whole_text if windows.get(trigger) else ()
+            elif windows is not None:
+                spans = windows.get(trigger)
+            elif trigger is None:
+                spans = whole_text
+            else:
+                # Short texts: a single trigger check per text instead of windows
+                hit = fired.get(trigger)
+                if hit is None:
+                    hit = fired[trigger] = trigger.search(text) is not None
+                spans = whole_text if hit else ()
+
+            for start, end in spans:
+                for match in pattern.finditer(text, start, end):
+                    if match.end() > match.start():
+                        candidates.append((match.start(), priority, name, match, replacement))
+
+        candidates.sort(key=lambda candidate: candidate[:2])
+
+        matches = []
+        position = 0
+        for start, _, name, match, replacement in candidates:
+            if start >= position:
+                matches.append((name, match, replacement))
+                position = match.end()
+        return matches
+
+    def _get_rules(self, aggressive: bool) -> List[Tuple[str, re.Pattern, str, re.Pattern]]:
+        """Get built-in (name, pattern, replacement, trigger) rules, built once per mode."""
+        rules = self._rules_cache.get(aggressive)
+        if rules is None:
+            rules = self._rules_cache[aggressive] = [
+                (
+                    name,
+                    pattern,
+                    self._get_replacement(name, aggressive),
+                    _PATTERN_TRIGGERS.get(name),
+                )
+                for name, pattern in self.patterns.items()
+                # Skip domain/URL sanitization unless aggressive mode
+                if aggressive or name not in ("domain", "url")
+            ]
+        return rules
+
+    @staticmethod
+    def _replace_matches(text: str, matches: List[Tuple[str, re.Match, str]]) -> str:
+        """Build the sanitized text in a single sweep."""
+        if not matches:
+            return text
+
+        parts = []
+        position = 0
+        for _, match, replacement in matches:
+            parts.append(text[position : match.start()])
+            parts.append(match.expand(replacement) if "\\" in replacement else replacement)
+            position = match.end()
+        parts.append(text[position:])
+        return "".join(parts)
+
     def _get_replacement(self, pattern_name: str, aggressive: bool = False) -> str:
         """Get appropriate replacement text for pattern."""
         replacements = {
@@ -156,6 +321,10 @@ class DataSanitizer:
 
     def _aggressive_sanitize(self, text: str) -> str:
         """Apply aggressive sanitization."""
+        text_lower = text.lower()
+        if not any(keyword in text_lower for keyword in self.sensitive_keywords):
+            return text
+
         # Look for potential sensitive data patterns
         lines = text.split("\n")
         sanitized_lines = []
@@ -245,6 +414,10 @@ class DataSanitizer:
         detected = {}
 
         for pattern_name, pattern in self.patterns.items():
+            trigger = _PATTERN_TRIGGERS.get(pattern_name)
+            if trigger is not None and trigger.search(text) is None:
+                continue
+
             matches = pattern.findall(text)
             if matches:
                 detected[pattern_name] = matches
@@ -263,12 +436,10 @@ class DataSanitizer:
 
         # Additional OCR-specific sanitization
         # Remove potential credit card numbers that might be partially recognized
-        sanitized = re.sub(r"\b\d{4}[\s-]?\*+[\s-]?\*+[\s-]?\d{4}\b", "[CARD_NUMBER]", sanitized)
+        sanitized = _MASKED_CARD_NUMBER.sub("[CARD_NUMBER]", sanitized)
 
         # Remove potential account numbers
-        sanitized = re.sub(
-            r"\b(?:Account|Acct)[\s#:]*\d+\b", "[ACCOUNT_NUMBER]", sanitized, flags=re.IGNORECASE
-        )
+        sanitized = _ACCOUNT_NUMBER.sub("[ACCOUNT_NUMBER]", sanitized)
 
         return sanitized
 
@@ -286,6 +457,7 @@ class DataSanitizer:
         return {
             "total_sanitizations": self.total_sanitizations,
             "by_pattern": dict(self.sanitization_stats),
+            "by_custom_rule": dict(self.custom_rule_stats),
             "custom_rules_count": len(self.custom_rules),
             "patterns_available": list(self.patterns.keys()),
         }
@@ -293,6 +465,7 @@ class DataSanitizer:
     def reset_stats(self) -> None:
         """Reset sanitization statistics."""
         self.sanitization_stats = {pattern_name: 0 for pattern_name in self.patterns.keys()}
+        self.custom_rule_stats = {}
         self.total_sanitizations = 0
         logger.info("Sanitization statistics reset")
 
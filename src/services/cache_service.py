@@ -61,7 +61,7 @@ class TranslationCache:
         while len(self.cache) >= self.max_size and self.access_order:
             lru_key = self.access_order[0]
             self._remove_entry(lru_key)
-            logger.debug(f"Evicted LRU cache entry: {lru_key}")
+            logger.debug("Evicted LRU cache entry: %s", lru_key)
 
     def get(self, text: str, target_language: str) -> Optional[Translation]:
         """Get translation from cache"""
@@ -75,14 +75,14 @@ class TranslationCache:
 
         if key not in self.cache:
             self.misses += 1
-            logger.debug(f"Cache miss for key: {key[:8]}...")
+            logger.debug("Cache miss for key: %.8s...", key)
             return None
 
         entry = self.cache[key]
 
         if self._is_expired(entry):
             self._remove_entry(key)
-            logger.debug(f"Cache entry expired: {key[:8]}...")
+            logger.debug("Cache entry expired: %.8s...", key)
             return None
 
         # Update access order
@@ -92,7 +92,7 @@ class TranslationCache:
         translation.cached = True
 
         self.hits += 1
-        logger.debug(f"Cache hit for key: {key[:8]}...")
+        logger.debug("Cache hit for key: %.8s...", key)
         return translation
 
     def set(self, text: str, target_language: str, translation: Translation) -> None:
@@ -111,7 +111,7 @@ class TranslationCache:
         # Update access order
         self._update_access_order(key)
 
-        logger.debug(f"Cached translation for key: {key[:8]}...")
+        logger.debug("Cached translation for key: %.8s...", key)
 
     def add(self, translation: Translation) -> None:
         """Add translation to cache (convenience method)"""
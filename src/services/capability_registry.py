@@ -0,0 +1,375 @@
+"""
+Capability registry for Screen Translator v2.0.
+Probes engine availability once, in the background, and caches the results
+on disk so restarts and health checks do not repeat expensive probes.
+"""
+
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Set
+
+from src.utils.logger import logger
+
+# Default location of the persistent capability cache (under the project data dir)
+DEFAULT_CAPABILITY_CACHE = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "cache", "capabilities.json")
+)
+
+# Cached probe results are trusted for this long (seconds)
+DEFAULT_CAPABILITY_TTL = 24 * 60 * 60
+
+
+class CapabilityState(Enum):
+    """Probe state of a capability."""
+
+    UNKNOWN = "unknown"
+    PROBING = "probing"
+    AVAILABLE = "available"
+    UNAVAILABLE = "unavailable"
+
+
+@dataclass
+class CapabilityStatus:
+    """Last known availability of a capability."""
+
+    name: str
+    state: CapabilityState = CapabilityState.UNKNOWN
+    version: Optional[str] = None
+    checked_at: float = 0.0
+    duration: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def available(self) -> Optional[bool]:
+        """True/False when probed, None while unknown."""
+        if self.state == CapabilityState.AVAILABLE:
+            return True
+        if self.state == CapabilityState.UNAVAILABLE:
+            return False
+        return None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert status to dictionary."""
+        data = asdict(self)
+        data["state"] = self.state.value
+        data["available"] = self.available
+        return data
+
+
+def binary_version(command: Optional[str]) -> str:
+    """
+    Get a cheap version key of an executable (path, mtime and size).
+
+    Args:
+        command: Executable name or path
+
+    Returns:
+        Version key; changes when the binary is installed, updated or removed
+    """
+    path = shutil.which(command) if command else None
+    if path is None:
+        return "missing"
+
+    try:
+        stat = os.stat(path)
+        return f"{os.path.realpath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+    except OSError:
+        return "missing"
+
+
+def package_version(distribution: str) -> str:
+    """Get installed version of a Python distribution ("missing" if absent)."""
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            return version(distribution)
+        except PackageNotFoundError:
+            return "missing"
+    except ImportError:
+        return "unknown"
+
+
+@dataclass
+class _Probe:
+    """Registered probe of a capability."""
+
+    func: Callable[[], bool]
+    version: Optional[str]
+
+
+class CapabilityRegistry:
+    """Caches engine availability probes with TTL and disk persistence."""
+
+    def __init__(
+        self,
+        cache_file: Optional[str] = DEFAULT_CAPABILITY_CACHE,
+        ttl: float = DEFAULT_CAPABILITY_TTL,
+    ):
+        """
+        Initialize capability registry.
+
+        Args:
+            cache_file: JSON file for persisted results; None keeps them in memory
+            ttl: Seconds a probe result stays valid
+        """
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self._probes: Dict[str, _Probe] = {}
+        self._statuses: Dict[str, CapabilityStatus] = {}
+        self._loaded: Set[str] = set()  # Statuses read from the cache file
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.RLock()
+        self._load()
+
+    def register(
+        self, name: str, probe: Callable[[], bool], version: Optional[str] = None
+    ) -> None:
+        """
+        Register (or replace) the probe of a capability.
+
+        Args:
+            name: Capability name
+            probe: Function returning True if the capability works; may be slow
+            version: Version key of the underlying binary/package; cached results
+                with a different version are discarded
+        """
+        with self._lock:
+            self._probes[name] = _Probe(probe, version)
+
+    def get_status(self, name: str, refresh: bool = True) -> CapabilityStatus:
+        """
+        Get last known status without blocking.
+
+        Args:
+            name: Capability name
+            refresh: Start a background probe if the status is missing or stale
+
+        Returns:
+            Capability status (state UNKNOWN/PROBING until a probe finishes)
+        """
+        with self._lock:
+            status = self._valid_status(name)
+            if status is not None:
+                return status
+
+            if refresh and name in self._probes:
+                self._start_probe(name, background=True)
+
+            if name in self._inflight:
+                return CapabilityStatus(name, CapabilityState.PROBING)
+            return CapabilityStatus(name)
+
+    def check(self, name: str, timeout: Optional[float] = None) -> bool:
+        """
+        Get availability, probing synchronously if there is no valid result.
+
+        Args:
+            name: Capability name
+            timeout: Maximum seconds to wait for a running probe
+
+        Returns:
+            True if available; False if unavailable, unknown or timed out
+        """
+        with self._lock:
+            status = self._valid_status(name)
+            if status is not None:
+                return bool(status.available)
+            if name not in self._probes:
+                return False
+            event = self._inflight.get(name)
+            run_here = event is None
+            if run_here:
+                event = self._inflight[name] = threading.Event()
+
+        if run_here:
+            self._run_probe(name, event)
+        elif not event.wait(timeout):
+            return False
+
+        with self._lock:
+            status = self._statuses.get(name)
+            return bool(status and status.available)
+
+    def record(
+        self,
+        name: str,
+        available: bool,
+        version: Optional[str] = None,
+        error: Optional[str] = None,
+        duration: float = 0.0,
+    ) -> None:
+        """
+        Record an availability result obtained elsewhere (e.g. engine initialization).
+
+        Negative results without a version are kept in memory only: a later
+        run could not tell whether the missing package has been installed.
+
+        Args:
+            name: Capability name
+            available: Whether the capability works
+            version: Version key of the underlying binary/package
+            error: Failure description
+            duration: Seconds the check took
+        """
+        status = CapabilityStatus(
+            name=name,
+            state=CapabilityState.AVAILABLE if available else CapabilityState.UNAVAILABLE,
+            version=version,
+            checked_at=time.time(),
+            duration=duration,
+            error=error,
+        )
+        with self._lock:
+            self._statuses[name] = status
+            self._loaded.discard(name)
+            self._save()
+
+    def invalidate(self, name: str) -> None:
+        """Drop cached result of a capability."""
+        with self._lock:
+            self._loaded.discard(name)
+            if self._statuses.pop(name, None) is not None:
+                self._save()
+
+    def probe_all(self) -> None:
+        """Start background probes for all registered capabilities without valid results."""
+        with self._lock:
+            for name in list(self._probes):
+                if self._valid_status(name) is None:
+                    self._start_probe(name, background=True)
+
+    def snapshot(self, refresh: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Get statuses of all known capabilities without blocking.
+
+        Args:
+            refresh: Start background probes for missing or stale results
+
+        Returns:
+            Capability name -> status dictionary
+        """
+        with self._lock:
+            names = set(self._probes) | set(self._statuses)
+        return {name: self.get_status(name, refresh).to_dict() for name in sorted(names)}
+
+    def _valid_status(self, name: str) -> Optional[CapabilityStatus]:
+        status = self._statuses.get(name)
+        if status is None:
+            return None
+        if time.time() - status.checked_at > self.ttl:
+            return None
+        probe = self._probes.get(name)
+        if probe is not None and probe.version is not None and probe.version != status.version:
+            return None
+        if status.available is False and name in self._loaded:
+            # A negative result from an earlier run holds only while a probe
+            # confirms the binary/package is still the same version
+            if probe is None or probe.version is None:
+                return None
+        return status
+
+    def _start_probe(self, name: str, background: bool) -> None:
+        # Called with the lock held
+        if name in self._inflight:
+            return
+        event = self._inflight[name] = threading.Event()
+        if background:
+            threading.Thread(
+                target=self._run_probe, args=(name, event), name=f"probe-{name}", daemon=True
+            ).start()
+
+    def _run_probe(self, name: str, event: threading.Event) -> None:
+        probe = self._probes[name]
+        start = time.perf_counter()
+        error = None
+        try:
+            available = bool(probe.func())
+        except Exception as e:
+            available = False
+            error = str(e)
+        duration = time.perf_counter() - start
+
+        try:
+            self.record(name, available, probe.version, error, duration)
+            logger.debug("Capability %s probed: %s (%.3fs)", name, available, duration)
+        finally:
+            with self._lock:
+                self._inflight.pop(name, None)
+            event.set()
+
+    def _load(self) -> None:
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+            for name, entry in data.items():
+                self._statuses[name] = CapabilityStatus(
+                    name=name,
+                    state=CapabilityState(entry["state"]),
+                    version=entry.get("version"),
+                    checked_at=entry.get("checked_at", 0.0),
+                    duration=entry.get("duration", 0.0),
+                    error=entry.get("error"),
+                )
+                self._loaded.add(name)
+
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load capability cache: {e}")
+
+    def _save(self) -> None:
+        # Called with the lock held
+        if not self.cache_file:
+            return
+
+        data = {}
+        for name, status in self._statuses.items():
+            if status.available is False and status.version is None:
+                continue
+            entry = status.to_dict()
+            del entry["name"], entry["available"]
+            data[name] = entry
+
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            temp_path = f"{self.cache_file}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(temp_path, self.cache_file)
+
+        except OSError as e:
+            logger.warning(f"Failed to save capability cache: {e}")
+
+
+# Global capability registry instance
+_capability_registry: Optional[CapabilityRegistry] = None
+_capability_registry_lock = threading.Lock()
+
+
+def get_capability_registry() -> CapabilityRegistry:
+    """Get global capability registry instance."""
+    global _capability_registry
+
+    if _capability_registry is None:
+        with _capability_registry_lock:
+            if _capability_registry is None:
+                _capability_registry = CapabilityRegistry()
+
+    return _capability_registry
+
+
+def set_capability_registry(registry: Optional[CapabilityRegistry]) -> None:
+    """Replace the global capability registry (None resets to default on next use)."""
+    global _capability_registry
+    _capability_registry = registry
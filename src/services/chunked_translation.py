@@ -0,0 +1,164 @@
+"""
+Chunked translation of long texts.
+
+Long texts are split by src.utils.text_segmentation into chunks within the
+backend request limit. Chunks that are not cached are packed into as few
+requests as the limit allows, translated concurrently with a bounded fan-out
+and reassembled in their original order. Translated chunks are cached per
+language pair, so re-translating a document after editing one paragraph only
+sends the chunks of that paragraph.
+"""
+
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import logger
+from src.utils.text_segmentation import (
+    DEFAULT_MAX_CHARS,
+    REQUEST_SEPARATOR,
+    join_segments,
+    pack_chunks,
+    segment_text,
+    unpack_chunks,
+)
+
+# (text, target_language, source_language) -> translated text
+ChunkTranslateFunc = Callable[[str, str, str], Awaitable[str]]
+
+
+class ChunkedTranslator:
+    """Translate long texts chunk by chunk with a per-chunk LRU cache."""
+
+    def __init__(
+        self,
+        translate_chunk: ChunkTranslateFunc,
+        max_chars: int = DEFAULT_MAX_CHARS,
+        split_threshold: int = 1000,
+        max_concurrency: int = 4,
+        cache_size: int = 512,
+    ):
+        """
+        Args:
+            translate_chunk: Coroutine function translating one request (chunks
+                separated by blank lines)
+            max_chars: Maximum request length accepted by the backend
+            split_threshold: Texts up to this length are sent in one request
+            max_concurrency: Maximum number of requests in flight per text
+            cache_size: Number of translated chunks to keep
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive")
+
+        self.translate_chunk = translate_chunk
+        self.max_chars = max_chars
+        self.split_threshold = min(split_threshold, max_chars)
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.texts_split = 0
+        self.chunks_translated = 0
+        self.chunk_cache_hits = 0
+        self.requests_sent = 0
+
+    async def translate(self, text: str, target_language: str, source_language: str) -> str:
+        """
+        Translate text, splitting it into chunks if it is long.
+
+        Raises:
+            Exception: Whatever translate_chunk raised for the first failed chunk
+        """
+        if len(text) <= self.split_threshold:
+            return await self.translate_chunk(text, target_language, source_language)
+
+        segments = segment_text(text, self.max_chars)
+        translations: Dict[str, str] = {"": ""}
+        pending: List[str] = []
+        for segment in segments:
+            if segment.text in translations or segment.text in pending:
+                continue
+            cached = self._get(segment.text, target_language, source_language)
+            if cached is None:
+                pending.append(segment.text)
+            else:
+                translations[segment.text] = cached
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        requests = 0
+
+        async def send(request: str) -> str:
+            nonlocal requests
+            async with semaphore:
+                requests += 1
+                return await self.translate_chunk(request, target_language, source_language)
+
+        async def translate_group(group: List[str]) -> List[str]:
+            translated = await send(REQUEST_SEPARATOR.join(group))
+            if len(group) == 1:
+                return [translated]
+            parts = unpack_chunks(translated, len(group))
+            if parts is not None:
+                return parts
+            # The backend merged or split paragraphs; send the chunks one by one
+            logger.debug("Packed request lost chunk boundaries", chunks=len(group))
+            return list(await asyncio.gather(*(send(chunk) for chunk in group)))
+
+        groups = pack_chunks(pending, self.max_chars)
+        results = await asyncio.gather(*(translate_group(group) for group in groups))
+        for group, translated_group in zip(groups, results):
+            for chunk, translated in zip(group, translated_group):
+                translations[chunk] = translated
+                self._put(chunk, target_language, source_language, translated)
+
+        with self._lock:
+            self.texts_split += 1
+            self.chunks_translated += len(pending)
+            self.chunk_cache_hits += len(translations) - 1 - len(pending)
+            self.requests_sent += requests
+
+        logger.debug(
+            "Translated long text in chunks",
+            text_length=len(text),
+            chunks=len(segments),
+            translated=len(pending),
+            requests=requests,
+        )
+        return join_segments([translations[s.text] for s in segments], segments)
+
+    def _get(self, chunk: str, target_language: str, source_language: str) -> Optional[str]:
+        key = (source_language, target_language, chunk)
+        with self._lock:
+            translated = self._cache.get(key)
+            if translated is not None:
+                self._cache.move_to_end(key)
+            return translated
+
+    def _put(self, chunk: str, target_language: str, source_language: str, translated: str):
+        with self._lock:
+            self._cache[(source_language, target_language, chunk)] = translated
+            self._cache.move_to_end((source_language, target_language, chunk))
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached chunk translations."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get chunking statistics."""
+        with self._lock:
+            return {
+                "texts_split": self.texts_split,
+                "chunks_translated": self.chunks_translated,
+                "chunk_cache_hits": self.chunk_cache_hits,
+                "requests_sent": self.requests_sent,
+                "cached_chunks": len(self._cache),
+                "max_chars": self.max_chars,
+                "max_concurrency": self.max_concurrency,
+            }
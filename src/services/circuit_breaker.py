@@ -6,11 +6,14 @@ failures gracefully and prevent cascading failures.
 """
 
 import asyncio
+import functools
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, Optional, TypeVar
 
+from src.services.concurrency_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimiterConfig
 from src.utils.logger import logger
 
 T = TypeVar("T")
@@ -33,6 +36,7 @@ class CircuitBreakerConfig:
     success_threshold: int = 3  # Successes needed to close circuit in half-open
     timeout: float = 30.0  # Request timeout in seconds
     expected_exception: Exception = Exception  # Exception type that triggers circuit
+    concurrency: Optional[AdaptiveLimiterConfig] = None  # Adaptive in-flight limit
 
 
 class CircuitBreakerError(Exception):
@@ -43,6 +47,48 @@ class CircuitBreakerError(Exception):
         self.state = state
 
 
+class ConcurrencyLimitError(CircuitBreakerError):
+    """Request waited too long for an in-flight slot of the service."""
+
+
+class _Slot:
+    """Limiter slot returned once the caller and any worker thread are done with it."""
+
+    def __init__(self, limiter: AdaptiveConcurrencyLimiter):
+        self.limiter = limiter
+        self.started_at = time.monotonic()
+        self.dropped = False
+        self._holders = 1
+        self._lock = threading.Lock()
+
+    def hold(self) -> None:
+        with self._lock:
+            self._holders += 1
+
+    def done(self) -> None:
+        with self._lock:
+            self._holders -= 1
+            last = self._holders == 0
+        if last:
+            self.limiter.release(self.started_at, time.monotonic() - self.started_at, self.dropped)
+
+
+def _release_after(func: Callable[[], T], slot: _Slot) -> Callable[[], T]:
+    def run() -> T:
+        try:
+            return func()
+        finally:
+            slot.done()
+
+    return run
+
+
+def _consume_result(future: asyncio.Future) -> None:
+    # Results of abandoned calls are not awaited; keep asyncio from logging them
+    if not future.cancelled():
+        future.exception()
+
+
 class CircuitBreaker:
     """Circuit breaker implementation for external services."""
 
@@ -54,13 +100,18 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = 0
         self.last_success_time = 0
-        self._lock = asyncio.Lock()
+        # Held only around state updates; a thread lock because callers run
+        # their own event loops in worker threads
+        self._lock = threading.Lock()
+        self.limiter = (
+            AdaptiveConcurrencyLimiter(name, config.concurrency) if config.concurrency else None
+        )
 
         logger.info(f"Circuit breaker '{name}' initialized with config: {config}")
 
     async def call(self, func: Callable[..., T], *args, **kwargs) -> T:
         """Execute function with circuit breaker protection."""
-        async with self._lock:
+        with self._lock:
             # Move to half-open if enough time has passed (before fail fast check)
             if self._should_attempt_reset():
                 self._move_to_half_open()
@@ -71,16 +122,23 @@ class CircuitBreaker:
                     f"Circuit breaker '{self.name}' is OPEN - failing fast", self.state
                 )
 
+        # Wait for an in-flight slot of the backend
+        await self._acquire_slot()
+        slot = _Slot(self.limiter) if self.limiter is not None else None
+
         # Execute the function
         try:
             # Add timeout protection
             result = await asyncio.wait_for(
-                self._execute_function(func, *args, **kwargs), timeout=self.config.timeout
+                self._execute_function(func, *args, slot=slot, **kwargs),
+                timeout=self.config.timeout,
             )
             await self._on_success()
             return result
 
         except asyncio.TimeoutError as e:
+            if slot is not None:
+                slot.dropped = True
             await self._on_failure(f"Timeout after {self.config.timeout}s")
             raise CircuitBreakerError(
                 f"Circuit breaker '{self.name}' - operation timed out", self.state
@@ -89,6 +147,8 @@ class CircuitBreaker:
         except Exception as e:
             # Check if this is an expected exception type
             if isinstance(e, self.config.expected_exception):
+                if slot is not None:
+                    slot.dropped = True
                 await self._on_failure(str(e))
                 raise CircuitBreakerError(
                     f"Circuit breaker '{self.name}' - service failure: {str(e)}", self.state
@@ -97,14 +157,46 @@ class CircuitBreaker:
                 # Unexpected exception, don't trigger circuit breaker
                 raise
 
-    async def _execute_function(self, func: Callable[..., T], *args, **kwargs) -> T:
+        finally:
+            if slot is not None:
+                slot.done()
+
+    async def _acquire_slot(self) -> None:
+        """Take an in-flight slot, waiting on the event loop if the limit is reached."""
+        if self.limiter is None or self.limiter.try_acquire():
+            return
+
+        if not await self.limiter.acquire_async():
+            raise ConcurrencyLimitError(
+                f"Circuit breaker '{self.name}' - concurrency limit "
+                f"{self.limiter.current_limit} reached",
+                self.state,
+            )
+
+    async def _execute_function(
+        self, func: Callable[..., T], *args, slot: Optional["_Slot"] = None, **kwargs
+    ) -> T:
         """Execute function, handling both sync and async functions."""
         try:
             if asyncio.iscoroutinefunction(func):
                 return await func(*args, **kwargs)
             else:
                 # Run synchronous function in thread pool
-                return await asyncio.get_event_loop().run_in_executor(None, func, *args, **kwargs)
+                loop = asyncio.get_event_loop()
+                call = functools.partial(func, *args, **kwargs)
+                if slot is None:
+                    return await loop.run_in_executor(None, call)
+
+                # A timed out call keeps its slot until the thread finishes, so
+                # the executor future is shielded from cancellation
+                slot.hold()
+                try:
+                    future = loop.run_in_executor(None, _release_after(call, slot))
+                except BaseException:
+                    slot.done()
+                    raise
+                future.add_done_callback(_consume_result)
+                return await asyncio.shield(future)
         except Exception as e:
             logger.debug(f"Circuit breaker '{self.name}' caught exception: {type(e).__name__}: {e}")
             raise
@@ -128,7 +220,7 @@ class CircuitBreaker:
 
     async def _on_success(self) -> None:
         """Handle successful operation."""
-        async with self._lock:
+        with self._lock:
             self.last_success_time = time.time()
 
             if self.state == CircuitState.HALF_OPEN:
@@ -145,7 +237,7 @@ class CircuitBreaker:
 
     async def _on_failure(self, error_message: str) -> None:
         """Handle failed operation."""
-        async with self._lock:
+        with self._lock:
             self.failure_count += 1
             self.last_failure_time = time.time()
 
@@ -175,7 +267,7 @@ class CircuitBreaker:
 
     def get_metrics(self) -> Dict[str, Any]:
         """Get circuit breaker metrics."""
-        return {
+        metrics = {
             "name": self.name,
             "state": self.state.value,
             "failure_count": self.failure_count,
@@ -189,6 +281,9 @@ class CircuitBreaker:
                 "timeout": self.config.timeout,
             },
         }
+        if self.limiter is not None:
+            metrics["concurrency"] = self.limiter.get_metrics()
+        return metrics
 
     def reset(self) -> None:
         """Manually reset circuit breaker to closed state."""
@@ -197,6 +292,8 @@ class CircuitBreaker:
         self.success_count = 0
         self.last_failure_time = 0
         self.last_success_time = 0
+        if self.limiter is not None:
+            self.limiter.reset()
         logger.info(f"Circuit breaker '{self.name}' manually reset to CLOSED state")
 
 
@@ -288,6 +385,7 @@ TRANSLATION_SERVICE_CONFIG = CircuitBreakerConfig(
     success_threshold=2,
     timeout=15.0,
     expected_exception=Exception,
+    concurrency=AdaptiveLimiterConfig(initial_limit=4, max_limit=16, max_queue_wait=15.0),
 )
 
 OCR_SERVICE_CONFIG = CircuitBreakerConfig(
@@ -296,6 +394,7 @@ OCR_SERVICE_CONFIG = CircuitBreakerConfig(
     success_threshold=3,
     timeout=10.0,
     expected_exception=Exception,
+    concurrency=AdaptiveLimiterConfig(initial_limit=2, max_limit=8, max_queue_wait=10.0),
 )
 
 TTS_SERVICE_CONFIG = CircuitBreakerConfig(
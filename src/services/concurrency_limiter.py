@@ -0,0 +1,282 @@
+"""
+Adaptive concurrency limiter for external backends.
+
+Limits how many requests are in flight to a backend and adapts the limit
+with AIMD: the window grows by one after a full window of fast successful
+requests while it is saturated, and is cut multiplicatively on errors,
+timeouts or latency spikes. Used by circuit breakers so bursts from batch
+jobs queue locally instead of triggering backend throttling.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.utils.logger import logger
+
+
+@dataclass
+class AdaptiveLimiterConfig:
+    """Configuration for adaptive concurrency limiter."""
+
+    initial_limit: int = 4  # Starting in-flight window
+    min_limit: int = 1
+    max_limit: int = 32
+    backoff_ratio: float = 0.5  # Multiplicative decrease on congestion
+    latency_tolerance: float = 2.0  # Spike = latency above baseline * tolerance
+    smoothing: float = 0.05  # EWMA factor of the baseline latency
+    max_queue_wait: float = 10.0  # Seconds a request may wait for a slot
+
+
+class AdaptiveConcurrencyLimiter:
+    """Thread-safe AIMD concurrency limiter."""
+
+    def __init__(self, name: str, config: Optional[AdaptiveLimiterConfig] = None):
+        self.name = name
+        self.config = config or AdaptiveLimiterConfig()
+        self.limit = float(self.config.initial_limit)
+        self.inflight = 0
+        self.waiting = 0
+
+        self._cond = threading.Condition()
+        # Coroutines waiting for a slot, woken on their own loops
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self._baseline_latency: Optional[float] = None
+        self._successes_in_window = 0
+        self._saturated = False
+        self._last_decrease = 0.0
+
+        # Metrics
+        self.total_requests = 0
+        self.total_rejected = 0
+        self.total_drops = 0
+        self.decrease_count = 0
+        self.avg_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+
+    @property
+    def current_limit(self) -> int:
+        """Current in-flight window."""
+        return max(self.config.min_limit, int(self.limit))
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting."""
+        with self._cond:
+            if self.inflight < self.current_limit:
+                self._take_slot(0.0)
+                return True
+            self._saturated = True
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a slot.
+
+        Args:
+            timeout: Maximum seconds to wait (default: config.max_queue_wait)
+
+        Returns:
+            True if a slot was taken, False if the wait timed out
+        """
+        timeout = self.config.max_queue_wait if timeout is None else timeout
+        start = time.monotonic()
+
+        with self._cond:
+            if self.inflight >= self.current_limit:
+                self._saturated = True
+                self.waiting += 1
+                try:
+                    acquired = self._cond.wait_for(
+                        lambda: self.inflight < self.current_limit, timeout=timeout
+                    )
+                finally:
+                    self.waiting -= 1
+
+                if not acquired:
+                    self.total_rejected += 1
+                    logger.warning(
+                        f"Concurrency limiter '{self.name}' rejected request after "
+                        f"{timeout:.1f}s (limit {self.current_limit})"
+                    )
+                    return False
+
+            self._take_slot(time.monotonic() - start)
+            return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a slot without blocking a thread.
+
+        Args:
+            timeout: Maximum seconds to wait (default: config.max_queue_wait)
+
+        Returns:
+            True if a slot was taken, False if the wait timed out
+        """
+        timeout = self.config.max_queue_wait if timeout is None else timeout
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        waiter = None
+
+        with self._cond:
+            self.waiting += 1
+        try:
+            while True:
+                with self._cond:
+                    if waiter is not None and waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+                    if self.inflight < self.current_limit:
+                        self._take_slot(time.monotonic() - start)
+                        return True
+                    self._saturated = True
+                    waiter = (loop, loop.create_future())
+                    self._async_waiters.append(waiter)
+
+                remaining = start + timeout - time.monotonic()
+                try:
+                    # A cancelled wait holds no slot, so nothing to give back
+                    await asyncio.wait_for(waiter[1], max(remaining, 0.0))
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            with self._cond:
+                self.waiting -= 1
+                if waiter is not None and waiter in self._async_waiters:
+                    self._async_waiters.remove(waiter)
+
+        with self._cond:
+            self.total_rejected += 1
+        logger.warning(
+            f"Concurrency limiter '{self.name}' rejected request after "
+            f"{timeout:.1f}s (limit {self.current_limit})"
+        )
+        return False
+
+    def release(self, started_at: float, latency: float, dropped: bool = False) -> None:
+        """
+        Return a slot and feed the request outcome into the limit.
+
+        Args:
+            started_at: time.monotonic() when the request started
+            latency: Request duration in seconds
+            dropped: True if the request failed or timed out
+        """
+        with self._cond:
+            self.inflight -= 1
+
+            spike = (
+                self._baseline_latency is not None
+                and latency > self._baseline_latency * self.config.latency_tolerance
+            )
+            if dropped or spike:
+                if dropped:
+                    self.total_drops += 1
+                # One decrease per congestion event: ignore outcomes of requests
+                # that were already in flight when the limit was last cut
+                if started_at >= self._last_decrease:
+                    self._decrease("error" if dropped else f"latency {latency:.3f}s")
+            else:
+                self._successes_in_window += 1
+                if self._saturated and self._successes_in_window >= self.current_limit:
+                    self.limit = min(float(self.config.max_limit), self.limit + 1)
+                    self._successes_in_window = 0
+                    self._saturated = False
+
+            if not dropped:
+                # Slow EWMA so a permanent slowdown becomes the new normal
+                if self._baseline_latency is None:
+                    self._baseline_latency = latency
+                else:
+                    alpha = self.config.smoothing
+                    self._baseline_latency += alpha * (latency - self._baseline_latency)
+
+            self._notify_all()
+
+    def abandon(self) -> None:
+        """Return a slot without recording a sample (e.g. the caller was cancelled)."""
+        with self._cond:
+            self.inflight -= 1
+            self._notify_all()
+
+    @contextmanager
+    def slot(self, timeout: Optional[float] = None) -> Iterator[None]:
+        """
+        Run a block inside a slot, measuring its latency.
+
+        Raises:
+            TimeoutError: If no slot became free in time
+        """
+        if not self.acquire(timeout):
+            raise TimeoutError(f"Concurrency limit of '{self.name}' reached")
+
+        started_at = time.monotonic()
+        try:
+            yield
+        except BaseException:
+            self.release(started_at, time.monotonic() - started_at, dropped=True)
+            raise
+        self.release(started_at, time.monotonic() - started_at)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get limiter metrics."""
+        with self._cond:
+            return {
+                "name": self.name,
+                "limit": self.current_limit,
+                "inflight": self.inflight,
+                "waiting": self.waiting,
+                "baseline_latency": self._baseline_latency,
+                "avg_queue_delay": self.avg_queue_delay,
+                "max_queue_delay": self.max_queue_delay,
+                "total_requests": self.total_requests,
+                "total_rejected": self.total_rejected,
+                "total_drops": self.total_drops,
+                "decrease_count": self.decrease_count,
+            }
+
+    def reset(self) -> None:
+        """Reset limit and latency baseline."""
+        with self._cond:
+            self.limit = float(self.config.initial_limit)
+            self._baseline_latency = None
+            self._successes_in_window = 0
+            self._saturated = False
+            self._notify_all()
+
+    def _notify_all(self) -> None:
+        # Called with the condition held; waiters recheck the limit themselves
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                pass  # Loop already closed
+
+    def _take_slot(self, queue_delay: float) -> None:
+        # Called with the condition held
+        self.inflight += 1
+        self.total_requests += 1
+        if self.inflight >= self.current_limit:
+            self._saturated = True
+        self.avg_queue_delay += 0.1 * (queue_delay - self.avg_queue_delay)
+        self.max_queue_delay = max(self.max_queue_delay, queue_delay)
+
+    def _decrease(self, reason: str) -> None:
+        # Called with the condition held
+        previous = self.current_limit
+        self.limit = max(float(self.config.min_limit), self.limit * self.config.backoff_ratio)
+        self._successes_in_window = 0
+        self._last_decrease = time.monotonic()
+        self.decrease_count += 1
+        logger.debug(
+            f"Concurrency limiter '{self.name}' limit {previous} -> {self.current_limit} ({reason})"
+        )
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
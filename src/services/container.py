@@ -1,113 +1,349 @@
-from typing import Any, Callable, Dict, Optional, Type, TypeVar
+import inspect
+import os
+import threading
+import typing
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from src.utils.logger import logger
 
 T = TypeVar("T")
 
+# Marker for "no cached instance" (None is a valid service instance)
+_MISSING = object()
+
+# Resolver compiled per interface: takes the active scope (or None)
+Resolver = Callable[[Optional["ServiceScope"]], Any]
+
+
+class Lifetime(Enum):
+    """Service lifetime"""
+
+    SINGLETON = "singleton"
+    TRANSIENT = "transient"
+    SCOPED = "scoped"
+
+
+class ServiceScope:
+    """
+    Scope for services with SCOPED lifetime (e.g. one API request).
+
+    Scoped services are created once per scope; singletons and transients are
+    resolved through the parent container. Closing the scope calls ``close()``
+    on scoped instances that provide it.
+    """
+
+    def __init__(self, container: "DIContainer"):
+        self.container = container
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.closed = False
+
+    def get(self, interface: Type[T]) -> T:
+        """Get service instance within this scope"""
+        if self.closed:
+            raise RuntimeError("Service scope is closed")
+        return self.container._resolve(interface, self)
+
+    def close(self) -> None:
+        """Dispose scoped instances"""
+        with self._lock:
+            instances = list(self._instances.items())
+            self._instances.clear()
+            self.closed = True
+
+        for key, instance in reversed(instances):
+            close = getattr(instance, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f"Failed to close scoped service {key}: {e}")
+
+    def __enter__(self) -> "ServiceScope":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
 
 class DIContainer:
-    """Simple Dependency Injection Container"""
+    """
+    Dependency Injection Container with constructor injection.
+
+    Constructor type hints are introspected once per service and compiled
+    into a resolver, so repeated ``get`` calls are a dictionary lookup plus
+    the cached instance check. Singletons are created under a per-key lock
+    (double-checked), so concurrent workers never build two instances.
+    """
 
     def __init__(self):
-        self._services: Dict[str, Any] = {}
+        # key -> (implementation, lifetime)
+        self._services: Dict[str, Tuple[Any, Lifetime]] = {}
         self._singletons: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable] = {}
+        # key -> (factory, lifetime)
+        self._factories: Dict[str, Tuple[Callable, Lifetime]] = {}
+
+        self._resolvers: Dict[Any, Resolver] = {}
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, threading.RLock] = {}
+        self._local = threading.local()
 
         logger.debug("DI Container initialized")
 
     def register_singleton(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register a singleton service"""
-        key = self._get_key(interface)
-        self._services[key] = (implementation, True)
-        logger.debug(f"Registered singleton: {key}")
+        self._register_service(interface, implementation, Lifetime.SINGLETON)
 
     def register_transient(self, interface: Type[T], implementation: Type[T]) -> None:
         """Register a transient service (new instance each time)"""
+        self._register_service(interface, implementation, Lifetime.TRANSIENT)
+
+    def register_scoped(self, interface: Type[T], implementation: Type[T]) -> None:
+        """Register a scoped service (one instance per ServiceScope)"""
+        self._register_service(interface, implementation, Lifetime.SCOPED)
+
+    def register_factory(
+        self,
+        interface: Type[T],
+        factory: Callable[[], T],
+        lifetime: Lifetime = Lifetime.TRANSIENT,
+    ) -> None:
+        """Register a factory function (called on each resolve unless lifetime says otherwise)"""
         key = self._get_key(interface)
-        self._services[key] = (implementation, False)
-        logger.debug(f"Registered transient: {key}")
-
-    def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
-        """Register a factory function"""
-        key = self._get_key(interface)
-        self._factories[key] = factory
-        logger.debug(f"Registered factory: {key}")
+        with self._lock:
+            self._unregister(key)
+            self._factories[key] = (factory, lifetime)
+            self._resolvers.clear()
+        logger.debug(f"Registered factory: {key} ({lifetime.value})")
 
     def register_instance(self, interface: Type[T], instance: T) -> None:
         """Register a specific instance"""
         key = self._get_key(interface)
-        self._singletons[key] = instance
+        with self._lock:
+            self._unregister(key)
+            self._singletons[key] = instance
+            self._resolvers.clear()
         logger.debug(f"Registered instance: {key}")
 
     def get(self, interface: Type[T]) -> T:
         """Get service instance"""
+        resolver = self._resolvers.get(interface)
+        if resolver is None:
+            resolver = self._compile(interface)
+        return resolver(None)
+
+    def create_scope(self) -> ServiceScope:
+        """Create a scope for SCOPED services"""
+        return ServiceScope(self)
+
+    def _resolve(self, interface: Any, scope: Optional[ServiceScope]) -> Any:
+        """Resolve service within an optional scope"""
+        resolver = self._resolvers.get(interface)
+        if resolver is None:
+            resolver = self._compile(interface)
+        return resolver(scope)
+
+    def _register_service(self, interface: Any, implementation: Any, lifetime: Lifetime) -> None:
         key = self._get_key(interface)
+        with self._lock:
+            self._unregister(key)
+            self._services[key] = (implementation, lifetime)
+            self._resolvers.clear()
+        logger.debug(f"Registered {lifetime.value}: {key}")
+
+    def _unregister(self, key: str) -> None:
+        # Later registrations override earlier ones; called with the lock held
+        self._services.pop(key, None)
+        self._factories.pop(key, None)
+        self._singletons.pop(key, None)
 
-        # Check if we have a cached singleton
-        if key in self._singletons:
-            return self._singletons[key]
+    def _get_key(self, interface: Type) -> str:
+        """Get string key for interface"""
+        if isinstance(interface, str):
+            return interface
+        return f"{interface.__module__}.{interface.__name__}"
 
-        # Check if we have a factory
-        if key in self._factories:
-            instance = self._factories[key]()
+    def _is_registered(self, key: str) -> bool:
+        return key in self._services or key in self._factories or key in self._singletons
+
+    def _compile(self, interface: Any) -> Resolver:
+        """Build and cache the resolver of an interface"""
+        with self._lock:
+            resolver = self._resolvers.get(interface)
+            if resolver is not None:
+                return resolver
+
+            key = self._get_key(interface)
+            if key in self._factories:
+                factory, lifetime = self._factories[key]
+                build = self._compile_factory(key, factory)
+            elif key in self._services:
+                implementation, lifetime = self._services[key]
+                build = self._compile_constructor(key, implementation, lifetime)
+            elif key in self._singletons:
+                instance = self._singletons[key]
+                resolver = self._resolvers[interface] = lambda scope: instance
+                return resolver
+            else:
+                raise ValueError(f"Service not registered: {key}")
+
+            if lifetime == Lifetime.SINGLETON:
+                resolver = self._singleton_resolver(key, build)
+            elif lifetime == Lifetime.SCOPED:
+                resolver = self._scoped_resolver(key, build)
+            else:
+                resolver = build
+
+            self._resolvers[interface] = resolver
+            return resolver
+
+    def _compile_factory(self, key: str, factory: Callable) -> Resolver:
+        def build(scope: Optional[ServiceScope]) -> Any:
+            self._enter(key)
+            try:
+                instance = factory()
+            finally:
+                self._exit()
             logger.debug(f"Created instance from factory: {key}")
             return instance
 
-        # Check if we have a registered service
-        if key in self._services:
-            implementation, is_singleton = self._services[key]
+        return build
+
+    def _compile_constructor(self, key: str, implementation: Any, lifetime: Lifetime) -> Resolver:
+        """Introspect constructor type hints once and build an injecting factory"""
+        dependencies = self._constructor_dependencies(key, implementation)
+
+        def build(scope: Optional[ServiceScope]) -> Any:
+            self._enter(key)
+            try:
+                kwargs = {name: self._resolve(dep, scope) for name, dep in dependencies}
+                instance = implementation(**kwargs)
+            except Exception as e:
+                logger.error(f"Failed to create instance of {implementation}", error=e)
+                raise
+            finally:
+                self._exit()
+            logger.debug(f"Created instance: {key} ({lifetime.value})")
+            return instance
 
-            # Create instance
-            instance = self._create_instance(implementation)
+        return build
 
-            # Cache if singleton
-            if is_singleton:
-                self._singletons[key] = instance
+    def _constructor_dependencies(self, key: str, implementation: Any) -> List[Tuple[str, Any]]:
+        """Get (parameter name, interface) pairs to inject"""
+        try:
+            signature = inspect.signature(implementation)
+        except (TypeError, ValueError):
+            return []
 
-            logger.debug(f"Created instance: {key} (singleton: {is_singleton})")
+        try:
+            target = implementation.__init__ if inspect.isclass(implementation) else implementation
+            hints = typing.get_type_hints(target)
+        except Exception:
+            # Unresolvable forward references: inject nothing, use defaults
+            hints = {}
+
+        dependencies = []
+        for name, parameter in signature.parameters.items():
+            if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+                continue
+
+            hint = hints.get(name)
+            if hint is not None and self._is_injectable(hint):
+                dependencies.append((name, hint))
+            elif parameter.default is parameter.empty:
+                raise ValueError(
+                    f"Cannot resolve parameter '{name}' of {key}: "
+                    f"no registered service for {hint!r}"
+                )
+
+        return dependencies
+
+    def _is_injectable(self, hint: Any) -> bool:
+        try:
+            return self._is_registered(self._get_key(hint))
+        except AttributeError:
+            # typing constructs such as Optional[X] are not injected
+            return False
+
+    def _singleton_resolver(self, key: str, build: Resolver) -> Resolver:
+        singletons = self._singletons
+        lock = self._key_locks.setdefault(key, threading.RLock())
+
+        def resolve(scope: Optional[ServiceScope]) -> Any:
+            instance = singletons.get(key, _MISSING)
+            if instance is _MISSING:
+                with lock:
+                    instance = singletons.get(key, _MISSING)
+                    if instance is _MISSING:
+                        # Singletons never capture a scope
+                        instance = build(None)
+                        singletons[key] = instance
             return instance
 
-        raise ValueError(f"Service not registered: {key}")
+        return resolve
 
-    def _get_key(self, interface: Type) -> str:
-        """Get string key for interface"""
-        return f"{interface.__module__}.{interface.__name__}"
+    def _scoped_resolver(self, key: str, build: Resolver) -> Resolver:
+        def resolve(scope: Optional[ServiceScope]) -> Any:
+            if scope is None:
+                raise ValueError(f"Scoped service requires a scope: {key}")
 
-    def _create_instance(self, implementation: Type[T]) -> T:
-        """Create instance with dependency injection"""
-        try:
-            # Simple creation - can be enhanced with constructor injection
-            return implementation()
-        except Exception as e:
-            logger.error(f"Failed to create instance of {implementation}", error=e)
-            raise
+            instance = scope._instances.get(key, _MISSING)
+            if instance is _MISSING:
+                with scope._lock:
+                    instance = scope._instances.get(key, _MISSING)
+                    if instance is _MISSING:
+                        instance = build(scope)
+                        scope._instances[key] = instance
+            return instance
+
+        return resolve
+
+    def _enter(self, key: str) -> None:
+        """Track services being created in this thread to detect cycles"""
+        stack = self._local.__dict__.setdefault("stack", [])
+        if key in stack:
+            raise ValueError(f"Circular dependency: {' -> '.join(stack + [key])}")
+        stack.append(key)
+
+    def _exit(self) -> None:
+        self._local.stack.pop()
 
     def clear(self) -> None:
         """Clear all registered services"""
-        self._services.clear()
-        self._singletons.clear()
-        self._factories.clear()
+        with self._lock:
+            self._services.clear()
+            self._singletons.clear()
+            self._factories.clear()
+            self._resolvers.clear()
         logger.debug("DI Container cleared")
 
     def get_registered_services(self) -> Dict[str, dict]:
         """Get information about registered services"""
         services = {}
 
-        for key, (impl, is_singleton) in self._services.items():
+        for key, (impl, lifetime) in self._services.items():
             services[key] = {
-                "implementation": impl.__name__,
-                "singleton": is_singleton,
+                "implementation": getattr(impl, "__name__", repr(impl)),
+                "singleton": lifetime == Lifetime.SINGLETON,
+                "lifetime": lifetime.value,
                 "instantiated": key in self._singletons,
             }
 
-        for key in self._factories:
-            services[key] = {"implementation": "Factory", "singleton": False, "instantiated": False}
+        for key, (_, lifetime) in self._factories.items():
+            services[key] = {
+                "implementation": "Factory",
+                "singleton": lifetime == Lifetime.SINGLETON,
+                "lifetime": lifetime.value,
+                "instantiated": key in self._singletons,
+            }
 
         for key in self._singletons:
             if key not in services:
                 services[key] = {
                     "implementation": "Instance",
                     "singleton": True,
+                    "lifetime": Lifetime.SINGLETON.value,
                     "instantiated": True,
                 }
 
@@ -161,7 +397,13 @@ def setup_default_services(target_container: Optional[DIContainer] = None):
 
     def create_translation_processor():
         config_manager = target_container.get(ConfigManager)
-        return TranslationProcessor(config_manager.get_config().features.cache_translations)
+        config = config_manager.get_config()
+        data_dir = getattr(config, "data_directory", "data")
+        return TranslationProcessor(
+            config.features.cache_translations,
+            fuzzy_threshold=config.features.translation_memory_fuzzy_threshold,
+            memory_path=os.path.join(data_dir, "translation_memory.jsonl"),
+        )
 
     def create_tts_processor():
         config_manager = target_container.get(ConfigManager)
@@ -188,7 +430,10 @@ def setup_default_services(target_container: Optional[DIContainer] = None):
         return FileScreenshotRepository(data_dir)
 
     target_container.register_factory(RepositoryManager, create_repository_manager)
-    target_container.register_factory(TranslationRepository, create_translation_repository)
+    # Shared, so every writer notifies the same change listeners (e.g. query caches)
+    target_container.register_factory(
+        TranslationRepository, create_translation_repository, lifetime=Lifetime.SINGLETON
+    )
     target_container.register_factory(ScreenshotRepository, create_screenshot_repository)
 
     # Register circuit breaker services
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from src.plugins.base_plugin import OCRPlugin, PluginType, TranslationPlugin, TTSPlugin
 from src.plugins.plugin_manager import PluginManager
+from src.services.capability_registry import get_capability_registry
 from src.services.config_manager import ConfigManager, ConfigObserver
 from src.utils.logger import logger
 
@@ -87,34 +88,39 @@ class PluginService(ConfigObserver):
 
     def get_best_ocr_engine(self) -> Optional[OCRPlugin]:
         """Get the best available OCR engine."""
-        ocr_engines = self.get_available_ocr_engines()
-
-        # Simple selection: return first available enabled engine
-        for engine in ocr_engines:
-            if engine.enabled and engine.is_available():
-                return engine
-
-        return None
+        return self._select_engine(PluginType.OCR)
 
     def get_best_translation_engine(self) -> Optional[TranslationPlugin]:
         """Get the best available translation engine."""
-        translation_engines = self.get_available_translation_engines()
-
-        # Simple selection: return first available enabled engine
-        for engine in translation_engines:
-            if engine.enabled and engine.is_available():
-                return engine
-
-        return None
+        return self._select_engine(PluginType.TRANSLATION)
 
     def get_best_tts_engine(self) -> Optional[TTSPlugin]:
         """Get the best available TTS engine."""
-        tts_engines = self.get_available_tts_engines()
+        return self._select_engine(PluginType.TTS)
+
+    def _select_engine(self, plugin_type: PluginType) -> Optional[Any]:
+        """
+        Select first available enabled plugin of a type.
 
-        # Simple selection: return first available enabled engine
-        for engine in tts_engines:
-            if engine.enabled and engine.is_available():
-                return engine
+        Cached capability probes rank the candidates: plugins known to work come
+        first, plugins known to be unavailable are skipped without importing them.
+        Only the selected plugin is imported and initialized.
+        """
+        capabilities = get_capability_registry()
+        candidates = []
+        for manifest in self.plugin_manager.list_plugins(plugin_type):
+            if not self.plugin_manager.is_plugin_enabled(manifest.name):
+                continue
+            available = capabilities.get_status(manifest.name).available
+            if available is False:
+                continue
+            candidates.append((available is not True, manifest.name))
+
+        # Stable sort keeps discovery order within each group
+        for _, plugin_name in sorted(candidates, key=lambda item: item[0]):
+            plugin = self.plugin_manager.get_plugin(plugin_name)
+            if plugin is not None and plugin.enabled and plugin.is_available():
+                return plugin
 
         return None
 
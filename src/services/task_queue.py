@@ -3,13 +3,19 @@ Task queue service for asynchronous processing of screenshots and translations.
 Provides non-blocking operations for better UI responsiveness.
 """
 
+import heapq
+import itertools
+import math
 import queue
 import threading
 import time
+from collections import deque
+from concurrent import futures
+from concurrent.futures import Future
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from src.utils.logger import logger
 
@@ -22,6 +28,7 @@ class TaskStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    EXPIRED = "expired"
 
 
 class TaskPriority(Enum):
@@ -33,6 +40,27 @@ class TaskPriority(Enum):
     CRITICAL = 3
 
 
+class TaskLane(Enum):
+    """Scheduling lanes, served in this order"""
+
+    INTERACTIVE = "interactive"  # User-triggered work, has reserved workers
+    BATCH = "batch"  # Bulk jobs, shared fairly between groups
+    BACKGROUND = "background"  # Runs only when nothing else is waiting
+
+
+# Lane used when submit() is called without one
+DEFAULT_LANES = {
+    TaskPriority.CRITICAL: TaskLane.INTERACTIVE,
+    TaskPriority.HIGH: TaskLane.INTERACTIVE,
+    TaskPriority.NORMAL: TaskLane.BATCH,
+    TaskPriority.LOW: TaskLane.BACKGROUND,
+}
+
+
+class TaskExpiredError(TimeoutError):
+    """Task was dropped because its deadline passed before it started"""
+
+
 @dataclass
 class Task:
     """Represents a task in the queue"""
@@ -51,43 +79,169 @@ class Task:
     status: TaskStatus = TaskStatus.PENDING
     result: Any = None
     error: Optional[Exception] = None
+    future: Optional[Future] = None
+    lane: TaskLane = TaskLane.BATCH
+    group: Optional[str] = None
+    deadline: Optional[float] = None  # time.monotonic() value
+    submitted_at: float = 0.0  # time.monotonic() value
 
     def __post_init__(self):
         if self.kwargs is None:
             self.kwargs = {}
         if self.created_at is None:
             self.created_at = datetime.now()
+        if not self.submitted_at:
+            self.submitted_at = time.monotonic()
+        if self.future is None:
+            self.future = Future()
+            self.future.task_id = self.id
 
     def __lt__(self, other):
         """For priority queue comparison"""
         return self.priority.value > other.priority.value
 
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        """Check if the deadline has passed"""
+        if self.deadline is None:
+            return False
+        return (now if now is not None else time.monotonic()) > self.deadline
 
-class TaskQueue:
-    """Asynchronous task queue with priority support"""
 
-    def __init__(self, num_workers: int = 2, max_queue_size: int = 100):
+@dataclass
+class BatchHandler:
+    """Micro-batching configuration for tasks with the same name"""
+
+    func: Callable[[List[tuple]], List[Any]]
+    window: float = 0.01
+    max_batch_size: int = 32
+
+
+class _Lane:
+    """
+    Pending tasks of one lane.
+
+    Each group (e.g. a batch job) has its own heap ordered by priority, then
+    deadline, then submission order. Groups are served round-robin so one
+    large job cannot starve another.
+    """
+
+    def __init__(self, lane: TaskLane, drop_expired: bool):
+        self.lane = lane
+        self.drop_expired = drop_expired
+        self.groups: Dict[Optional[str], List[Tuple[int, float, int, Task]]] = {}
+        self.rotation: Deque[Optional[str]] = deque()
+        self.size = 0  # Heap entries, including stale ones
+        self.stale = 0  # Entries of tasks no longer pending
+
+    def __len__(self) -> int:
+        return self.size - self.stale
+
+    def push(self, entry: Tuple[int, float, int, Task], group: Optional[str]) -> None:
+        heap = self.groups.get(group)
+        if heap is None:
+            heap = self.groups[group] = []
+            self.rotation.append(group)
+        heapq.heappush(heap, entry)
+        self.size += 1
+
+    def pop(self) -> Task:
+        group = self.rotation.popleft()
+        heap = self.groups[group]
+        task = heapq.heappop(heap)[-1]
+        self.size -= 1
+        if heap:
+            self.rotation.append(group)
+        else:
+            del self.groups[group]
+        return task
+
+    def compact(self) -> None:
+        """Drop stale entries"""
+        for group in list(self.rotation):
+            heap = [entry for entry in self.groups[group] if entry[-1].status == TaskStatus.PENDING]
+            if heap:
+                heapq.heapify(heap)
+                self.groups[group] = heap
+            else:
+                del self.groups[group]
+        self.rotation = deque(group for group in self.rotation if group in self.groups)
+        self.size = sum(len(heap) for heap in self.groups.values())
+        self.stale = 0
+
+
+class TaskQueue:
+    """
+    Asynchronous task queue with priority lanes.
+
+    Tasks are scheduled in lanes: interactive, batch and background. General
+    workers serve the lanes in that order; ``interactive_workers`` extra
+    workers serve only the interactive lane, so bulk work can never occupy
+    every thread. Within a lane, groups are served round-robin and tasks are
+    ordered by priority, then deadline. Interactive tasks whose deadline
+    passed before they started are dropped.
+
+    Cancelled tasks are removed lazily: they stay in their heap and are
+    skipped when popped. Every task has a ``concurrent.futures.Future``;
+    waiting uses its condition variable instead of polling. Finished tasks
+    are retained for lookup up to ``max_retained_tasks``.
+    """
+
+    # Compact the lanes when more than this many entries are stale
+    _COMPACT_THRESHOLD = 64
+
+    # Workers of each kind and the lanes they serve, in order
+    _GENERAL_LANES = (TaskLane.INTERACTIVE, TaskLane.BATCH, TaskLane.BACKGROUND)
+    _RESERVED_LANES = (TaskLane.INTERACTIVE,)
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        max_queue_size: int = 100,
+        max_retained_tasks: int = 1000,
+        interactive_workers: int = 1,
+    ):
         self.num_workers = num_workers
+        self.interactive_workers = interactive_workers
         self.max_queue_size = max_queue_size
+        self.max_retained_tasks = max_retained_tasks
 
-        # Priority queue for tasks
-        self.task_queue = queue.PriorityQueue(maxsize=max_queue_size)
+        # Pending tasks per lane
+        self._lanes: Dict[TaskLane, _Lane] = {
+            lane: _Lane(lane, drop_expired=lane == TaskLane.INTERACTIVE) for lane in TaskLane
+        }
+        self._sequence = itertools.count()
 
-        # Task tracking
+        # Task tracking (pending, running and the most recent finished tasks)
         self.tasks: Dict[str, Task] = {}
-        self.completed_tasks: List[Task] = []
-        self.task_lock = threading.Lock()
+        self.completed_tasks: Deque[Task] = deque(maxlen=100)
+        self._finished_ids: Deque[str] = deque()
+        self.task_lock = threading.RLock()
+        self._not_empty = threading.Condition(self.task_lock)
+        self._not_full = threading.Condition(self.task_lock)
+
+        # Micro-batching: task name -> handler and pending tasks of that name
+        self._batch_handlers: Dict[str, BatchHandler] = {}
+        self._batch_pending: Dict[str, Deque[Task]] = {}
 
         # Worker threads
         self.workers: List[threading.Thread] = []
         self.running = False
 
-        # Statistics
+        # Statistics (maintained incrementally)
         self.total_tasks = 0
         self.completed_count = 0
         self.failed_count = 0
-
-        logger.info(f"Task queue initialized with {num_workers} workers")
+        self.cancelled_count = 0
+        self.expired_count = 0
+        self.pending_count = 0
+        self.running_count = 0
+        self.batch_count = 0
+        self.batched_task_count = 0
+
+        logger.info(
+            f"Task queue initialized with {num_workers} workers "
+            f"(+{interactive_workers} interactive)"
+        )
 
     def start(self):
         """Start worker threads"""
@@ -99,27 +253,38 @@ class TaskQueue:
         # Create and start worker threads
         for i in range(self.num_workers):
             worker = threading.Thread(
-                target=self._worker_loop, daemon=True, name=f"TaskWorker-{i+1}"
+                target=self._worker_loop,
+                args=(self._GENERAL_LANES,),
+                daemon=True,
+                name=f"TaskWorker-{i+1}",
             )
             worker.start()
             self.workers.append(worker)
 
-        logger.info(f"Started {self.num_workers} task workers")
+        for i in range(self.interactive_workers):
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(self._RESERVED_LANES,),
+                daemon=True,
+                name=f"InteractiveWorker-{i+1}",
+            )
+            worker.start()
+            self.workers.append(worker)
+
+        logger.info(
+            f"Started {self.num_workers} task workers "
+            f"and {self.interactive_workers} interactive workers"
+        )
 
     def stop(self, wait: bool = True, timeout: float = 5.0):
         """Stop worker threads"""
         if not self.running:
             return
 
-        self.running = False
-
-        # Add sentinel values to wake up workers
-        for _ in range(self.num_workers):
-            try:
-                # Используем кортеж с низким приоритетом для sentinel
-                self.task_queue.put((-1, None), block=False)
-            except queue.Full:
-                pass
+        # Wake up idle workers
+        with self.task_lock:
+            self.running = False
+            self._not_empty.notify_all()
 
         if wait:
             # Wait for workers to finish
@@ -129,6 +294,31 @@ class TaskQueue:
         self.workers.clear()
         logger.info("Task queue stopped")
 
+    def register_batch_handler(
+        self,
+        name: str,
+        func: Callable[[List[tuple]], List[Any]],
+        window: float = 0.01,
+        max_batch_size: int = 32,
+    ) -> None:
+        """
+        Enable micro-batching for tasks submitted with the given name.
+
+        Tasks of that name arriving within ``window`` seconds of each other are
+        executed with a single ``func([task.args, ...])`` call, which must return
+        one result per task in the same order. A task that finds no companions
+        runs its own function as usual.
+
+        Args:
+            name: Task name to batch
+            func: Batched implementation
+            window: Seconds to wait for more tasks once the first is picked up
+            max_batch_size: Maximum tasks per batch
+        """
+        with self.task_lock:
+            self._batch_handlers[name] = BatchHandler(func, window, max_batch_size)
+            self._batch_pending.setdefault(name, deque())
+
     def submit(
         self,
         func: Callable,
@@ -138,47 +328,102 @@ class TaskQueue:
         priority: TaskPriority = TaskPriority.NORMAL,
         callback: Optional[Callable] = None,
         error_callback: Optional[Callable] = None,
+        lane: Optional[TaskLane] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
     ) -> str:
         """Submit a task to the queue"""
+        return self.submit_future(
+            func, args, kwargs, name, priority, callback, error_callback, lane, deadline, group
+        ).task_id
 
-        # Generate task ID
-        task_id = f"task-{self.total_tasks + 1}-{int(time.time() * 1000)}"
-
-        # Create task
-        task = Task(
-            id=task_id,
-            name=name or func.__name__,
-            func=func,
-            args=args,
-            kwargs=kwargs or {},
-            priority=priority,
-            callback=callback,
-            error_callback=error_callback,
-        )
+    def submit_future(
+        self,
+        func: Callable,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        name: Optional[str] = None,
+        priority: TaskPriority = TaskPriority.NORMAL,
+        callback: Optional[Callable] = None,
+        error_callback: Optional[Callable] = None,
+        lane: Optional[TaskLane] = None,
+        deadline: Optional[float] = None,
+        group: Optional[str] = None,
+    ) -> Future:
+        """
+        Submit a task and get its future.
+
+        The returned ``concurrent.futures.Future`` has a ``task_id`` attribute;
+        ``future.cancel()`` cancels the task while it is pending.
+
+        Args:
+            lane: Scheduling lane (default derived from priority, see DEFAULT_LANES)
+            deadline: Seconds from now by which the task should start; expired
+                interactive tasks fail with TaskExpiredError instead of running
+            group: Fair-share group within the lane (e.g. batch job ID)
+
+        Raises:
+            queue.Full: If the queue stays full for one second
+        """
+        lane = lane or DEFAULT_LANES[priority]
+        now = time.monotonic()
+        absolute_deadline = now + deadline if deadline is not None else None
 
-        # Track task
         with self.task_lock:
-            self.tasks[task_id] = task
-            self.total_tasks += 1
+            if not self._not_full.wait_for(self._has_capacity, timeout=1.0):
+                logger.error("Failed to queue task: queue full")
+                raise queue.Full("Task queue is full")
 
-        # Queue task
-        try:
-            self.task_queue.put((task.priority.value, task), timeout=1.0)
-            logger.debug(f"Task {task_id} ({task.name}) queued with priority {priority.name}")
-        except queue.Full:
-            task.status = TaskStatus.FAILED
-            task.error = Exception("Task queue is full")
-            logger.error(f"Failed to queue task {task_id}: queue full")
-            raise
+            # Generate task ID
+            self.total_tasks += 1
+            task_id = f"task-{self.total_tasks}-{int(time.time() * 1000)}"
+
+            # Create task
+            task = Task(
+                id=task_id,
+                name=name or func.__name__,
+                func=func,
+                args=args,
+                kwargs=kwargs or {},
+                priority=priority,
+                callback=callback,
+                error_callback=error_callback,
+                lane=lane,
+                group=group,
+                deadline=absolute_deadline,
+                submitted_at=now,
+            )
 
-        return task_id
+            # Track and queue task
+            self.tasks[task_id] = task
+            self.pending_count += 1
+            entry = (
+                -priority.value,
+                absolute_deadline if absolute_deadline is not None else math.inf,
+                next(self._sequence),
+                task,
+            )
+            self._lanes[lane].push(entry, group)
+            if task.name in self._batch_pending:
+                self._batch_pending[task.name].append(task)
+            # Workers serve different lanes, so wake all of them
+            self._not_empty.notify_all()
+
+        task.future.add_done_callback(lambda _future, task=task: self._on_future_done(task))
+        logger.debug(
+            "Task %s (%s) queued with priority %s in %s lane",
+            task_id,
+            task.name,
+            priority.name,
+            lane.value,
+        )
+        return task.future
 
     def cancel(self, task_id: str) -> bool:
         """Cancel a pending task"""
         with self.task_lock:
             task = self.tasks.get(task_id)
-            if task and task.status == TaskStatus.PENDING:
-                task.status = TaskStatus.CANCELLED
+            if task and task.status == TaskStatus.PENDING and task.future.cancel():
                 logger.info(f"Task {task_id} cancelled")
                 return True
         return False
@@ -197,43 +442,194 @@ class TaskQueue:
                 return task.result
             return None
 
-    def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> bool:
-        """Wait for task completion"""
-        start_time = time.time()
-
-        while True:
-            with self.task_lock:
-                task = self.tasks.get(task_id)
-                if not task:
-                    return False
-                if task.status in (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED):
-                    return task.status == TaskStatus.COMPLETED
+    def get_future(self, task_id: str) -> Optional[Future]:
+        """Get future of a task (None if unknown or no longer retained)"""
+        with self.task_lock:
+            task = self.tasks.get(task_id)
+            return task.future if task else None
 
-            if timeout and (time.time() - start_time) >= timeout:
-                return False
+    def wait_for_task(self, task_id: str, timeout: Optional[float] = None) -> bool:
+        """Wait for task completion. Returns True if the task completed successfully."""
+        future = self.get_future(task_id)
+        if future is None:
+            return False
 
-            time.sleep(0.1)
+        done, _ = futures.wait([future], timeout=timeout or None)
+        return bool(done) and not future.cancelled() and future.exception() is None
 
     def get_queue_size(self) -> int:
         """Get current queue size"""
-        return self.task_queue.qsize()
+        with self.task_lock:
+            return self._queued_count()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get queue statistics"""
         with self.task_lock:
-            pending_count = sum(1 for t in self.tasks.values() if t.status == TaskStatus.PENDING)
-            running_count = sum(1 for t in self.tasks.values() if t.status == TaskStatus.RUNNING)
-
-        return {
-            "queue_size": self.get_queue_size(),
-            "total_tasks": self.total_tasks,
-            "pending": pending_count,
-            "running": running_count,
-            "completed": self.completed_count,
-            "failed": self.failed_count,
-            "workers": self.num_workers,
-            "is_running": self.running,
-        }
+            return {
+                "queue_size": self._queued_count(),
+                "total_tasks": self.total_tasks,
+                "pending": self.pending_count,
+                "running": self.running_count,
+                "completed": self.completed_count,
+                "failed": self.failed_count,
+                "cancelled": self.cancelled_count,
+                "expired": self.expired_count,
+                "batches": self.batch_count,
+                "batched_tasks": self.batched_task_count,
+                "retained_tasks": len(self.tasks),
+                "lanes": {lane.value: len(pending) for lane, pending in self._lanes.items()},
+                "workers": self.num_workers,
+                "interactive_workers": self.interactive_workers,
+                "is_running": self.running,
+            }
+
+    def _queued_count(self) -> int:
+        # Called with the lock held
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def _has_capacity(self) -> bool:
+        return self._queued_count() < self.max_queue_size
+
+    def _on_future_done(self, task: Task) -> None:
+        """Mark tasks cancelled through their future"""
+        if not task.future.cancelled():
+            return
+
+        with self.task_lock:
+            if task.status == TaskStatus.PENDING:
+                self._mark_cancelled(task)
+                self._lanes[task.lane].stale += 1
+                self._not_full.notify()
+                self._compact_if_needed()
+
+    def _mark_cancelled(self, task: Task) -> None:
+        # Called with the lock held
+        task.status = TaskStatus.CANCELLED
+        task.completed_at = datetime.now()
+        self.pending_count -= 1
+        self.cancelled_count += 1
+        self._retain_finished(task)
+
+    def _retain_finished(self, task: Task) -> None:
+        """Keep finished task for lookup, dropping the oldest beyond the limit"""
+        # Called with the lock held
+        self._finished_ids.append(task.id)
+        while len(self._finished_ids) > self.max_retained_tasks:
+            self.tasks.pop(self._finished_ids.popleft(), None)
+
+    def _compact_if_needed(self) -> None:
+        # Called with the lock held
+        stale = sum(lane.stale for lane in self._lanes.values())
+        size = sum(lane.size for lane in self._lanes.values())
+        if stale > self._COMPACT_THRESHOLD and stale * 2 > size:
+            for lane in self._lanes.values():
+                lane.compact()
+            for name, pending in self._batch_pending.items():
+                self._batch_pending[name] = deque(
+                    t for t in pending if t.status == TaskStatus.PENDING
+                )
+
+    def _claim(self, task: Task) -> bool:
+        """Move pending task to running. Returns False if it was cancelled."""
+        # Called with the lock held
+        if not task.future.set_running_or_notify_cancel():
+            self._mark_cancelled(task)
+            return False
+
+        task.status = TaskStatus.RUNNING
+        task.started_at = datetime.now()
+        self.pending_count -= 1
+        self.running_count += 1
+        return True
+
+    def _next_tasks(self, lanes: Tuple[TaskLane, ...]) -> Tuple[Optional[List[Task]], List[Task]]:
+        """
+        Wait for the next task (or batch of tasks) from the given lanes.
+
+        Returns:
+            Tuple of (tasks to run or None on shutdown, expired tasks to fail)
+        """
+        expired: List[Task] = []
+        with self.task_lock:
+            while True:
+                lane = self._first_nonempty(lanes)
+                while self.running and lane is None and not expired:
+                    self._not_empty.wait()
+                    lane = self._first_nonempty(lanes)
+                if not self.running:
+                    return None, expired
+                if lane is None:
+                    # Report expired tasks before waiting again
+                    return [], expired
+
+                task = lane.pop()
+                if task.status != TaskStatus.PENDING:
+                    # Lazily deleted entry (cancelled or claimed by a batch)
+                    lane.stale -= 1
+                    continue
+
+                self._not_full.notify()
+                if not self._claim(task):
+                    continue
+
+                if lane.drop_expired and task.is_expired():
+                    expired.append(task)
+                    continue
+
+                handler = self._batch_handlers.get(task.name)
+                if handler is None:
+                    return [task], expired
+                return self._collect_batch(task, handler, expired), expired
+
+    def _first_nonempty(self, lanes: Tuple[TaskLane, ...]) -> Optional[_Lane]:
+        # Called with the lock held; stale entries count so they get popped
+        for lane in lanes:
+            pending = self._lanes[lane]
+            if pending.size:
+                return pending
+        return None
+
+    def _collect_batch(
+        self, first: Task, handler: BatchHandler, expired: List[Task]
+    ) -> List[Task]:
+        """
+        Gather pending tasks with the same name and lane into a batch.
+
+        Tasks of other lanes stay queued for workers serving their lane;
+        expired tasks of a lane that drops them are moved to expired.
+        """
+        # Called with the lock held
+        batch = [first]
+        lane = self._lanes[first.lane]
+        pending = self._batch_pending[first.name]
+        deadline = time.monotonic() + handler.window
+
+        while len(batch) < handler.max_batch_size:
+            kept = []
+            while pending and len(batch) < handler.max_batch_size:
+                task = pending.popleft()
+                if task is first or task.status != TaskStatus.PENDING:
+                    continue
+                if task.lane != first.lane:
+                    kept.append(task)
+                    continue
+                # Its heap entry becomes stale either way
+                lane.stale += 1
+                if not self._claim(task):
+                    continue
+                if lane.drop_expired and task.is_expired():
+                    expired.append(task)
+                else:
+                    batch.append(task)
+            pending.extendleft(reversed(kept))
+
+            remaining = deadline - time.monotonic()
+            if len(batch) >= handler.max_batch_size or remaining <= 0 or not self.running:
+                break
+            self._not_empty.wait(remaining)
+
+        self._not_full.notify_all()
+        return batch
 
     def _handle_task_success(self, task, result):
         """Handle successful task completion."""
@@ -241,12 +637,12 @@ class TaskQueue:
             task.status = TaskStatus.COMPLETED
             task.result = result
             task.completed_at = datetime.now()
+            self.running_count -= 1
             self.completed_count += 1
             self.completed_tasks.append(task)
+            self._retain_finished(task)
 
-            # Limit completed tasks history
-            if len(self.completed_tasks) > 100:
-                self.completed_tasks = self.completed_tasks[-100:]
+        task.future.set_result(result)
 
         # Call success callback
         if task.callback:
@@ -255,17 +651,27 @@ class TaskQueue:
             except Exception as e:
                 logger.error(f"Task callback error: {e}")
 
-        logger.debug(f"Task {task.id} completed successfully")
+        logger.debug("Task %s completed successfully", task.id)
 
-    def _handle_task_failure(self, task, error):
+    def _handle_task_failure(self, task, error, status: TaskStatus = TaskStatus.FAILED):
         """Handle task failure."""
-        logger.error(f"Task {task.id} failed: {error}")
+        if status == TaskStatus.EXPIRED:
+            logger.warning(f"Task {task.id} dropped: {error}")
+        else:
+            logger.error(f"Task {task.id} failed: {error}")
 
         with self.task_lock:
-            task.status = TaskStatus.FAILED
+            task.status = status
             task.error = error
             task.completed_at = datetime.now()
-            self.failed_count += 1
+            self.running_count -= 1
+            if status == TaskStatus.EXPIRED:
+                self.expired_count += 1
+            else:
+                self.failed_count += 1
+            self._retain_finished(task)
+
+        task.future.set_exception(error)
 
         # Call error callback
         if task.error_callback:
@@ -277,38 +683,61 @@ class TaskQueue:
     def _execute_task(self, task, worker_name):
         """Execute a single task."""
         try:
-            logger.debug(f"{worker_name} executing task {task.id} ({task.name})")
+            logger.debug("%s executing task %s (%s)", worker_name, task.id, task.name)
             result = task.func(*task.args, **task.kwargs)
             self._handle_task_success(task, result)
         except Exception as e:
             self._handle_task_failure(task, e)
 
-    def _worker_loop(self):
+    def _execute_batch(self, batch: List[Task], worker_name: str) -> None:
+        """Execute tasks with one call to their batch handler."""
+        name = batch[0].name
+        logger.debug("%s executing batch of %d %s tasks", worker_name, len(batch), name)
+
+        with self.task_lock:
+            handler = self._batch_handlers[name]
+            self.batch_count += 1
+            self.batched_task_count += len(batch)
+
+        try:
+            results = list(handler.func([task.args for task in batch]))
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch handler for {name} returned {len(results)} results "
+                    f"for {len(batch)} tasks"
+                )
+        except Exception as e:
+            for task in batch:
+                self._handle_task_failure(task, e)
+            return
+
+        for task, result in zip(batch, results):
+            self._handle_task_success(task, result)
+
+    def _worker_loop(self, lanes: Tuple[TaskLane, ...] = _GENERAL_LANES):
         """Worker thread main loop"""
         worker_name = threading.current_thread().name
         logger.debug(f"{worker_name} started")
 
-        while self.running:
+        while True:
             try:
-                # Get task from queue
-                item = self.task_queue.get(timeout=1.0)
-
-                # Check for shutdown sentinel
-                priority, task = item
-                if task is None:
-                    break
+                batch, expired = self._next_tasks(lanes)
 
-                # Check if task was cancelled
-                with self.task_lock:
-                    if task.status == TaskStatus.CANCELLED:
-                        continue
-                    task.status = TaskStatus.RUNNING
-                    task.started_at = datetime.now()
+                for task in expired:
+                    waited = time.monotonic() - task.submitted_at
+                    self._handle_task_failure(
+                        task,
+                        TaskExpiredError(f"Deadline passed after {waited:.3f}s in queue"),
+                        TaskStatus.EXPIRED,
+                    )
 
-                self._execute_task(task, worker_name)
+                if batch is None:
+                    break
+                if len(batch) == 1:
+                    self._execute_task(batch[0], worker_name)
+                elif batch:
+                    self._execute_batch(batch, worker_name)
 
-            except queue.Empty:
-                continue
             except Exception as e:
                 logger.error(f"{worker_name} error: {e}")
 
@@ -5,13 +5,31 @@ Translation Cache Service - Screen Translator v2.0
 
 import hashlib
 import json
+import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from src.utils.logger import logger
+from src.utils.translation_archive import (
+    ARCHIVE_EXTENSION,
+    ArchiveReader,
+    ArchiveWriter,
+    ColumnType,
+    is_archive,
+)
+
+# Колонки записи кэша в компактном архиве
+CACHE_ARCHIVE_SCHEMA = (
+    ("text", ColumnType.STRING),
+    ("translation", ColumnType.STRING),
+    ("source_lang", ColumnType.DICT),
+    ("target_lang", ColumnType.DICT),
+    ("timestamp", ColumnType.TIMESTAMP),
+    ("hit_count", ColumnType.INT),
+)
 
 
 @dataclass
@@ -45,6 +63,8 @@ class TranslationCache:
         self.ttl_seconds = ttl_seconds
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        # Кэш используется из нескольких потоков (сохранение идет в фоне)
+        self._lock = threading.RLock()
 
         logger.info(f"Translation cache initialized (max_size={max_size}, ttl={ttl_seconds}s)")
 
@@ -72,15 +92,18 @@ class TranslationCache:
         """
         key = self._generate_key(text, source_lang, target_lang)
 
-        if key in self._cache:
-            entry = self._cache[key]
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
 
             # Проверка срока действия
             if entry.is_expired(self.ttl_seconds):
                 self._cache.pop(key)
                 self._stats["expirations"] += 1
                 self._stats["misses"] += 1
-                logger.debug(f"Cache entry expired for key: {key}")
+                logger.debug("Cache entry expired for key: %s", key)
                 return None
 
             # Обновление позиции (LRU)
@@ -88,11 +111,8 @@ class TranslationCache:
             entry.hit_count += 1
             self._stats["hits"] += 1
 
-            logger.debug(f"Cache hit for key: {key} (hits: {entry.hit_count})")
-            return entry.translation
-
-        self._stats["misses"] += 1
-        return None
+        logger.debug("Cache hit for key: %s (hits: %d)", key, entry.hit_count)
+        return entry.translation
 
     def add(self, text: str, translation: str, source_lang: str, target_lang: str) -> None:
         """
@@ -116,27 +136,29 @@ class TranslationCache:
         )
 
         # Добавление в кэш
-        if key in self._cache:
-            # Обновление существующей записи
-            self._cache[key] = entry
-            self._cache.move_to_end(key)
-        else:
-            # Проверка размера кэша
-            if len(self._cache) >= self.max_size:
-                # Удаление самой старой записи (LRU)
-                oldest_key = next(iter(self._cache))
-                self._cache.pop(oldest_key)
-                self._stats["evictions"] += 1
-                logger.debug(f"Evicted oldest cache entry: {oldest_key}")
-
-            self._cache[key] = entry
-
-        logger.debug(f"Added to cache: {key}")
+        with self._lock:
+            if key in self._cache:
+                # Обновление существующей записи
+                self._cache[key] = entry
+                self._cache.move_to_end(key)
+            else:
+                # Проверка размера кэша
+                if len(self._cache) >= self.max_size:
+                    # Удаление самой старой записи (LRU)
+                    oldest_key = next(iter(self._cache))
+                    self._cache.pop(oldest_key)
+                    self._stats["evictions"] += 1
+                    logger.debug("Evicted oldest cache entry: %s", oldest_key)
+
+                self._cache[key] = entry
+
+        logger.debug("Added to cache: %s", key)
 
     def clear(self) -> None:
         """Очистить весь кэш"""
-        size = len(self._cache)
-        self._cache.clear()
+        with self._lock:
+            size = len(self._cache)
+            self._cache.clear()
         logger.info(f"Cache cleared ({size} entries removed)")
 
     def get_stats(self) -> Dict[str, any]:
@@ -157,15 +179,14 @@ class TranslationCache:
 
     def cleanup_expired(self) -> int:
         """Удалить истекшие записи"""
-        expired_keys = []
-
-        for key, entry in self._cache.items():
-            if entry.is_expired(self.ttl_seconds):
-                expired_keys.append(key)
+        with self._lock:
+            expired_keys = [
+                key for key, entry in self._cache.items() if entry.is_expired(self.ttl_seconds)
+            ]
 
-        for key in expired_keys:
-            self._cache.pop(key)
-            self._stats["expirations"] += 1
+            for key in expired_keys:
+                self._cache.pop(key)
+                self._stats["expirations"] += 1
 
         if expired_keys:
             logger.info(f"Cleaned up {len(expired_keys)} expired cache entries")
@@ -174,7 +195,9 @@ class TranslationCache:
 
     def get_most_used(self, limit: int = 10) -> List[Tuple[str, int]]:
         """Получить наиболее используемые переводы"""
-        sorted_entries = sorted(self._cache.items(), key=lambda x: x[1].hit_count, reverse=True)
+        with self._lock:
+            items = list(self._cache.items())
+        sorted_entries = sorted(items, key=lambda x: x[1].hit_count, reverse=True)
 
         return [
             (f"{entry.text} -> {entry.translation}", entry.hit_count)
@@ -182,10 +205,23 @@ class TranslationCache:
         ]
 
     def save_to_file(self, filepath: str) -> None:
-        """Сохранить кэш в файл"""
+        """
+        Сохранить кэш в файл
+
+        Файлы с расширением .stra пишутся в компактном колоночном архиве,
+        остальные - в JSON.
+        """
+        # Снимок записей под блокировкой; запись в файл идет без нее
+        with self._lock:
+            snapshot = list(self._cache.values())
+
+        if filepath.endswith(ARCHIVE_EXTENSION):
+            self._save_to_archive(filepath, snapshot)
+            return
+
         cache_data = {
             "metadata": {
-                "size": len(self._cache),
+                "size": len(snapshot),
                 "ttl_seconds": self.ttl_seconds,
                 "saved_at": datetime.now().isoformat(),
             },
@@ -198,53 +234,89 @@ class TranslationCache:
                     "timestamp": entry.timestamp.isoformat(),
                     "hit_count": entry.hit_count,
                 }
-                for entry in self._cache.values()
+                for entry in snapshot
             ],
         }
 
         try:
             with open(filepath, "w", encoding="utf-8") as f:
                 json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.info(f"Cache saved to {filepath} ({len(self._cache)} entries)")
+            logger.info(f"Cache saved to {filepath} ({len(snapshot)} entries)")
         except Exception as e:
             logger.error(f"Failed to save cache: {e}")
 
     def load_from_file(self, filepath: str) -> int:
-        """Загрузить кэш из файла"""
+        """Загрузить кэш из файла (JSON или архив, формат определяется по содержимому)"""
         try:
+            if is_archive(filepath):
+                with ArchiveReader(filepath) as reader:
+                    return self._load_entries(reader.iter_records(), filepath)
+
             with open(filepath, "r", encoding="utf-8") as f:
                 cache_data = json.load(f)
 
-            self._cache.clear()
-            loaded = 0
-
-            for entry_data in cache_data.get("entries", []):
-                try:
-                    entry = CacheEntry(
-                        text=entry_data["text"],
-                        translation=entry_data["translation"],
-                        source_lang=entry_data["source_lang"],
-                        target_lang=entry_data["target_lang"],
-                        timestamp=datetime.fromisoformat(entry_data["timestamp"]),
-                        hit_count=entry_data.get("hit_count", 0),
-                    )
-
-                    # Проверка срока действия
-                    if not entry.is_expired(self.ttl_seconds):
-                        key = self._generate_key(entry.text, entry.source_lang, entry.target_lang)
-                        self._cache[key] = entry
-                        loaded += 1
-
-                except Exception as e:
-                    logger.warning(f"Failed to load cache entry: {e}")
-
-            logger.info(f"Cache loaded from {filepath} ({loaded} entries)")
-            return loaded
+            return self._load_entries(cache_data.get("entries", []), filepath)
 
         except Exception as e:
             logger.error(f"Failed to load cache: {e}")
             return 0
 
+    def _save_to_archive(self, filepath: str, snapshot: List[CacheEntry]) -> None:
+        """Сохранить снимок записей кэша в компактный архив"""
+        entries = (
+            {
+                "text": entry.text,
+                "translation": entry.translation,
+                "source_lang": entry.source_lang,
+                "target_lang": entry.target_lang,
+                "timestamp": entry.timestamp,
+                "hit_count": entry.hit_count,
+            }
+            for entry in snapshot
+        )
+
+        try:
+            with ArchiveWriter(
+                filepath, CACHE_ARCHIVE_SCHEMA, metadata={"ttl_seconds": self.ttl_seconds}
+            ) as writer:
+                writer.write_many(entries)
+            logger.info(f"Cache saved to {filepath} ({writer.count} entries, archive)")
+        except Exception as e:
+            logger.error(f"Failed to save cache: {e}")
+
+    def _load_entries(self, entries: Iterable[dict], filepath: str) -> int:
+        """Заполнить кэш записями из файла, пропуская истекшие"""
+        loaded: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+        for entry_data in entries:
+            try:
+                timestamp = entry_data["timestamp"]
+                if isinstance(timestamp, str):
+                    timestamp = datetime.fromisoformat(timestamp)
+
+                entry = CacheEntry(
+                    text=entry_data["text"],
+                    translation=entry_data["translation"],
+                    source_lang=entry_data["source_lang"],
+                    target_lang=entry_data["target_lang"],
+                    timestamp=timestamp,
+                    hit_count=entry_data.get("hit_count") or 0,
+                )
+
+                # Проверка срока действия
+                if not entry.is_expired(self.ttl_seconds):
+                    key = self._generate_key(entry.text, entry.source_lang, entry.target_lang)
+                    loaded[key] = entry
+
+            except Exception as e:
+                logger.warning(f"Failed to load cache entry: {e}")
+
+        with self._lock:
+            self._cache = loaded
+
+        logger.info(f"Cache loaded from {filepath} ({len(loaded)} entries)")
+        return len(loaded)
+
 
 # Глобальный экземпляр кэша
 _translation_cache: Optional[TranslationCache] = None
@@ -0,0 +1,431 @@
+"""
+Sentence-level translation memory with fuzzy matching.
+
+The exact translation caches only hit when the whole text matches. OCR'd
+subtitles and game text repeat the same lines with a different number, name
+or punctuation, so the memory stores translations per sentence and answers
+lookups in tiers:
+
+1. exact match of the normalized sentence;
+2. template match, where numbers are masked and the new numbers are
+   substituted into the stored translation;
+3. fuzzy match (opt-in), where candidates come from MinHash LSH over
+   character trigrams and are scored by a bounded edit distance.
+
+Fuzzy matches are suggestions: the stored translation belongs to a
+different text. Texts of several sentences are served from the memory only
+if every sentence hits. Lookups cost O(bands + candidates) regardless of
+the number of stored segments; the least recently used segments are
+evicted above max_segments.
+"""
+
+import hashlib
+import itertools
+import json
+import re
+import struct
+import threading
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.utils.logger import logger
+from src.utils.text_segmentation import split_paragraphs, split_sentences
+
+_NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Languages written without spaces between sentences
+_UNSPACED_LANGUAGES = frozenset({"ja", "zh", "zh-cn", "zh-tw", "th"})
+
+_SHINGLE = 3
+
+# Default maximum number of stored segments
+DEFAULT_MAX_SEGMENTS = 100_000
+
+
+@dataclass(frozen=True)
+class MemoryMatch:
+    """Translation served from the memory."""
+
+    translated_text: str
+    score: float  # 1.0 for exact and template matches
+    kind: str  # "exact", "template", "fuzzy" or "sentences"
+
+    @property
+    def suggestion(self) -> bool:
+        """True if the translation comes from a merely similar text."""
+        return self.score < 1.0
+
+
+@dataclass
+class _Segment:
+    """Stored sentence or text and the keys indexing it."""
+
+    source_lang: str
+    target_lang: str
+    text: str
+    normalized: str
+    numbers: Tuple[str, ...]
+    translation: str
+    template: str
+    band_keys: List[int]
+
+
+def normalize(text: str) -> str:
+    """Normalize text for matching: NFKC, case-folded, single spaces."""
+    return _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFKC", text)).strip().casefold()
+
+
+def bounded_edit_distance(a: str, b: str, max_distance: int) -> Optional[int]:
+    """
+    Levenshtein distance if it does not exceed max_distance, else None.
+
+    Only a diagonal band of width 2 * max_distance + 1 is computed.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if a == b:
+        return 0
+    if len(a) > len(b):
+        a, b = b, a
+
+    limit = max_distance + 1
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [limit] * (len(b) + 1)
+        current[0] = min(i, limit)
+        row_min = current[0]
+        for j in range(max(1, i - max_distance), min(len(b), i + max_distance) + 1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char != b[j - 1]),
+            )
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[len(b)]
+    return distance if distance <= max_distance else None
+
+
+def _split_units(text: str) -> List[Tuple[str, str]]:
+    """Split text into (sentence, separator) pairs across paragraphs."""
+    units: List[Tuple[str, str]] = []
+    for paragraph, paragraph_separator in split_paragraphs(text.strip()):
+        sentences = split_sentences(paragraph)
+        last, separator = sentences[-1]
+        sentences[-1] = (last, separator + paragraph_separator)
+        units.extend(sentences)
+    return units
+
+
+class TranslationMemory:
+    """Thread-safe in-memory store of translated sentences."""
+
+    def __init__(
+        self,
+        fuzzy_threshold: Optional[float] = None,
+        bands: int = 6,
+        rows: int = 3,
+        max_candidates: int = 16,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ):
+        """
+        Args:
+            fuzzy_threshold: Minimum similarity of served fuzzy matches (e.g.
+                0.9); None serves exact and template matches only
+            bands: LSH bands; with rows, sets the candidate similarity cutoff
+            rows: MinHash values per band
+            max_candidates: Candidates scored per lookup
+            max_segments: Stored segments kept; least recently used are evicted
+        """
+        if max_segments < 1:
+            raise ValueError("max_segments must be positive")
+
+        self.fuzzy_threshold = fuzzy_threshold
+        self.bands = bands
+        self.rows = rows
+        self.max_candidates = max_candidates
+        self.max_segments = max_segments
+
+        # Each shingle hash is split into one 32-bit value per MinHash function
+        self._hash_format = struct.Struct(f"<{bands * rows}I")
+
+        # Segment id -> segment, least recently used first
+        self._segments: "OrderedDict[int, _Segment]" = OrderedDict()
+        self._ids = itertools.count()
+        self._exact: Dict[Tuple[str, str, str], int] = {}
+        self._templates: Dict[Tuple[str, str, str], int] = {}
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+        # Statistics
+        self.lookups = 0
+        self.hits = {"exact": 0, "template": 0, "fuzzy": 0, "sentences": 0}
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def add(self, text: str, translation: str, source_lang: str, target_lang: str) -> int:
+        """
+        Store a translation and its sentence-aligned pairs.
+
+        Sentences are aligned only when both sides split into the same
+        number of sentences.
+
+        Returns:
+            Number of segments stored or updated
+        """
+        pairs = [(text, translation)]
+        sources = _split_units(text)
+        if len(sources) > 1:
+            targets = _split_units(translation)
+            if len(targets) == len(sources):
+                pairs.extend((s, t) for (s, _), (t, _) in zip(sources, targets))
+
+        with self._lock:
+            for source, target in pairs:
+                self._add(source.strip(), target.strip(), source_lang, target_lang)
+        return len(pairs)
+
+    def _add(self, text: str, translation: str, source_lang: str, target_lang: str) -> None:
+        normalized = normalize(text)
+        if not normalized or not translation:
+            return
+
+        key = (source_lang, target_lang, normalized)
+        segment_id = self._exact.get(key)
+        if segment_id is not None:
+            self._segments[segment_id].translation = translation
+            self._segments.move_to_end(segment_id)
+            return
+
+        template = _NUMBER_RE.sub("#", normalized)
+        segment = _Segment(
+            source_lang,
+            target_lang,
+            text,
+            normalized,
+            tuple(_NUMBER_RE.findall(normalized)),
+            translation,
+            template,
+            self._band_keys(template, key[:2]),
+        )
+        segment_id = next(self._ids)
+        self._segments[segment_id] = segment
+        self._exact[key] = segment_id
+        self._templates.setdefault((source_lang, target_lang, template), segment_id)
+        for bucket, band_key in zip(self._buckets, segment.band_keys):
+            bucket.setdefault(band_key, []).append(segment_id)
+
+        while len(self._segments) > self.max_segments:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove the least recently used segment and its index entries."""
+        segment_id, segment = self._segments.popitem(last=False)
+        languages = (segment.source_lang, segment.target_lang)
+        del self._exact[languages + (segment.normalized,)]
+        template_key = languages + (segment.template,)
+        if self._templates.get(template_key) == segment_id:
+            del self._templates[template_key]
+        for bucket, band_key in zip(self._buckets, segment.band_keys):
+            ids = bucket[band_key]
+            ids.remove(segment_id)
+            if not ids:
+                del bucket[band_key]
+        self.evictions += 1
+
+    def lookup(
+        self,
+        text: str,
+        target_lang: str,
+        source_lang: str = "auto",
+        fuzzy_threshold: Optional[float] = None,
+    ) -> Optional[MemoryMatch]:
+        """
+        Find a translation for text.
+
+        Args:
+            text: Text to translate
+            target_lang: Target language
+            source_lang: Source language, as passed when storing
+            fuzzy_threshold: Overrides the memory's fuzzy threshold
+
+        Returns:
+            Match or None if the text (or one of its sentences) is unknown
+        """
+        threshold = self.fuzzy_threshold if fuzzy_threshold is None else fuzzy_threshold
+        with self._lock:
+            self.lookups += 1
+            match = self._lookup_segment(text, source_lang, target_lang, threshold)
+            if match is None:
+                match = self._lookup_sentences(text, source_lang, target_lang, threshold)
+            if match is not None:
+                self.hits[match.kind] += 1
+            return match
+
+    def _lookup_sentences(
+        self, text: str, source_lang: str, target_lang: str, threshold: Optional[float]
+    ) -> Optional[MemoryMatch]:
+        units = _split_units(text)
+        if len(units) < 2:
+            return None
+
+        parts, score = [], 1.0
+        for sentence, separator in units:
+            match = self._lookup_segment(sentence, source_lang, target_lang, threshold)
+            if match is None:
+                return None
+            score = min(score, match.score)
+            if "\n" not in separator:
+                separator = "" if target_lang in _UNSPACED_LANGUAGES else " "
+            parts.append(match.translated_text + separator)
+        return MemoryMatch("".join(parts).strip(), score, "sentences")
+
+    def _lookup_segment(
+        self, text: str, source_lang: str, target_lang: str, threshold: Optional[float]
+    ) -> Optional[MemoryMatch]:
+        normalized = normalize(text)
+        if not normalized:
+            return None
+
+        segment_id = self._exact.get((source_lang, target_lang, normalized))
+        if segment_id is not None:
+            self._segments.move_to_end(segment_id)
+            return MemoryMatch(self._segments[segment_id].translation, 1.0, "exact")
+
+        template = _NUMBER_RE.sub("#", normalized)
+        segment_id = self._templates.get((source_lang, target_lang, template))
+        if segment_id is not None:
+            segment = self._segments[segment_id]
+            substituted = _substitute_numbers(
+                segment.translation, segment.numbers, tuple(_NUMBER_RE.findall(normalized))
+            )
+            if substituted is not None:
+                self._segments.move_to_end(segment_id)
+                return MemoryMatch(substituted, 1.0, "template")
+
+        if threshold is None:
+            return None
+        return self._lookup_fuzzy(normalized, template, (source_lang, target_lang), threshold)
+
+    def _lookup_fuzzy(
+        self, normalized: str, template: str, languages: Tuple[str, str], threshold: float
+    ) -> Optional[MemoryMatch]:
+        collisions: Dict[int, int] = {}
+        for bucket, band_key in zip(self._buckets, self._band_keys(template, languages)):
+            for segment_id in bucket.get(band_key, ()):
+                collisions[segment_id] = collisions.get(segment_id, 0) + 1
+
+        candidates = sorted(collisions, key=collisions.__getitem__, reverse=True)
+        best: Optional[MemoryMatch] = None
+        best_id = None
+        for segment_id in candidates[: self.max_candidates]:
+            segment = self._segments[segment_id]
+            if (segment.source_lang, segment.target_lang) != languages:
+                continue
+            length = max(len(segment.normalized), len(normalized))
+            distance = bounded_edit_distance(
+                normalized, segment.normalized, int((1 - threshold) * length)
+            )
+            if distance is None:
+                continue
+            score = 1 - distance / length
+            if best is None or score > best.score:
+                best = MemoryMatch(segment.translation, score, "fuzzy")
+                best_id = segment_id
+        if best_id is not None:
+            self._segments.move_to_end(best_id)
+        return best
+
+    def _band_keys(self, template: str, languages: Tuple[str, str]) -> List[int]:
+        """MinHash signature of the template's trigrams, hashed per band."""
+        padded = f" {template} ".encode("utf-8")
+        size = self._hash_format.size
+        unpack = self._hash_format.unpack
+        shingles = {padded[i : i + _SHINGLE] for i in range(max(1, len(padded) - _SHINGLE + 1))}
+        signature = [
+            min(column)
+            for column in zip(*(unpack(hashlib.shake_128(s).digest(size)) for s in shingles))
+        ]
+        rows = self.rows
+        return [
+            hash((languages, band, tuple(signature[band * rows : (band + 1) * rows])))
+            for band in range(self.bands)
+        ]
+
+    def clear(self) -> None:
+        """Remove all segments."""
+        with self._lock:
+            self._segments.clear()
+            self._exact.clear()
+            self._templates.clear()
+            for bucket in self._buckets:
+                bucket.clear()
+
+    def save(self, path: str) -> int:
+        """Save segments as JSON lines (least recently used first); returns the count."""
+        with self._lock:
+            records = [
+                (segment.source_lang, segment.target_lang, segment.text, segment.translation)
+                for segment in self._segments.values()
+            ]
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return len(records)
+
+    def load(self, path: str) -> int:
+        """Load segments saved by save(); returns the number loaded."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f if line.strip()]
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load translation memory from {path}: {e}")
+            return 0
+
+        with self._lock:
+            for source_lang, target_lang, text, translation in records:
+                self._add(text, translation, source_lang, target_lang)
+        return len(records)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memory statistics."""
+        with self._lock:
+            hits = sum(self.hits.values())
+            return {
+                "segments": len(self._segments),
+                "max_segments": self.max_segments,
+                "evictions": self.evictions,
+                "lookups": self.lookups,
+                "hits": dict(self.hits),
+                "hit_rate": hits / self.lookups if self.lookups else 0.0,
+                "fuzzy_threshold": self.fuzzy_threshold,
+            }
+
+
+def _substitute_numbers(
+    translation: str, stored: Sequence[str], numbers: Sequence[str]
+) -> Optional[str]:
+    """Replace stored numbers in a translation; None if they are ambiguous."""
+    if len(stored) != len(numbers):
+        return None
+    if len(set(stored)) != len(stored):
+        return None
+
+    found = _NUMBER_RE.findall(translation)
+    if sorted(found) != sorted(stored):
+        return None
+
+    mapping = dict(zip(stored, numbers))
+    return _NUMBER_RE.sub(lambda m: mapping[m.group(0)], translation)
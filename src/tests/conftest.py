@@ -12,6 +12,17 @@ sys.path.insert(0, str(src_path))
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_capability_registry():
+    """Give each test a fresh in-memory capability registry (no probe cache on disk)."""
+    from src.services.capability_registry import CapabilityRegistry, set_capability_registry
+
+    registry = CapabilityRegistry(cache_file=None)
+    set_capability_registry(registry)
+    yield registry
+    set_capability_registry(None)
+
+
 @pytest.fixture
 def sample_translation_data():
     """Sample translation data for tests."""
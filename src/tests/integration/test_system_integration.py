@@ -76,7 +76,7 @@ def test_plugin_system():
         from src.plugins.base_plugin import PluginType
         from src.plugins.plugin_manager import PluginManager
 
-        plugin_manager = PluginManager()
+        plugin_manager = PluginManager(manifest_cache_path=None)
         plugins = plugin_manager.discover_plugins()
 
         print(f"[PASS] Discovered {len(plugins)} plugins")
@@ -0,0 +1,130 @@
+"""
+Unit tests for parallel region OCR in the AI OCR plugin.
+"""
+
+import threading
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+from src.core.ai_ocr_engine import (  # noqa: E402
+    AIEnhancedOCRPlugin,
+    TextRegion,
+    plan_region_batches,
+    sort_reading_order,
+    stitch_regions,
+)
+
+
+def region(x1, y1, x2, y2):
+    return TextRegion(bbox=(x1, y1, x2, y2), text="", confidence=0.0, language="eng")
+
+
+class FakeOCR:
+    """OCR engine returning the region's position encoded in its pixels."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def extract_text(self, image, languages):
+        with self._lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        # Each crop is filled with its label value; stitched canvases have several
+        pixels = np.asarray(image)
+        labels = [int(v) for v in np.unique(pixels) if v not in (0, 255)]
+        return "\n".join(f"r{v}" for v in labels), 0.8
+
+
+class TestRegionPlanning:
+    """Test ordering and batching of regions."""
+
+    def test_reading_order(self):
+        """Test lines go top-to-bottom and regions within a line left-to-right."""
+        regions = [
+            region(300, 104, 400, 130),
+            region(10, 10, 100, 40),
+            region(10, 100, 100, 128),
+            region(200, 14, 290, 38),
+        ]
+
+        ordered = sort_reading_order(regions)
+
+        assert [r.bbox[:2] for r in ordered] == [(10, 10), (200, 14), (10, 100), (300, 104)]
+
+    def test_tiny_regions_are_batched(self):
+        """Test consecutive tiny regions share a batch and large ones stay alone."""
+        regions = [region(0, 0, 50, 20), region(60, 0, 110, 20), region(0, 40, 600, 100)]
+        regions += [region(0, 120 + 30 * i, 40, 140 + 30 * i) for i in range(10)]
+
+        batches = plan_region_batches(regions, max_batch=8)
+
+        assert [len(batch) for batch in batches] == [2, 1, 8, 2]
+
+    def test_stitch_regions(self):
+        """Test crops are stacked with padding in the background color."""
+        image = np.full((100, 200), 0, dtype=np.uint8)
+        image[10:20, 10:50] = 240
+        image[50:70, 100:130] = 240
+        image[14:16, 20:30] = 7  # "text" inside the first crop
+
+        canvas = stitch_regions(image, [region(10, 10, 50, 20), region(100, 50, 130, 70)], 4)
+
+        assert canvas.shape == (4 + 10 + 4 + 20 + 4, 40 + 8)
+        assert (canvas[4:14, 4:44] == image[10:20, 10:50]).all()
+        assert (canvas[18:38, 4:34] == 240).all()
+        assert canvas[0, 0] == 240  # median of the crops' borders
+
+
+class TestRegionFanOut:
+    """Test the plugin's parallel region extraction."""
+
+    def make_plugin(self, workers):
+        plugin = AIEnhancedOCRPlugin()
+        plugin.base_ocr = FakeOCR()
+        plugin.region_workers = workers
+        return plugin
+
+    def make_image(self, regions):
+        image = np.full((800, 800), 255, dtype=np.uint8)
+        for label, r in enumerate(regions, 1):
+            x1, y1, x2, y2 = r.bbox
+            image[y1:y2, x1:x2] = label
+        return image
+
+    def test_results_in_reading_order(self):
+        """Test parallel results are combined top-to-bottom."""
+        regions = [region(10, 100 * i, 400, 100 * i + 60) for i in range(6)]
+        image = self.make_image(regions)
+        plugin = self.make_plugin(workers=4)
+
+        text, confidence = plugin._extract_from_regions(image, list(reversed(regions)), ["eng"])
+
+        assert text == " ".join(f"r{i}" for i in range(1, 7))
+        assert confidence == pytest.approx(0.8)
+        assert plugin.base_ocr.max_active > 1
+        assert [r.text for r in regions] == [f"r{i}" for i in range(1, 7)]
+        plugin.cleanup()
+
+    def test_tiny_regions_share_ocr_call(self):
+        """Test tiny adjacent regions are stitched into one OCR call."""
+        regions = [region(10 + 60 * i, 10, 60 + 60 * i, 30) for i in range(5)]
+        image = self.make_image(regions)
+        plugin = self.make_plugin(workers=1)
+
+        text, _ = plugin._extract_from_regions(image, regions, ["eng"])
+
+        assert plugin.base_ocr.calls == 1
+        assert text == "r1 r2 r3 r4 r5"
+        assert regions[2].text == "r3"
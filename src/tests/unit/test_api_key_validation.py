@@ -0,0 +1,121 @@
+"""
+Unit tests for API key validation in AuthenticationManager.
+"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.security.auth import AuthenticationManager
+
+
+class TestAPIKeyValidation:
+    """Test indexed API key validation and deferred usage persistence."""
+
+    @pytest.fixture
+    def auth_manager(self, tmp_path):
+        """Create auth manager with a long flush interval."""
+        manager = AuthenticationManager(data_dir=str(tmp_path), usage_flush_interval=3600)
+        yield manager
+        manager.shutdown()
+
+    @pytest.fixture
+    def user_id(self, auth_manager):
+        """Create a user owning the keys."""
+        auth_manager.create_user("api_user", "password123")
+        return "api_user"
+
+    def test_validate_api_key(self, auth_manager, user_id):
+        """Test valid and invalid keys."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+
+        record = auth_manager.validate_api_key(api_key)
+        assert record is not None
+        assert record.name == "test key"
+        assert record.usage_count == 1
+        assert auth_manager.validate_api_key("st_invalid") is None
+
+    def test_validation_does_not_rewrite_key_file(self, auth_manager, user_id):
+        """Test usage stats are kept in memory until flushed."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+
+        with patch.object(auth_manager, "_save_api_keys") as mock_save:
+            for _ in range(100):
+                assert auth_manager.validate_api_key(api_key) is not None
+            mock_save.assert_not_called()
+
+        assert auth_manager.flush_api_key_usage() is True
+        assert auth_manager.flush_api_key_usage() is False
+
+    def test_usage_survives_reload(self, auth_manager, user_id, tmp_path):
+        """Test flushed usage stats are loaded by a new manager."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+        for _ in range(3):
+            auth_manager.validate_api_key(api_key)
+        auth_manager.shutdown()
+
+        reloaded = AuthenticationManager(data_dir=str(tmp_path))
+        record = reloaded.validate_api_key(api_key)
+        assert record is not None
+        assert record.usage_count == 4
+        reloaded.shutdown()
+
+    def test_background_writer_flushes(self, tmp_path):
+        """Test the background writer persists usage stats."""
+        manager = AuthenticationManager(data_dir=str(tmp_path), usage_flush_interval=0.05)
+        manager.create_user("api_user", "password123")
+        api_key = manager.create_api_key("api_user", "test key")
+
+        with patch.object(manager, "_save_api_keys", return_value=True) as mock_save:
+            manager.validate_api_key(api_key)
+            deadline = time.time() + 2.0
+            while not mock_save.called and time.time() < deadline:
+                time.sleep(0.01)
+            assert mock_save.called
+
+        manager.shutdown()
+
+    def test_revoked_key_is_not_served_from_cache(self, auth_manager, user_id):
+        """Test revocation invalidates cached validations."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+        record = auth_manager.validate_api_key(api_key)
+
+        assert auth_manager.revoke_api_key(record.key_id) is True
+        assert auth_manager.validate_api_key(api_key) is None
+
+    def test_cache_respects_key_expiry(self, auth_manager, user_id):
+        """Test cached validations never outlive the key."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+        record = auth_manager.validate_api_key(api_key)
+
+        record.expires_at = time.time() - 1
+        auth_manager._validation_cache.clear()
+        assert auth_manager.validate_api_key(api_key) is None
+
+    def test_cache_is_bounded(self, tmp_path):
+        """Test the validation cache evicts least recently used keys."""
+        manager = AuthenticationManager(
+            data_dir=str(tmp_path), validation_cache_size=2, usage_flush_interval=3600
+        )
+        manager.create_user("api_user", "password123")
+        keys = [manager.create_api_key("api_user", f"key {i}") for i in range(3)]
+
+        for api_key in keys:
+            assert manager.validate_api_key(api_key) is not None
+
+        assert len(manager._validation_cache) == 2
+        assert manager._hash_api_key(keys[0]) not in manager._validation_cache
+        assert not set(keys) & set(manager._validation_cache)
+        manager.shutdown()
+
+    def test_pending_usage_flushed_at_exit(self, auth_manager, user_id):
+        """Test usage stats are flushed by an exit hook until shutdown."""
+        api_key = auth_manager.create_api_key(user_id, "test key")
+
+        with patch("src.security.auth.atexit") as mock_atexit:
+            auth_manager.validate_api_key(api_key)
+            mock_atexit.register.assert_called_once_with(auth_manager.shutdown)
+
+            auth_manager.shutdown()
+            mock_atexit.unregister.assert_called_with(auth_manager.shutdown)
@@ -0,0 +1,112 @@
+"""
+Unit tests for the content-addressed screenshot blob store.
+"""
+
+import pytest
+
+from src.repositories.blob_store import ContentAddressedBlobStore
+
+
+class TestContentAddressedBlobStore:
+    """Test ContentAddressedBlobStore implementation."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        """Create blob store with a small pack threshold."""
+        return ContentAddressedBlobStore(tmp_path / "blobs", pack_threshold=64, auto_gc_bytes=0)
+
+    def test_put_and_get(self, store):
+        """Test blobs round-trip for packed and loose storage."""
+        small = b"small blob"
+        large = b"x" * 1000
+
+        small_hash = store.put(small)
+        large_hash = store.put(large)
+
+        assert store.get(small_hash) == small
+        assert store.get(large_hash) == large
+        assert store.get("0" * 64) is None
+
+        stats = store.get_statistics()
+        assert stats["packed_blobs"] == 1
+        assert stats["loose_blobs"] == 1
+
+    def test_identical_content_is_stored_once(self, store):
+        """Test deduplication by content hash."""
+        first = store.put(b"same bytes")
+        second = store.put(b"same bytes")
+
+        assert first == second
+        assert store.ref_count(first) == 2
+
+        stats = store.get_statistics()
+        assert stats["blobs"] == 1
+        assert stats["stored_bytes"] == len(b"same bytes")
+        assert stats["logical_bytes"] == 2 * len(b"same bytes")
+        assert stats["dedup_ratio"] == pytest.approx(2.0)
+
+    def test_release_and_gc(self, store):
+        """Test unreferenced blobs are freed by garbage collection."""
+        kept = store.put(b"kept")
+        dropped = store.put(b"y" * 500)
+
+        assert store.release(dropped) == 0
+        assert store.contains(dropped)
+
+        result = store.gc()
+        assert result["blobs_freed"] == 1
+        assert result["bytes_freed"] == 500
+        assert not store.contains(dropped)
+        assert store.get(kept) == b"kept"
+
+    def test_gc_repacks_mostly_dead_packs(self, store):
+        """Test pack files are rewritten when most of their blobs are dead."""
+        digests = [store.put(f"blob-{i}".encode()) for i in range(10)]
+        for digest in digests[1:]:
+            store.release(digest)
+
+        result = store.gc()
+        assert result["blobs_freed"] == 9
+        assert result["packs_rewritten"] == 1
+        assert store.get(digests[0]) == b"blob-0"
+        assert store.get_statistics()["packs"] == 1
+
+    def test_repack_keeps_blobs_moved_into_open_pack(self, tmp_path):
+        """Test blobs moved out of a dead pack survive repacking of later packs."""
+        store = ContentAddressedBlobStore(
+            tmp_path / "blobs", pack_threshold=256, max_pack_size=300, auto_gc_bytes=0
+        )
+        blobs = [bytes([i]) * size for i, size in enumerate((40, 130, 125, 20, 100, 100))]
+        digests = [store.put(blob) for blob in blobs]
+        for index in (1, 2, 4, 5):
+            store.release(digests[index])
+
+        store.gc()
+
+        assert store.get(digests[0]) == blobs[0]
+        assert store.get(digests[3]) == blobs[3]
+
+    def test_index_survives_reopen(self, store):
+        """Test state is restored from the index log."""
+        shared = store.put(b"shared")
+        store.put(b"shared")
+        loose = store.put(b"z" * 200)
+        store.release(loose)
+        store.gc()
+
+        reopened = ContentAddressedBlobStore(store.root, pack_threshold=64)
+        assert reopened.ref_count(shared) == 2
+        assert reopened.get(shared) == b"shared"
+        assert not reopened.contains(loose)
+
+    def test_find_similar(self, store):
+        """Test perceptual hash lookup tolerates a few differing bits."""
+        phash = 0x0123456789ABCDEF
+        digest = store.put(b"image", phash=phash)
+
+        assert store.find_similar(phash ^ 0b101, max_distance=2) == digest
+        assert store.find_similar(phash ^ 0b111, max_distance=2) is None
+        assert store.find_similar(~phash & (2**64 - 1)) is None
+
+        store.release(digest)
+        assert store.find_similar(phash) is None
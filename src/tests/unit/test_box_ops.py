@@ -0,0 +1,196 @@
+"""
+Unit tests for vectorized box operations and the detectors built on them.
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.utils import box_ops  # noqa: E402
+
+
+def random_boxes(count, seed=0, extent=1000, max_size=80):
+    rng = np.random.default_rng(seed)
+    corners = rng.integers(0, extent, size=(count, 2))
+    sizes = rng.integers(1, max_size, size=(count, 2))
+    return np.hstack([corners, corners + sizes]).astype(float)
+
+
+def brute_pairs(boxes, threshold, metric):
+    pairs = set()
+    ratios = box_ops.iou_matrix(boxes, boxes)
+    areas = box_ops.box_areas(boxes)
+    for i in range(len(boxes)):
+        for j in range(i + 1, len(boxes)):
+            if metric == "min":
+                union = areas[i] + areas[j]
+                intersection = ratios[i, j] * union / (1 + ratios[i, j])
+                ratio = intersection / min(areas[i], areas[j])
+            else:
+                ratio = ratios[i, j]
+            if ratio > 0 and ratio >= threshold:
+                pairs.add((i, j))
+    return pairs
+
+
+def brute_nms(boxes, scores, threshold):
+    ious = box_ops.iou_matrix(boxes, boxes)
+    keep = []
+    for index in np.argsort(-scores, kind="stable"):
+        if all(ious[index, kept] <= threshold for kept in keep):
+            keep.append(index)
+    return keep
+
+
+class TestPairs:
+    """Test sweep-line pair search against all-pairs references."""
+
+    @pytest.mark.parametrize("metric", ["iou", "min"])
+    def test_overlap_graph_matches_brute_force(self, metric):
+        """Test every overlapping pair is found exactly once."""
+        boxes = random_boxes(300)
+
+        i, j = box_ops.overlap_graph(boxes, 0.1, metric)
+        found = {(min(a, b), max(a, b)) for a, b in zip(i.tolist(), j.tolist())}
+
+        assert len(found) == len(i)
+        assert found == brute_pairs(boxes, 0.1, metric)
+
+    def test_touching_boxes_do_not_intersect(self):
+        """Test boxes sharing only an edge are not paired."""
+        boxes = np.array([[0, 0, 10, 10], [10, 0, 20, 10], [0, 10, 10, 20]], dtype=float)
+
+        i, _ = box_ops.intersecting_pairs(boxes)
+
+        assert len(i) == 0
+
+    def test_chunked_sweep(self, monkeypatch):
+        """Test results do not depend on the chunk size."""
+        boxes = random_boxes(200, seed=3, extent=200)
+        expected = box_ops.intersecting_pairs(boxes)
+        monkeypatch.setattr(box_ops, "_PAIR_CHUNK", 7)
+
+        i, j = box_ops.intersecting_pairs(boxes)
+
+        assert sorted(zip(i.tolist(), j.tolist())) == sorted(
+            zip(expected[0].tolist(), expected[1].tolist())
+        )
+
+
+class TestGrouping:
+    """Test union-find labelling and group reductions."""
+
+    def test_connected_components(self):
+        """Test chains are joined transitively and labels follow input order."""
+        i = np.array([4, 1, 5])
+        j = np.array([1, 6, 2])
+
+        labels = box_ops.connected_components(7, i, j)
+
+        assert labels.tolist() == [0, 1, 2, 3, 1, 2, 1]
+
+    def test_group_reductions(self):
+        """Test merged boxes, maxima and means per group."""
+        boxes = np.array([[0, 0, 10, 10], [5, 5, 20, 12], [50, 50, 60, 60]], dtype=float)
+        labels = np.array([0, 0, 1])
+
+        assert box_ops.merge_groups(boxes, labels).tolist() == [
+            [0, 0, 20, 12],
+            [50, 50, 60, 60],
+        ]
+        assert box_ops.group_max(np.array([0.2, 0.9, 0.5]), labels).tolist() == [0.9, 0.5]
+        assert box_ops.group_mean(np.array([0.2, 0.4, 0.5]), labels).tolist() == pytest.approx(
+            [0.3, 0.5]
+        )
+
+
+class TestNonMaxSuppression:
+    """Test greedy NMS."""
+
+    def test_matches_brute_force(self):
+        """Test kept boxes match the reference greedy loop."""
+        boxes = random_boxes(400, seed=1, extent=400)
+        scores = np.random.default_rng(2).random(len(boxes))
+
+        keep = box_ops.non_max_suppression(boxes, scores, 0.4)
+
+        assert keep.tolist() == brute_nms(boxes, scores, 0.4)
+
+    def test_suppressed_box_does_not_suppress(self):
+        """Test a suppressed box cannot remove boxes it overlaps."""
+        boxes = np.array([[0, 0, 10, 10], [3, 0, 13, 10], [6, 0, 16, 10]], dtype=float)
+
+        keep = box_ops.non_max_suppression(boxes, np.array([0.9, 0.8, 0.7]), 0.4)
+
+        assert keep.tolist() == [0, 2]
+
+
+class TestDetectorMerging:
+    """Test region merging in the detectors."""
+
+    def test_smart_detector_merges_overlaps(self):
+        """Test overlapping regions merge into one hybrid region."""
+        pytest.importorskip("cv2")
+        from src.ai.smart_area_detection import DetectionMethod, SmartAreaDetector, TextRegion
+
+        def region(x, y, w, h, confidence):
+            return TextRegion(x, y, w, h, confidence, 0.5, DetectionMethod.CONTOUR_BASED)
+
+        detector = SmartAreaDetector()
+        regions = [region(0, 0, 100, 20, 0.4), region(10, 0, 100, 20, 0.9)]
+        regions.append(region(500, 500, 30, 30, 0.7))
+
+        merged = detector._merge_overlapping_regions(regions)
+
+        assert [(r.x, r.y, r.width, r.height) for r in merged] == [
+            (0, 0, 110, 20),
+            (500, 500, 30, 30),
+        ]
+        assert merged[0].confidence == 0.9
+        assert merged[0].method_used == DetectionMethod.HYBRID
+        assert merged[1] is regions[2]
+
+    def test_similar_pairs_match_predicate(self):
+        """Test the vectorized similarity search agrees with _are_regions_similar."""
+        pytest.importorskip("cv2")
+        from src.ai.smart_area_detection import DetectionMethod, SmartAreaDetector, TextRegion
+
+        detector = SmartAreaDetector()
+        boxes = random_boxes(60, seed=4, extent=300).astype(int)
+        regions = [
+            TextRegion(x1, y1, x2 - x1, y2 - y1, 0.5, 0.5, DetectionMethod.CONTOUR_BASED)
+            for x1, y1, x2, y2 in boxes.tolist()
+        ]
+        similar = [
+            (a, b)
+            for a in range(len(regions))
+            for b in range(a + 1, len(regions))
+            if detector._are_regions_similar(regions[a], regions[b])
+        ]
+        expected = box_ops.connected_components(
+            len(regions), np.array([p[0] for p in similar]), np.array([p[1] for p in similar])
+        )
+
+        merged = detector._merge_similar_regions(regions)
+
+        assert len(merged) == expected.max() + 1
+
+    def test_text_detector_filters_groups(self):
+        """Test TextDetector keeps groups whose best confidence passes."""
+        pytest.importorskip("cv2")
+        from src.core.ai_ocr_engine import TextDetector, TextRegion
+
+        detector = TextDetector()
+        detector.confidence_threshold = 0.5
+        regions = [
+            TextRegion((0, 0, 50, 20), "", 0.4, "eng"),
+            TextRegion((10, 0, 60, 20), "", 0.8, "eng"),
+            TextRegion((200, 0, 250, 20), "", 0.3, "eng"),
+            TextRegion((300, 0, 350, 20), "", 0.6, "eng"),
+        ]
+
+        merged = detector._merge_and_filter_regions(regions)
+
+        assert [r.bbox for r in merged] == [(0, 0, 60, 20), (300, 0, 350, 20)]
+        assert merged[0].confidence == 0.8
+        assert merged[1] is regions[3]
@@ -0,0 +1,187 @@
+"""
+Unit tests for cached engine availability probing.
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from src.services.capability_registry import (
+    CapabilityRegistry,
+    CapabilityState,
+    binary_version,
+    get_capability_registry,
+)
+
+
+class CountingProbe:
+    """Probe that counts calls and can be held until released."""
+
+    def __init__(self, result=True, block=False):
+        self.result = result
+        self.calls = 0
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def __call__(self):
+        self.calls += 1
+        self.release.wait(5)
+        return self.result
+
+
+class TestCapabilityRegistry:
+    """Test CapabilityRegistry probing and caching."""
+
+    def test_check_probes_once(self):
+        """Test repeated checks reuse the cached result."""
+        registry = CapabilityRegistry(cache_file=None)
+        probe = CountingProbe()
+        registry.register("ocr", probe)
+
+        assert registry.check("ocr") is True
+        assert registry.check("ocr") is True
+        assert probe.calls == 1
+
+    def test_unknown_capability(self):
+        """Test unregistered capabilities are not available."""
+        registry = CapabilityRegistry(cache_file=None)
+
+        assert registry.check("missing") is False
+        assert registry.get_status("missing").state == CapabilityState.UNKNOWN
+
+    def test_probe_exception_marks_unavailable(self):
+        """Test failing probes record the error."""
+        registry = CapabilityRegistry(cache_file=None)
+
+        def broken():
+            raise RuntimeError("no binary")
+
+        registry.register("ocr", broken)
+
+        assert registry.check("ocr") is False
+        status = registry.get_status("ocr")
+        assert status.state == CapabilityState.UNAVAILABLE
+        assert status.error == "no binary"
+
+    def test_get_status_does_not_block(self):
+        """Test status lookups return immediately while a background probe runs."""
+        registry = CapabilityRegistry(cache_file=None)
+        probe = CountingProbe(block=True)
+        registry.register("ocr", probe)
+
+        start = time.perf_counter()
+        status = registry.get_status("ocr")
+        assert time.perf_counter() - start < 0.5
+        assert status.state == CapabilityState.PROBING
+        assert status.available is None
+
+        # A concurrent blocking check waits for the same probe
+        assert registry.check("ocr", timeout=0.01) is False
+        probe.release.set()
+        assert registry.check("ocr", timeout=5) is True
+        assert probe.calls == 1
+
+    def test_ttl_expiry(self):
+        """Test results older than the TTL are probed again."""
+        registry = CapabilityRegistry(cache_file=None, ttl=60)
+        probe = CountingProbe()
+        registry.register("ocr", probe)
+        registry.check("ocr")
+
+        registry._statuses["ocr"].checked_at -= 120
+        registry.check("ocr")
+
+        assert probe.calls == 2
+
+    def test_version_change_invalidates(self):
+        """Test a new binary/package version forces a new probe."""
+        registry = CapabilityRegistry(cache_file=None)
+        probe = CountingProbe()
+        registry.register("ocr", probe, version="1.0")
+        registry.check("ocr")
+
+        registry.register("ocr", probe, version="2.0")
+        registry.check("ocr")
+
+        assert probe.calls == 2
+        assert registry.get_status("ocr").version == "2.0"
+
+    def test_persistence(self, tmp_path):
+        """Test results survive a restart when the version matches."""
+        cache_file = str(tmp_path / "capabilities.json")
+        first = CapabilityRegistry(cache_file=cache_file)
+        first.register("ocr", CountingProbe(result=False), version="1.0")
+        first.check("ocr")
+
+        with open(cache_file, encoding="utf-8") as f:
+            assert json.load(f)["ocr"]["state"] == "unavailable"
+
+        second = CapabilityRegistry(cache_file=cache_file)
+        probe = CountingProbe(result=True)
+        second.register("ocr", probe, version="1.0")
+
+        assert second.check("ocr") is False
+        assert probe.calls == 0
+
+    def test_unversioned_failure_is_not_persisted(self, tmp_path):
+        """Test a failure without a version is rechecked after a restart."""
+        cache_file = str(tmp_path / "capabilities.json")
+        first = CapabilityRegistry(cache_file=cache_file)
+        first.record("tts", False)
+        first.record("translate", True)
+
+        assert first.get_status("tts").available is False
+        with open(cache_file, encoding="utf-8") as f:
+            assert set(json.load(f)) == {"translate"}
+
+    def test_persisted_failure_needs_versioned_probe(self, tmp_path):
+        """Test a cached failure is ignored until a probe can confirm its version."""
+        cache_file = str(tmp_path / "capabilities.json")
+        CapabilityRegistry(cache_file=cache_file).record("ocr", False, version="missing")
+
+        second = CapabilityRegistry(cache_file=cache_file)
+        assert second.get_status("ocr", refresh=False).available is None
+
+        second.register("ocr", CountingProbe(result=True), version="missing")
+        assert second.get_status("ocr", refresh=False).available is False
+
+    def test_corrupted_cache_is_ignored(self, tmp_path):
+        """Test an unreadable cache file does not break startup."""
+        cache_file = tmp_path / "capabilities.json"
+        cache_file.write_text("{not json", encoding="utf-8")
+
+        registry = CapabilityRegistry(cache_file=str(cache_file))
+
+        assert registry.snapshot() == {}
+
+    def test_record_and_snapshot(self):
+        """Test externally recorded results appear in snapshots."""
+        registry = CapabilityRegistry(cache_file=None)
+        registry.record("google_translate", True, version="googletrans")
+        registry.record("pyttsx3_tts", False, error="no driver")
+
+        snapshot = registry.snapshot()
+
+        assert snapshot["google_translate"]["available"] is True
+        assert snapshot["pyttsx3_tts"]["state"] == "unavailable"
+        assert snapshot["pyttsx3_tts"]["error"] == "no driver"
+
+        registry.invalidate("pyttsx3_tts")
+        assert "pyttsx3_tts" not in registry.snapshot()
+
+    def test_binary_version_missing(self):
+        """Test missing executables have a stable version key."""
+        assert binary_version("definitely-not-a-real-binary") == "missing"
+        assert binary_version(None) == "missing"
+
+    def test_tests_use_isolated_registry(self, isolated_capability_registry):
+        """Test the global registry is the per-test in-memory instance."""
+        assert get_capability_registry() is isolated_capability_registry
+        assert isolated_capability_registry.cache_file is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -3,6 +3,7 @@ Unit tests for circuit breaker implementation.
 """
 
 import asyncio
+import threading
 import time
 
 import pytest
@@ -172,6 +173,24 @@ class TestCircuitBreaker:
         assert circuit_breaker.failure_count == 0
         assert circuit_breaker.success_count == 0
 
+    def test_calls_from_threads_with_own_loops(self, circuit_breaker):
+        """Test a call waiting on state held by another thread resumes after release."""
+        results = []
+
+        async def operation():
+            return "ok"
+
+        def worker():
+            results.append(asyncio.run(circuit_breaker.call(operation)))
+
+        with circuit_breaker._lock:
+            thread = threading.Thread(target=worker, daemon=True)
+            thread.start()
+            time.sleep(0.05)
+        thread.join(timeout=1.0)
+
+        assert results == ["ok"]
+
 
 class TestCircuitBreakerManager:
     """Test CircuitBreakerManager functionality."""
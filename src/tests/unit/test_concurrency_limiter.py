@@ -0,0 +1,237 @@
+"""
+Unit tests for the adaptive concurrency limiter.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.services.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitBreakerError,
+    ConcurrencyLimitError,
+)
+from src.services.concurrency_limiter import AdaptiveConcurrencyLimiter, AdaptiveLimiterConfig
+
+
+def run_requests(limiter, count, latency=0.001, dropped=False):
+    """Run sequential requests that saturate the limiter."""
+    for _ in range(count):
+        assert limiter.acquire(timeout=1.0)
+        started_at = time.monotonic()
+        limiter.release(started_at, latency, dropped=dropped)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit adaptation."""
+
+    @pytest.fixture
+    def limiter(self):
+        """Create limiter starting at two slots."""
+        return AdaptiveConcurrencyLimiter(
+            "backend", AdaptiveLimiterConfig(initial_limit=2, min_limit=1, max_limit=4)
+        )
+
+    def test_limit_blocks_extra_requests(self, limiter):
+        """Test requests beyond the limit wait and time out."""
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+
+        assert limiter.try_acquire() is False
+        assert limiter.acquire(timeout=0.01) is False
+        assert limiter.get_metrics()["total_rejected"] == 1
+
+    def test_additive_increase_when_saturated(self, limiter):
+        """Test the window grows after a full window of fast successes."""
+        for _ in range(3):
+            limiter.try_acquire()
+            limiter.try_acquire()
+            now = time.monotonic()
+            limiter.release(now, 0.01)
+            limiter.release(now, 0.01)
+
+        assert limiter.current_limit > 2
+        assert limiter.current_limit <= 4
+
+    def test_no_increase_when_underused(self, limiter):
+        """Test the window does not grow while requests never hit it."""
+        run_requests(limiter, 20)
+
+        assert limiter.current_limit == 2
+
+    def test_multiplicative_decrease_on_error(self, limiter):
+        """Test errors halve the window, once per congestion event."""
+        limiter.limit = 4.0
+        started_at = time.monotonic()
+        for _ in range(3):
+            limiter.try_acquire()
+
+        limiter.release(started_at, 0.01, dropped=True)
+        limiter.release(started_at, 0.01, dropped=True)
+        limiter.release(started_at, 0.01, dropped=True)
+
+        assert limiter.current_limit == 2
+        assert limiter.get_metrics()["decrease_count"] == 1
+        assert limiter.get_metrics()["total_drops"] == 3
+
+    def test_decrease_on_latency_spike(self, limiter):
+        """Test a latency far above the baseline counts as congestion."""
+        run_requests(limiter, 10, latency=0.01)
+
+        run_requests(limiter, 1, latency=0.5)
+
+        assert limiter.current_limit == 1
+
+    def test_waiter_wakes_on_release(self, limiter):
+        """Test a queued request gets the freed slot and its delay is recorded."""
+        limiter.try_acquire()
+        limiter.try_acquire()
+        results = []
+
+        waiter = threading.Thread(target=lambda: results.append(limiter.acquire(timeout=1.0)))
+        waiter.start()
+        time.sleep(0.05)
+        limiter.release(time.monotonic(), 0.01)
+        waiter.join(timeout=1.0)
+
+        assert results == [True]
+        assert limiter.get_metrics()["max_queue_delay"] >= 0.04
+
+    def test_async_waiters_wake_without_threads(self, limiter):
+        """Test coroutines queue on the event loop and get freed slots in turn."""
+        limiter.try_acquire()
+        limiter.try_acquire()
+        threads = threading.active_count()
+
+        async def main():
+            waiters = [asyncio.ensure_future(limiter.acquire_async(1.0)) for _ in range(3)]
+            await asyncio.sleep(0.02)
+            assert threading.active_count() == threads
+            assert limiter.get_metrics()["waiting"] == 3
+
+            # Released from another thread, as a worker finishing a request would
+            threading.Thread(target=limiter.release, args=(time.monotonic(), 0.01)).start()
+            await asyncio.sleep(0.05)
+            assert sum(waiter.done() for waiter in waiters) == 1
+
+            limiter.abandon()
+            limiter.abandon()
+            return await asyncio.gather(*waiters)
+
+        assert asyncio.run(main()) == [True, True, True]
+        assert limiter.get_metrics()["waiting"] == 0
+
+    def test_async_wait_timeout(self, limiter):
+        """Test an async waiter gives up after the timeout."""
+        limiter.try_acquire()
+        limiter.try_acquire()
+
+        assert asyncio.run(limiter.acquire_async(0.01)) is False
+        assert limiter.inflight == 2
+        assert limiter.get_metrics()["total_rejected"] == 1
+
+    def test_slot_context_manager(self, limiter):
+        """Test slot() releases on success and on exceptions."""
+        with limiter.slot():
+            assert limiter.inflight == 1
+
+        with pytest.raises(RuntimeError):
+            with limiter.slot():
+                raise RuntimeError("backend error")
+
+        assert limiter.inflight == 0
+        assert limiter.get_metrics()["total_drops"] == 1
+
+
+class TestCircuitBreakerConcurrency:
+    """Test limiter integration in CircuitBreaker."""
+
+    def make_breaker(self, **limiter_options):
+        config = CircuitBreakerConfig(
+            failure_threshold=10,
+            timeout=1.0,
+            concurrency=AdaptiveLimiterConfig(**limiter_options),
+        )
+        return CircuitBreaker("limited", config)
+
+    def test_breaker_caps_inflight_requests(self):
+        """Test concurrent calls never exceed the limit."""
+        breaker = self.make_breaker(initial_limit=2, max_limit=2)
+        active = []
+        peak = []
+
+        async def operation():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.02)
+            active.pop()
+            return "ok"
+
+        async def main():
+            return await asyncio.gather(*(breaker.call(operation) for _ in range(6)))
+
+        assert asyncio.run(main()) == ["ok"] * 6
+        assert max(peak) <= 2
+        assert breaker.get_metrics()["concurrency"]["inflight"] == 0
+
+    def test_breaker_rejects_after_queue_wait(self):
+        """Test requests that wait too long fail with ConcurrencyLimitError."""
+        breaker = self.make_breaker(initial_limit=1, max_limit=1, max_queue_wait=0.01)
+
+        async def slow():
+            await asyncio.sleep(0.2)
+
+        async def main():
+            return await asyncio.gather(
+                breaker.call(slow), breaker.call(slow), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert any(isinstance(result, ConcurrencyLimitError) for result in results)
+        assert breaker.get_metrics()["concurrency"]["total_rejected"] == 1
+
+    def test_timed_out_sync_call_keeps_slot_until_thread_ends(self):
+        """Test a slot is returned when the worker thread finishes, not at the timeout."""
+        breaker = self.make_breaker(initial_limit=1, max_limit=1)
+        breaker.config.timeout = 0.05
+        release = threading.Event()
+
+        async def main():
+            with pytest.raises(CircuitBreakerError):
+                await breaker.call(release.wait, 5)
+            held = breaker.limiter.inflight
+
+            release.set()
+            deadline = time.monotonic() + 1.0
+            while breaker.limiter.inflight and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            return held
+
+        assert asyncio.run(main()) == 1
+        assert breaker.limiter.inflight == 0
+        assert breaker.get_metrics()["concurrency"]["total_drops"] == 1
+
+    def test_failures_shrink_limit(self):
+        """Test service failures feed back into the limit."""
+        breaker = self.make_breaker(initial_limit=4)
+
+        async def failing():
+            raise ValueError("throttled")
+
+        async def main():
+            await asyncio.gather(*(breaker.call(failing) for _ in range(3)), return_exceptions=True)
+
+        asyncio.run(main())
+
+        assert breaker.get_metrics()["concurrency"]["limit"] == 2
+
+    def test_breaker_without_limiter(self):
+        """Test breakers without concurrency config report no limiter metrics."""
+        breaker = CircuitBreaker("plain", CircuitBreakerConfig())
+
+        assert breaker.limiter is None
+        assert "concurrency" not in breaker.get_metrics()
@@ -108,6 +108,7 @@ class TestFeaturesConfig:
         assert config.copy_to_clipboard is True
         assert config.cache_translations is True
         assert config.save_debug_screenshots is False
+        assert config.translation_memory_fuzzy_threshold is None
 
     def test_custom_values(self):
         """Test custom features configuration."""
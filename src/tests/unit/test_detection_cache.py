@@ -0,0 +1,92 @@
+"""
+Unit tests for the fingerprint-keyed detection cache.
+"""
+
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.ai.detection_cache import DetectionCache, frame_samples  # noqa: E402
+
+
+@pytest.fixture
+def frame():
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 256, size=(1080, 1920, 3), dtype=np.uint8)
+
+
+class TestFingerprint:
+    """Test frame sampling and keys."""
+
+    def test_samples_are_a_small_grid(self, frame):
+        """Test the fingerprint holds at most grid x grid pixels of the frame."""
+        samples = frame_samples(frame, grid=64)
+
+        assert samples.shape == (64, 64, 3)
+        assert samples[0, 0].tolist() == frame[1080 // 64 // 2, 1920 // 64 // 2].tolist()
+
+    def test_key_depends_on_method_and_shape(self, frame):
+        """Test equal frames share a key only for the same method and shape."""
+        cache = DetectionCache()
+
+        assert cache.key(frame, "edge").digest == cache.key(frame.copy(), "edge").digest
+        assert cache.key(frame, "edge").digest != cache.key(frame, "mser").digest
+        assert cache.key(frame, "edge").digest != cache.key(frame[:-1], "edge").digest
+
+
+class TestDetectionCache:
+    """Test lookups, near-duplicates, LRU bound and expiry."""
+
+    def test_exact_hit(self, frame):
+        """Test regions are returned for the same frame."""
+        cache = DetectionCache()
+        cache.put(cache.key(frame), ["region"])
+
+        assert cache.get(cache.key(frame.copy())) == ["region"]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_near_duplicate_hit(self, frame):
+        """Test a frame with a small changed area reuses regions."""
+        cache = DetectionCache(max_diff=0.01)
+        cache.put(cache.key(frame), ["region"])
+        changed = frame.copy()
+        changed[500:540, 900:960] = 0  # Blinking cursor sized change
+        scrolled = np.roll(frame, 40, axis=0)
+
+        assert cache.get(cache.key(changed)) == ["region"]
+        assert cache.get(cache.key(scrolled)) is None
+        assert cache.get_stats()["near_hits"] == 1
+
+    def test_near_duplicates_disabled(self, frame):
+        """Test max_diff=0 only allows exact fingerprint matches."""
+        cache = DetectionCache(max_diff=0)
+        cache.put(cache.key(frame), ["region"])
+        changed = frame.copy()
+        changed[500:540, 900:960] = 0
+
+        assert cache.get(cache.key(changed)) is None
+
+    def test_lru_bound(self):
+        """Test the least recently used frame is evicted."""
+        cache = DetectionCache(max_entries=2, max_diff=0)
+        frames = [np.full((100, 100), value, dtype=np.uint8) for value in (0, 100, 200)]
+        keys = [cache.key(image) for image in frames]
+        cache.put(keys[0], [0])
+        cache.put(keys[1], [1])
+        cache.get(keys[0])
+        cache.put(keys[2], [2])
+
+        assert len(cache) == 2
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == [0]
+
+    def test_expiry(self, frame):
+        """Test entries older than the TTL are not returned."""
+        cache = DetectionCache(ttl_seconds=0.01)
+        cache.put(cache.key(frame), ["region"])
+        time.sleep(0.02)
+
+        assert cache.get(cache.key(frame)) is None
+        assert len(cache) == 0
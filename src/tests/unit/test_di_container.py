@@ -2,7 +2,7 @@ import unittest
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
-from src.services.container import DIContainer, setup_default_services
+from src.services.container import DIContainer, Lifetime, setup_default_services
 
 
 class __TestService:
@@ -351,5 +351,145 @@ class TestDIContainer(unittest.TestCase):
         self.assertIsInstance(c, ServiceC)
 
 
+class Repository:
+    """Service used as a constructor dependency"""
+
+
+class UnitOfWork:
+    """Scoped service with cleanup"""
+
+    def __init__(self, repository: Repository):
+        self.repository = repository
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class Handler:
+    """Service with injected dependencies and a default argument"""
+
+    def __init__(self, repository: Repository, unit: UnitOfWork, retries: int = 3):
+        self.repository = repository
+        self.unit = unit
+        self.retries = retries
+
+
+class TestDIContainerInjection(unittest.TestCase):
+    """Test constructor injection, locking and scopes"""
+
+    def setUp(self):
+        """Setup test environment"""
+        self.container = DIContainer()
+
+    def test_constructor_injection(self):
+        """Test dependencies are resolved from constructor type hints"""
+        self.container.register_singleton(Repository, Repository)
+        self.container.register_transient(UnitOfWork, UnitOfWork)
+
+        unit = self.container.get(UnitOfWork)
+
+        self.assertIs(unit.repository, self.container.get(Repository))
+        self.assertIsNot(unit, self.container.get(UnitOfWork))
+
+    def test_unresolvable_parameter(self):
+        """Test required parameters without a registered service fail clearly"""
+        self.container.register_transient(UnitOfWork, UnitOfWork)
+
+        with self.assertRaises(ValueError) as context:
+            self.container.get(UnitOfWork)
+
+        self.assertIn("repository", str(context.exception))
+
+    def test_string_keys(self):
+        """Test services can be registered under plain names"""
+        self.container.register_singleton("repository", Repository)
+
+        self.assertIs(self.container.get("repository"), self.container.get("repository"))
+
+    def test_concurrent_singleton_created_once(self):
+        """Test racing threads build a singleton exactly once"""
+        import threading
+        import time
+
+        created = []
+
+        class SlowService:
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.05)
+
+        self.container.register_singleton(SlowService, SlowService)
+        barrier = threading.Barrier(8)
+        instances = []
+
+        def worker():
+            barrier.wait()
+            instances.append(self.container.get(SlowService))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertTrue(all(instance is created[0] for instance in instances))
+
+    def test_scoped_lifetime(self):
+        """Test scoped services are shared within a scope and closed with it"""
+        self.container.register_singleton(Repository, Repository)
+        self.container.register_scoped(UnitOfWork, UnitOfWork)
+        self.container.register_transient(Handler, Handler)
+
+        with self.container.create_scope() as scope:
+            handler = scope.get(Handler)
+            self.assertIs(handler.unit, scope.get(UnitOfWork))
+            self.assertEqual(handler.retries, 3)
+
+        self.assertTrue(handler.unit.closed)
+
+        with self.container.create_scope() as other:
+            self.assertIsNot(other.get(UnitOfWork), handler.unit)
+
+    def test_scoped_service_requires_scope(self):
+        """Test resolving a scoped service outside a scope fails"""
+        self.container.register_singleton(Repository, Repository)
+        self.container.register_scoped(UnitOfWork, UnitOfWork)
+
+        with self.assertRaises(ValueError):
+            self.container.get(UnitOfWork)
+
+    def test_circular_dependency_detected(self):
+        """Test factories resolving each other raise instead of recursing"""
+        self.container.register_factory("a", lambda: self.container.get("b"))
+        self.container.register_factory("b", lambda: self.container.get("a"))
+
+        with self.assertRaises(ValueError) as context:
+            self.container.get("a")
+
+        self.assertIn("Circular dependency", str(context.exception))
+
+    def test_reregistration_replaces_compiled_resolver(self):
+        """Test registering again takes effect after a service was resolved"""
+        self.container.register_singleton(Repository, Repository)
+        first = self.container.get(Repository)
+
+        replacement = Repository()
+        self.container.register_instance(Repository, replacement)
+
+        self.assertIsNot(first, replacement)
+        self.assertIs(self.container.get(Repository), replacement)
+
+    def test_singleton_factory_lifetime(self):
+        """Test factories can be registered as singletons"""
+        self.container.register_factory(Repository, Repository, lifetime=Lifetime.SINGLETON)
+
+        self.assertIs(self.container.get(Repository), self.container.get(Repository))
+        self.assertTrue(self.container.get_registered_services()[
+            self.container._get_key(Repository)
+        ]["instantiated"])
+
+
 if __name__ == "__main__":
     unittest.main()
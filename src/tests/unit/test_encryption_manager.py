@@ -0,0 +1,126 @@
+"""
+Unit tests for EncryptionManager token formats, bulk and stream APIs.
+"""
+
+import base64
+import io
+
+import pytest
+
+from src.security.encryption import TOKEN_PREFIX_V2, EncryptionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create encryption manager with a temporary key file."""
+    return EncryptionManager(key_file=str(tmp_path / ".encryption_key"))
+
+
+class TestBulkEncryption:
+    """Test bulk string and dictionary encryption."""
+
+    def test_encrypt_many_round_trip(self, manager):
+        """Test bulk encryption keeps order and empty values."""
+        values = ["alpha", "", "Привет мир", "x" * 1000]
+
+        tokens = manager.encrypt_many(values)
+        assert len(tokens) == len(values)
+        assert tokens[1] == ""
+        assert manager.decrypt_many(tokens) == values
+
+    def test_dict_round_trip(self, manager):
+        """Test dictionary values are converted to strings and restored."""
+        data = {"api_key": "secret", "retries": 3, "enabled": True}
+
+        encrypted = manager.encrypt_dict(data)
+        assert list(encrypted) == list(data)
+        assert manager.decrypt_dict(encrypted) == {
+            "api_key": "secret",
+            "retries": "3",
+            "enabled": "True",
+        }
+
+    def test_decrypt_many_keeps_invalid_tokens(self, manager):
+        """Test undecryptable tokens are returned unchanged."""
+        tokens = manager.encrypt_many(["ok"]) + ["not a token!"]
+
+        assert manager.decrypt_many(tokens) == ["ok", "not a token!"]
+
+
+class TestStreamEncryption:
+    """Test chunked stream and file encryption."""
+
+    @pytest.mark.parametrize("size", [0, 10, 64, 65, 1000])
+    def test_stream_round_trip(self, manager, size):
+        """Test streams of various sizes around the chunk boundary."""
+        data = bytes(range(256)) * 4
+        data = data[:size]
+        encrypted = io.BytesIO()
+
+        assert manager.encrypt_stream(io.BytesIO(data), encrypted, chunk_size=64) == size
+
+        encrypted.seek(0)
+        decrypted = io.BytesIO()
+        assert manager.decrypt_stream(encrypted, decrypted) == size
+        assert decrypted.getvalue() == data
+
+    def test_file_round_trip(self, manager, tmp_path):
+        """Test file encryption helpers."""
+        source = tmp_path / "plain.bin"
+        source.write_bytes(b"\x00\x01 binary \xff" * 5000)
+
+        manager.encrypt_file(str(source), str(tmp_path / "data.enc"), chunk_size=1024)
+        manager.decrypt_file(str(tmp_path / "data.enc"), str(tmp_path / "plain.out"))
+
+        assert (tmp_path / "plain.out").read_bytes() == source.read_bytes()
+
+    def test_truncated_stream_is_rejected(self, manager):
+        """Test dropping the final chunk is detected."""
+        encrypted = io.BytesIO()
+        manager.encrypt_stream(io.BytesIO(b"a" * 200), encrypted, chunk_size=64)
+        lines = encrypted.getvalue().split(b"\n")
+
+        truncated = b"\n".join(lines[:-2]) + b"\n"
+        with pytest.raises(ValueError, match="truncated"):
+            manager.decrypt_stream(io.BytesIO(truncated), io.BytesIO())
+
+    def test_reordered_chunks_are_rejected(self, manager):
+        """Test swapped chunks are detected."""
+        encrypted = io.BytesIO()
+        manager.encrypt_stream(io.BytesIO(b"a" * 200), encrypted, chunk_size=64)
+        header, first, second, *rest = encrypted.getvalue().split(b"\n")
+
+        swapped = b"\n".join([header, second, first, *rest])
+        with pytest.raises(ValueError, match="Unexpected chunk"):
+            manager.decrypt_stream(io.BytesIO(swapped), io.BytesIO())
+
+    def test_rejects_foreign_stream(self, manager):
+        """Test streams without the header are rejected."""
+        with pytest.raises(ValueError, match="Not an encrypted stream"):
+            manager.decrypt_stream(io.BytesIO(b"plain data"), io.BytesIO())
+
+
+class TestFernetTokens:
+    """Test versioned Fernet tokens."""
+
+    @pytest.fixture
+    def fernet_manager(self, manager):
+        """Require the cryptography library."""
+        pytest.importorskip("cryptography")
+        return manager
+
+    def test_v2_token_is_single_encoded(self, fernet_manager):
+        """Test new tokens carry the Fernet token without a second base64 layer."""
+        token = fernet_manager.encrypt_string("secret")
+
+        assert token.startswith(TOKEN_PREFIX_V2)
+        assert token[len(TOKEN_PREFIX_V2) :].startswith("gAAAAA")
+        assert fernet_manager.decrypt_string(token) == "secret"
+
+    def test_reads_legacy_tokens(self, fernet_manager):
+        """Test double-encoded legacy tokens still decrypt."""
+        fernet_token = fernet_manager._fernet.encrypt(b"legacy secret")
+        legacy = base64.urlsafe_b64encode(fernet_token).decode("utf-8")
+
+        assert fernet_manager.decrypt_string(legacy) == "legacy secret"
+        assert fernet_manager.decrypt_many([legacy]) == ["legacy secret"]
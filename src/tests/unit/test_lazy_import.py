@@ -0,0 +1,81 @@
+"""
+Unit tests for lazy import helpers.
+"""
+
+import sys
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.lazy_import import lazy_exports, lazy_import, module_available
+
+
+@pytest.fixture
+def fake_module(tmp_path, monkeypatch):
+    """Create an importable module that records when its code runs."""
+    source = "import sys\nsys.lazy_fake_loaded = True\nVALUE = 42\n"
+    (tmp_path / "lazy_fake_mod.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "lazy_fake_mod"
+    sys.modules.pop("lazy_fake_mod", None)
+    if hasattr(sys, "lazy_fake_loaded"):
+        del sys.lazy_fake_loaded
+
+
+class TestLazyImport:
+    """Test lazy_import and module_available."""
+
+    def test_module_runs_on_first_attribute_access(self, fake_module):
+        """Test module code is deferred until used."""
+        module = lazy_import(fake_module)
+
+        assert module is not None
+        assert not hasattr(sys, "lazy_fake_loaded")
+        assert module.VALUE == 42
+        assert sys.lazy_fake_loaded is True
+
+    def test_missing_module_returns_none(self):
+        """Test missing modules keep the ``module is None`` convention."""
+        assert lazy_import("definitely_missing_module_xyz") is None
+        assert module_available("definitely_missing_module_xyz") is False
+        assert lazy_import("definitely_missing_pkg_xyz.sub") is None
+
+    def test_already_imported_module_is_returned(self):
+        """Test modules in sys.modules are returned as is."""
+        assert lazy_import("json") is sys.modules["json"]
+
+    def test_concurrent_first_access(self, tmp_path, monkeypatch):
+        """Test threads touching a loading module wait for it to finish."""
+        source = "import time\ntime.sleep(0.05)\nVALUE = 42\n"
+        (tmp_path / "lazy_slow_mod.py").write_text(source)
+        monkeypatch.syspath_prepend(str(tmp_path))
+        module = lazy_import("lazy_slow_mod")
+
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                values = list(executor.map(lambda _: module.VALUE, range(8)))
+        finally:
+            sys.modules.pop("lazy_slow_mod", None)
+
+        assert values == [42] * 8
+
+
+class TestLazyExports:
+    """Test PEP 562 lazy re-exports."""
+
+    def test_exports_resolve_on_access(self, fake_module, monkeypatch):
+        """Test exported names import their module on first access."""
+        package = types.ModuleType("lazy_fake_pkg")
+        package.__getattr__, package.__dir__ = lazy_exports(
+            "lazy_fake_pkg", {"VALUE": fake_module}
+        )
+        monkeypatch.setitem(sys.modules, "lazy_fake_pkg", package)
+
+        assert "VALUE" in package.__dir__()
+        assert not hasattr(sys, "lazy_fake_loaded")
+        assert package.VALUE == 42
+        assert "VALUE" in vars(package)
+
+        with pytest.raises(AttributeError):
+            package.MISSING
@@ -240,6 +240,8 @@ class TestAppLogger:
     def test_convenience_methods(self):
         """Test convenience logging methods."""
         app_logger = AppLogger()
+        # Key/value formatting is level-gated
+        app_logger.setup_logging("DEBUG")
 
         with patch.object(app_logger.logger, "debug") as mock_debug:
             app_logger.debug("Debug message", key1="value1")
@@ -265,9 +267,12 @@ class TestAppLogger:
             assert "Error message" in log_message
             assert "fatal: True" in log_message
 
+        app_logger.setup_logging("INFO")
+
     def test_convenience_methods_without_kwargs(self):
         """Test convenience methods without keyword arguments."""
         app_logger = AppLogger()
+        app_logger.setup_logging("DEBUG")
 
         with patch.object(app_logger.logger, "debug") as mock_debug:
             app_logger.debug("Plain debug message")
@@ -277,6 +282,90 @@ class TestAppLogger:
             app_logger.info("Plain info message")
             mock_info.assert_called_with("Plain info message")
 
+        app_logger.setup_logging("INFO")
+
+    def test_disabled_level_returns_before_logging(self):
+        """Test plain messages below the enabled level never reach the logger."""
+        app_logger = AppLogger()
+        app_logger.setup_logging("WARNING")
+
+        with patch.object(app_logger.logger, "debug") as mock_debug, patch.object(
+            app_logger.logger, "info"
+        ) as mock_info:
+            app_logger.debug("Plain debug message")
+            app_logger.info("Plain info message")
+
+        mock_debug.assert_not_called()
+        mock_info.assert_not_called()
+        app_logger.setup_logging("INFO")
+
+    def test_lazy_arguments_skipped_when_disabled(self):
+        """Test deferred messages are not formatted below the enabled level."""
+        app_logger = AppLogger()
+        app_logger.setup_logging("INFO")
+        render = MagicMock(return_value="expensive")
+
+        with patch.object(app_logger.logger, "debug") as mock_debug:
+            app_logger.debug(render)
+            app_logger.debug("Cache hit for key: %s", render)
+            app_logger.debug("Cache hit", key=render)
+
+            mock_debug.assert_not_called()
+        render.assert_not_called()
+
+    def test_lazy_arguments_formatted_when_enabled(self):
+        """Test deferred messages are formatted when the level is enabled."""
+        app_logger = AppLogger()
+        app_logger.setup_logging("DEBUG")
+
+        with patch.object(app_logger.logger, "debug") as mock_debug:
+            app_logger.debug("Cache hit for key: %.8s...", "0123456789")
+            # Arguments are formatted by the record when it is emitted
+            mock_debug.assert_called_with("Cache hit for key: %.8s...", "0123456789")
+
+            app_logger.debug(lambda: "Computed message")
+            mock_debug.assert_called_with("Computed message")
+
+        app_logger.setup_logging("INFO")
+
+    def test_structured_output(self):
+        """Test structured JSON output with key/value fields."""
+        import json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "app.log"
+            app_logger = AppLogger()
+            app_logger.setup_logging("INFO", str(log_file), structured=True)
+
+            app_logger.info("Translation completed", source="en", duration=0.5)
+            for handler in app_logger.logger.handlers:
+                handler.close()
+
+            record = json.loads(log_file.read_text(encoding="utf-8").strip())
+            assert record["message"] == "Translation completed"
+            assert record["source"] == "en"
+            assert record["duration"] == 0.5
+
+            app_logger.setup_logging("INFO")
+
+    def test_async_sink(self):
+        """Test records are written by the queue listener."""
+        from logging.handlers import QueueHandler
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_file = Path(temp_dir) / "app.log"
+            app_logger = AppLogger()
+            app_logger.setup_logging("INFO", str(log_file), async_sink=True)
+
+            assert all(isinstance(h, QueueHandler) for h in app_logger.logger.handlers)
+            app_logger.info("Queued message %d", 42)
+
+            # Stopping the listener drains the queue
+            app_logger.shutdown()
+            assert "Queued message 42" in log_file.read_text(encoding="utf-8")
+
+            app_logger.setup_logging("INFO")
+
 
 class TestGlobalLoggerInstance:
     """Test the global logger instance."""
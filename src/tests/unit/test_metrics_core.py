@@ -0,0 +1,144 @@
+"""
+Unit tests for the low-overhead metrics core.
+"""
+
+import threading
+
+import pytest
+
+from src.utils.metrics_core import (
+    LatencyHistogram,
+    MetricsCore,
+    bucket_index,
+    bucket_upper_bound,
+)
+
+
+class TestBuckets:
+    """Test log-linear bucket layout."""
+
+    def test_small_values_are_exact(self):
+        """Test values below the sub-bucket count map to their own bucket."""
+        for value in range(64):
+            assert bucket_upper_bound(bucket_index(value)) == value
+
+    def test_bucket_bounds_are_contiguous(self):
+        """Test every value falls into the bucket whose bounds contain it."""
+        for value in range(0, 2_000_000, 97):
+            index = bucket_index(value)
+            assert bucket_upper_bound(index) >= value
+            if index > 0:
+                assert bucket_upper_bound(index - 1) < value
+
+    def test_relative_error_is_bounded(self):
+        """Test bucket width stays within ~3% of the value."""
+        for value in (1_000, 50_000, 3_600_000_000):
+            assert (bucket_upper_bound(bucket_index(value)) - value) / value < 0.035
+
+
+class TestLatencyHistogram:
+    """Test LatencyHistogram implementation."""
+
+    def test_percentiles(self):
+        """Test percentiles of a uniform distribution."""
+        histogram = LatencyHistogram()
+        for ms in range(1, 1001):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 1000
+        assert histogram.percentile(50) == pytest.approx(0.5, rel=0.04)
+        assert histogram.percentile(95) == pytest.approx(0.95, rel=0.04)
+        assert histogram.percentile(99) == pytest.approx(0.99, rel=0.04)
+        assert histogram.percentile(100) == 1.0
+
+    def test_summary(self):
+        """Test summary counters."""
+        histogram = LatencyHistogram()
+        histogram.record(0.2)
+        histogram.record(0.4, success=False)
+
+        summary = histogram.summary()
+        assert summary["count"] == 2
+        assert summary["errors"] == 1
+        assert summary["mean"] == pytest.approx(0.3)
+        assert summary["min"] == 0.2
+        assert summary["max"] == 0.4
+
+    def test_empty_summary(self):
+        """Test summary of an empty histogram."""
+        summary = LatencyHistogram().summary()
+        assert summary["count"] == 0
+        assert summary["p99"] == 0.0
+        assert summary["min"] == 0.0
+
+
+class TestMetricsCore:
+    """Test MetricsCore implementation."""
+
+    def test_record_and_merge_threads(self):
+        """Test recordings from several threads are merged."""
+        core = MetricsCore()
+
+        def worker():
+            for _ in range(1000):
+                core.record("ocr", 0.01)
+            core.record("ocr", 0.5, success=False)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        histogram = core.histogram("ocr")
+        assert histogram.count == 4004
+        assert histogram.errors == 4
+        assert histogram.max == 0.5
+        assert core.totals() == (4004, 4)
+        assert core.operations() == ["ocr"]
+
+    def test_window(self, monkeypatch):
+        """Test windowed statistics only include recent slices."""
+        import src.utils.metrics_core as metrics_core
+
+        now = [1000.0]
+        monkeypatch.setattr(metrics_core.time, "monotonic", lambda: now[0])
+
+        core = MetricsCore(slice_seconds=60, retained_slices=10)
+        core.record("translate", 1.0)
+        now[0] += 300
+        core.record("translate", 2.0)
+
+        assert core.histogram("translate").count == 2
+        assert core.histogram("translate", window=120).count == 1
+
+        # Slices older than the retention are dropped
+        now[0] += 3600
+        core.record("translate", 3.0)
+        assert core.histogram("translate", window=10**6).count == 1
+        assert core.histogram("translate").count == 3
+
+    def test_exited_thread_shards_are_reclaimed(self):
+        """Test shards of finished threads are merged and dropped."""
+        core = MetricsCore()
+        core.record("ocr", 0.1)
+
+        for _ in range(20):
+            thread = threading.Thread(target=core.record, args=("ocr", 0.2, False))
+            thread.start()
+            thread.join()
+
+        assert core.shard_count() == 1
+        histogram = core.histogram("ocr")
+        assert histogram.count == 21
+        assert histogram.errors == 20
+        assert core.histogram("ocr", window=60).count == 21
+        assert core.totals() == (21, 20)
+
+    def test_reset(self):
+        """Test reset drops all data."""
+        core = MetricsCore()
+        core.record("op", 0.1)
+        core.reset()
+        assert core.operations() == []
+        assert core.histogram("op").count == 0
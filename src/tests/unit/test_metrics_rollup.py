@@ -0,0 +1,157 @@
+"""
+Unit tests for time-series metric rollups.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from src.handlers.query_handlers import PerformanceQueryHandler
+from src.models.translation import Translation
+from src.queries.performance_queries import GetPerformanceMetricsQuery, GetUsageStatsQuery
+from src.repositories import FileTranslationRepository
+from src.utils.metrics_rollup import RollupStore, RollupTier, language_pair_label
+
+NOW = datetime(2024, 6, 30, 12, 30, 15)
+
+
+def make_store(**kwargs):
+    """Create a store with a fixed clock."""
+    return RollupStore(clock=lambda: NOW, **kwargs)
+
+
+class TestRollupStore:
+    """Test recording and range queries."""
+
+    def test_summary_matches_raw_events(self):
+        """Test summaries agree with a raw scan for ranges resolved by retained tiers."""
+        store = make_store()
+        rng = random.Random(7)
+        events = [NOW - timedelta(seconds=rng.randint(0, 30 * 86400)) for _ in range(5000)]
+        for i, timestamp in enumerate(events):
+            store.record("translation", 0.1 + i % 10 / 10, timestamp, success=i % 7 != 0)
+
+        # Day/hour-aligned edges are resolved exactly by the hour tier
+        since = datetime(2024, 6, 10, 5)
+        expected = [t for t in events if t >= since]
+        summary = store.summary("translation", since)
+
+        assert summary.count == len(expected)
+        assert store.summary("translation", NOW - timedelta(minutes=30)).count == sum(
+            1 for t in events if t >= NOW.replace(second=0) - timedelta(minutes=30)
+        )
+
+    def test_min_max_sum_and_errors(self):
+        """Test aggregates survive merging buckets of several tiers."""
+        store = make_store()
+        for i, value in enumerate([1.0, 2.0, 3.0, 4.0]):
+            store.record("ocr", value, NOW - timedelta(days=i), success=i != 2)
+
+        summary = store.summary("ocr", NOW - timedelta(days=10))
+
+        assert (summary.count, summary.errors) == (4, 1)
+        assert (summary.min, summary.max, summary.total) == (1.0, 4.0, 10.0)
+
+    def test_query_cost_is_bounded_by_buckets(self):
+        """Test a 90 day range is covered by a few hundred buckets at most."""
+        store = make_store()
+
+        plan = store._plan(
+            int((NOW - timedelta(days=90) - datetime(1970, 1, 1)).total_seconds()),
+            int((NOW - datetime(1970, 1, 1)).total_seconds()),
+            len(store.tiers) - 1,
+        )
+
+        assert len(plan) < 200
+
+    def test_retention_prunes_old_buckets(self):
+        """Test tiers drop buckets older than their retention."""
+        tiers = (RollupTier("minute", 60, 3600), RollupTier("hour", 3600, 86400))
+        store = make_store(tiers=tiers)
+
+        store.record("op", 1.0, NOW - timedelta(hours=5))
+        store.record("op", 1.0, NOW)
+
+        stats = store.get_stats()
+        assert stats["minute"]["buckets"] == 1
+        assert stats["hour"]["buckets"] == 2
+        # The old event is still visible through the hour tier
+        assert store.summary("op", NOW - timedelta(hours=6)).count == 2
+
+    def test_timeline_and_breakdown(self):
+        """Test grouping by period and by language pair."""
+        store = make_store()
+        for day in range(40):
+            pair = language_pair_label("en", "ru" if day % 4 else "de")
+            store.record("translation", 0.5, NOW - timedelta(days=day), language_pair=pair)
+
+        months = store.timeline("translation", NOW - timedelta(days=39), group_by="month")
+        weeks = store.timeline("translation", NOW - timedelta(days=13), group_by="week")
+        pairs = store.breakdown("translation", NOW - timedelta(days=39))
+
+        assert [label for label, _ in months] == ["2024-05", "2024-06"]
+        assert sum(h.count for _, h in months) == 40
+        assert [label for label, _ in weeks] == ["2024-W25", "2024-W26"]
+        assert {pair: h.count for pair, h in pairs.items()} == {"en->de": 10, "en->ru": 30}
+
+    def test_save_and_load(self, tmp_path):
+        """Test rollups survive a save/load roundtrip."""
+        store = make_store()
+        store.record("translation", 1.5, NOW, success=False, language_pair="en->ru")
+        path = str(tmp_path / "rollups.json")
+
+        store.save(path)
+        restored = make_store()
+
+        assert restored.load(path) == 3
+        summary = restored.summary("translation", NOW - timedelta(hours=1), NOW, "en->ru")
+        assert (summary.count, summary.errors, summary.total) == (1, 1, 1.5)
+        assert make_store().load(str(tmp_path / "missing.json")) == 0
+
+
+class TestRollupQueries:
+    """Test query handlers on top of rollups."""
+
+    def test_usage_rollups_follow_repository_writes(self, tmp_path):
+        """Test usage rollups are updated on save and rebuilt after delete."""
+        repository = FileTranslationRepository(str(tmp_path))
+        now = datetime.now()
+        ids = [
+            asyncio.run(
+                repository.save(
+                    Translation("Hello", "Привет", "en", "ru", timestamp=now, cached=True)
+                )
+            )
+            for _ in range(3)
+        ]
+        handler = PerformanceQueryHandler(repository)
+
+        before = asyncio.run(handler.handle(GetUsageStatsQuery(time_range_days=1)))
+        asyncio.run(repository.delete(ids[0]))
+        after = asyncio.run(handler.handle(GetUsageStatsQuery(time_range_days=1)))
+
+        assert before.data["language_pairs"] == {"en->ru": 3}
+        assert before.data["periods"][0]["characters"] == 15
+        assert after.total_count == 2
+        assert after.data["features"]["cached"] == 2
+
+    def test_performance_metrics_query(self):
+        """Test performance metrics come from monitor rollups and are not cached."""
+        monitor = SimpleNamespace(rollups=RollupStore())
+        now = datetime.now()
+        for i in range(10):
+            monitor.rollups.record("translation", 0.2, now, i != 0, "en->ru")
+            monitor.rollups.record("ocr_extraction", 0.4, now)
+        handler = PerformanceQueryHandler(monitor=monitor)
+        query = GetPerformanceMetricsQuery(metric_types=["translation", "overall"])
+
+        result = asyncio.run(handler.handle(query))
+        monitor.rollups.record("translation", 0.2, now)
+        again = asyncio.run(handler.handle(query))
+
+        assert result.data["translation"]["count"] == 10
+        assert result.data["translation"]["errors"] == 1
+        assert result.data["translation"]["language_pairs"]["en->ru"]["count"] == 10
+        assert result.data["overall"]["count"] == 20
+        assert again.data["translation"]["count"] == 11
@@ -52,8 +52,9 @@ class TestTesseractOCR(unittest.TestCase):
         mock_find_spec.return_value = Mock()  # pytesseract available
         mock_find_tesseract.return_value = "/usr/bin/tesseract"
 
-        # Mock pytesseract module
+        # Mock pytesseract module; drop the result probed by setUp
         with patch.dict("sys.modules", {"pytesseract": MagicMock()}):
+            self.engine.capabilities.invalidate("tesseract_ocr")
             self.assertTrue(self.engine.is_available())
 
     @patch("src.core.ocr_engine.TesseractOCR._find_tesseract")
@@ -44,7 +44,7 @@ def plugin_directories(tmp_path):
 @pytest.fixture
 def plugin_manager(plugin_directories):
     """Create PluginManager instance"""
-    return PluginManager(plugin_directories)
+    return PluginManager(plugin_directories, manifest_cache_path=None)
 
 
 class TestPluginManager:
@@ -61,7 +61,7 @@ class TestPluginManager:
 
     def test_initialization_default_directories(self):
         """Test initialization with default directories"""
-        manager = PluginManager()
+        manager = PluginManager(manifest_cache_path=None)
 
         # Should include default builtin directory
         builtin_dir = os.path.join(
@@ -0,0 +1,141 @@
+"""
+Unit tests for lazy plugin loading with the manifest cache.
+"""
+
+import os
+
+import pytest
+
+from src.plugins.base_plugin import PluginType
+from src.plugins.plugin_manager import PluginManager
+
+PLUGIN_SOURCE = '''
+from pathlib import Path
+
+from src.plugins.base_plugin import BasePlugin, PluginMetadata, PluginType
+
+# Record every import of this module
+with open(Path(__file__).with_name("imports.log"), "a") as log:
+    log.write("import\\n")
+
+
+class LazyTestPlugin(BasePlugin):
+    @property
+    def metadata(self):
+        return PluginMetadata(
+            name="{name}",
+            version="{version}",
+            description="Lazy test plugin",
+            author="Test",
+            plugin_type=PluginType.{plugin_type},
+        )
+
+    def initialize(self, config):
+        self._initialized = True
+        return True
+
+    def cleanup(self):
+        pass
+'''
+
+
+class TestLazyPluginLoading:
+    """Test manifest cache and deferred plugin imports."""
+
+    @pytest.fixture
+    def plugin_dir(self, tmp_path):
+        """Create plugin directory with two plugins."""
+        plugin_dir = tmp_path / "plugins"
+        plugin_dir.mkdir()
+        self._write_plugin(plugin_dir, "lazy_ocr", "Lazy OCR", "1.0.0", "OCR")
+        self._write_plugin(plugin_dir, "lazy_tts", "Lazy TTS", "1.0.0", "TTS")
+        return plugin_dir
+
+    @staticmethod
+    def _write_plugin(plugin_dir, module, name, version, plugin_type):
+        source = PLUGIN_SOURCE.format(name=name, version=version, plugin_type=plugin_type)
+        (plugin_dir / f"{module}.py").write_text(source)
+
+    @staticmethod
+    def _import_count(plugin_dir):
+        log = plugin_dir / "imports.log"
+        return len(log.read_text().splitlines()) if log.exists() else 0
+
+    def _manager(self, plugin_dir, tmp_path):
+        return PluginManager(
+            [str(plugin_dir)], manifest_cache_path=str(tmp_path / "manifests.json")
+        )
+
+    def _warm_cache(self, plugin_dir, tmp_path):
+        self._manager(plugin_dir, tmp_path).load_all_plugins()
+        return self._import_count(plugin_dir)
+
+    def test_cached_startup_does_not_import(self, plugin_dir, tmp_path):
+        """Test plugins are listed from the cache without imports."""
+        imports = self._warm_cache(plugin_dir, tmp_path)
+        assert imports == 2
+
+        manager = self._manager(plugin_dir, tmp_path)
+        assert manager.load_all_plugins() >= 2
+
+        assert self._import_count(plugin_dir) == imports
+        names = {m.name for m in manager.list_plugins(PluginType.OCR)}
+        assert "Lazy OCR" in names
+        info = {i["name"]: i for i in manager.get_plugin_info()}
+        assert info["Lazy OCR"]["loaded"] is False
+
+    def test_first_use_imports_and_initializes(self, plugin_dir, tmp_path):
+        """Test get_plugin activates only the requested plugin."""
+        imports = self._warm_cache(plugin_dir, tmp_path)
+        manager = self._manager(plugin_dir, tmp_path)
+        manager.load_all_plugins()
+
+        plugin = manager.get_plugin("Lazy OCR")
+
+        assert plugin is not None
+        assert plugin.initialized
+        assert manager.get_plugin("Lazy OCR") is plugin
+        assert self._import_count(plugin_dir) == imports + 1
+
+    def test_changed_source_invalidates_cache(self, plugin_dir, tmp_path):
+        """Test edited plugins are imported again and get fresh metadata."""
+        imports = self._warm_cache(plugin_dir, tmp_path)
+        self._write_plugin(plugin_dir, "lazy_ocr", "Lazy OCR", "2.0.0", "OCR")
+
+        manager = self._manager(plugin_dir, tmp_path)
+        manager.load_all_plugins()
+
+        assert self._import_count(plugin_dir) == imports + 1
+        assert manager.manifests["Lazy OCR"].version == "2.0.0"
+
+    def test_touched_source_keeps_cache(self, plugin_dir, tmp_path):
+        """Test a timestamp-only change is resolved by the content hash."""
+        imports = self._warm_cache(plugin_dir, tmp_path)
+        source = plugin_dir / "lazy_ocr.py"
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        manager = self._manager(plugin_dir, tmp_path)
+        manager.load_all_plugins()
+
+        assert self._import_count(plugin_dir) == imports
+
+    def test_disabled_pending_plugin_is_not_imported(self, plugin_dir, tmp_path):
+        """Test disabling a lazy plugin skips it without importing."""
+        imports = self._warm_cache(plugin_dir, tmp_path)
+        manager = self._manager(plugin_dir, tmp_path)
+        manager.load_all_plugins()
+
+        assert manager.disable_plugin("Lazy OCR") is True
+        assert "Lazy OCR" not in [
+            p.metadata.name for p in manager.iter_plugins_by_type(PluginType.OCR)
+        ]
+        assert self._import_count(plugin_dir) == imports
+
+    def test_discover_plugins_returns_instances(self, plugin_dir, tmp_path):
+        """Test discover_plugins still returns plugin instances."""
+        manager = self._manager(plugin_dir, tmp_path)
+
+        plugins = manager.discover_plugins()
+
+        assert {"Lazy OCR", "Lazy TTS"} <= {p.metadata.name for p in plugins}
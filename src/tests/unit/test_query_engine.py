@@ -0,0 +1,217 @@
+"""
+Unit tests for repository-backed CQRS query handlers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.handlers.query_cache import QueryCache
+from src.handlers.query_handlers import PerformanceQueryHandler, TranslationQueryHandler
+from src.models.translation import Translation
+from src.queries.base_query import FilterParams, PaginationParams, SortParams
+from src.queries.performance_queries import GetUsageStatsQuery
+from src.queries.translation_queries import GetTranslationHistoryQuery, SearchTranslationsQuery
+from src.repositories import FileTranslationRepository
+
+NOW = datetime.now().replace(microsecond=0)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository with 30 translations, one per hour, newest is 'text 29'."""
+    repository = FileTranslationRepository(str(tmp_path))
+    for i in range(30):
+        translation = Translation(
+            original_text=f"Hello text {i}" + " long" * (i % 5),
+            translated_text=f"Привет текст {i}",
+            source_language="en",
+            target_language="ru" if i % 3 else "de",
+            timestamp=NOW - timedelta(hours=29 - i),
+            confidence=(i * 7 % 30) / 30,
+            cached=i % 2 == 0,
+        )
+        asyncio.run(repository.save(translation))
+    return repository
+
+
+def run(handler, query):
+    """Execute a query synchronously."""
+    return asyncio.run(handler.handle(query))
+
+
+class TestTranslationQueries:
+    """Test history and search queries."""
+
+    def test_history_offset_pagination(self, repository):
+        """Test pages come newest first and total ignores pagination."""
+        handler = TranslationQueryHandler(repository)
+        query = GetTranslationHistoryQuery(pagination=PaginationParams(page=2, page_size=10))
+
+        result = run(handler, query)
+
+        assert result.success
+        assert result.total_count == 30
+        assert [t["original_text"].split()[2] for t in result.data] == [
+            str(i) for i in range(19, 9, -1)
+        ]
+        assert result.metadata["has_more"]
+        assert result.execution_time_ms > 0
+
+    def test_history_keyset_cursor(self, repository):
+        """Test following next_cursor visits every translation once."""
+        handler = TranslationQueryHandler(repository)
+        seen, cursor = [], None
+
+        while True:
+            pagination = PaginationParams(page_size=7, cursor=cursor)
+            result = run(handler, GetTranslationHistoryQuery(pagination=pagination))
+            seen.extend(t["id"] for t in result.data)
+            cursor = result.metadata.get("next_cursor")
+            if cursor is None:
+                break
+
+        assert len(seen) == len(set(seen)) == 30
+
+    def test_sort_by_confidence_top_k(self, repository):
+        """Test sorting by a non-indexed field."""
+        handler = TranslationQueryHandler(repository)
+        query = GetTranslationHistoryQuery(
+            sorting=SortParams("confidence", "desc"),
+            pagination=PaginationParams(page_size=5),
+        )
+
+        result = run(handler, query)
+
+        confidences = [t["confidence"] for t in result.data]
+        assert confidences == sorted(confidences, reverse=True)
+        assert confidences[0] == max(
+            translation.confidence for translation in repository._cache.values()
+        )
+
+    def test_filters_and_language(self, repository):
+        """Test language, criteria and date filters are combined."""
+        handler = TranslationQueryHandler(repository)
+        query = GetTranslationHistoryQuery(
+            language_filter="de",
+            filtering=FilterParams(filters={"cached": True}, date_from=NOW - timedelta(hours=12)),
+        )
+
+        result = run(handler, query)
+
+        # i in 18..29 with i % 3 == 0 and even i
+        assert result.total_count == 2
+        assert {t["original_text"].split()[2] for t in result.data} == {"18", "24"}
+
+    def test_search(self, repository):
+        """Test text search with case sensitivity and confidence threshold."""
+        handler = TranslationQueryHandler(repository)
+
+        found = run(handler, SearchTranslationsQuery(search_text="текст 2", search_in="translated"))
+        strict = run(handler, SearchTranslationsQuery(search_text="hello", case_sensitive=True))
+        confident = run(handler, SearchTranslationsQuery(search_text="hello", min_confidence=0.9))
+
+        assert {t["translated_text"] for t in found.data} >= {"Привет текст 2"}
+        assert strict.total_count == 0
+        assert all(t["confidence"] >= 0.9 for t in confident.data)
+        assert confident.total_count == 3
+
+    def test_invalid_cursor(self, repository):
+        """Test malformed cursors are reported as errors."""
+        query = GetTranslationHistoryQuery(pagination=PaginationParams(cursor="not-a-cursor"))
+
+        result = run(TranslationQueryHandler(repository), query)
+
+        assert not result.success
+        assert "cursor" in result.error
+
+
+class TestQueryCache:
+    """Test caching of query results."""
+
+    def test_cache_hit_and_invalidation(self, repository):
+        """Test equivalent queries are cached until the repository changes."""
+        handler = TranslationQueryHandler(repository, QueryCache())
+
+        first = run(handler, GetTranslationHistoryQuery(limit=5))
+        second = run(handler, GetTranslationHistoryQuery(limit=5))
+        asyncio.run(repository.save(Translation("New", "Новый", "en", "ru", timestamp=NOW)))
+        third = run(handler, GetTranslationHistoryQuery(limit=5))
+
+        assert not first.metadata["cache_hit"]
+        assert second.metadata["cache_hit"]
+        assert second.data == first.data
+        assert not third.metadata["cache_hit"]
+        assert third.total_count == 31
+        assert handler.get_metrics()["cache_hits"] == 1
+
+    def test_write_through_other_instance_invalidates(self, repository, tmp_path):
+        """Test writes by another repository on the same file are picked up."""
+        handler = TranslationQueryHandler(repository, QueryCache())
+        run(handler, GetTranslationHistoryQuery(limit=5))
+
+        other = FileTranslationRepository(str(tmp_path))
+        newest = NOW + timedelta(minutes=1)
+        asyncio.run(other.save(Translation("New", "Новый", "en", "ru", timestamp=newest)))
+        result = run(handler, GetTranslationHistoryQuery(limit=5))
+
+        assert not result.metadata["cache_hit"]
+        assert result.total_count == 31
+        assert result.data[0]["original_text"] == "New"
+
+    def test_default_repository_from_container(self, repository, monkeypatch):
+        """Test handlers without a repository share the container's instance."""
+        from src.repositories import TranslationRepository
+        from src.services import container as container_module
+
+        services = container_module.DIContainer()
+        services.register_instance(TranslationRepository, repository)
+        monkeypatch.setattr(container_module, "container", services)
+
+        assert TranslationQueryHandler().repository is repository
+
+    def test_fingerprint_ignores_query_identity(self):
+        """Test fingerprints depend on parameters only."""
+        a = GetTranslationHistoryQuery(query_id="a", limit=5)
+        b = GetTranslationHistoryQuery(query_id="b", limit=5)
+        c = GetTranslationHistoryQuery(query_id="a", limit=6)
+
+        assert QueryCache.fingerprint(a) == QueryCache.fingerprint(b)
+        assert QueryCache.fingerprint(a) != QueryCache.fingerprint(c)
+
+    def test_lru_eviction(self, repository):
+        """Test the cache keeps at most max_entries results."""
+        cache = QueryCache(max_entries=2)
+        handler = TranslationQueryHandler(repository, cache)
+
+        for limit in (1, 2, 3):
+            run(handler, GetTranslationHistoryQuery(limit=limit))
+
+        assert cache.get_stats()["size"] == 2
+        assert cache.get(GetTranslationHistoryQuery(limit=1)) is None
+
+
+class TestUsageStats:
+    """Test usage statistics."""
+
+    @pytest.mark.parametrize("group_by", ["hour", "day", "week", "month"])
+    def test_usage_stats(self, repository, group_by):
+        """Test bucketing, language pairs and feature counts."""
+        handler = PerformanceQueryHandler(repository)
+
+        result = run(handler, GetUsageStatsQuery(time_range_days=30, group_by=group_by))
+
+        data = result.data
+        assert result.total_count == 30
+        assert sum(period["translations"] for period in data["periods"]) == 30
+        assert data["language_pairs"] == {"en->ru": 20, "en->de": 10}
+        assert data["features"]["cached"] == 15
+        if group_by == "hour":
+            assert len(data["periods"]) == 30
+
+    def test_unsupported_query(self, repository):
+        """Test queries without an implementation return an error."""
+        result = run(TranslationQueryHandler(repository), GetUsageStatsQuery())
+
+        assert not result.success
@@ -115,6 +115,25 @@ class TestFileTranslationRepository:
         results = await repository.search({"source_language": "fr"})
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_search_text(self, repository, sample_translation):
+        """Test full-text search over translation history."""
+        await repository.save(sample_translation)
+
+        results = await repository.search({"original_text": "hello wor"})
+        assert len(results) == 1
+
+        results = await repository.search({"query": "mundo", "target_language": "es"})
+        assert len(results) == 1
+
+        results = await repository.search({"translated_text": "hello"})
+        assert len(results) == 0
+
+        # Index is updated on delete
+        await repository.delete(sample_translation.id)
+        results = await repository.search({"query": "hello"})
+        assert len(results) == 0
+
     @pytest.mark.asyncio
     async def test_delete(self, repository, sample_translation):
         """Test deleting translation."""
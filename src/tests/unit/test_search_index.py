@@ -0,0 +1,182 @@
+"""
+Unit tests for the translation full-text search index.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.translation import Translation
+from src.utils.search_index import TranslationSearchIndex, parse_query, tokenize
+
+
+class TestTokenize:
+    """Test Unicode-aware tokenization."""
+
+    def test_latin_words_are_casefolded(self):
+        """Test words are normalized and punctuation is dropped."""
+        assert tokenize("Hello, WORLD!") == {"hello", "world"}
+
+    def test_cyrillic_words(self):
+        """Test non-Latin alphabetic scripts are tokenized as words."""
+        assert tokenize("Привет мир") == {"привет", "мир"}
+
+    def test_cjk_ngrams(self):
+        """Test CJK runs are split into unigrams and bigrams."""
+        tokens = tokenize("日本語")
+        assert {"日", "本", "語", "日本", "本語"} <= tokens
+        assert "日本語" not in tokens
+
+    def test_mixed_script_word(self):
+        """Test words mixing Latin and CJK are split into runs."""
+        tokens = tokenize("Windows10の設定")
+        assert "windows10" in tokens
+        assert "設定" in tokens
+
+    def test_fullwidth_is_normalized(self):
+        """Test NFKC normalization of full-width characters."""
+        assert tokenize("ＡＢＣ") == {"abc"}
+
+
+class TestParseQuery:
+    """Test query parsing."""
+
+    def test_quoted_phrase(self):
+        """Test quoted segments become phrase clauses."""
+        clauses = parse_query('"hello world" foo')
+        assert len(clauses) == 2
+        assert clauses[0].phrase == "hello world"
+        assert clauses[1].phrase is None
+
+    def test_trailing_star_marks_prefix(self):
+        """Test trailing star marks a prefix term."""
+        clauses = parse_query("hel*")
+        assert clauses[0].terms == ["hel"]
+        assert clauses[0].prefix is True
+
+
+class TestTranslationSearchIndex:
+    """Test TranslationSearchIndex implementation."""
+
+    @pytest.fixture
+    def now(self):
+        """Reference time for timestamps."""
+        return datetime.now()
+
+    @pytest.fixture
+    def index(self, now):
+        """Create index populated with sample documents."""
+        index = TranslationSearchIndex()
+        index.add("en1", "Hello world", "Hola mundo", "en", "es", now)
+        index.add("ja1", "こんにちは世界", "Hello world", "ja", "en", now - timedelta(days=2))
+        index.add("zh1", "你好，世界", "Hello, world!", "zh", "en", now - timedelta(days=10))
+        return index
+
+    def test_term_search(self, index):
+        """Test exact term search across both fields, newest first."""
+        assert index.search("world") == ["en1", "ja1", "zh1"]
+        assert index.search("mundo") == ["en1"]
+
+    def test_prefix_search(self, index):
+        """Test prefix matching."""
+        assert index.search("hel") == []
+        assert index.search("hel*") == ["en1", "ja1", "zh1"]
+        assert index.search("mun", prefix=True) == ["en1"]
+
+    def test_phrase_search(self, index):
+        """Test phrase queries require adjacent words."""
+        assert index.search('"hello world"') == ["en1", "ja1", "zh1"]
+        assert index.search('"world hello"') == []
+
+    def test_cjk_search(self, index):
+        """Test CJK substring queries."""
+        assert index.search("世界") == ["ja1", "zh1"]
+        assert index.search("界") == ["ja1", "zh1"]
+        assert index.search("にちは") == ["ja1"]
+        # Bigram candidates are verified against the text
+        assert index.search("こ世") == []
+
+    def test_field_restriction(self, index):
+        """Test searching a single field."""
+        assert index.search("hello", fields=("original",)) == ["en1"]
+
+    def test_language_filters(self, index):
+        """Test language filters."""
+        assert index.search("world", target_language="en") == ["ja1", "zh1"]
+        assert index.search("", source_language="zh") == ["zh1"]
+        assert index.search("world", source_language="fr") == []
+
+    def test_date_filters(self, index, now):
+        """Test date range filters."""
+        assert index.search("", since=now - timedelta(days=5)) == ["en1", "ja1"]
+        assert index.search("world", until=now - timedelta(days=1)) == ["ja1", "zh1"]
+
+    def test_limit(self, index):
+        """Test result limit keeps most recent documents."""
+        assert index.search("", limit=2) == ["en1", "ja1"]
+        assert index.search("world", limit=1) == ["en1"]
+
+    def test_incremental_update(self, index, now):
+        """Test replacing and removing documents updates postings."""
+        index.add("en1", "Goodbye", "Adios", "en", "es", now)
+        assert index.search("hello", fields=("original",)) == []
+        assert index.search("goodbye") == ["en1"]
+
+        assert index.remove("en1") is True
+        assert index.remove("en1") is False
+        assert index.search("goodbye") == []
+        assert index.search("goodbye*") == []
+        assert len(index) == 2
+
+    def test_add_translation_model(self):
+        """Test indexing Translation models."""
+        index = TranslationSearchIndex()
+        translation = Translation(
+            original_text="Good morning",
+            translated_text="Доброе утро",
+            source_language="en",
+            target_language="ru",
+        )
+        index.add_translation(translation)
+
+        assert translation.id in index
+        assert index.search("утро") == [translation.id]
+
+    def test_clear(self, index):
+        """Test clearing the index."""
+        index.clear()
+        assert len(index) == 0
+        assert index.search("") == []
+
+    def test_search_within_narrows_previous_result(self, index):
+        """Test narrowing a previous result keeps its order."""
+        previous = index.search("hel", prefix=True)
+        assert previous == ["en1", "ja1", "zh1"]
+
+        narrowed = index.search("hello wor", prefix=True, within=previous)
+        assert narrowed == ["en1", "ja1", "zh1"]
+        assert index.search("hola", prefix=True, within=previous) == ["en1"]
+        assert index.search("hello", target_language="en", within=previous) == ["ja1", "zh1"]
+        assert index.search("世界", within=["zh1", "en1"]) == ["zh1"]
+        assert index.search("hello", within=["missing"]) == []
+
+    def test_rebuild(self):
+        """Test bulk rebuild from Translation models."""
+        index = TranslationSearchIndex()
+        translations = [
+            Translation(
+                original_text=f"Text {i}",
+                translated_text=f"Текст {i}",
+                source_language="en",
+                target_language="ru",
+            )
+            for i in range(5)
+        ]
+        index.rebuild(translations)
+
+        assert len(index) == 5
+        assert len(index.search("текст")) == 5
+        assert index.search("3") == [translations[3].id]
+
+        index.remove(translations[3].id)
+        assert index.search("3") == []
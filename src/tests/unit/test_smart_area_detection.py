@@ -0,0 +1,116 @@
+"""
+Unit tests for coarse-to-fine smart area detection.
+"""
+
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+cv2 = pytest.importorskip("cv2")
+
+from src.ai.smart_area_detection import (  # noqa: E402
+    DetectionConfig,
+    DetectionMethod,
+    SmartAreaDetector,
+    TextRegion,
+)
+
+
+@pytest.fixture(scope="module")
+def frame():
+    """Light frame with dark text lines scattered over it."""
+    image = np.full((1080, 1920, 3), 235, dtype=np.uint8)
+    rng = np.random.default_rng(0)
+    for line in range(12):
+        x, y = int(rng.integers(40, 1500)), int(rng.integers(60, 1040))
+        cv2.putText(
+            image, f"Sample text {line}", (x, y), cv2.FONT_HERSHEY_SIMPLEX, 1.2, (20, 20, 20), 2
+        )
+    return image
+
+
+def detector(**overrides):
+    config = DetectionConfig(enable_caching=False, max_regions=100, coarse_min_pixels=1)
+    for name, value in overrides.items():
+        setattr(config, name, value)
+    return SmartAreaDetector(config)
+
+
+def boxes(regions):
+    return sorted(region.coordinates for region in regions)
+
+
+class TestCoarseToFine:
+    """Test detection on a downscaled frame with full-size refinement."""
+
+    @pytest.mark.parametrize(
+        "method", [DetectionMethod.EDGE_DETECTION, DetectionMethod.TEXT_DETECTION]
+    )
+    def test_matches_full_size_detection(self, frame, method):
+        """Test refined regions equal those found on the full frame."""
+        full = detector(coarse_to_fine=False).detect_text_regions(frame, method)
+        coarse = detector().detect_text_regions(frame, method)
+
+        assert full
+        assert boxes(coarse) == boxes(full)
+
+    def test_small_frames_run_at_full_size(self, frame, monkeypatch):
+        """Test frames below coarse_min_pixels skip the pyramid."""
+        smart = detector(coarse_min_pixels=frame.shape[0] * frame.shape[1] + 1)
+        monkeypatch.setattr(smart, "_detect_coarse_to_fine", None)
+
+        assert smart.detect_text_regions(frame, DetectionMethod.EDGE_DETECTION)
+
+    def test_refinement_skips_tried_methods_to_fallback(self, frame, monkeypatch):
+        """Test a fallback is tried even if an earlier fallback was already used."""
+        smart = detector()
+        calls = []
+        region = TextRegion(1, 1, 10, 5, 0.9, 0.5, DetectionMethod.EDGE_DETECTION)
+
+        def detect(image, method, config=None, deadline=None):
+            calls.append(method)
+            return [region] if method == DetectionMethod.EDGE_DETECTION else []
+
+        monkeypatch.setattr(smart, "_detect_with_method", detect)
+
+        found = smart._refine_roi(
+            frame[:100, :200], [DetectionMethod.CONTOUR_BASED], time.time() + 60
+        )
+
+        assert calls == [DetectionMethod.CONTOUR_BASED, DetectionMethod.EDGE_DETECTION]
+        assert found == [region]
+
+    def test_time_budget_returns_coarse_candidates(self, frame):
+        """Test an exhausted budget returns upscaled coarse regions uncached."""
+        smart = detector(max_processing_time=0.0, enable_caching=True)
+
+        regions = smart.detect_text_regions(frame, DetectionMethod.EDGE_DETECTION)
+
+        assert regions
+        assert all(region.x + region.width <= frame.shape[1] for region in regions)
+        assert smart.budget_overruns == 1
+        assert smart.get_detection_stats()["cache_size"] == 0
+
+
+class TestDetectionCaching:
+    """Test the detector's fingerprint cache."""
+
+    def test_near_duplicate_frame_reuses_regions(self, frame):
+        """Test a slightly changed frame is served from the cache."""
+        smart = detector(enable_caching=True)
+        regions = smart.detect_text_regions(frame, DetectionMethod.EDGE_DETECTION)
+        changed = frame.copy()
+        changed[10:30, 10:14] = 0  # Cursor
+
+        assert smart.detect_text_regions(changed, DetectionMethod.EDGE_DETECTION) == regions
+        assert len(smart.detection_times) == 1
+        assert smart.get_detection_stats()["cache"]["near_hits"] == 1
+
+    def test_cache_is_per_method(self, frame):
+        """Test results of one method are not returned for another."""
+        smart = detector(enable_caching=True)
+        smart.detect_text_regions(frame, DetectionMethod.EDGE_DETECTION)
+        smart.detect_text_regions(frame, DetectionMethod.CONTOUR_BASED)
+
+        assert len(smart.detection_times) == 2
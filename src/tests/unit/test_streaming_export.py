@@ -0,0 +1,270 @@
+"""
+Unit tests for streaming exporters.
+"""
+
+import csv
+import json
+import threading
+import tracemalloc
+import zipfile
+from datetime import datetime
+from xml.etree import ElementTree
+
+import pytest
+
+from src.models.translation import Translation
+from src.utils.export_manager import ExportManager
+from src.utils.streaming_export import (
+    ExportCancelledError,
+    StreamingWriter,
+    get_stream_writer,
+    translation_record,
+)
+
+
+def make_translations(count):
+    """Generate translations lazily (no len())."""
+    for i in range(count):
+        yield Translation(
+            original_text=f"Hello <{i}> & \"friends\"",
+            translated_text=f"Привет {i}",
+            source_language="en",
+            target_language="ru",
+            timestamp=datetime(2024, 1, 1, 12, 30, 0),
+            confidence=90.0 if i % 2 else None,
+        )
+
+
+class TestStreamingWriters:
+    """Test format output of the streaming writers."""
+
+    def test_json_roundtrip(self, tmp_path):
+        """Test JSON output is valid and keeps export_info with the final count."""
+        path = tmp_path / "history.json"
+
+        count = get_stream_writer("json", chunk_size=3).write(make_translations(7), str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert count == 7
+        assert data["export_info"]["count"] == 7
+        assert data["export_info"]["format"] == "json"
+        assert len(data["translations"]) == 7
+        assert data["translations"][1]["translated_text"] == "Привет 1"
+
+    def test_json_empty_and_extra_keys(self, tmp_path):
+        """Test empty exports and extra top-level keys stay valid JSON."""
+        path = tmp_path / "empty.json"
+
+        get_stream_writer("json").write([], str(path), extra={"batch_job": {"id": "b1"}})
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data["translations"] == []
+        assert data["batch_job"] == {"id": "b1"}
+
+    def test_json_bare_array(self, tmp_path):
+        """Test array_key=None writes a plain list of records."""
+        path = tmp_path / "areas.json"
+
+        get_stream_writer("json", array_key=None, record_factory=dict).write(
+            [{"area_id": 1}, {"area_id": 2}], str(path)
+        )
+
+        assert json.loads(path.read_text(encoding="utf-8")) == [{"area_id": 1}, {"area_id": 2}]
+
+    def test_ndjson_lines(self, tmp_path):
+        """Test NDJSON writes one parseable record per line."""
+        path = tmp_path / "history.ndjson"
+
+        get_stream_writer("ndjson", chunk_size=2).write(make_translations(5), str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 5
+        assert json.loads(lines[4])["original_text"] == 'Hello <4> & "friends"'
+
+    def test_csv_quoting(self, tmp_path):
+        """Test CSV header and quoting of special characters."""
+        path = tmp_path / "history.csv"
+
+        get_stream_writer("csv", chunk_size=2).write(make_translations(3), str(path))
+
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0][0] == "Timestamp"
+        assert rows[1][1] == 'Hello <0> & "friends"'
+        assert rows[1][5] == ""
+        assert len(rows) == 4
+
+    def test_xml_is_well_formed(self, tmp_path):
+        """Test XML escapes text and puts metadata after the records."""
+        path = tmp_path / "history.xml"
+
+        get_stream_writer("xml", chunk_size=2).write(make_translations(3), str(path))
+
+        root = ElementTree.parse(path).getroot()
+        assert root.find("metadata/count").text == "3"
+        originals = [e.text for e in root.iter("original_text")]
+        assert originals[2] == 'Hello <2> & "friends"'
+
+    def test_html_escapes_text(self, tmp_path):
+        """Test HTML output escapes user text."""
+        path = tmp_path / "history.html"
+
+        get_stream_writer("html").write(make_translations(2), str(path))
+
+        content = path.read_text(encoding="utf-8")
+        assert "Hello &lt;1&gt; &amp; &quot;friends&quot;" in content
+        assert "Total translations: 2" in content
+        assert content.rstrip().endswith("</html>")
+
+    def test_xlsx_package(self, tmp_path):
+        """Test XLSX output is a valid package with the sheet rows."""
+        path = tmp_path / "history.xlsx"
+
+        get_stream_writer("xlsx").write(make_translations(2), str(path))
+
+        with zipfile.ZipFile(path) as archive:
+            assert "xl/workbook.xml" in archive.namelist()
+            sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+        ns = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        assert len(sheet.findall("s:sheetData/s:row", ns)) == 3
+
+    def test_writer_requires_record_renderer(self):
+        """Test StreamingWriter is abstract."""
+        with pytest.raises(TypeError):
+            StreamingWriter()
+
+    def test_domain_entity_record(self):
+        """Test domain Translation entities are converted to flat records."""
+        from src.domain.entities.translation import Translation as TranslationEntity
+        from src.domain.value_objects.language import Language, LanguagePair
+        from src.domain.value_objects.text import Text, TranslatedText
+
+        entity = TranslationEntity(
+            original=Text("Hello"),
+            translated=TranslatedText("Привет", confidence=0.9),
+            language_pair=LanguagePair(Language("en"), Language("ru")),
+        )
+
+        record = translation_record(entity)
+
+        assert record["original_text"] == "Hello"
+        assert record["target_language"] == "ru"
+        assert record["confidence"] == 0.9
+
+
+class TestStreamingControl:
+    """Test progress, cancellation and memory behaviour."""
+
+    def test_progress_per_chunk(self, tmp_path):
+        """Test progress is reported after every chunk."""
+        calls = []
+        writer = get_stream_writer(
+            "csv", chunk_size=4, progress_callback=lambda done, total: calls.append((done, total))
+        )
+
+        writer.write(list(make_translations(10)), str(tmp_path / "out.csv"))
+
+        assert calls == [(4, 10), (8, 10), (10, 10)]
+
+    def test_cancel_keeps_existing_file(self, tmp_path):
+        """Test cancellation removes partial output and leaves the old file intact."""
+        path = tmp_path / "history.json"
+        path.write_text("previous export", encoding="utf-8")
+        cancel = threading.Event()
+        writer = get_stream_writer(
+            "json", chunk_size=5, progress_callback=lambda done, total: cancel.set()
+        )
+        writer.cancel_event = cancel
+
+        with pytest.raises(ExportCancelledError):
+            writer.write(make_translations(50), str(path))
+
+        assert path.read_text(encoding="utf-8") == "previous export"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_peak_memory_independent_of_size(self, tmp_path):
+        """Test streaming a large generator keeps memory bounded by the chunk size."""
+        tracemalloc.start()
+        try:
+            get_stream_writer("json", chunk_size=200).write(
+                make_translations(20000), str(tmp_path / "large.json")
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert (tmp_path / "large.json").stat().st_size > 2_000_000
+        assert peak < 1_000_000
+
+
+class TestExportManagerStreaming:
+    """Test ExportManager on top of streaming writers."""
+
+    def test_export_generator(self, tmp_path):
+        """Test export_translations accepts iterators."""
+        manager = ExportManager(chunk_size=10)
+        path = tmp_path / "history.ndjson"
+
+        assert manager.export_translations(make_translations(25), str(path), "ndjson")
+
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 25
+
+    def test_export_cancelled_returns_false(self, tmp_path):
+        """Test cancelled exports report failure without leaving files."""
+        cancel = threading.Event()
+        cancel.set()
+        path = tmp_path / "history.csv"
+
+        result = ExportManager().export_translations(
+            make_translations(5), str(path), "csv", cancel_event=cancel
+        )
+
+        assert result is False
+        assert not path.exists()
+
+    def test_export_repository(self, tmp_path):
+        """Test a repository history is streamed via iter_all()."""
+        import asyncio
+
+        from src.domain.entities.translation import Translation as TranslationEntity
+        from src.domain.value_objects.language import Language, LanguagePair
+        from src.domain.value_objects.text import Text, TranslatedText
+        from src.infrastructure.repositories.translation_repository import (
+            JsonTranslationRepository,
+        )
+
+        repository = JsonTranslationRepository(tmp_path / "store")
+        for word in ("one", "two"):
+            entity = TranslationEntity(
+                original=Text(word),
+                translated=TranslatedText(word.upper()),
+                language_pair=LanguagePair(Language("en"), Language("ru")),
+            )
+            asyncio.run(repository.save(entity))
+        path = tmp_path / "history.json"
+
+        assert ExportManager().export_repository(repository, str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert [t["original_text"] for t in data["translations"]] == ["one", "two"]
+
+    def test_export_file_repository(self, tmp_path):
+        """Test the application repository streams its history via iter_all()."""
+        import asyncio
+
+        from src.repositories import FileTranslationRepository
+
+        repository = FileTranslationRepository(str(tmp_path / "store"))
+        for translation in make_translations(3):
+            asyncio.run(repository.save(translation))
+        progress = []
+        path = tmp_path / "history.csv"
+
+        assert ExportManager(chunk_size=2).export_repository(
+            repository, str(path), "csv", progress_callback=lambda *args: progress.append(args)
+        )
+
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert [row[2] for row in rows[1:]] == ["Привет 0", "Привет 1", "Привет 2"]
+        assert progress == [(2, None), (3, None)]
@@ -1,11 +1,18 @@
 """Unit tests for task queue module"""
 
+import threading
 import time
 from unittest.mock import MagicMock
 
 import pytest
 
-from src.services.task_queue import TaskPriority, TaskQueue
+from src.services.task_queue import (
+    TaskExpiredError,
+    TaskLane,
+    TaskPriority,
+    TaskQueue,
+    TaskStatus,
+)
 
 
 class TestTaskQueue:
@@ -86,3 +93,294 @@ class TestTaskQueue:
 
         # Should handle multiple stops gracefully
         task_queue.stop(wait=False)
+
+
+class TestTaskQueueFutures:
+    """Test futures, waiting, retention and micro-batching"""
+
+    @pytest.fixture
+    def running_queue(self):
+        """Create a started task queue"""
+        task_queue = TaskQueue(num_workers=2)
+        task_queue.start()
+        yield task_queue
+        task_queue.stop(wait=True, timeout=1.0)
+
+    def test_future_result(self, running_queue):
+        """Test submit_future returns a concurrent.futures.Future"""
+        future = running_queue.submit_future(lambda x: x * 2, args=(21,))
+
+        assert future.result(timeout=1.0) == 42
+        assert running_queue.get_task_status(future.task_id) == TaskStatus.COMPLETED
+
+    def test_wait_for_task_wakes_immediately(self, running_queue):
+        """Test waiting does not add polling latency"""
+        task_id = running_queue.submit(lambda: "done")
+
+        start = time.perf_counter()
+        assert running_queue.wait_for_task(task_id, timeout=1.0) is True
+        assert time.perf_counter() - start < 0.05
+        assert running_queue.get_task_result(task_id) == "done"
+
+    def test_failed_task(self, running_queue):
+        """Test failures propagate to the future and wait_for_task"""
+
+        def failing():
+            raise RuntimeError("boom")
+
+        future = running_queue.submit_future(failing)
+
+        with pytest.raises(RuntimeError):
+            future.result(timeout=1.0)
+        assert running_queue.wait_for_task(future.task_id, timeout=1.0) is False
+        assert running_queue.get_stats()["failed"] == 1
+
+    def test_priority_order_and_lazy_cancellation(self):
+        """Test higher priorities run first and cancelled tasks are skipped"""
+        task_queue = TaskQueue(num_workers=1, interactive_workers=0)
+        order = []
+
+        low = task_queue.submit(order.append, args=("low",), priority=TaskPriority.LOW)
+        cancelled = task_queue.submit(order.append, args=("cancelled",))
+        high = task_queue.submit(order.append, args=("high",), priority=TaskPriority.HIGH)
+
+        assert task_queue.cancel(cancelled) is True
+        assert task_queue.get_queue_size() == 2
+        assert task_queue.get_stats()["pending"] == 2
+
+        task_queue.start()
+        try:
+            assert task_queue.wait_for_task(low, timeout=1.0)
+            assert task_queue.wait_for_task(high, timeout=1.0)
+        finally:
+            task_queue.stop()
+
+        assert order == ["high", "low"]
+        assert task_queue.get_task_status(cancelled) == TaskStatus.CANCELLED
+        assert task_queue.get_stats()["cancelled"] == 1
+
+    def test_future_cancel(self):
+        """Test cancelling through the future updates the task"""
+        task_queue = TaskQueue(num_workers=1)
+        future = task_queue.submit_future(lambda: None)
+
+        assert future.cancel() is True
+        assert task_queue.get_task_status(future.task_id) == TaskStatus.CANCELLED
+        assert task_queue.get_queue_size() == 0
+
+    def test_bounded_retention(self, running_queue):
+        """Test finished tasks beyond the retention limit are forgotten"""
+        running_queue.max_retained_tasks = 5
+        futures = [running_queue.submit_future(lambda i=i: i) for i in range(20)]
+        for future in futures:
+            future.result(timeout=1.0)
+
+        stats = running_queue.get_stats()
+        assert stats["completed"] == 20
+        assert stats["retained_tasks"] == 5
+        assert running_queue.get_task_status(futures[0].task_id) is None
+
+    def test_micro_batching(self):
+        """Test same-named tasks are grouped into one batched call"""
+        task_queue = TaskQueue(num_workers=1)
+        calls = []
+
+        def translate_batch(items):
+            calls.append(len(items))
+            return [text.upper() for (text,) in items]
+
+        task_queue.register_batch_handler("translate", translate_batch, window=0.05)
+        futures = [
+            task_queue.submit_future(str.upper, args=(word,), name="translate")
+            for word in ("one", "two", "three")
+        ]
+
+        task_queue.start()
+        try:
+            assert [f.result(timeout=1.0) for f in futures] == ["ONE", "TWO", "THREE"]
+        finally:
+            task_queue.stop()
+
+        assert calls == [3]
+        assert task_queue.get_stats()["batches"] == 1
+
+    def test_batch_handler_result_mismatch(self):
+        """Test a batch handler returning the wrong number of results fails all tasks"""
+        task_queue = TaskQueue(num_workers=1)
+        task_queue.register_batch_handler("translate", lambda items: [], window=0.01)
+        futures = [
+            task_queue.submit_future(str.upper, args=(word,), name="translate")
+            for word in ("one", "two")
+        ]
+
+        task_queue.start()
+        try:
+            for future in futures:
+                with pytest.raises(ValueError):
+                    future.result(timeout=1.0)
+        finally:
+            task_queue.stop()
+
+
+class TestTaskQueueLanes:
+    """Test lanes, reserved workers, deadlines and fair sharing"""
+
+    def test_interactive_not_starved_by_batch(self):
+        """Test reserved workers run interactive tasks while batch work occupies the rest"""
+        task_queue = TaskQueue(num_workers=1, interactive_workers=1)
+        release = threading.Event()
+        task_queue.start()
+        try:
+            blocker = task_queue.submit_future(release.wait, args=(5,), lane=TaskLane.BATCH)
+            for _ in range(5):
+                task_queue.submit(release.wait, args=(5,), lane=TaskLane.BATCH)
+
+            future = task_queue.submit_future(lambda: "hotkey", priority=TaskPriority.HIGH)
+
+            assert future.result(timeout=1.0) == "hotkey"
+            assert not blocker.done()
+        finally:
+            release.set()
+            task_queue.stop()
+
+    def test_default_lanes_from_priority(self):
+        """Test submit() without a lane picks one from the priority"""
+        task_queue = TaskQueue(num_workers=1)
+        task_queue.submit(lambda: None, priority=TaskPriority.HIGH)
+        task_queue.submit(lambda: None)
+        task_queue.submit(lambda: None, priority=TaskPriority.LOW)
+
+        assert task_queue.get_stats()["lanes"] == {
+            "interactive": 1,
+            "batch": 1,
+            "background": 1,
+        }
+
+    def test_expired_interactive_task_dropped(self):
+        """Test interactive tasks past their deadline fail without running"""
+        task_queue = TaskQueue(num_workers=1, interactive_workers=0)
+        ran = []
+        errors = []
+
+        future = task_queue.submit_future(
+            ran.append,
+            args=("late",),
+            lane=TaskLane.INTERACTIVE,
+            deadline=0.01,
+            error_callback=errors.append,
+        )
+        time.sleep(0.05)
+
+        task_queue.start()
+        try:
+            with pytest.raises(TaskExpiredError):
+                future.result(timeout=1.0)
+        finally:
+            task_queue.stop()
+
+        assert ran == []
+        assert isinstance(errors[0], TaskExpiredError)
+        assert task_queue.get_task_status(future.task_id) == TaskStatus.EXPIRED
+        assert task_queue.get_stats()["expired"] == 1
+
+    def test_deadline_orders_within_priority(self):
+        """Test earlier deadlines run first among equal priorities"""
+        task_queue = TaskQueue(num_workers=1, interactive_workers=0)
+        order = []
+
+        task_queue.submit(order.append, args=("later",), deadline=60)
+        task_queue.submit(order.append, args=("none",))
+        last = task_queue.submit(order.append, args=("sooner",), deadline=30)
+
+        task_queue.start()
+        try:
+            task_queue.wait_for_task(last, timeout=1.0)
+            time.sleep(0.05)
+        finally:
+            task_queue.stop()
+
+        assert order == ["sooner", "later", "none"]
+
+    def test_batch_groups_share_fairly(self):
+        """Test groups in the batch lane are served round-robin"""
+        task_queue = TaskQueue(num_workers=1, interactive_workers=0)
+        order = []
+
+        for i in range(3):
+            task_queue.submit(order.append, args=(f"a{i}",), group="job-a")
+        for i in range(3):
+            task_queue.submit(order.append, args=(f"b{i}",), group="job-b")
+
+        task_queue.start()
+        try:
+            deadline = time.monotonic() + 2.0
+            while task_queue.get_stats()["completed"] < 6 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            task_queue.stop()
+
+        assert order == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+    def test_batch_collects_only_first_task_lane(self):
+        """Test a reserved worker's batch leaves other lanes' tasks queued"""
+        task_queue = TaskQueue(num_workers=0, interactive_workers=1)
+        calls = []
+
+        def translate_batch(items):
+            calls.append(len(items))
+            return [text.upper() for (text,) in items]
+
+        task_queue.register_batch_handler("translate", translate_batch, window=0.01)
+        bulk = [
+            task_queue.submit_future(str.upper, args=(word,), name="translate")
+            for word in ("one", "two")
+        ]
+        hotkeys = [
+            task_queue.submit_future(
+                str.upper, args=(word,), name="translate", lane=TaskLane.INTERACTIVE
+            )
+            for word in ("three", "four")
+        ]
+
+        task_queue.start()
+        try:
+            assert [f.result(timeout=1.0) for f in hotkeys] == ["THREE", "FOUR"]
+            time.sleep(0.05)
+        finally:
+            task_queue.stop()
+
+        assert calls == [2]
+        assert not any(future.done() for future in bulk)
+        assert task_queue.get_stats()["lanes"]["batch"] == 2
+
+    def test_batch_drops_expired_interactive_tasks(self):
+        """Test expired interactive tasks are not run as part of a batch"""
+        task_queue = TaskQueue(num_workers=0, interactive_workers=1)
+        calls = []
+
+        def translate_batch(items):
+            calls.append([text for (text,) in items])
+            return [text.upper() for (text,) in items]
+
+        task_queue.register_batch_handler("translate", translate_batch, window=0.01)
+        fresh = [
+            task_queue.submit_future(
+                str.upper, args=(word,), name="translate", lane=TaskLane.INTERACTIVE
+            )
+            for word in ("one", "two")
+        ]
+        late = task_queue.submit_future(
+            str.upper, args=("late",), name="translate", lane=TaskLane.INTERACTIVE, deadline=0.01
+        )
+        time.sleep(0.05)
+
+        task_queue.start()
+        try:
+            assert [f.result(timeout=1.0) for f in fresh] == ["ONE", "TWO"]
+            with pytest.raises(TaskExpiredError):
+                late.result(timeout=1.0)
+        finally:
+            task_queue.stop()
+
+        assert calls == [["one", "two"]]
+        assert task_queue.get_stats()["expired"] == 1
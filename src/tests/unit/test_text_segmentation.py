@@ -0,0 +1,216 @@
+"""
+Unit tests for text segmentation and chunked translation.
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from src.services.chunked_translation import ChunkedTranslator
+from src.utils.text_segmentation import (
+    contains_cjk,
+    join_segments,
+    pack_chunks,
+    segment_text,
+    split_sentences,
+    unpack_chunks,
+)
+
+WORDS = ["alpha", "beta,", "gamma.", "日本語。", "x" * 30, "\n\n", "delta;", "？", "Hi! ", "。」"]
+
+
+def paragraphs(count, sentences=20):
+    """Build a text of numbered paragraphs."""
+    return "\n\n".join(
+        " ".join(f"Paragraph {p} sentence {s}." for s in range(sentences)) for p in range(count)
+    )
+
+
+class TestSegmentation:
+    """Test splitting text into chunks."""
+
+    @pytest.mark.parametrize("max_chars", [1, 5, 17, 100])
+    def test_roundtrip_and_limits(self, max_chars):
+        """Test chunks respect the limit and joining reproduces the text."""
+        rng = random.Random(max_chars)
+        for _ in range(200):
+            text = "".join(
+                rng.choice(WORDS) + rng.choice(["", " ", "\n"]) for _ in range(rng.randint(0, 40))
+            )
+
+            segments = segment_text(text, max_chars)
+
+            assert join_segments([s.text for s in segments], segments) == text
+            assert all(len(s.text) <= max_chars for s in segments)
+            assert all(s.text == s.text.strip() for s in segments)
+
+    def test_splits_at_sentence_boundaries(self):
+        """Test long paragraphs are packed from whole sentences."""
+        text = paragraphs(1, sentences=50)
+
+        segments = segment_text(text, 200)
+
+        assert len(segments) > 1
+        assert all(s.text.endswith(".") for s in segments)
+        assert all(len(s.text) <= 200 for s in segments)
+
+    def test_cjk_sentences(self):
+        """Test CJK terminators split sentences without following spaces."""
+        pieces = split_sentences("今日は晴れです。明日は雨でしょう！「本当？」はい")
+
+        assert [text for text, _ in pieces] == [
+            "今日は晴れです。",
+            "明日は雨でしょう！",
+            "「本当？」",
+            "はい",
+        ]
+        assert contains_cjk("今日は") and not contains_cjk("Hello.")
+
+    def test_lowercase_continuation_is_not_a_sentence_end(self):
+        """Test abbreviations followed by lowercase words stay in one sentence."""
+        pieces = split_sentences("See e.g. the manual. Then stop.")
+
+        assert [text for text, _ in pieces] == ["See e.g. the manual.", "Then stop."]
+
+    def test_editing_paragraph_keeps_other_chunks(self):
+        """Test chunks never span paragraphs."""
+        text = paragraphs(5)
+        edited = text.replace("Paragraph 2 sentence 3.", "Paragraph 2 was edited.")
+
+        before = [s.text for s in segment_text(text, 300)]
+        after = [s.text for s in segment_text(edited, 300)]
+
+        assert len(set(after) - set(before)) <= 2
+        assert all("Paragraph 2" in chunk for chunk in set(after) - set(before))
+
+    def test_pack_and_unpack_chunks(self):
+        """Test chunks are grouped within the limit and split back in order."""
+        chunks = ["a" * 4, "b" * 4, "c" * 4, "d" * 20]
+
+        groups = pack_chunks(chunks, 12)
+
+        assert groups == [["a" * 4, "b" * 4], ["c" * 4], ["d" * 20]]
+        assert unpack_chunks("AAAA\n\n \nBBBB\n", 2) == ["AAAA", "BBBB"]
+        assert unpack_chunks("AAAA BBBB", 2) is None
+
+
+class FakeBackend:
+    """Chunk translator recording calls and concurrency."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on = fail_on
+
+    async def __call__(self, text, target_language, source_language):
+        self.calls.append(text)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Finish in reverse order to check reassembly
+            await asyncio.sleep(0.001 * (100 - len(self.calls) % 100))
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError("backend error")
+            return text.upper()
+        finally:
+            self.in_flight -= 1
+
+
+class TestChunkedTranslator:
+    """Test concurrent chunk translation."""
+
+    def test_short_text_is_sent_whole(self):
+        """Test texts below the threshold are not split."""
+        backend = FakeBackend()
+        translator = ChunkedTranslator(backend, split_threshold=1000)
+
+        result = asyncio.run(translator.translate("Hello. World.", "ru", "en"))
+
+        assert result == "HELLO. WORLD."
+        assert backend.calls == ["Hello. World."]
+
+    def test_order_and_bounded_concurrency(self):
+        """Test chunks are reassembled in order with limited fan-out."""
+        backend = FakeBackend()
+        translator = ChunkedTranslator(
+            backend, max_chars=300, split_threshold=300, max_concurrency=3
+        )
+        text = paragraphs(8)
+
+        result = asyncio.run(translator.translate(text, "ru", "en"))
+
+        assert result == text.upper()
+        assert len(backend.calls) > 3
+        assert backend.max_in_flight == 3
+        assert all(len(chunk) <= 300 for chunk in backend.calls)
+
+    def test_edit_retranslates_only_changed_chunk(self):
+        """Test the per-chunk cache reuses unchanged paragraphs."""
+        backend = FakeBackend()
+        translator = ChunkedTranslator(backend, max_chars=2000, split_threshold=500)
+        text = paragraphs(4, sentences=10)
+        asyncio.run(translator.translate(text, "ru", "en"))
+        backend.calls.clear()
+
+        edited = text.replace("Paragraph 1 sentence 5.", "Paragraph 1 changed.")
+        result = asyncio.run(translator.translate(edited, "ru", "en"))
+        asyncio.run(translator.translate(edited, "de", "en"))
+
+        assert result == edited.upper()
+        assert len(backend.calls) == 2
+        assert "Paragraph 1 changed." in backend.calls[0]
+        assert translator.get_stats()["chunk_cache_hits"] == 3
+
+    def test_short_paragraphs_packed_into_one_request(self):
+        """Test many short chunks share a request but are cached one by one."""
+        backend = FakeBackend()
+        translator = ChunkedTranslator(backend)
+        text = "\n\n".join(f"Short paragraph number {i}." for i in range(60))
+
+        result = asyncio.run(translator.translate(text, "ru", "en"))
+        edited = text.replace("number 7.", "number seven.")
+        asyncio.run(translator.translate(edited, "ru", "en"))
+
+        assert len(text) > translator.split_threshold
+        assert result == text.upper()
+        assert backend.calls[1] == "Short paragraph number seven."
+        assert translator.get_stats()["requests_sent"] == 2
+        assert translator.get_stats()["chunks_translated"] == 61
+
+    def test_packed_request_falls_back_when_boundaries_lost(self):
+        """Test chunks are resent one by one if the translation merges paragraphs."""
+        calls = []
+
+        async def merging_backend(text, target_language, source_language):
+            calls.append(text)
+            return text.upper().replace("\n\n", " ")
+
+        translator = ChunkedTranslator(merging_backend, split_threshold=10)
+
+        result = asyncio.run(translator.translate("One.\n\nTwo.\n\nThree.", "ru", "en"))
+
+        assert result == "ONE.\n\nTWO.\n\nTHREE."
+        assert calls[0] == "One.\n\nTwo.\n\nThree."
+        assert sorted(calls[1:]) == ["One.", "Three.", "Two."]
+
+    def test_duplicate_chunks_translated_once(self):
+        """Test identical paragraphs are sent once."""
+        backend = FakeBackend()
+        translator = ChunkedTranslator(backend, split_threshold=10)
+
+        result = asyncio.run(translator.translate("Same text.\n\nSame text.", "ru", "en"))
+
+        assert result == "SAME TEXT.\n\nSAME TEXT."
+        assert backend.calls == ["Same text."]
+
+    def test_chunk_failure_propagates(self):
+        """Test a failed chunk fails the whole translation and is not cached."""
+        backend = FakeBackend(fail_on="Paragraph 2")
+        translator = ChunkedTranslator(backend, max_chars=500, split_threshold=500)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(translator.translate(paragraphs(3), "ru", "en"))
+
+        assert translator.get_stats()["cached_chunks"] == 0
@@ -0,0 +1,223 @@
+"""
+Unit tests for the columnar translation archive.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models.translation import Translation
+from src.services.translation_cache import TranslationCache
+from src.utils.export_manager import ExportManager
+from src.utils.translation_archive import (
+    TRANSLATION_SCHEMA,
+    ArchiveError,
+    ArchiveReader,
+    ArchiveWriter,
+    Codec,
+    ColumnType,
+    is_archive,
+)
+
+BASE_TIME = datetime(2024, 5, 1, 10, 0, 0, 123456)
+
+
+def make_records(count):
+    """Create flat translation records."""
+    return [
+        {
+            "timestamp": BASE_TIME + timedelta(seconds=i * 7),
+            "original_text": f"Hello world {i} ✓",
+            "translated_text": f"Привет мир {i}",
+            "source_language": "en",
+            "target_language": ("ru", "de", "fr")[i % 3],
+            "confidence": None if i % 4 == 0 else i / 10,
+        }
+        for i in range(count)
+    ]
+
+
+class TestArchiveFormat:
+    """Test writing and reading archives."""
+
+    @pytest.mark.parametrize("codec", [Codec.NONE, Codec.ZLIB, Codec.LZMA])
+    def test_roundtrip(self, tmp_path, codec):
+        """Test records survive a roundtrip with every codec."""
+        path = tmp_path / "history.stra"
+        records = make_records(25)
+
+        with ArchiveWriter(str(path), block_size=10, codec=codec) as writer:
+            writer.write_many(records)
+
+        with ArchiveReader(str(path)) as reader:
+            assert len(reader) == 25
+            assert reader.block_count == 3
+            assert list(reader.iter_records()) == records
+
+    def test_random_access(self, tmp_path):
+        """Test get() and read_block() address single blocks."""
+        path = tmp_path / "history.stra"
+        records = make_records(50)
+        with ArchiveWriter(str(path), block_size=8) as writer:
+            writer.write_many(records)
+
+        with ArchiveReader(str(path)) as reader:
+            assert reader.get(0) == records[0]
+            assert reader.get(37) == records[37]
+            assert reader.read_block(6) == records[48:]
+            with pytest.raises(IndexError):
+                reader.get(50)
+
+    def test_column_projection(self, tmp_path):
+        """Test reading only selected columns."""
+        path = tmp_path / "history.stra"
+        with ArchiveWriter(str(path), block_size=4) as writer:
+            writer.write_many(make_records(6))
+
+        with ArchiveReader(str(path)) as reader:
+            columns = reader.read_columns(1, ["target_language"])
+            records = list(reader.iter_records(["source_language"]))
+
+        assert columns == {"target_language": ["de", "fr"]}
+        assert records[0] == {"source_language": "en"}
+
+    def test_custom_schema_and_metadata(self, tmp_path):
+        """Test other column types and header metadata."""
+        path = tmp_path / "custom.stra"
+        schema = (("id", ColumnType.STRING), ("hits", ColumnType.INT), ("ok", ColumnType.BOOL))
+        rows = [{"id": "a", "hits": -3, "ok": True}, {"id": None, "hits": None, "ok": None}]
+
+        with ArchiveWriter(str(path), schema, metadata={"ttl": 60}) as writer:
+            writer.write_many(rows)
+
+        with ArchiveReader(str(path)) as reader:
+            assert reader.metadata == {"ttl": 60}
+            assert list(reader.iter_records()) == rows
+
+    def test_smaller_than_json(self, tmp_path):
+        """Test the archive is much smaller than indented JSON."""
+        records = make_records(2000)
+        json_path = tmp_path / "history.json"
+        json_path.write_text(json.dumps(records, indent=2, default=str), encoding="utf-8")
+        archive_path = tmp_path / "history.stra"
+
+        with ArchiveWriter(str(archive_path), TRANSLATION_SCHEMA) as writer:
+            writer.write_many(records)
+
+        assert archive_path.stat().st_size * 5 < json_path.stat().st_size
+
+    def test_failed_write_keeps_no_file(self, tmp_path):
+        """Test an exception inside the writer discards the partial archive."""
+        path = tmp_path / "broken.stra"
+
+        with pytest.raises(RuntimeError):
+            with ArchiveWriter(str(path)) as writer:
+                writer.write_many(make_records(3))
+                raise RuntimeError("interrupted")
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejects_invalid_files(self, tmp_path):
+        """Test non-archives and truncated archives are rejected."""
+        not_archive = tmp_path / "plain.json"
+        not_archive.write_text("[]", encoding="utf-8")
+        truncated = tmp_path / "truncated.stra"
+        with ArchiveWriter(str(truncated)) as writer:
+            writer.write_many(make_records(3))
+        truncated.write_bytes(truncated.read_bytes()[:-2])
+
+        assert not is_archive(str(not_archive))
+        with pytest.raises(ArchiveError):
+            ArchiveReader(str(not_archive))
+        with pytest.raises(ArchiveError):
+            ArchiveReader(str(truncated))
+
+
+class TestArchiveIntegration:
+    """Test archive support in ExportManager, repositories and TranslationCache."""
+
+    def test_export_manager_archive(self, tmp_path):
+        """Test ExportManager writes archives readable by ArchiveReader."""
+        translations = [
+            Translation("Hello", "Привет", "en", "ru", timestamp=BASE_TIME, confidence=0.5)
+        ]
+        path = tmp_path / "history.stra"
+
+        assert ExportManager().export_translations(translations, str(path), "archive")
+
+        with ArchiveReader(str(path)) as reader:
+            assert reader.get(0)["translated_text"] == "Привет"
+            assert reader.get(0)["timestamp"] == BASE_TIME
+        assert ExportManager().suggest_filename("history", "archive", False) == "history.stra"
+
+    def test_translation_cache_archive(self, tmp_path):
+        """Test TranslationCache saves to and loads from .stra files."""
+        cache = TranslationCache()
+        cache.add("Hello", "Привет", "en", "ru")
+        cache.add("World", "Мир", "en", "ru")
+        path = str(tmp_path / "cache.stra")
+
+        cache.save_to_file(path)
+        restored = TranslationCache()
+
+        assert is_archive(path)
+        assert restored.load_from_file(path) == 2
+        assert restored.get("World", "en", "ru") == "Мир"
+
+    def test_translation_cache_archive_while_adding(self, tmp_path):
+        """Test saving takes a consistent snapshot while other threads add entries."""
+        cache = TranslationCache(max_size=500)
+        for i in range(500):
+            cache.add(f"text {i}", f"текст {i}", "en", "ru")
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                cache.add(f"new {i}", "новый", "en", "ru")
+                i += 1
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for n in range(20):
+                cache.save_to_file(str(tmp_path / f"cache{n}.stra"))
+        finally:
+            stop.set()
+            thread.join()
+
+        for n in range(20):
+            assert TranslationCache(max_size=500).load_from_file(
+                str(tmp_path / f"cache{n}.stra")
+            ) == 500
+
+    def test_repository_archive(self, tmp_path):
+        """Test a repository history roundtrips through an archive."""
+        import asyncio
+
+        from src.domain.entities.translation import Translation as TranslationEntity
+        from src.domain.value_objects.language import Language, LanguagePair
+        from src.domain.value_objects.text import Text, TranslatedText
+        from src.infrastructure.repositories.translation_repository import (
+            JsonTranslationRepository,
+        )
+
+        repository = JsonTranslationRepository(tmp_path / "store")
+        entity = TranslationEntity(
+            original=Text("Hello"),
+            translated=TranslatedText("Привет", confidence=0.8),
+            language_pair=LanguagePair(Language("en"), Language("ru")),
+            duration_ms=12.5,
+        )
+        asyncio.run(repository.save(entity))
+
+        assert repository.save_archive() == 1
+        restored = list(repository.iter_archive())
+
+        assert len(restored) == 1
+        assert str(restored[0].id) == str(entity.id)
+        assert restored[0].translated.content == "Привет"
+        assert restored[0].duration_ms == 12.5
+        assert restored[0].timestamp == entity.timestamp
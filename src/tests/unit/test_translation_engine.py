@@ -43,6 +43,15 @@ class MockTranslationEngine(TranslationEngine):
         return self.available
 
 
+def make_processor():
+    """Create a TranslationProcessor without engines or translation memory"""
+    processor = TranslationProcessor.__new__(TranslationProcessor)
+    processor.fuzzy_threshold = None
+    processor.memory_path = None
+    processor.memory = None
+    return processor
+
+
 class TestTranslationEngine:
     """Test abstract TranslationEngine base class"""
 
@@ -277,7 +286,7 @@ class TestTranslationProcessor:
         available_engine = MockTranslationEngine(available=True)
         unavailable_engine = MockTranslationEngine(available=False)
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.engines = [unavailable_engine, available_engine]
 
         result = processor._get_available_engine()
@@ -289,7 +298,7 @@ class TestTranslationProcessor:
         engine1 = MockTranslationEngine(available=False)
         engine2 = MockTranslationEngine(available=False)
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.engines = [engine1, engine2]
 
         result = processor._get_available_engine()
@@ -301,7 +310,7 @@ class TestTranslationProcessor:
         """Test translate_text when no engine is available"""
         mock_time.return_value = 1000.0
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = None
         processor.cache = None
 
@@ -314,7 +323,7 @@ class TestTranslationProcessor:
         """Test translate_text with empty text"""
         mock_time.return_value = 1000.0
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = MockTranslationEngine()
         processor.cache = None
 
@@ -342,7 +351,7 @@ class TestTranslationProcessor:
         mock_cache = Mock()
         mock_cache.get.return_value = cached_translation
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = MockTranslationEngine()
         processor.cache = mock_cache
 
@@ -366,7 +375,7 @@ class TestTranslationProcessor:
         mock_cache = Mock()
         mock_cache.get.return_value = None  # No cache hit
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
         processor.cache = mock_cache
 
@@ -389,7 +398,7 @@ class TestTranslationProcessor:
         mock_engine = Mock()
         mock_engine.translate.return_value = "Привет"
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
         processor.cache = None
 
@@ -411,7 +420,7 @@ class TestTranslationProcessor:
         mock_engine = Mock()
         mock_engine.translate.return_value = None
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
         processor.cache = None
 
@@ -428,7 +437,7 @@ class TestTranslationProcessor:
         mock_engine = Mock()
         mock_engine.translate.side_effect = Exception("Translation failed")
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
         processor.cache = None
 
@@ -441,7 +450,7 @@ class TestTranslationProcessor:
         mock_engine = Mock()
         mock_engine.get_supported_languages.return_value = ["en", "ru", "ja"]
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
 
         result = processor.get_supported_languages()
@@ -450,7 +459,7 @@ class TestTranslationProcessor:
 
     def test_get_supported_languages_no_engine(self):
         """Test get_supported_languages without active engine"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = None
 
         result = processor.get_supported_languages()
@@ -459,14 +468,14 @@ class TestTranslationProcessor:
 
     def test_is_available_with_engine(self):
         """Test is_available with active engine"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = Mock()
 
         assert processor.is_available() is True
 
     def test_is_available_no_engine(self):
         """Test is_available without active engine"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = None
 
         assert processor.is_available() is False
@@ -475,7 +484,7 @@ class TestTranslationProcessor:
         """Test clear_cache when cache exists"""
         mock_cache = Mock()
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = mock_cache
 
         result = processor.clear_cache()
@@ -485,7 +494,7 @@ class TestTranslationProcessor:
 
     def test_clear_cache_no_cache(self):
         """Test clear_cache when cache doesn't exist"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = None
 
         result = processor.clear_cache()
@@ -497,7 +506,7 @@ class TestTranslationProcessor:
         mock_cache = Mock()
         mock_cache.get_stats.return_value = {"hits": 10, "misses": 5}
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = mock_cache
 
         result = processor.get_cache_stats()
@@ -506,7 +515,7 @@ class TestTranslationProcessor:
 
     def test_get_cache_stats_no_cache(self):
         """Test get_cache_stats when cache doesn't exist"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = None
 
         result = processor.get_cache_stats()
@@ -519,7 +528,7 @@ class TestTranslationProcessor:
         mock_cache = Mock()
         mock_cache_class.return_value = mock_cache
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = None
         processor.cache_enabled = False
 
@@ -532,7 +541,7 @@ class TestTranslationProcessor:
         """Test enable_cache to disable caching"""
         mock_cache = Mock()
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = mock_cache
         processor.cache_enabled = True
 
@@ -545,7 +554,7 @@ class TestTranslationProcessor:
         """Test enable_cache when already enabled"""
         mock_cache = Mock()
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.cache = mock_cache
         processor.cache_enabled = True
 
@@ -563,7 +572,7 @@ class TestTranslationProcessor:
         # Set mock engine class name
         mock_engine.__class__.__name__ = "MockEngine"
 
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = mock_engine
         processor.cache_enabled = True
 
@@ -576,7 +585,7 @@ class TestTranslationProcessor:
 
     def test_get_engine_info_no_engine(self):
         """Test get_engine_info without active engine"""
-        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor = make_processor()
         processor.active_engine = None
 
         result = processor.get_engine_info()
@@ -0,0 +1,241 @@
+"""
+Unit tests for the sentence-level translation memory.
+"""
+
+import random
+import string
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.translation_engine import TranslationProcessor
+from src.services.translation_memory import (
+    TranslationMemory,
+    bounded_edit_distance,
+    normalize,
+)
+
+
+def levenshtein(a, b):
+    """Reference edit distance."""
+    previous = list(range(len(b) + 1))
+    for i, char in enumerate(a, 1):
+        current = [i]
+        for j, other in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[-1] + 1, previous[j - 1] + (char != other)))
+        previous = current
+    return previous[-1]
+
+
+@pytest.fixture
+def memory():
+    memory = TranslationMemory(fuzzy_threshold=0.9)
+    memory.add("You have 5 coins left.", "У вас осталось 5 монет.", "en", "ru")
+    memory.add(
+        "Welcome back, traveler! The gate is closed.",
+        "С возвращением, путник! Ворота закрыты.",
+        "en",
+        "ru",
+    )
+    return memory
+
+
+class TestEditDistance:
+    """Test the bounded edit distance."""
+
+    def test_matches_reference(self):
+        """Test results agree with full Levenshtein within the bound."""
+        rng = random.Random(3)
+        for _ in range(500):
+            a = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            b = "".join(rng.choice("abc") for _ in range(rng.randint(0, 12)))
+            bound = rng.randint(0, 6)
+
+            expected = levenshtein(a, b)
+
+            assert bounded_edit_distance(a, b, bound) == (expected if expected <= bound else None)
+
+
+class TestTranslationMemory:
+    """Test lookup tiers."""
+
+    def test_exact_match_is_normalized(self, memory):
+        """Test case and whitespace differences still match exactly."""
+        match = memory.lookup("welcome back,   TRAVELER!", "ru", "en")
+
+        assert match.kind == "exact"
+        assert match.translated_text == "С возвращением, путник!"
+        assert normalize(" A　b ") == "a b"
+
+    def test_numbers_are_substituted(self, memory):
+        """Test a sentence differing in numbers reuses the stored translation."""
+        match = memory.lookup("You have 12 coins left.", "ru", "en")
+
+        assert match.kind == "template"
+        assert match.translated_text == "У вас осталось 12 монет."
+
+    def test_fuzzy_match_respects_threshold(self, memory):
+        """Test near matches are served only above the threshold."""
+        close = memory.lookup("Welcome back, traveller!", "ru", "en")
+        other_name = memory.lookup("Welcome back, Mary!", "ru", "en")
+        strict = memory.lookup("Welcome back, traveller!", "ru", "en", fuzzy_threshold=0.99)
+
+        assert close.kind == "fuzzy" and 0.9 <= close.score < 1
+        assert close.suggestion
+        assert other_name is None
+        assert strict is None
+
+    def test_fuzzy_matching_is_opt_in(self):
+        """Test a memory without a threshold serves exact and template matches only."""
+        memory = TranslationMemory()
+        memory.add("Welcome back, traveler!", "С возвращением, путник!", "en", "ru")
+
+        assert memory.lookup("Welcome back, traveller!", "ru", "en") is None
+        assert not memory.lookup("Welcome back, traveler!", "ru", "en").suggestion
+        assert memory.lookup("Welcome back, traveller!", "ru", "en", fuzzy_threshold=0.9)
+
+    def test_least_recently_used_segments_evicted(self):
+        """Test the memory keeps at most max_segments, dropping the least used."""
+        memory = TranslationMemory(fuzzy_threshold=0.9, max_segments=2)
+        memory.add("Open the door.", "Открой дверь.", "en", "ru")
+        memory.add("Close the window.", "Закрой окно.", "en", "ru")
+        memory.lookup("Open the door.", "ru", "en")
+
+        memory.add("You have 5 coins left.", "У вас осталось 5 монет.", "en", "ru")
+
+        assert len(memory) == 2
+        assert memory.get_stats()["evictions"] == 1
+        assert memory.lookup("Close the window.", "ru", "en") is None
+        assert memory.lookup("Close the windows.", "ru", "en") is None
+        assert memory.lookup("Open the door.", "ru", "en").kind == "exact"
+        assert memory.lookup("You have 7 coins left.", "ru", "en").kind == "template"
+
+    def test_sentences_are_composed(self, memory):
+        """Test multi-sentence texts are served when every sentence hits."""
+        match = memory.lookup("The gate is closed. You have 3 coins left.", "ru", "en")
+        partial = memory.lookup("The gate is closed. Where is the key?", "ru", "en")
+
+        assert match.kind == "sentences"
+        assert match.translated_text == "Ворота закрыты. У вас осталось 3 монет."
+        assert partial is None
+
+    def test_language_pairs_are_separate(self, memory):
+        """Test translations are not served for another language pair."""
+        assert memory.lookup("You have 5 coins left.", "de", "en") is None
+
+    def test_fuzzy_lookup_scales(self):
+        """Test near duplicates are found among many random segments."""
+        rng = random.Random(0)
+        vocabulary = [
+            "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9)))
+            for _ in range(2000)
+        ]
+        memory = TranslationMemory(fuzzy_threshold=0.9)
+        sentences = [" ".join(rng.sample(vocabulary, 8)) + "." for _ in range(5000)]
+        for sentence in sentences:
+            memory.add(sentence, sentence.upper(), "en", "ru")
+
+        found = 0
+        for sentence in rng.sample(sentences, 100):
+            i = rng.randrange(len(sentence) - 1)
+            query = sentence[:i] + "#" + sentence[i + 1 :]
+            match = memory.lookup(query, "ru", "en")
+            found += match is not None and match.translated_text == sentence.upper()
+
+        assert found >= 95
+        assert len(memory) == 5000
+
+    def test_save_and_load(self, memory, tmp_path):
+        """Test segments survive a save/load roundtrip."""
+        path = str(tmp_path / "memory.jsonl")
+
+        saved = memory.save(path)
+        restored = TranslationMemory()
+
+        assert restored.load(path) == saved == len(memory)
+        assert restored.lookup("The gate is closed.", "ru", "en").translated_text == (
+            "Ворота закрыты."
+        )
+        assert TranslationMemory().load(str(tmp_path / "missing.jsonl")) == 0
+
+
+class TestProcessorIntegration:
+    """Test the memory in front of the translation backend."""
+
+    def make_processor(self, fuzzy_threshold=None, memory_path=None):
+        processor = TranslationProcessor.__new__(TranslationProcessor)
+        processor.active_engine = Mock()
+        processor.active_engine.translate.return_value = "У вас осталось 5 монет."
+        processor.cache = None
+        processor.fuzzy_threshold = fuzzy_threshold
+        processor.memory_path = memory_path
+        processor.memory = processor._create_memory()
+        return processor
+
+    def test_backend_skipped_on_memory_hit(self):
+        """Test translations are learned and reused for similar text."""
+        processor = self.make_processor()
+
+        first = processor.translate_text("You have 5 coins left.", "ru", "en")
+        second = processor.translate_text("You have 7 coins left.", "ru", "en")
+
+        assert not first.cached
+        assert second.cached
+        assert second.translated_text == "У вас осталось 7 монет."
+        assert second.confidence == 1.0
+        processor.active_engine.translate.assert_called_once()
+
+    def test_fuzzy_hit_is_flagged_as_suggestion(self):
+        """Test fuzzy matches get reduced confidence and a suggestion flag."""
+        processor = self.make_processor(fuzzy_threshold=0.9)
+        processor.translate_text("You have 5 coins left.", "ru", "en")
+
+        suggestion = processor.translate_text("You have 5 coin left.", "ru", "en")
+
+        assert suggestion.cached
+        assert suggestion.metadata["suggestion"] is True
+        assert suggestion.metadata["memory_match"] == "fuzzy"
+        similarity = suggestion.metadata["similarity"]
+        assert suggestion.confidence == pytest.approx(
+            similarity * TranslationProcessor.SUGGESTION_CONFIDENCE_FACTOR
+        )
+        processor.active_engine.translate.assert_called_once()
+
+    def test_disabling_cache_bypasses_memory(self):
+        """Test enable_cache(False) sends every text to the backend."""
+        processor = self.make_processor()
+        processor.translate_text("You have 5 coins left.", "ru", "en")
+
+        processor.enable_cache(False)
+        result = processor.translate_text("You have 5 coins left.", "ru", "en")
+        processor.enable_cache(True)
+
+        assert not result.cached
+        assert processor.active_engine.translate.call_count == 2
+        assert processor.memory is not None and len(processor.memory) == 0
+
+    def test_memory_persists_between_processors(self, tmp_path):
+        """Test segments saved by one processor are served by the next one."""
+        path = str(tmp_path / "data" / "translation_memory.jsonl")
+        processor = self.make_processor(memory_path=path)
+        processor.translate_text("You have 5 coins left.", "ru", "en")
+
+        assert processor.save_memory() == 1
+
+        restarted = self.make_processor(memory_path=path)
+        result = restarted.translate_text("You have 9 coins left.", "ru", "en")
+
+        assert result.cached
+        assert result.translated_text == "У вас осталось 9 монет."
+        restarted.active_engine.translate.assert_not_called()
+
+    def test_clearing_cache_clears_saved_memory(self, tmp_path):
+        """Test clear_cache() also empties the saved memory."""
+        path = str(tmp_path / "translation_memory.jsonl")
+        processor = self.make_processor(memory_path=path)
+        processor.translate_text("You have 5 coins left.", "ru", "en")
+        processor.save_memory()
+
+        processor.clear_cache()
+
+        assert len(self.make_processor(memory_path=path).memory) == 0
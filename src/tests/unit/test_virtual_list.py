@@ -0,0 +1,89 @@
+"""
+Unit tests for the virtualized list model.
+"""
+
+import pytest
+
+from src.ui.virtual_list import VirtualListModel
+
+
+class TestVirtualListModel:
+    """Test VirtualListModel implementation."""
+
+    @pytest.fixture
+    def model(self):
+        """Create model with 1000 items, 10 visible rows and 5 overscan rows."""
+        model = VirtualListModel(viewport_size=10, overscan=5)
+        model.set_items(list(range(1000)))
+        return model
+
+    def test_materialize_is_bounded_by_viewport(self, model):
+        """Test only visible rows plus overscan are materialized."""
+        start, end, rows = model.materialize()
+        assert (start, end) == (0, 15)
+        assert rows == list(range(15))
+
+        model.scroll_to(500)
+        start, end, rows = model.materialize()
+        assert (start, end) == (495, 515)
+        assert len(rows) == 20
+
+    def test_scroll_within_overscan_needs_no_render(self, model):
+        """Test small scrolls inside the overscan band reuse the window."""
+        model.scroll_to(500)
+        model.materialize()
+
+        assert model.scroll_by(3) is False
+        assert model.offset_in_window() == 8
+        assert model.scroll_by(10) is True
+
+    def test_scroll_is_clamped(self, model):
+        """Test scroll position stays within the list."""
+        model.scroll_to(-5)
+        assert model.first_visible == 0
+
+        model.scroll_to(5000)
+        assert model.first_visible == 990
+        assert model.visible_range() == (990, 1000)
+
+    def test_scroll_fraction_and_pages(self, model):
+        """Test scrollbar moveto and page scrolling."""
+        model.scroll_fraction(0.5)
+        assert model.first_visible == 500
+
+        model.scroll_pages(-2)
+        assert model.first_visible == 480
+
+    def test_scrollbar_position(self, model):
+        """Test scrollbar fractions."""
+        model.scroll_to(100)
+        assert model.scrollbar_position() == (0.1, 0.11)
+
+        model.set_items([])
+        assert model.scrollbar_position() == (0.0, 1.0)
+
+    def test_set_items_resets_or_keeps_position(self, model):
+        """Test replacing items resets scroll unless asked to keep it."""
+        model.scroll_to(100)
+        model.set_items(list(range(500)), keep_position=True)
+        assert model.first_visible == 100
+        assert model.needs_render() is True
+
+        model.set_items(list(range(50)))
+        assert model.first_visible == 0
+
+    def test_ensure_visible(self, model):
+        """Test scrolling an index into view."""
+        model.ensure_visible(25)
+        assert model.visible_range() == (16, 26)
+
+        assert model.ensure_visible(20) is False
+        model.ensure_visible(3)
+        assert model.first_visible == 3
+
+    def test_viewport_resize(self, model):
+        """Test viewport size changes."""
+        model.scroll_to(995)
+        model.set_viewport_size(20)
+        assert model.first_visible == 980
+        assert model.visible_range() == (980, 1000)
@@ -1,26 +1,28 @@
-from PIL import ImageGrab
-
 """
 Enhanced capture interface with smart area detection integration.
 """
 
+from __future__ import annotations
+
 import threading
 import tkinter as tk
 from tkinter import ttk
 from typing import Callable, List, Optional, Tuple
 
-try:
-    import cv2
-except ImportError:
-    print("OpenCV не доступен в данной среде")
-    cv2 = None
-import numpy as np
-from PIL import Image, ImageTk
-
 from src.ai.smart_area_detection import DetectionConfig, SmartAreaDetector, TextRegion
 from src.ui.real_time_overlay import OverlayConfig
+from src.utils.lazy_import import lazy_import
 from src.utils.logger import logger
 
+# Heavy dependencies are loaded on first use
+cv2 = lazy_import("cv2")
+if cv2 is None:
+    print("OpenCV не доступен в данной среде")
+np = lazy_import("numpy")
+Image = lazy_import("PIL.Image")
+ImageGrab = lazy_import("PIL.ImageGrab")
+ImageTk = lazy_import("PIL.ImageTk")
+
 
 class EnhancedCaptureInterface:
     """Enhanced screen capture interface with smart area detection."""
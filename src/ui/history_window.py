@@ -23,16 +23,23 @@ except ImportError:
     # Используем заглушки для импортированных компонентов
     from src.utils.mock_gui import filedialog, messagebox, ttk
 
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.models.translation import Translation
 from src.services.config_manager import ConfigManager, ConfigObserver
+from src.ui.virtual_list import VirtualListModel
 from src.utils.logger import logger
+from src.utils.search_index import TranslationSearchIndex
 
 
 class HistoryWindow(ConfigObserver):
     """Enhanced translation history window with advanced features."""
 
+    FILTER_DEBOUNCE_MS = 250  # Delay before search input is applied
+    TREE_HEIGHT = 15  # Initial number of visible rows
+    ROW_HEIGHT = 20  # Approximate Treeview row height in pixels
+    OVERSCAN_ROWS = 10  # Rows materialized above/below the viewport
+
     def __init__(self, config_manager: ConfigManager, parent: Optional[tk.Tk] = None):
         """
         Initialize history window.
@@ -47,6 +54,20 @@ class HistoryWindow(ConfigObserver):
         self.translations: List[Translation] = []
         self.filtered_translations: List[Translation] = []
         self.favorites: List[str] = []  # List of translation IDs
+        self._search_index = TranslationSearchIndex()
+        self._translations_by_id: Dict[str, Translation] = {}
+        self._history_version = 0  # Bumped whenever the translation list changes
+
+        # Virtualized list state
+        self._list_model: VirtualListModel[Translation] = VirtualListModel(
+            viewport_size=self.TREE_HEIGHT, overscan=self.OVERSCAN_ROWS
+        )
+        self._row_translations: Dict[str, Translation] = {}  # Treeview item -> translation
+        self._selected_translation_id: Optional[str] = None
+        self._filter_job: Optional[str] = None
+        self._last_filter: Optional[Tuple[Any, ...]] = None
+        self._statistics_key: Optional[Tuple[Any, ...]] = None
+        self._statistics_cache: Dict[str, Any] = {}
 
         # UI components
         self.search_var = tk.StringVar()
@@ -87,8 +108,12 @@ class HistoryWindow(ConfigObserver):
     def close(self) -> None:
         """Close the history window."""
         if self.window:
+            if self._filter_job is not None:
+                self.window.after_cancel(self._filter_job)
+                self._filter_job = None
             self.window.destroy()
             self.window = None
+            self.tree = None
             logger.info("History window closed")
 
     def add_translation(self, translation: Translation) -> None:
@@ -100,20 +125,26 @@ class HistoryWindow(ConfigObserver):
         """
         # Insert at beginning (most recent first)
         self.translations.insert(0, translation)
+        self._translations_by_id[translation.id] = translation
+        self._search_index.add_translation(translation)
 
         # Limit history size (configurable)
         max_history = 1000  # Could be made configurable
         if len(self.translations) > max_history:
+            for dropped in self.translations[max_history:]:
+                self._translations_by_id.pop(dropped.id, None)
+                self._search_index.remove(dropped.id)
             self.translations = self.translations[:max_history]
+        self._history_version += 1
 
         if self.window:
             self._apply_filters()
-            self._update_display()
 
         logger.debug(f"Added translation to history: {len(translation.original_text)} chars")
 
     def toggle_favorite(self, translation_id: str) -> None:
         """Toggle favorite status of a translation."""
+        self._history_version += 1
         if translation_id in self.favorites:
             self.favorites.remove(translation_id)
             logger.debug(f"Removed from favorites: {translation_id}")
@@ -327,7 +358,9 @@ class HistoryWindow(ConfigObserver):
             "Cached",
             "Favorite",
         )
-        self.tree = ttk.Treeview(tree_frame, columns=columns, show="headings", height=15)
+        self.tree = ttk.Treeview(
+            tree_frame, columns=columns, show="headings", height=self.TREE_HEIGHT
+        )
 
         # Configure column headings and widths
         self.tree.heading("Time", text="Time")
@@ -348,10 +381,11 @@ class HistoryWindow(ConfigObserver):
         self.tree.column("Cached", width=60, minwidth=50)
         self.tree.column("Favorite", width=30, minwidth=30)
 
-        # Add scrollbars
-        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        # Add scrollbars; the vertical one scrolls the virtual list, not the tree
+        v_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self._on_scrollbar)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+        self.tree.configure(xscrollcommand=h_scrollbar.set)
+        self.v_scrollbar = v_scrollbar
 
         # Pack treeview and scrollbars
         self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -394,8 +428,8 @@ class HistoryWindow(ConfigObserver):
 
     def _bind_events(self) -> None:
         """Bind UI events."""
-        # Filter change events
-        self.search_var.trace_add("write", lambda *args: self._apply_filters())
+        # Filter change events (search input is debounced)
+        self.search_var.trace_add("write", lambda *args: self._schedule_filters())
         self.source_lang_var.trace_add("write", lambda *args: self._apply_filters())
         self.target_lang_var.trace_add("write", lambda *args: self._apply_filters())
         self.date_filter_var.trace_add("write", lambda *args: self._apply_filters())
@@ -406,11 +440,20 @@ class HistoryWindow(ConfigObserver):
             self.tree.bind("<<TreeviewSelect>>", self._on_tree_select)
             self.tree.bind("<Double-1>", self._on_tree_double_click)
 
+            # Virtual scrolling
+            self.tree.bind("<MouseWheel>", self._on_mouse_wheel)
+            self.tree.bind("<Button-4>", self._on_mouse_wheel)
+            self.tree.bind("<Button-5>", self._on_mouse_wheel)
+            self.tree.bind("<Prior>", lambda event: self._scroll_list(pages=-1))
+            self.tree.bind("<Next>", lambda event: self._scroll_list(pages=1))
+            self.tree.bind("<Configure>", self._on_tree_configure)
+
     def _load_translations(self) -> None:
         """Load translations from history (placeholder - would integrate with actual history storage)."""
         # This would typically load from a file or database
         # For now, we'll use empty list
         self.translations = []
+        self._rebuild_search_index()
 
         # Update language filter options
         self._update_language_filters()
@@ -431,31 +474,48 @@ class HistoryWindow(ConfigObserver):
         self.source_combo["values"] = source_values
         self.target_combo["values"] = target_values
 
+    def _rebuild_search_index(self) -> None:
+        """Rebuild the search index from the current translation list."""
+        self._translations_by_id = {t.id: t for t in self.translations}
+        self._search_index.rebuild(self.translations)
+        self._history_version += 1
+
+    def _schedule_filters(self) -> None:
+        """Apply filters once search input pauses instead of on every keystroke."""
+        if not self.window:
+            self._apply_filters()
+            return
+
+        if self._filter_job is not None:
+            self.window.after_cancel(self._filter_job)
+        self._filter_job = self.window.after(self.FILTER_DEBOUNCE_MS, self._run_scheduled_filters)
+
+    def _run_scheduled_filters(self) -> None:
+        """Run a debounced filter update."""
+        self._filter_job = None
+        self._apply_filters()
+
     def _apply_filters(self) -> None:
         """Apply current filters to translation list."""
-        filtered = self.translations.copy()
-
-        # Search filter
-        search_text = self.search_var.get().lower()
-        if search_text:
-            filtered = [
-                t
-                for t in filtered
-                if search_text in t.original_text.lower()
-                or search_text in t.translated_text.lower()
-            ]
+        if len(self._search_index) != len(self.translations):
+            # Translation list was replaced directly
+            self._rebuild_search_index()
 
-        # Language filters
+        query = self.search_var.get()
         source_lang = self.source_lang_var.get()
-        if source_lang != "All":
-            filtered = [t for t in filtered if t.source_language == source_lang]
-
         target_lang = self.target_lang_var.get()
-        if target_lang != "All":
-            filtered = [t for t in filtered if t.target_language == target_lang]
+        date_filter = self.date_filter_var.get()
+        favorites_only = self.show_favorites_var.get()
+        filter_state = (
+            self._history_version,
+            source_lang,
+            target_lang,
+            date_filter,
+            favorites_only,
+        )
 
         # Date filter
-        date_filter = self.date_filter_var.get()
+        cutoff = None
         if date_filter != "All time":
             now = datetime.now()
             if date_filter == "Today":
@@ -464,17 +524,37 @@ class HistoryWindow(ConfigObserver):
                 cutoff = now - timedelta(days=7)
             elif date_filter == "This month":
                 cutoff = now - timedelta(days=30)
-            else:
-                cutoff = None
 
-            if cutoff:
-                filtered = [t for t in filtered if t.timestamp >= cutoff]
+        # When the query only got longer, the new result is a subset of the
+        # previous one, so narrow it instead of querying the whole history
+        within = None
+        previous = self._last_filter
+        if previous is not None and previous[1:] == filter_state and query.startswith(previous[0]):
+            within = [t.id for t in self.filtered_translations]
+
+        # Search, language and date filters are answered by the index
+        matching_ids = self._search_index.search(
+            query,
+            source_language=None if source_lang == "All" else source_lang,
+            target_language=None if target_lang == "All" else target_lang,
+            since=cutoff,
+            prefix=True,
+            within=within,
+        )
+        filtered = [
+            self._translations_by_id[translation_id]
+            for translation_id in matching_ids
+            if translation_id in self._translations_by_id
+        ]
 
         # Favorites filter
-        if self.show_favorites_var.get():
-            filtered = [t for t in filtered if self._get_translation_id(t) in self.favorites]
+        if favorites_only and within is None:
+            favorites = set(self.favorites)
+            filtered = [t for t in filtered if self._get_translation_id(t) in favorites]
 
+        self._last_filter = (query,) + filter_state
         self.filtered_translations = filtered
+        self._list_model.set_items(filtered)
         self._update_display()
 
     def _update_display(self) -> None:
@@ -482,22 +562,76 @@ class HistoryWindow(ConfigObserver):
         if not self.tree:
             return
 
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-
-        # Add filtered translations
-        for translation in self.filtered_translations:
-            self._add_translation_to_tree(translation)
+        # Only rows around the viewport are materialized
+        self._list_model.set_items(self.filtered_translations, keep_position=True)
+        self._render_rows()
 
         # Update statistics
         self._update_statistics()
 
-    def _add_translation_to_tree(self, translation: Translation) -> None:
-        """Add a translation to the treeview."""
+    def _render_rows(self) -> None:
+        """Materialize the rows around the viewport, reusing existing tree items."""
         if not self.tree:
             return
 
+        _, _, rows = self._list_model.materialize()
+        existing = self.tree.get_children()
+
+        self._row_translations = {}
+        selected_item = None
+        for position, translation in enumerate(rows):
+            item = f"row{position}"
+            values = self._format_row(translation)
+            if position < len(existing):
+                self.tree.item(item, values=values)
+            else:
+                self.tree.insert("", tk.END, iid=item, values=values)
+            self._row_translations[item] = translation
+            if translation.id == self._selected_translation_id:
+                selected_item = item
+
+        # Drop pooled rows that are no longer needed
+        surplus = existing[len(rows) :]
+        if surplus:
+            self.tree.delete(*surplus)
+
+        if selected_item is not None:
+            if self.tree.selection() != (selected_item,):
+                self.tree.selection_set(selected_item)
+        elif self.tree.selection():
+            self.tree.selection_remove(*self.tree.selection())
+
+        self._sync_view()
+
+    def _sync_view(self) -> None:
+        """Scroll the tree inside the materialized window and update the scrollbar."""
+        if not self.tree:
+            return
+
+        start, end = self._list_model.window
+        if end > start:
+            self.tree.yview_moveto(self._list_model.offset_in_window() / (end - start))
+        if getattr(self, "v_scrollbar", None) is not None:
+            self.v_scrollbar.set(*self._list_model.scrollbar_position())
+
+    def _refresh_viewport(self, needs_render: bool) -> None:
+        """Re-render or just reposition after a scroll."""
+        if needs_render:
+            self._render_rows()
+        else:
+            self._sync_view()
+
+    def _scroll_list(self, rows: int = 0, pages: int = 0) -> str:
+        """Scroll the virtual list by rows or pages."""
+        if pages:
+            needs_render = self._list_model.scroll_pages(pages)
+        else:
+            needs_render = self._list_model.scroll_by(rows)
+        self._refresh_viewport(needs_render)
+        return "break"
+
+    def _format_row(self, translation: Translation) -> Tuple[str, ...]:
+        """Format treeview column values for a translation."""
         translation_id = self._get_translation_id(translation)
         is_favorite = translation_id in self.favorites
 
@@ -519,8 +653,7 @@ class HistoryWindow(ConfigObserver):
             else translation.translated_text
         )
 
-        # Insert item
-        values = (
+        return (
             time_str,
             translation.source_language,
             translation.target_language,
@@ -531,14 +664,14 @@ class HistoryWindow(ConfigObserver):
             favorite_str,
         )
 
-        item = self.tree.insert("", tk.END, values=values)
-
-        # Store translation reference
-        self.tree.set(item, "#0", translation_id)
-
     def _update_statistics(self) -> None:
         """Update statistics display."""
-        stats = self.get_statistics()
+        # Statistics cover the whole history, so only recompute when it changes
+        key = (self._history_version, len(self.translations), datetime.now().date())
+        if key != self._statistics_key:
+            self._statistics_cache = self.get_statistics()
+            self._statistics_key = key
+        stats = self._statistics_cache
 
         if self.stats_labels:
             self.stats_labels["total"].config(text=f"Total: {stats.get('total_translations', 0)}")
@@ -566,21 +699,18 @@ class HistoryWindow(ConfigObserver):
         if not selection:
             return None
 
-        item = selection[0]
-        translation_id = self.tree.set(item, "#0")
-
-        # Find translation by ID
-        for translation in self.filtered_translations:
-            if self._get_translation_id(translation) == translation_id:
-                return translation
-
-        return None
+        return self._row_translations.get(selection[0])
 
     # Event handlers
     def _on_tree_select(self, event) -> None:
         """Handle tree selection change."""
         translation = self._get_selected_translation()
-        if translation and self.on_translation_select:
+        if not translation or translation.id == self._selected_translation_id:
+            # Re-selection after the row window was re-rendered
+            return
+
+        self._selected_translation_id = translation.id
+        if self.on_translation_select:
             self.on_translation_select(translation)
 
     def _on_tree_double_click(self, event) -> None:
@@ -589,6 +719,38 @@ class HistoryWindow(ConfigObserver):
         if translation and self.on_translation_repeat:
             self.on_translation_repeat(translation)
 
+    def _on_scrollbar(self, *args) -> None:
+        """Handle vertical scrollbar commands ("moveto" / "scroll")."""
+        if not args:
+            return
+
+        if args[0] == "moveto":
+            needs_render = self._list_model.scroll_fraction(float(args[1]))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                needs_render = self._list_model.scroll_pages(amount)
+            else:
+                needs_render = self._list_model.scroll_by(amount)
+        else:
+            return
+
+        self._refresh_viewport(needs_render)
+
+    def _on_mouse_wheel(self, event) -> str:
+        """Handle mouse wheel scrolling."""
+        if getattr(event, "num", None) == 4 or getattr(event, "delta", 0) > 0:
+            return self._scroll_list(rows=-3)
+        return self._scroll_list(rows=3)
+
+    def _on_tree_configure(self, event) -> None:
+        """Track viewport size when the tree is resized."""
+        header_height = self.ROW_HEIGHT
+        rows = max(1, (event.height - header_height) // self.ROW_HEIGHT)
+        if rows != self._list_model.viewport_size:
+            self._list_model.set_viewport_size(rows)
+            self._render_rows()
+
     def _repeat_translation(self) -> None:
         """Repeat selected translation."""
         translation = self._get_selected_translation()
@@ -680,6 +842,9 @@ class HistoryWindow(ConfigObserver):
             self.translations.clear()
             self.filtered_translations.clear()
             self.favorites.clear()
+            self._translations_by_id.clear()
+            self._search_index.clear()
+            self._history_version += 1
             self._update_display()
             logger.info("Translation history cleared")
 
@@ -0,0 +1,131 @@
+"""
+Virtualized list model for large Treeview-based lists.
+
+Only the rows inside the viewport plus a small overscan band are
+materialized in the widget, so rendering cost is bounded by the viewport
+size rather than the number of items.
+"""
+
+from typing import Generic, List, Sequence, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class VirtualListModel(Generic[T]):
+    """Scroll state and materialization window for a virtual list."""
+
+    def __init__(self, viewport_size: int = 15, overscan: int = 10):
+        """
+        Initialize list model.
+
+        Args:
+            viewport_size: Number of rows visible at once
+            overscan: Extra rows materialized above and below the viewport
+        """
+        self.viewport_size = max(1, viewport_size)
+        self.overscan = max(0, overscan)
+        self.first_visible = 0
+        self._items: Sequence[T] = []
+        self._window: Tuple[int, int] = (0, 0)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def items(self) -> Sequence[T]:
+        """All items in the list."""
+        return self._items
+
+    @property
+    def window(self) -> Tuple[int, int]:
+        """Currently materialized ``[start, end)`` range."""
+        return self._window
+
+    def set_items(self, items: Sequence[T], keep_position: bool = False) -> None:
+        """
+        Replace list contents; the window must be re-rendered afterwards.
+
+        Args:
+            items: New items
+            keep_position: Keep scroll position instead of returning to top
+        """
+        self._items = items
+        self.first_visible = self._clamp(self.first_visible if keep_position else 0)
+        self._window = (0, 0)
+
+    def set_viewport_size(self, viewport_size: int) -> None:
+        """Update the number of visible rows (e.g. after a resize)."""
+        self.viewport_size = max(1, viewport_size)
+        self.first_visible = self._clamp(self.first_visible)
+
+    def visible_range(self) -> Tuple[int, int]:
+        """Get the ``[start, end)`` range of rows inside the viewport."""
+        end = min(len(self._items), self.first_visible + self.viewport_size)
+        return self.first_visible, end
+
+    def needs_render(self) -> bool:
+        """Check whether the viewport moved outside the materialized window."""
+        start, end = self.visible_range()
+        window_start, window_end = self._window
+        if window_end == window_start:
+            return True
+        return start < window_start or end > window_end
+
+    def materialize(self) -> Tuple[int, int, List[T]]:
+        """
+        Compute a new materialized window around the viewport.
+
+        Returns:
+            Tuple of (window start, window end, items in the window)
+        """
+        start, end = self.visible_range()
+        window_start = max(0, start - self.overscan)
+        window_end = min(len(self._items), end + self.overscan)
+        self._window = (window_start, window_end)
+        return window_start, window_end, list(self._items[window_start:window_end])
+
+    def offset_in_window(self) -> int:
+        """Position of the first visible row inside the materialized window."""
+        return self.first_visible - self._window[0]
+
+    def scroll_to(self, index: int) -> bool:
+        """
+        Scroll so that ``index`` is the first visible row.
+
+        Returns:
+            True if the window must be re-rendered
+        """
+        self.first_visible = self._clamp(index)
+        return self.needs_render()
+
+    def scroll_by(self, rows: int) -> bool:
+        """Scroll by a number of rows (negative scrolls up)."""
+        return self.scroll_to(self.first_visible + rows)
+
+    def scroll_pages(self, pages: int) -> bool:
+        """Scroll by whole viewport pages."""
+        return self.scroll_by(pages * self.viewport_size)
+
+    def scroll_fraction(self, fraction: float) -> bool:
+        """Scroll to a position given as fraction of the list (scrollbar ``moveto``)."""
+        return self.scroll_to(int(round(float(fraction) * len(self._items))))
+
+    def ensure_visible(self, index: int) -> bool:
+        """Scroll minimally so that ``index`` is inside the viewport."""
+        if index < self.first_visible:
+            return self.scroll_to(index)
+        if index >= self.first_visible + self.viewport_size:
+            return self.scroll_to(index - self.viewport_size + 1)
+        return False
+
+    def scrollbar_position(self) -> Tuple[float, float]:
+        """Get ``(first, last)`` fractions for ``Scrollbar.set``."""
+        total = len(self._items)
+        if total == 0:
+            return 0.0, 1.0
+        start, end = self.visible_range()
+        return start / total, end / total
+
+    def _clamp(self, index: int) -> int:
+        max_first = max(0, len(self._items) - self.viewport_size)
+        return min(max(0, index), max_first)
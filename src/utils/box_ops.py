@@ -0,0 +1,233 @@
+"""
+Vectorized operations on axis-aligned boxes.
+
+Boxes are stored as an (N, 4) float array of (x1, y1, x2, y2). Overlapping
+pairs are found with a sweep along one axis (boxes sorted by their start,
+each box paired with the following boxes that start before it ends) and
+filtered on the other, so the work grows with the number of overlapping
+pairs rather than N^2.
+Pairs feed union-find merging (connected components by pointer jumping)
+and greedy non-max suppression.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Sequence, Tuple
+
+from src.utils.lazy_import import lazy_import
+
+np = lazy_import("numpy")
+
+# Candidate pairs materialized at once by the sweep
+_PAIR_CHUNK = 1 << 20
+
+Pairs = Tuple["np.ndarray", "np.ndarray"]
+
+
+def as_boxes(boxes: Iterable[Sequence[float]]) -> np.ndarray:
+    """Convert (x1, y1, x2, y2) boxes to an (N, 4) float array."""
+    if not hasattr(boxes, "shape"):
+        boxes = list(boxes)
+    return np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def box_areas(boxes: np.ndarray) -> np.ndarray:
+    """Areas of (N, 4) boxes; inverted boxes have zero area."""
+    widths = np.clip(boxes[:, 2] - boxes[:, 0], 0, None)
+    heights = np.clip(boxes[:, 3] - boxes[:, 1], 0, None)
+    return widths * heights
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Dense (N, M) IoU matrix; use for small batches only."""
+    x1 = np.maximum(a[:, None, 0], b[None, :, 0])
+    y1 = np.maximum(a[:, None, 1], b[None, :, 1])
+    x2 = np.minimum(a[:, None, 2], b[None, :, 2])
+    y2 = np.minimum(a[:, None, 3], b[None, :, 3])
+    intersection = np.clip(x2 - x1, 0, None) * np.clip(y2 - y1, 0, None)
+    union = box_areas(a)[:, None] + box_areas(b)[None, :] - intersection
+    return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+
+def _sweep_counts(starts: np.ndarray, stops: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort intervals by start; count later intervals starting before each one stops."""
+    order = np.argsort(starts, kind="stable")
+    ends = np.searchsorted(starts[order], stops[order], side="left")
+    return order, np.clip(ends - np.arange(1, len(starts) + 1), 0, None)
+
+
+def intersecting_pairs(boxes: np.ndarray) -> Pairs:
+    """
+    Find all pairs of boxes with a positive-area intersection.
+
+    Sweeps along the axis with fewer overlapping intervals and checks the
+    other axis for the resulting candidates, in chunks of bounded size.
+
+    Returns:
+        Index arrays (i, j) with one entry per unordered pair
+    """
+    n = len(boxes)
+    order, counts = _sweep_counts(boxes[:, 0], boxes[:, 2])
+    other = (1, 3)
+    y_order, y_counts = _sweep_counts(boxes[:, 1], boxes[:, 3])
+    if y_counts.sum() < counts.sum():
+        order, counts, other = y_order, y_counts, (0, 2)
+
+    # Cross-axis bounds in sweep order, so candidates are checked without
+    # going through the permutation
+    lows = boxes[order, other[0]]
+    highs = boxes[order, other[1]]
+    cumulative = np.cumsum(counts)
+    found_i, found_j = [], []
+    row = 0
+    while row < n:
+        # Rows whose candidates fit into one chunk (at least one row)
+        base = cumulative[row - 1] if row else 0
+        stop = max(int(np.searchsorted(cumulative, base + _PAIR_CHUNK, side="right")), row + 1)
+        chunk_counts = counts[row:stop]
+        total = int(chunk_counts.sum())
+        if total:
+            first = np.repeat(np.arange(row, stop), chunk_counts)
+            row_starts = np.cumsum(chunk_counts) - chunk_counts
+            second = first + 1 + np.arange(total) - np.repeat(row_starts, chunk_counts)
+            overlap = np.minimum(highs[first], highs[second]) > np.maximum(
+                lows[first], lows[second]
+            )
+            found_i.append(order[first[overlap]])
+            found_j.append(order[second[overlap]])
+        row = stop
+
+    if not found_i:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty
+    return np.concatenate(found_i), np.concatenate(found_j)
+
+
+def pair_overlap(boxes: np.ndarray, i: np.ndarray, j: np.ndarray, metric: str = "iou"):
+    """
+    Overlap ratio of box pairs.
+
+    Args:
+        boxes: (N, 4) boxes
+        i, j: Pair index arrays
+        metric: "iou" (intersection over union) or "min" (intersection over
+            the smaller area)
+    """
+    a, b = boxes[i], boxes[j]
+    width = np.minimum(a[:, 2], b[:, 2]) - np.maximum(a[:, 0], b[:, 0])
+    height = np.minimum(a[:, 3], b[:, 3]) - np.maximum(a[:, 1], b[:, 1])
+    intersection = np.clip(width, 0, None) * np.clip(height, 0, None)
+    area_a, area_b = box_areas(a), box_areas(b)
+    if metric == "iou":
+        denominator = area_a + area_b - intersection
+    elif metric == "min":
+        denominator = np.minimum(area_a, area_b)
+    else:
+        raise ValueError(f"Unknown overlap metric: {metric}")
+    ratio = np.zeros_like(intersection)
+    return np.divide(intersection, denominator, out=ratio, where=denominator > 0)
+
+
+def overlap_graph(
+    boxes: np.ndarray, threshold: float, metric: str = "iou", strict: bool = False
+) -> Pairs:
+    """Pairs whose overlap ratio reaches threshold (exceeds it if strict)."""
+    i, j = intersecting_pairs(boxes)
+    ratio = pair_overlap(boxes, i, j, metric)
+    keep = ratio > threshold if strict else ratio >= threshold
+    return i[keep], j[keep]
+
+
+def connected_components(n: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+    """
+    Union-find over edges (i, j) without a Python loop per edge.
+
+    Roots are hooked onto the smaller root of each edge and paths are
+    compressed by pointer jumping until no edge joins two trees.
+
+    Returns:
+        Component label per node, numbered by the smallest node of each
+        component (so labels follow input order)
+    """
+    parent = np.arange(n)
+    while len(i):
+        root_i, root_j = parent[i], parent[j]
+        pending = root_i != root_j
+        if not pending.any():
+            break
+        low = np.minimum(root_i[pending], root_j[pending])
+        high = np.maximum(root_i[pending], root_j[pending])
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+    return np.unique(parent, return_inverse=True)[1].reshape(-1)
+
+
+def merge_groups(boxes: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Union box of each label group; returns (labels.max() + 1, 4) boxes."""
+    count = int(labels.max()) + 1 if len(labels) else 0
+    merged = np.empty((count, 4))
+    merged[:, :2] = np.inf
+    merged[:, 2:] = -np.inf
+    np.minimum.at(merged[:, 0], labels, boxes[:, 0])
+    np.minimum.at(merged[:, 1], labels, boxes[:, 1])
+    np.maximum.at(merged[:, 2], labels, boxes[:, 2])
+    np.maximum.at(merged[:, 3], labels, boxes[:, 3])
+    return merged
+
+
+def group_max(values: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Maximum of values per label group."""
+    result = np.full(int(labels.max()) + 1 if len(labels) else 0, -np.inf)
+    np.maximum.at(result, labels, values)
+    return result
+
+
+def group_mean(values: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """Mean of values per label group."""
+    return np.bincount(labels, weights=values) / np.bincount(labels)
+
+
+def non_max_suppression(
+    boxes: np.ndarray, scores: np.ndarray, iou_threshold: float
+) -> np.ndarray:
+    """
+    Greedy non-max suppression.
+
+    Boxes are visited by descending score; a kept box suppresses every
+    lower-scored box with IoU above iou_threshold.
+
+    Returns:
+        Indices of kept boxes by descending score
+    """
+    n = len(boxes)
+    order = np.argsort(-np.asarray(scores, dtype=np.float64), kind="stable")
+    if n < 2:
+        return order
+
+    rank = np.empty(n, dtype=np.intp)
+    rank[order] = np.arange(n)
+    i, j = overlap_graph(boxes, iou_threshold, "iou", strict=True)
+    if not len(i):
+        return order
+
+    # Edges from the higher-scored box to the box it may suppress
+    winner = np.where(rank[i] < rank[j], i, j)
+    loser = np.where(rank[i] < rank[j], j, i)
+    by_winner = np.argsort(winner, kind="stable")
+    winner, loser = winner[by_winner], loser[by_winner]
+    first = np.searchsorted(winner, np.arange(n), side="left")
+    last = np.searchsorted(winner, np.arange(n), side="right")
+
+    suppressed = np.zeros(n, dtype=bool)
+    keep = []
+    for index in order.tolist():
+        if suppressed[index]:
+            continue
+        keep.append(index)
+        if last[index] > first[index]:
+            suppressed[loser[first[index] : last[index]]] = True
+    return np.asarray(keep, dtype=np.intp)
@@ -17,6 +17,7 @@ from typing import Any, Dict, List, Optional
 from src.services.circuit_breaker import get_circuit_breaker_manager
 from src.utils.circuit_breaker_monitor import get_circuit_breaker_monitor
 from src.utils.logger import logger
+from src.utils.metrics_rollup import RollupStore
 from src.utils.performance_monitor import get_performance_monitor
 
 
@@ -112,6 +113,12 @@ class EnhancedMetricsCollector:
         self.gauges: Dict[str, float] = {}
         self.histograms: defaultdict[str, List[float]] = defaultdict(list)
 
+        # Minute/hour/day rollups of every metric, persisted across restarts
+        self.rollups_file = self.data_dir / "metrics_rollups.json"
+        self.rollups = RollupStore()
+        self.rollups.load(str(self.rollups_file))
+        self._latest: Dict[str, MetricPoint] = {}
+
         # Component references
         self.performance_monitor = get_performance_monitor()
         self.circuit_breaker_manager = get_circuit_breaker_manager()
@@ -141,8 +148,16 @@ class EnhancedMetricsCollector:
                 await self._collection_task
             except asyncio.CancelledError:
                 pass
+        self.save_rollups()
         logger.info("Enhanced metrics collection stopped")
 
+    def save_rollups(self) -> None:
+        """Persist metric rollups to the data directory."""
+        try:
+            self.rollups.save(str(self.rollups_file))
+        except OSError as e:
+            logger.error(f"Failed to save metric rollups: {e}")
+
     async def _collection_loop(self, interval: float) -> None:
         """Main collection loop."""
         while self._collecting:
@@ -308,6 +323,10 @@ class EnhancedMetricsCollector:
         )
 
         self.metrics.append(metric)
+        self._latest[name] = metric
+        self.rollups.record(
+            name, value, timestamp, language_pair=metric.labels.get("language_pair")
+        )
 
         # Update aggregations
         if metric_type == MetricType.COUNTER:
@@ -321,29 +340,24 @@ class EnhancedMetricsCollector:
                 self.histograms[name] = self.histograms[name][-1000:]
 
     def get_metric_summary(self, metric_name: str, hours: int = 1) -> Dict[str, Any]:
-        """Get statistical summary for a metric over time period."""
+        """Get statistical summary for a metric over time period (from rollups)."""
         cutoff_time = datetime.now() - timedelta(hours=hours)
+        histogram = self.rollups.summary(metric_name, cutoff_time)
 
-        # Get metrics for the time period
-        matching_metrics = [
-            m for m in self.metrics if m.metric_name == metric_name and m.timestamp > cutoff_time
-        ]
-
-        if not matching_metrics:
+        if histogram.count == 0:
             return {"metric": metric_name, "count": 0, "period_hours": hours}
 
-        values = [m.value for m in matching_metrics]
-
+        latest = self._latest.get(metric_name)
         return {
             "metric": metric_name,
-            "count": len(values),
+            "count": histogram.count,
             "period_hours": hours,
-            "min": min(values),
-            "max": max(values),
-            "avg": sum(values) / len(values),
-            "latest": values[-1] if values else 0,
-            "first_timestamp": matching_metrics[0].timestamp.isoformat(),
-            "last_timestamp": matching_metrics[-1].timestamp.isoformat(),
+            "min": histogram.min,
+            "max": histogram.max,
+            "avg": histogram.total / histogram.count,
+            "p95": histogram.percentile(95),
+            "latest": latest.value if latest else 0,
+            "last_timestamp": latest.timestamp.isoformat() if latest else None,
         }
 
     def get_dashboard_data(self) -> Dict[str, Any]:
@@ -391,8 +405,9 @@ class EnhancedMetricsCollector:
             ),
             "metric_summaries": {
                 name: self.get_metric_summary(name, hours=24)
-                for name in set(m.metric_name for m in self.metrics)
+                for name in self.rollups.operations()
             },
+            "rollups": self.rollups.get_stats(),
             "counters": dict(self.counters),
             "gauges": self.gauges,
             "histogram_stats": {
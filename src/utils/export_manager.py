@@ -2,65 +2,98 @@
 Export manager for translation results and batch processing data
 """
 
-import csv
-import json
-
-try:
-    import defusedxml.ElementTree as ET
-except ImportError:
-    # Fallback to standard library with security warning
-    import warnings
-    import xml.etree.ElementTree as ET
-
-    warnings.warn(
-        "defusedxml not available. Using xml.etree.ElementTree which may be vulnerable to XML attacks",
-        UserWarning,
-        stacklevel=2,
-    )
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from src.core.batch_processor import BatchJob
 from src.models.translation import Translation
 from src.utils.logger import logger
+from src.utils.streaming_export import (
+    DEFAULT_CHUNK_SIZE,
+    ExportCancelledError,
+    ProgressCallback,
+    escape_html,
+    get_stream_writer,
+    translation_record,
+)
+from src.utils.translation_archive import ARCHIVE_EXTENSION, TRANSLATION_SCHEMA, ArchiveWriter
 
 
 class ExportManager:
     """Manager for exporting translation data in various formats"""
 
-    def __init__(self):
+    def __init__(self, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
         self.supported_formats = {
             "json": self._export_json,
+            "ndjson": self._export_ndjson,
             "csv": self._export_csv,
             "txt": self._export_txt,
             "xml": self._export_xml,
             "html": self._export_html,
+            "archive": self._export_archive,
         }
 
     def export_translations(
-        self, translations: List[Translation], file_path: str, format_type: str = "json"
+        self,
+        translations: Iterable[Translation],
+        file_path: str,
+        format_type: str = "json",
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Any] = None,
     ) -> bool:
-        """Export translations to specified format"""
+        """
+        Export translations to specified format.
+
+        translations may be any iterable (e.g. a repository iterator); it is
+        streamed in chunks and never materialized as a whole.
+
+        Args:
+            translations: Translations to export
+            file_path: Target file
+            format_type: One of get_supported_formats()
+            progress_callback: Called as (written, total) after every chunk
+            cancel_event: Object with is_set(); stops the export and removes the file
+        """
         try:
             if format_type not in self.supported_formats:
                 logger.error(f"Unsupported export format: {format_type}")
                 return False
 
-            # Ensure directory exists
-            Path(file_path).parent.mkdir(parents=True, exist_ok=True)
-
             # Export using the appropriate method
             export_func = self.supported_formats[format_type]
-            export_func(translations, file_path)
+            count = export_func(
+                translations,
+                file_path,
+                progress_callback=progress_callback,
+                cancel_event=cancel_event,
+            )
 
-            logger.info(f"Exported {len(translations)} translations to {file_path}")
+            logger.info(f"Exported {count} translations to {file_path}")
             return True
 
+        except ExportCancelledError as e:
+            logger.info(f"Export to {file_path} cancelled: {e}")
+            return False
+
         except Exception as e:
             logger.error(f"Export failed: {e}")
             return False
 
+    def export_repository(
+        self,
+        repository: Any,
+        file_path: str,
+        format_type: str = "json",
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Any] = None,
+    ) -> bool:
+        """Stream the whole history of a repository with iter_all() to a file"""
+        return self.export_translations(
+            repository.iter_all(), file_path, format_type, progress_callback, cancel_event
+        )
+
     def export_batch_job(
         self,
         batch_job: BatchJob,
@@ -88,155 +121,60 @@ class ExportManager:
             logger.error(f"Batch export failed: {e}")
             return False
 
-    def _export_json(self, translations: List[Translation], file_path: str) -> None:
+    def _stream(
+        self, format_type: str, translations: Iterable[Translation], file_path: str, **options
+    ) -> int:
+        """Write translations with the streaming writer of a format"""
+        extra = options.pop("extra", None)
+        writer = get_stream_writer(format_type, chunk_size=self.chunk_size, **options)
+        return writer.write(translations, file_path, extra=extra)
+
+    def _export_json(self, translations: Iterable[Translation], file_path: str, **options) -> int:
         """Export to JSON format"""
-        data = {
-            "export_info": {
-                "timestamp": datetime.now().isoformat(),
-                "count": len(translations),
-                "format": "json",
-                "version": "2.0",
-            },
-            "translations": [self._translation_to_dict(t) for t in translations],
-        }
+        return self._stream("json", translations, file_path, **options)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    def _export_ndjson(
+        self, translations: Iterable[Translation], file_path: str, **options
+    ) -> int:
+        """Export to newline-delimited JSON (one translation per line)"""
+        return self._stream("ndjson", translations, file_path, **options)
 
-    def _export_csv(self, translations: List[Translation], file_path: str) -> None:
+    def _export_csv(self, translations: Iterable[Translation], file_path: str, **options) -> int:
         """Export to CSV format"""
-        with open(file_path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-
-            # Header
-            writer.writerow(
-                [
-                    "Timestamp",
-                    "Original Text",
-                    "Translated Text",
-                    "Source Language",
-                    "Target Language",
-                    "Confidence",
-                ]
-            )
-
-            # Data rows
-            for t in translations:
-                writer.writerow(
-                    [
-                        t.timestamp.isoformat() if t.timestamp else "",
-                        t.original_text,
-                        t.translated_text,
-                        t.source_language,
-                        t.target_language,
-                        t.confidence if t.confidence is not None else "",
-                    ]
-                )
+        return self._stream("csv", translations, file_path, **options)
 
-    def _export_txt(self, translations: List[Translation], file_path: str) -> None:
+    def _export_txt(self, translations: Iterable[Translation], file_path: str, **options) -> int:
         """Export to plain text format"""
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(f"Screen Translator Export - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"Total translations: {len(translations)}\n")
-            f.write("=" * 60 + "\n\n")
+        return self._stream("txt", translations, file_path, **options)
 
-            for i, t in enumerate(translations, 1):
-                f.write(f"Translation #{i}\n")
-                f.write(f"Time: {t.timestamp.strftime('%H:%M:%S') if t.timestamp else 'Unknown'}\n")
-                f.write(f"Language: {t.source_language} → {t.target_language}\n")
-                if t.confidence is not None:
-                    f.write(f"Confidence: {t.confidence:.1f}%\n")
-                f.write(f"\nOriginal:\n{t.original_text}\n")
-                f.write(f"\nTranslation:\n{t.translated_text}\n")
-                f.write("-" * 40 + "\n\n")
-
-    def _export_xml(self, translations: List[Translation], file_path: str) -> None:
+    def _export_xml(self, translations: Iterable[Translation], file_path: str, **options) -> int:
         """Export to XML format"""
-        root = ET.Element("screen_translator_export")
-
-        # Metadata
-        metadata = ET.SubElement(root, "metadata")
-        ET.SubElement(metadata, "timestamp").text = datetime.now().isoformat()
-        ET.SubElement(metadata, "count").text = str(len(translations))
-        ET.SubElement(metadata, "format").text = "xml"
-        ET.SubElement(metadata, "version").text = "2.0"
-
-        # Translations
-        translations_elem = ET.SubElement(root, "translations")
-
-        for t in translations:
-            trans_elem = ET.SubElement(translations_elem, "translation")
-
-            if t.timestamp:
-                ET.SubElement(trans_elem, "timestamp").text = t.timestamp.isoformat()
-            ET.SubElement(trans_elem, "original_text").text = t.original_text
-            ET.SubElement(trans_elem, "translated_text").text = t.translated_text
-            ET.SubElement(trans_elem, "source_language").text = t.source_language
-            ET.SubElement(trans_elem, "target_language").text = t.target_language
-            if t.confidence is not None:
-                ET.SubElement(trans_elem, "confidence").text = str(t.confidence)
-
-        # Write to file
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="  ", level=0)
-        tree.write(file_path, encoding="utf-8", xml_declaration=True)
-
-    def _export_html(self, translations: List[Translation], file_path: str) -> None:
-        """Export to HTML format"""
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Screen Translator Export</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background-color: #f5f5f5; padding: 20px; border-radius: 5px; margin-bottom: 20px; }}
-        .translation {{ border: 1px solid #ddd; margin-bottom: 15px; padding: 15px; border-radius: 5px; }}
-        .original {{ background-color: #e3f2fd; padding: 10px; margin-bottom: 10px; border-radius: 3px; }}
-        .translated {{ background-color: #e8f5e8; padding: 10px; border-radius: 3px; }}
-        .metadata {{ font-size: 0.9em; color: #666; margin-bottom: 10px; }}
-        .confidence {{ color: #ff9800; font-weight: bold; }}
-    </style>
-</head>
-<body>
-    <div class="header">
-        <h1>Screen Translator Export</h1>
-        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        <p>Total translations: {len(translations)}</p>
-    </div>
-"""
-
-        for i, t in enumerate(translations, 1):
-            confidence_html = (
-                f" | Confidence: <span class='confidence'>{t.confidence:.1f}%</span>"
-                if t.confidence is not None
-                else ""
-            )
-            time_html = t.timestamp.strftime("%H:%M:%S") if t.timestamp else "Unknown"
-
-            html_content += f"""
-    <div class="translation">
-        <div class="metadata">
-            #{i} | {time_html} | {t.source_language} → {t.target_language}{confidence_html}
-        </div>
-        <div class="original">
-            <strong>Original:</strong><br>
-            {self._escape_html(t.original_text)}
-        </div>
-        <div class="translated">
-            <strong>Translation:</strong><br>
-            {self._escape_html(t.translated_text)}
-        </div>
-    </div>
-"""
+        return self._stream("xml", translations, file_path, **options)
 
-        html_content += """
-</body>
-</html>"""
+    def _export_html(self, translations: Iterable[Translation], file_path: str, **options) -> int:
+        """Export to HTML format"""
+        return self._stream("html", translations, file_path, **options)
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(html_content)
+    def _export_archive(
+        self,
+        translations: Iterable[Translation],
+        file_path: str,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Any] = None,
+    ) -> int:
+        """Export to the compact columnar archive format (see utils.translation_archive)"""
+        total = len(translations) if hasattr(translations, "__len__") else None
+        with ArchiveWriter(file_path, TRANSLATION_SCHEMA, block_size=self.chunk_size) as writer:
+            for translation in translations:
+                writer.write(translation_record(translation))
+                if writer.count % self.chunk_size == 0:
+                    if progress_callback:
+                        progress_callback(writer.count, total)
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise ExportCancelledError(f"Export cancelled after {writer.count} records")
+            if progress_callback:
+                progress_callback(writer.count, total)
+            return writer.count
 
     def _export_batch_with_metadata(
         self, batch_job: BatchJob, translations: List[Translation], file_path: str, format_type: str
@@ -271,24 +209,21 @@ class ExportManager:
                 ),
             }
 
-            data = {
-                "export_info": {
-                    "timestamp": datetime.now().isoformat(),
-                    "type": "batch_job",
-                    "format": "json",
-                    "version": "2.0",
-                },
-                "batch_job": job_dict,
-                "translations": [self._translation_to_dict(t) for t in translations],
-                "failed_items": [
-                    {"id": item.id, "error": item.error, "processing_time": item.processing_time}
-                    for item in batch_job.items
-                    if item.status.value == "failed"
-                ],
-            }
+            failed_items = [
+                {"id": item.id, "error": item.error, "processing_time": item.processing_time}
+                for item in batch_job.items
+                if item.status.value == "failed"
+            ]
 
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            self._export_json(
+                translations,
+                file_path,
+                extra={
+                    "batch_job": job_dict,
+                    "failed_items": failed_items,
+                    "export_info": {"type": "batch_job"},
+                },
+            )
 
             return True
 
@@ -418,26 +353,11 @@ class ExportManager:
 
     def _translation_to_dict(self, translation: Translation) -> Dict[str, Any]:
         """Convert Translation object to dictionary"""
-        return {
-            "timestamp": translation.timestamp.isoformat() if translation.timestamp else None,
-            "original_text": translation.original_text,
-            "translated_text": translation.translated_text,
-            "source_language": translation.source_language,
-            "target_language": translation.target_language,
-            "confidence": translation.confidence,
-        }
+        return translation_record(translation)
 
     def _escape_html(self, text: str) -> str:
         """Escape HTML special characters"""
-        if not text:
-            return ""
-        return (
-            text.replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-            .replace('"', "&quot;")
-            .replace("'", "&#x27;")
-        )
+        return escape_html(text)
 
     def get_supported_formats(self) -> List[str]:
         """Get list of supported export formats"""
@@ -448,7 +368,8 @@ class ExportManager:
     ) -> str:
         """Suggest a filename for export"""
         timestamp = datetime.now().strftime("_%Y%m%d_%H%M%S") if include_timestamp else ""
-        return f"{base_name}{timestamp}.{format_type}"
+        extension = ARCHIVE_EXTENSION if format_type == "archive" else f".{format_type}"
+        return f"{base_name}{timestamp}{extension}"
 
 
 # Convenience functions for quick exports
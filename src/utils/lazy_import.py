@@ -0,0 +1,141 @@
+"""
+Lazy import helpers for heavy optional dependencies.
+
+``lazy_import`` returns a module proxy that imports the module on first
+attribute access, or None when the module is not installed, so existing ``if cv2:`` /
+``cv2 is None`` availability checks keep working without paying the import
+at startup. ``lazy_exports`` implements module-level ``__getattr__``
+(PEP 562) for packages that re-export names from heavy submodules.
+"""
+
+import importlib
+import importlib.util
+import sys
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_availability: Dict[str, bool] = {}
+
+
+class _LazyModule(ModuleType):
+    """
+    Proxy that imports its module on first attribute access.
+
+    The import runs under a per-proxy lock, so threads touching the proxy
+    during the first load wait for it instead of seeing a half-initialized
+    module. Every access is forwarded to the real module; nothing is copied,
+    so patches applied to the real module are visible through the proxy.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        # Stored in the instance dict directly; __setattr__ is forwarded
+        vars(self)["_lazy_lock"] = threading.Lock()
+        vars(self)["_lazy_module"] = None
+
+    def _lazy_load(self) -> ModuleType:
+        namespace = vars(self)
+        module = namespace["_lazy_module"]
+        if module is None:
+            with namespace["_lazy_lock"]:
+                module = namespace["_lazy_module"]
+                if module is None:
+                    module = namespace["_lazy_module"] = importlib.import_module(self.__name__)
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._lazy_load(), attr)
+
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._lazy_load(), attr, value)
+
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._lazy_load(), attr)
+
+    def __dir__(self) -> List[str]:
+        return dir(self._lazy_load())
+
+    def __repr__(self) -> str:
+        module = vars(self)["_lazy_module"]
+        return repr(module) if module is not None else f"<lazy module {self.__name__!r}>"
+
+
+def module_available(name: str) -> bool:
+    """
+    Check if a module can be imported, without importing it.
+
+    Args:
+        name: Absolute module name
+
+    Returns:
+        True if the module is installed (result is cached per process)
+    """
+    available = _availability.get(name)
+    if available is None:
+        if name in sys.modules:
+            available = sys.modules[name] is not None
+        else:
+            try:
+                available = importlib.util.find_spec(name) is not None
+            except (ImportError, ValueError):
+                available = False
+        _availability[name] = available
+    return available
+
+
+def lazy_import(name: str) -> Optional[ModuleType]:
+    """
+    Import a module lazily.
+
+    Errors raised by the module code itself surface on first use rather
+    than at import time.
+
+    Args:
+        name: Absolute module name (submodules such as ``PIL.Image`` allowed)
+
+    Returns:
+        Lazy module proxy, already imported module, or None if not installed
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    if not module_available(name):
+        return None
+
+    return _LazyModule(name)
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build PEP 562 ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Usage in a package ``__init__``::
+
+        __getattr__, __dir__ = lazy_exports(__name__, {"Name": ".submodule"})
+
+    Args:
+        package: Name of the package doing the re-export (``__name__``)
+        exports: Exported name -> module path (relative to package or absolute)
+
+    Returns:
+        Tuple of (__getattr__, __dir__) functions
+    """
+
+    def __getattr__(attr: str) -> Any:
+        module_path = exports.get(attr)
+        if module_path is None:
+            raise AttributeError(f"module {package!r} has no attribute {attr!r}")
+
+        value = getattr(importlib.import_module(module_path, package), attr)
+        # Cache in the package namespace; later lookups bypass __getattr__
+        setattr(sys.modules[package], attr, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,7 +1,29 @@
+import atexit
+import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Union
+
+
+class StructuredFormatter(logging.Formatter):
+    """Formats records as JSON lines with structured key/value fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": getattr(record, "event", None) or record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            data.update(fields)
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
 
 
 class AppLogger:
@@ -9,6 +31,7 @@ class AppLogger:
 
     _instance = None
     _initialized = False
+    _listener: Optional[QueueListener] = None
 
     def __new__(cls):
         if cls._instance is None:
@@ -21,8 +44,25 @@ class AppLogger:
             self.setup_logging()
             self._initialized = True
 
-    def setup_logging(self, log_level: str = "INFO", log_file: Optional[str] = None):
-        """Setup logging configuration"""
+    def setup_logging(
+        self,
+        log_level: str = "INFO",
+        log_file: Optional[str] = None,
+        async_sink: bool = False,
+        structured: bool = False,
+    ):
+        """
+        Setup logging configuration
+
+        Args:
+            log_level: Minimum level name
+            log_file: Optional log file path
+            async_sink: Write console/file output from a background listener thread,
+                so callers only enqueue records
+            structured: Emit JSON lines with key/value fields instead of plain text
+        """
+        self._stop_listener()
+
         # Clear existing handlers
         self.logger.handlers.clear()
 
@@ -30,24 +70,55 @@ class AppLogger:
         self.logger.setLevel(getattr(logging, log_level.upper()))
 
         # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
+        if structured:
+            formatter = StructuredFormatter(datefmt="%Y-%m-%d %H:%M:%S")
+        else:
+            formatter = logging.Formatter(
+                "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
 
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
+        handlers = [console_handler]
 
         # File handler if specified
+        file_error = None
         if log_file:
             try:
                 Path(log_file).parent.mkdir(parents=True, exist_ok=True)
                 file_handler = logging.FileHandler(log_file, encoding="utf-8")
                 file_handler.setFormatter(formatter)
-                self.logger.addHandler(file_handler)
+                handlers.append(file_handler)
             except (OSError, PermissionError) as e:
-                self.logger.warning(f"Could not create log file {log_file}: {e}")
+                file_error = e
+
+        if async_sink:
+            # I/O happens on the listener thread; callers only enqueue records
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            self._listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._listener.start()
+            self.logger.addHandler(QueueHandler(log_queue))
+        else:
+            for handler in handlers:
+                self.logger.addHandler(handler)
+
+        if file_error is not None:
+            self.logger.warning(f"Could not create log file {log_file}: {file_error}")
+
+    def shutdown(self):
+        """Flush queued records and stop the background sink"""
+        self._stop_listener()
+
+    def _stop_listener(self):
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether records of the level would be emitted"""
+        return self.logger.isEnabledFor(level)
 
     def log_translation(
         self,
@@ -122,26 +193,49 @@ class AppLogger:
         self.logger.info("Screen Translator shutting down")
 
     # Convenience methods
-    def debug(self, message: str, **kwargs):
+    #
+    # Messages may be passed lazily: either %-style arguments
+    # (``logger.debug("Cache hit for key: %s", key)``) or a zero-argument
+    # callable returning the message. Below the enabled level the call
+    # returns before any formatting; %-style arguments are otherwise left to
+    # the record, which formats them only when a handler emits it.
+    def _log(
+        self,
+        log_method: Callable[..., None],
+        message: Union[str, Callable[[], str]],
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ):
+        exc_info = kwargs.pop("exc_info", None)
+        if callable(message):
+            message = message()
         if kwargs:
-            message += " | " + " | ".join(f"{k}: {v}" for k, v in kwargs.items())
-        self.logger.debug(message)
+            # Fields are rendered into the text, so the event is formatted here
+            event = message % args if args else message
+            message = event + " | " + " | ".join(f"{k}: {v}" for k, v in kwargs.items())
+            log_method(message, exc_info=exc_info, extra={"event": event, "fields": kwargs})
+        elif exc_info:
+            log_method(message, *args, exc_info=exc_info)
+        else:
+            log_method(message, *args)
 
-    def info(self, message: str, **kwargs):
-        if kwargs:
-            message += " | " + " | ".join(f"{k}: {v}" for k, v in kwargs.items())
-        self.logger.info(message)
+    def debug(self, message: Union[str, Callable[[], str]], *args, **kwargs):
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(self.logger.debug, message, args, kwargs)
 
-    def warning(self, message: str, **kwargs):
-        if kwargs:
-            message += " | " + " | ".join(f"{k}: {v}" for k, v in kwargs.items())
-        self.logger.warning(message)
+    def info(self, message: Union[str, Callable[[], str]], *args, **kwargs):
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(self.logger.info, message, args, kwargs)
 
-    def error(self, message: str, **kwargs):
-        if kwargs:
-            message += " | " + " | ".join(f"{k}: {v}" for k, v in kwargs.items())
-        self.logger.error(message)
+    def warning(self, message: Union[str, Callable[[], str]], *args, **kwargs):
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(self.logger.warning, message, args, kwargs)
+
+    def error(self, message: Union[str, Callable[[], str]], *args, **kwargs):
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(self.logger.error, message, args, kwargs)
 
 
 # Global logger instance
 logger = AppLogger()
+atexit.register(logger.shutdown)
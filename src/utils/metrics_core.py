@@ -0,0 +1,264 @@
+"""
+Low-overhead metrics core for operation timing.
+
+Recording touches only the calling thread's shard, so the hot path takes no
+locks. Latencies go into fixed-precision log-linear (HDR-style) histograms,
+which give percentiles without storing individual samples. Readers merge all
+shards on demand; shards of exited threads are folded into a retired shard.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+# Histogram precision: 2**SUB_BUCKET_BITS exact buckets, then
+# 2**(SUB_BUCKET_BITS - 1) buckets per power of two (~3% relative error)
+SUB_BUCKET_BITS = 6
+_SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+
+# Values are recorded in integer microseconds
+_UNITS_PER_SECOND = 1_000_000
+
+
+def bucket_index(value: int) -> int:
+    """Get the histogram bucket of a non-negative integer value."""
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return shift * _SUB_BUCKET_HALF + (value >> shift)
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Get the highest value that falls into a histogram bucket."""
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift = index // _SUB_BUCKET_HALF - 1
+    mantissa = index - shift * _SUB_BUCKET_HALF
+    return ((mantissa + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with sparse buckets (durations in seconds)."""
+
+    __slots__ = ("counts", "count", "errors", "total", "min", "max")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, duration: float, success: bool = True) -> None:
+        """Record one duration."""
+        index = bucket_index(int(duration * _UNITS_PER_SECOND) if duration > 0 else 0)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        self.count += 1
+        self.total += duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        if not success:
+            self.errors += 1
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's data to this one."""
+        # dict() copies atomically under the GIL while the owner keeps writing
+        for index, count in dict(other.counts).items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.errors += other.errors
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Get the duration at a percentile.
+
+        Args:
+            percent: Percentile in the 0-100 range
+
+        Returns:
+            Duration in seconds (upper bound of the matching bucket)
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, int(round(percent / 100.0 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = bucket_upper_bound(index) / _UNITS_PER_SECOND
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, Any]:
+        """Get count, error, mean and percentile summary."""
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total": self.total,
+            "mean": 0.0 if empty else self.total / self.count,
+            "min": 0.0 if empty else self.min,
+            "max": self.max,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+
+class _OperationRecorder:
+    """Per-thread counters of one operation: lifetime and time-sliced histograms."""
+
+    __slots__ = ("lifetime", "slices")
+
+    def __init__(self):
+        self.lifetime = LatencyHistogram()
+        self.slices: Dict[int, LatencyHistogram] = {}
+
+
+class MetricsCore:
+    """Per-thread sharded operation counters with latency histograms."""
+
+    def __init__(self, slice_seconds: float = 60.0, retained_slices: int = 60):
+        """
+        Initialize metrics core.
+
+        Args:
+            slice_seconds: Width of a time slice for windowed statistics
+            retained_slices: Number of time slices kept per operation
+        """
+        self.slice_seconds = slice_seconds
+        self.retained_slices = retained_slices
+        self._local = threading.local()
+        self._shards: List[Tuple[threading.Thread, Dict[str, _OperationRecorder]]] = []
+        self._retired: Dict[str, _OperationRecorder] = {}
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> Dict[str, _OperationRecorder]:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            self._local.shard = shard
+            with self._shards_lock:
+                self._reclaim_shards()
+                self._shards.append((threading.current_thread(), shard))
+        return shard
+
+    def _reclaim_shards(self) -> None:
+        """Fold shards of exited threads into the retired shard (lock held)."""
+        alive = []
+        for thread, shard in self._shards:
+            if thread.is_alive():
+                alive.append((thread, shard))
+                continue
+            for operation, recorder in shard.items():
+                retired = self._retired.get(operation)
+                if retired is None:
+                    retired = self._retired[operation] = _OperationRecorder()
+                retired.lifetime.merge(recorder.lifetime)
+                for slice_id, histogram in recorder.slices.items():
+                    target = retired.slices.get(slice_id)
+                    if target is None:
+                        target = retired.slices[slice_id] = LatencyHistogram()
+                    target.merge(histogram)
+        if len(alive) < len(self._shards):
+            self._shards = alive
+            self._prune_retired()
+
+    def _prune_retired(self) -> None:
+        oldest = int(time.monotonic() // self.slice_seconds) - self.retained_slices
+        for recorder in self._retired.values():
+            for stale in [s for s in recorder.slices if s <= oldest]:
+                del recorder.slices[stale]
+
+    def record(self, operation: str, duration: float, success: bool = True) -> None:
+        """Record an operation; lock-free for the calling thread."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._shard()
+
+        recorder = shard.get(operation)
+        if recorder is None:
+            recorder = shard[operation] = _OperationRecorder()
+
+        recorder.lifetime.record(duration, success)
+
+        slice_id = int(time.monotonic() // self.slice_seconds)
+        current = recorder.slices.get(slice_id)
+        if current is None:
+            current = recorder.slices[slice_id] = LatencyHistogram()
+            oldest = slice_id - self.retained_slices
+            for stale in [s for s in recorder.slices if s <= oldest]:
+                del recorder.slices[stale]
+        current.record(duration, success)
+
+    def operations(self) -> List[str]:
+        """Get names of all recorded operations."""
+        names = set()
+        for shard in self._snapshot_shards():
+            names.update(list(shard))
+        return sorted(names)
+
+    def histogram(self, operation: str, window: Optional[float] = None) -> LatencyHistogram:
+        """
+        Get the merged histogram of an operation.
+
+        Args:
+            operation: Operation name
+            window: Only include the last ``window`` seconds (slice granularity);
+                None for lifetime data
+
+        Returns:
+            Merged histogram
+        """
+        merged = LatencyHistogram()
+        first_slice = None
+        if window is not None:
+            first_slice = int((time.monotonic() - window) // self.slice_seconds)
+
+        for shard in self._snapshot_shards():
+            recorder = shard.get(operation)
+            if recorder is None:
+                continue
+            if first_slice is None:
+                merged.merge(recorder.lifetime)
+            else:
+                for slice_id, histogram in list(recorder.slices.items()):
+                    if slice_id >= first_slice:
+                        merged.merge(histogram)
+        return merged
+
+    def totals(self) -> Tuple[int, int]:
+        """Get ``(count, errors)`` over all operations."""
+        count = errors = 0
+        for shard in self._snapshot_shards():
+            for recorder in list(shard.values()):
+                count += recorder.lifetime.count
+                errors += recorder.lifetime.errors
+        return count, errors
+
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._shards_lock:
+            for _, shard in self._shards:
+                shard.clear()
+            self._retired.clear()
+
+    def shard_count(self) -> int:
+        """Get the number of live per-thread shards."""
+        with self._shards_lock:
+            self._reclaim_shards()
+            return len(self._shards)
+
+    def _snapshot_shards(self) -> List[Dict[str, _OperationRecorder]]:
+        with self._shards_lock:
+            self._reclaim_shards()
+            return [shard for _, shard in self._shards] + [self._retired]
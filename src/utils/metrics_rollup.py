@@ -0,0 +1,393 @@
+"""
+Time-series rollups for dashboard and statistics queries.
+
+Every recorded value is added to a minute, an hour and a day bucket of its
+series (operation plus optional language pair). Buckets are log-linear
+latency histograms from metrics_core, so count, sum, min, max and
+percentiles survive aggregation. Each tier keeps its buckets for a limited
+retention period; range queries combine whole coarse buckets with finer
+buckets at the edges, so their cost depends on the number of buckets, not
+on the number of recorded events.
+
+Timestamps are naive local datetimes, as everywhere else in the
+application; buckets are aligned to local midnight and full hours.
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.utils.logger import logger
+from src.utils.metrics_core import LatencyHistogram
+
+_EPOCH = datetime(1970, 1, 1)
+
+# (operation, language pair or None)
+SeriesKey = Tuple[str, Optional[str]]
+
+# Period label formats for grouped results (ISO week for "week")
+PERIOD_FORMATS = {
+    "minute": "%Y-%m-%d %H:%M",
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+    "week": "%G-W%V",
+    "month": "%Y-%m",
+}
+
+
+@dataclass(frozen=True)
+class RollupTier:
+    """Bucket resolution and retention of one rollup tier (both in seconds)."""
+
+    name: str
+    resolution: int
+    retention: int
+
+
+DEFAULT_TIERS: Tuple[RollupTier, ...] = (
+    RollupTier("minute", 60, 2 * 86400),
+    RollupTier("hour", 3600, 35 * 86400),
+    RollupTier("day", 86400, 400 * 86400),
+)
+
+
+def language_pair_label(
+    source_language: Optional[str], target_language: Optional[str]
+) -> Optional[str]:
+    """Get the series label of a language pair ("en->ru")."""
+    if not target_language:
+        return None
+    return f"{source_language or 'auto'}->{target_language}"
+
+
+def _seconds(timestamp: datetime) -> int:
+    return int((timestamp.replace(tzinfo=None) - _EPOCH).total_seconds())
+
+
+def _datetime(seconds: int) -> datetime:
+    return _EPOCH + timedelta(seconds=seconds)
+
+
+def _copy(histogram: LatencyHistogram) -> LatencyHistogram:
+    merged = LatencyHistogram()
+    merged.merge(histogram)
+    return merged
+
+
+class RollupStore:
+    """Incrementally maintained multi-resolution aggregates."""
+
+    def __init__(
+        self,
+        tiers: Sequence[RollupTier] = DEFAULT_TIERS,
+        clock: Callable[[], datetime] = datetime.now,
+    ):
+        """
+        Initialize rollup store.
+
+        Args:
+            tiers: Tiers from finest to coarsest; each resolution must divide the next
+            clock: Source of the current time (for retention)
+        """
+        self.tiers = tuple(sorted(tiers, key=lambda tier: tier.resolution))
+        self.clock = clock
+        self._buckets: Dict[str, Dict[SeriesKey, Dict[int, LatencyHistogram]]] = {
+            tier.name: {} for tier in self.tiers
+        }
+        self._newest: Dict[str, int] = {tier.name: 0 for tier in self.tiers}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        operation: str,
+        value: float,
+        timestamp: Optional[datetime] = None,
+        success: bool = True,
+        language_pair: Optional[str] = None,
+    ) -> None:
+        """
+        Add one value to every tier.
+
+        Args:
+            operation: Operation or metric name
+            value: Recorded value (seconds for durations)
+            timestamp: Event time (defaults to now)
+            success: False counts the event as an error
+            language_pair: Optional series label, see language_pair_label()
+        """
+        seconds = _seconds(timestamp or self.clock())
+        key = (operation, language_pair)
+
+        with self._lock:
+            for tier in self.tiers:
+                start = seconds - seconds % tier.resolution
+                if start < self._newest[tier.name] - tier.retention:
+                    continue  # Backfill older than the tier keeps
+
+                buckets = self._buckets[tier.name].setdefault(key, {})
+                histogram = buckets.get(start)
+                if histogram is None:
+                    histogram = buckets[start] = LatencyHistogram()
+                    if start > self._newest[tier.name]:
+                        self._newest[tier.name] = start
+                        self._prune(tier, start - tier.retention)
+                histogram.record(value, success)
+
+    def record_many(
+        self, events: Iterable[Tuple[str, float, datetime, bool, Optional[str]]]
+    ) -> None:
+        """Record ``(operation, value, timestamp, success, language_pair)`` tuples."""
+        for operation, value, timestamp, success, language_pair in events:
+            self.record(operation, value, timestamp, success, language_pair)
+
+    def series(self, operation: Optional[str] = None) -> List[SeriesKey]:
+        """Get recorded series, optionally of one operation."""
+        with self._lock:
+            keys = set()
+            for series in self._buckets.values():
+                keys.update(series)
+        return sorted(
+            (key for key in keys if operation is None or key[0] == operation),
+            key=lambda key: (key[0], key[1] or ""),
+        )
+
+    def operations(self) -> List[str]:
+        """Get names of all recorded operations."""
+        return sorted({operation for operation, _ in self.series()})
+
+    def summary(
+        self,
+        operation: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        language_pair: Optional[str] = None,
+    ) -> LatencyHistogram:
+        """
+        Get the merged histogram of an operation over a time range.
+
+        Ranges are resolved to whole buckets: edges use the finest tier that
+        still retains them, so old edges snap outwards to hour or day
+        boundaries.
+
+        Args:
+            operation: Operation name
+            since: Range start (inclusive)
+            until: Range end (inclusive, defaults to now)
+            language_pair: Only this language pair (None for all)
+
+        Returns:
+            Merged histogram
+        """
+        start = _seconds(since)
+        end = _seconds(until or self.clock()) + 1
+        merged = LatencyHistogram()
+
+        with self._lock:
+            keys = self._series_keys(operation, language_pair)
+            for tier, bucket_start in self._plan(start, end, len(self.tiers) - 1):
+                tier_buckets = self._buckets[tier.name]
+                for key in keys:
+                    histogram = tier_buckets.get(key, {}).get(bucket_start)
+                    if histogram is not None:
+                        merged.merge(histogram)
+        return merged
+
+    def breakdown(
+        self, operation: str, since: datetime, until: Optional[datetime] = None
+    ) -> Dict[Optional[str], LatencyHistogram]:
+        """Get summary() per language pair."""
+        return {
+            language_pair: self.summary(operation, since, until, language_pair)
+            for _, language_pair in self.series(operation)
+        }
+
+    def timeline(
+        self,
+        operation: str,
+        since: datetime,
+        until: Optional[datetime] = None,
+        group_by: str = "hour",
+        language_pair: Optional[str] = None,
+    ) -> List[Tuple[str, LatencyHistogram]]:
+        """
+        Get per-period histograms of an operation.
+
+        Args:
+            operation: Operation name
+            since: Range start
+            until: Range end (defaults to now)
+            group_by: Key of PERIOD_FORMATS
+            language_pair: Only this language pair (None for all)
+
+        Returns:
+            ``(period label, histogram)`` pairs for non-empty periods, oldest
+            first; periods past the retention of the matching tier are missing
+        """
+        label_format = PERIOD_FORMATS[group_by]
+        tier = self._tier_for(group_by)
+        start = _seconds(since)
+        end = _seconds(until or self.clock()) + 1
+        periods: Dict[str, LatencyHistogram] = {}
+
+        with self._lock:
+            keys = self._series_keys(operation, language_pair)
+            tier_buckets = self._buckets[tier.name]
+            first = start - start % tier.resolution
+            for bucket_start in range(first, end, tier.resolution):
+                for key in keys:
+                    histogram = tier_buckets.get(key, {}).get(bucket_start)
+                    if histogram is None:
+                        continue
+                    label = _datetime(bucket_start).strftime(label_format)
+                    period = periods.get(label)
+                    if period is None:
+                        periods[label] = _copy(histogram)
+                    else:
+                        period.merge(histogram)
+        return list(periods.items())
+
+    def bucket_count(self) -> int:
+        """Get the number of stored buckets over all tiers."""
+        with self._lock:
+            return sum(
+                len(buckets) for series in self._buckets.values() for buckets in series.values()
+            )
+
+    def clear(self) -> None:
+        """Drop all buckets."""
+        with self._lock:
+            for series in self._buckets.values():
+                series.clear()
+            self._newest = {tier.name: 0 for tier in self.tiers}
+
+    def save(self, file_path: str) -> None:
+        """Write all buckets to a JSON file (atomically)."""
+        with self._lock:
+            data = {
+                tier_name: [
+                    {
+                        "operation": operation,
+                        "language_pair": language_pair,
+                        "buckets": {
+                            str(start): [
+                                {str(index): count for index, count in h.counts.items()},
+                                h.count,
+                                h.errors,
+                                h.total,
+                                h.min,
+                                h.max,
+                            ]
+                            for start, h in buckets.items()
+                        },
+                    }
+                    for (operation, language_pair), buckets in series.items()
+                ]
+                for tier_name, series in self._buckets.items()
+            }
+
+        path = Path(file_path)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "tiers": data}, f)
+        os.replace(temp_path, path)
+
+    def load(self, file_path: str) -> int:
+        """
+        Merge buckets from a file written by save().
+
+        Returns:
+            Number of loaded buckets (0 if the file is missing or invalid)
+        """
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                tiers = json.load(f)["tiers"]
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Failed to load metric rollups from {file_path}: {e}")
+            return 0
+
+        loaded = 0
+        with self._lock:
+            for tier in self.tiers:
+                for entry in tiers.get(tier.name, []):
+                    key = (entry["operation"], entry.get("language_pair"))
+                    buckets = self._buckets[tier.name].setdefault(key, {})
+                    for start, (counts, count, errors, total, low, high) in entry[
+                        "buckets"
+                    ].items():
+                        histogram = LatencyHistogram()
+                        histogram.counts = {int(index): n for index, n in counts.items()}
+                        histogram.count, histogram.errors, histogram.total = count, errors, total
+                        histogram.min, histogram.max = low, high
+                        existing = buckets.get(int(start))
+                        if existing is None:
+                            buckets[int(start)] = histogram
+                        else:
+                            existing.merge(histogram)
+                        self._newest[tier.name] = max(self._newest[tier.name], int(start))
+                        loaded += 1
+                self._prune(tier, self._newest[tier.name] - tier.retention)
+        return loaded
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get bucket counts per tier."""
+        with self._lock:
+            return {
+                tier.name: {
+                    "resolution_seconds": tier.resolution,
+                    "retention_seconds": tier.retention,
+                    "series": len(self._buckets[tier.name]),
+                    "buckets": sum(len(b) for b in self._buckets[tier.name].values()),
+                }
+                for tier in self.tiers
+            }
+
+    def _series_keys(self, operation: str, language_pair: Optional[str]) -> List[SeriesKey]:
+        if language_pair is not None:
+            return [(operation, language_pair)]
+        keys = set()
+        for series in self._buckets.values():
+            keys.update(key for key in series if key[0] == operation)
+        return list(keys)
+
+    def _tier_for(self, group_by: str) -> RollupTier:
+        """Coarsest tier whose buckets nest into the requested periods."""
+        limit = {"minute": 60, "hour": 3600}.get(group_by, 86400)
+        candidates = [tier for tier in self.tiers if tier.resolution <= limit]
+        return candidates[-1] if candidates else self.tiers[0]
+
+    def _plan(self, start: int, end: int, level: int) -> List[Tuple[RollupTier, int]]:
+        """Cover [start, end) with whole buckets of tiers[level] and finer edge buckets."""
+        tier = self.tiers[level]
+        resolution = tier.resolution
+        first = -(-start // resolution) * resolution
+        last = end - end % resolution
+
+        if level == 0 or first >= last and not self._retains(level - 1, start):
+            return [(tier, s) for s in range(start - start % resolution, end, resolution)]
+        if first >= last:
+            return self._plan(start, end, level - 1)
+
+        plan = [(tier, s) for s in range(first, last, resolution)]
+        for edge_start, edge_end in ((start, first), (last, end)):
+            if edge_start >= edge_end:
+                continue
+            if self._retains(level - 1, edge_start):
+                plan.extend(self._plan(edge_start, edge_end, level - 1))
+            else:
+                plan.append((tier, edge_start - edge_start % resolution))
+        return plan
+
+    def _retains(self, level: int, seconds: int) -> bool:
+        tier = self.tiers[level]
+        return seconds >= _seconds(self.clock()) - tier.retention
+
+    def _prune(self, tier: RollupTier, cutoff: int) -> None:
+        for buckets in self._buckets[tier.name].values():
+            for start in [s for s in buckets if s < cutoff]:
+                del buckets[start]
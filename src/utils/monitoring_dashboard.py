@@ -207,6 +207,7 @@ class MonitoringDashboard:
                     "system_performance": self.performance_monitor.get_system_performance(),
                     "circuit_breaker_details": self.circuit_monitor.get_service_details(),
                     "metric_summaries": self._get_metric_summaries(),
+                    "operation_trends": self._get_operation_trends(),
                 },
                 "active_alerts": [
                     asdict(alert) for alert in self.alert_manager.get_active_alerts()
@@ -242,6 +243,13 @@ class MonitoringDashboard:
 
         return summaries
 
+    def _get_operation_trends(self, hours: int = 24) -> Dict[str, Any]:
+        """Get hourly statistics of recorded operations (read from rollups)."""
+        return {
+            operation: self.performance_monitor.get_operation_trends(operation, hours)
+            for operation in self.performance_monitor.rollups.operations()
+        }
+
     def _get_recent_events(self, hours: int = 1) -> List[Dict[str, Any]]:
         """Get recent significant events."""
         events = []
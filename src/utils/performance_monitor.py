@@ -6,7 +6,7 @@ import json
 import platform
 import threading
 import time
-from collections import defaultdict, deque
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional
@@ -14,6 +14,8 @@ from typing import Any, Callable, Dict, List, Optional
 import psutil
 
 from src.utils.logger import logger
+from src.utils.metrics_core import MetricsCore
+from src.utils.metrics_rollup import RollupStore, language_pair_label
 
 
 @dataclass
@@ -51,14 +53,21 @@ class PerformanceMonitor:
         self.max_metrics = max_metrics
         self.enable_system_monitoring = enable_system_monitoring
 
-        # Metrics storage
-        self.metrics: deque = deque(maxlen=max_metrics)
+        # Raw samples as plain tuples (see _to_metric); metrics builds objects on demand
+        self._samples: deque = deque(maxlen=max_metrics)
         self.system_stats: deque = deque(maxlen=max_metrics // 10)  # Less frequent
 
-        # Operation counters
-        self.operation_counts: defaultdict[str, int] = defaultdict(int)
-        self.operation_total_time: defaultdict[str, float] = defaultdict(float)
-        self.operation_errors: defaultdict[str, int] = defaultdict(int)
+        # Operation counters and latency histograms (lock-free per thread)
+        self.metrics_core = MetricsCore()
+
+        # Minute/hour/day aggregates for reports over long periods, fed from
+        # pending samples when read instead of on every record
+        self._rollups = RollupStore()
+        self._pending_rollups: deque = deque()
+
+        # Latest system sample, refreshed by the background monitor only
+        self._last_cpu_percent = 0.0
+        self._last_memory_used_mb = 0.0
 
         # Thread safety
         self._lock = threading.Lock()
@@ -110,76 +119,122 @@ class PerformanceMonitor:
     ) -> None:
         """Record a performance metric for an operation"""
         try:
-            # Get current system stats
-            cpu_percent = psutil.cpu_percent(interval=None)
-            memory_info = psutil.virtual_memory()
-            psutil.Process()
-
-            metric = PerformanceMetric(
-                timestamp=datetime.now(),
-                operation=operation,
-                duration=duration,
-                memory_used=memory_info.used / (1024 * 1024),  # MB
-                cpu_percent=cpu_percent,
-                success=success,
-                error_message=error_message,
-                metadata=metadata or {},
+            self.metrics_core.record(operation, duration, success)
+
+            # System stats come from the latest background sample, not psutil calls
+            sample = (
+                time.time(),
+                operation,
+                duration,
+                success,
+                error_message,
+                metadata,
+                self._last_memory_used_mb,
+                self._last_cpu_percent,
             )
-
-            with self._lock:
-                self.metrics.append(metric)
-
-                # Update counters
-                self.operation_counts[operation] += 1
-                self.operation_total_time[operation] += duration
-                if not success:
-                    self.operation_errors[operation] += 1
+            self._samples.append(sample)
+            self._pending_rollups.append(sample)
+            if len(self._pending_rollups) > self.max_metrics:
+                self._flush_rollups()
 
             # Check for performance alerts
-            self._check_alerts(metric)
+            if not success or duration > self.alert_thresholds["operation_slow"]:
+                self._check_alerts(self._to_metric(sample))
 
         except Exception as e:
             logger.error(f"Failed to record performance metric: {e}")
 
+    @property
+    def metrics(self) -> List[PerformanceMetric]:
+        """Recent individual measurements, oldest first"""
+        return [self._to_metric(sample) for sample in list(self._samples)]
+
+    @property
+    def rollups(self) -> RollupStore:
+        """Minute/hour/day aggregates including all recorded operations"""
+        self._flush_rollups()
+        return self._rollups
+
+    @staticmethod
+    def _to_metric(sample: tuple) -> PerformanceMetric:
+        wall_time, operation, duration, success, error_message, metadata, memory, cpu = sample
+        return PerformanceMetric(
+            timestamp=datetime.fromtimestamp(wall_time),
+            operation=operation,
+            duration=duration,
+            memory_used=memory,
+            cpu_percent=cpu,
+            success=success,
+            error_message=error_message,
+            metadata=metadata or {},
+        )
+
+    def _flush_rollups(self) -> None:
+        """Move pending samples into the rollup store"""
+        pending = self._pending_rollups
+        while True:
+            try:
+                wall_time, operation, duration, success, _, metadata, _, _ = pending.popleft()
+            except IndexError:
+                return
+            self._rollups.record(
+                operation,
+                duration,
+                datetime.fromtimestamp(wall_time),
+                success,
+                self._language_pair(metadata or {}),
+            )
+
+    @property
+    def operation_counts(self) -> Dict[str, int]:
+        """Total number of recordings per operation"""
+        return {op: self.metrics_core.histogram(op).count for op in self.metrics_core.operations()}
+
+    @property
+    def operation_total_time(self) -> Dict[str, float]:
+        """Total recorded duration per operation"""
+        return {op: self.metrics_core.histogram(op).total for op in self.metrics_core.operations()}
+
+    @property
+    def operation_errors(self) -> Dict[str, int]:
+        """Number of failed recordings per operation"""
+        return {op: self.metrics_core.histogram(op).errors for op in self.metrics_core.operations()}
+
     def measure_operation(self, operation_name: str, metadata: Optional[Dict] = None):
         """Decorator/context manager for measuring operation performance"""
         return OperationMeasurer(self, operation_name, metadata)
 
     def get_operation_stats(self, operation: str) -> Dict[str, Any]:
         """Get statistics for a specific operation"""
-        with self._lock:
-            count = self.operation_counts.get(operation, 0)
-            total_time = self.operation_total_time.get(operation, 0.0)
-            errors = self.operation_errors.get(operation, 0)
+        lifetime = self.metrics_core.histogram(operation)
+        count = lifetime.count
 
         if count == 0:
             return {"operation": operation, "count": 0}
 
-        # Get recent metrics for this operation
-        recent_metrics = [
-            m
-            for m in self.metrics
-            if m.operation == operation and m.timestamp > datetime.now() - timedelta(hours=1)
-        ]
-
-        durations = [m.duration for m in recent_metrics]
+        # Recent data comes from the last hour of time-sliced histograms
+        recent = self.metrics_core.histogram(operation, window=3600).summary()
 
         return {
             "operation": operation,
             "total_count": count,
-            "total_time": total_time,
-            "average_time": total_time / count,
-            "error_count": errors,
-            "error_rate": errors / count,
-            "recent_count": len(recent_metrics),
-            "recent_avg_time": sum(durations) / len(durations) if durations else 0,
-            "recent_min_time": min(durations) if durations else 0,
-            "recent_max_time": max(durations) if durations else 0,
+            "total_time": lifetime.total,
+            "average_time": lifetime.total / count,
+            "error_count": lifetime.errors,
+            "error_rate": lifetime.errors / count,
+            "p50_time": lifetime.percentile(50),
+            "p95_time": lifetime.percentile(95),
+            "p99_time": lifetime.percentile(99),
+            "recent_count": recent["count"],
+            "recent_avg_time": recent["mean"],
+            "recent_min_time": recent["min"],
+            "recent_max_time": recent["max"],
+            "recent_p95_time": recent["p95"],
         }
 
     def get_all_operation_stats(self) -> List[Dict[str, Any]]:
         """Get statistics for all operations"""
-        operations = list(self.operation_counts.keys())
+        operations = self.metrics_core.operations()
         return [self.get_operation_stats(op) for op in operations]
 
     def get_system_performance(self) -> Dict[str, Any]:
@@ -228,8 +283,8 @@ class PerformanceMonitor:
                         successful_operations / total_operations if total_operations else 1.0
                     ),
                     "average_duration": avg_operation_time,
-                    "total_operations": sum(self.operation_counts.values()),
-                    "total_errors": sum(self.operation_errors.values()),
+                    "total_operations": self.metrics_core.totals()[0],
+                    "total_errors": self.metrics_core.totals()[1],
                 },
             }
 
@@ -242,33 +297,30 @@ class PerformanceMonitor:
         try:
             cutoff_time = datetime.now() - timedelta(hours=hours)
 
-            # Filter metrics by time period
-            period_metrics = [m for m in self.metrics if m.timestamp > cutoff_time]
-
-            if not period_metrics:
-                return {"message": f"No metrics available for the last {hours} hours"}
-
-            # Group by operation
-            by_operation = defaultdict(list)
-            for metric in period_metrics:
-                by_operation[metric.operation].append(metric)
-
-            # Calculate statistics per operation
+            # Aggregate rollup buckets instead of scanning individual metrics
             operation_stats = {}
-            for operation, metrics in by_operation.items():
-                durations = [m.duration for m in metrics]
-                success_count = len([m for m in metrics if m.success])
+            for operation in self.rollups.operations():
+                histogram = self.rollups.summary(operation, cutoff_time)
+                if histogram.count == 0:
+                    continue
 
                 operation_stats[operation] = {
-                    "count": len(metrics),
-                    "success_rate": success_count / len(metrics),
-                    "avg_duration": sum(durations) / len(durations),
-                    "min_duration": min(durations),
-                    "max_duration": max(durations),
-                    "total_duration": sum(durations),
-                    "error_count": len(metrics) - success_count,
+                    "count": histogram.count,
+                    "success_rate": (histogram.count - histogram.errors) / histogram.count,
+                    "avg_duration": histogram.total / histogram.count,
+                    "min_duration": histogram.min,
+                    "max_duration": histogram.max,
+                    "p95_duration": histogram.percentile(95),
+                    "total_duration": histogram.total,
+                    "error_count": histogram.errors,
                 }
 
+            if not operation_stats:
+                return {"message": f"No metrics available for the last {hours} hours"}
+
+            total_operations = sum(stats["count"] for stats in operation_stats.values())
+            total_errors = sum(stats["error_count"] for stats in operation_stats.values())
+
             # System resource analysis
             system_data = list(self.system_stats)
             if system_data:
@@ -291,10 +343,9 @@ class PerformanceMonitor:
             return {
                 "report_period": f"{hours} hours",
                 "generated_at": datetime.now().isoformat(),
-                "total_operations": len(period_metrics),
-                "unique_operations": len(by_operation),
-                "overall_success_rate": len([m for m in period_metrics if m.success])
-                / len(period_metrics),
+                "total_operations": total_operations,
+                "unique_operations": len(operation_stats),
+                "overall_success_rate": (total_operations - total_errors) / total_operations,
                 "operation_statistics": operation_stats,
                 "system_analysis": system_analysis,
                 "insights": insights,
@@ -305,6 +356,26 @@ class PerformanceMonitor:
             logger.error(f"Failed to generate performance report: {e}")
             return {"error": str(e)}
 
+    def get_operation_trends(
+        self, operation: str, hours: int = 24, group_by: str = "hour"
+    ) -> List[Dict[str, Any]]:
+        """Get per-period statistics of an operation from rollups"""
+        since = datetime.now() - timedelta(hours=hours)
+        return [
+            {"period": period, **histogram.summary()}
+            for period, histogram in self.rollups.timeline(operation, since, group_by=group_by)
+        ]
+
+    @staticmethod
+    def _language_pair(metadata: Dict[str, Any]) -> Optional[str]:
+        """Get the language pair label of an operation from its metadata"""
+        if "language_pair" in metadata:
+            return metadata["language_pair"]
+        return language_pair_label(
+            metadata.get("source_language") or metadata.get("source_lang"),
+            metadata.get("target_language") or metadata.get("target_lang"),
+        )
+
     def export_metrics(self, file_path: str, format_type: str = "json") -> bool:
         """Export performance metrics to file"""
         try:
@@ -393,6 +464,9 @@ class PerformanceMonitor:
 
                 with self._lock:
                     self.system_stats.append(stats)
+                self._flush_rollups()
+                self._last_cpu_percent = cpu_percent
+                self._last_memory_used_mb = stats.memory_used_mb
 
                 # Check system alerts
                 self._check_system_alerts(stats)
@@ -420,13 +494,10 @@ class PerformanceMonitor:
         # Operation error alert
         if not metric.success:
             # Check error rate for this operation
-            operation_metrics = [m for m in self.metrics if m.operation == metric.operation]
-            recent_metrics = [
-                m for m in operation_metrics if m.timestamp > datetime.now() - timedelta(minutes=10)
-            ]
+            recent = self.metrics_core.histogram(metric.operation, window=600)
 
-            if len(recent_metrics) >= 5:  # Need some data
-                error_rate = len([m for m in recent_metrics if not m.success]) / len(recent_metrics)
+            if recent.count >= 5:  # Need some data
+                error_rate = recent.errors / recent.count
                 if error_rate > self.alert_thresholds["error_rate_high"]:
                     alerts.append(
                         {
@@ -547,12 +618,12 @@ class OperationMeasurer:
         self.error_message: Optional[str] = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         _ = exc_tb  # Unused parameter - not needed for basic error handling
-        duration = time.time() - (self.start_time or 0)
+        duration = time.perf_counter() - (self.start_time or 0)
 
         if exc_type is not None:
             self.success = False
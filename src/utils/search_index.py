@@ -0,0 +1,472 @@
+"""
+Full-text search index for translation history.
+
+Inverted index over original and translated text with Unicode-aware
+tokenization and CJK n-grams, supporting prefix and phrase queries plus
+language and date filters. Updated incrementally as translations are saved.
+"""
+
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+FIELDS = ("original", "translated")
+
+_WORD_RE = re.compile(r"\w+")
+_QUERY_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+# Hiragana/Katakana, CJK ideographs (incl. extensions) and Hangul syllables
+_CJK_RANGES = (
+    (0x3040, 0x30FF),
+    (0x31F0, 0x31FF),
+    (0x3400, 0x4DBF),
+    (0x4E00, 0x9FFF),
+    (0xAC00, 0xD7AF),
+    (0xF900, 0xFAFF),
+    (0xFF66, 0xFF9F),
+    (0x20000, 0x2FFFF),
+)
+
+_CJK_CLASS = "".join(f"{chr(low)}-{chr(high)}" for low, high in _CJK_RANGES)
+# Group 1: CJK run, group 2: run of other word characters
+_RUN_RE = re.compile(rf"([{_CJK_CLASS}]+)|([^\W{_CJK_CLASS}]+)")
+
+Timestamp = Union[datetime, float, int, None]
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for indexing: NFKC, casefold, punctuation-free words."""
+    normalized = unicodedata.normalize("NFKC", text or "").casefold()
+    return " ".join(_WORD_RE.findall(normalized))
+
+
+def _split_runs(word: str) -> List[Tuple[str, bool]]:
+    """Split a word into alternating non-CJK and CJK runs."""
+    return [(match.group(), match.group(1) is not None) for match in _RUN_RE.finditer(word)]
+
+
+def _cjk_grams(run: str) -> List[str]:
+    """Unigrams and bigrams of a CJK run."""
+    grams = list(run)
+    grams.extend(run[i : i + 2] for i in range(len(run) - 1))
+    return grams
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Tokenize text into index terms.
+
+    Non-CJK runs become whole-word tokens, CJK runs are split into
+    character unigrams and bigrams since they carry no word separators.
+    """
+    return _tokenize_normalized(normalize_text(text))
+
+
+def _tokenize_normalized(normalized: str) -> Set[str]:
+    tokens: Set[str] = set()
+    for match in _RUN_RE.finditer(normalized):
+        cjk_run, word = match.groups()
+        if cjk_run is not None:
+            tokens.update(_cjk_grams(cjk_run))
+        else:
+            tokens.add(word)
+    return tokens
+
+
+def _to_epoch(value: Timestamp) -> float:
+    if value is None:
+        return 0.0
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class _Clause:
+    """A single query clause: a term or a phrase."""
+
+    __slots__ = ("terms", "prefix", "phrase")
+
+    def __init__(self, terms: List[str], prefix: bool, phrase: Optional[str]):
+        self.terms = terms  # Exact-match index terms
+        self.prefix = prefix  # Last non-CJK term is matched as prefix
+        self.phrase = phrase  # Normalized text that must appear verbatim
+
+
+def parse_query(query: str, prefix: bool = False, phrase: bool = False) -> List[_Clause]:
+    """
+    Parse a search query into clauses.
+
+    Quoted segments are phrase queries, a trailing ``*`` marks a prefix term.
+
+    Args:
+        query: Raw query string
+        prefix: Treat every bare term as a prefix (search-as-you-type)
+        phrase: Treat the whole query as one phrase (substring semantics)
+    """
+    if phrase:
+        parts = [(query, True, prefix)]
+    else:
+        parts = []
+        for match in _QUERY_RE.finditer(query or ""):
+            quoted, bare = match.groups()
+            if quoted is not None:
+                parts.append((quoted, True, False))
+            else:
+                is_prefix = prefix or bare.endswith("*")
+                parts.append((bare.rstrip("*"), False, is_prefix))
+
+    clauses = []
+    for text, is_phrase, is_prefix in parts:
+        normalized = normalize_text(text)
+        if not normalized:
+            continue
+        words = normalized.split()
+        if not is_phrase and len(words) > 1:
+            # Punctuation inside a bare term (e.g. "e-mail") splits it
+            is_phrase = True
+
+        terms: List[str] = []
+        needs_verify = is_phrase
+        last_prefix = False
+        for index, word in enumerate(words):
+            runs = _split_runs(word)
+            for run_index, (run, is_cjk) in enumerate(runs):
+                is_last = index == len(words) - 1 and run_index == len(runs) - 1
+                if is_cjk:
+                    if len(run) == 1:
+                        terms.append(run)
+                    else:
+                        terms.extend(run[i : i + 2] for i in range(len(run) - 1))
+                        needs_verify = True
+                else:
+                    terms.append(run)
+                    last_prefix = is_last and is_prefix
+        clauses.append(_Clause(terms, last_prefix, normalized if needs_verify else None))
+    return clauses
+
+
+class TranslationSearchIndex:
+    """Thread-safe inverted index over translation history."""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, Dict[str, Set[str]]] = {field: {} for field in FIELDS}
+        self._vocab: Dict[str, List[str]] = {field: [] for field in FIELDS}
+        self._texts: Dict[str, Tuple[str, str]] = {}
+        self._tokens: Dict[str, Tuple[Set[str], Set[str]]] = {}
+        self._languages: Dict[str, Tuple[str, str]] = {}
+        self._by_language: Dict[Tuple[str, str], Set[str]] = {}
+        self._timestamps: Dict[str, float] = {}
+        self._by_time: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, doc_id: object) -> bool:
+        return doc_id in self._texts
+
+    def add(
+        self,
+        doc_id: str,
+        original: str,
+        translated: str,
+        source_language: str = "",
+        target_language: str = "",
+        timestamp: Timestamp = None,
+    ) -> None:
+        """Add or replace a document in the index."""
+        with self._lock:
+            if doc_id in self._texts:
+                self._remove(doc_id)
+            self._add(doc_id, original, translated, source_language, target_language, timestamp)
+
+    def _add(
+        self,
+        doc_id: str,
+        original: str,
+        translated: str,
+        source_language: str,
+        target_language: str,
+        timestamp: Timestamp,
+        bulk: bool = False,
+    ) -> None:
+        # In bulk mode sorted lists are appended to and sorted once afterwards
+        texts = (normalize_text(original), normalize_text(translated))
+        field_tokens = (_tokenize_normalized(texts[0]), _tokenize_normalized(texts[1]))
+        for field, tokens in zip(FIELDS, field_tokens):
+            postings = self._postings[field]
+            vocab = self._vocab[field]
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is None:
+                    ids = postings[token] = set()
+                    if bulk:
+                        vocab.append(token)
+                    else:
+                        bisect.insort(vocab, token)
+                ids.add(doc_id)
+
+        self._texts[doc_id] = texts
+        self._tokens[doc_id] = field_tokens
+        self._languages[doc_id] = (source_language, target_language)
+        self._by_language.setdefault(("source", source_language), set()).add(doc_id)
+        self._by_language.setdefault(("target", target_language), set()).add(doc_id)
+
+        epoch = _to_epoch(timestamp)
+        self._timestamps[doc_id] = epoch
+        if bulk:
+            self._by_time.append((epoch, doc_id))
+        else:
+            bisect.insort(self._by_time, (epoch, doc_id))
+
+    def add_translation(self, translation) -> None:
+        """Index a ``models.translation.Translation``."""
+        self.add(
+            translation.id,
+            translation.original_text,
+            translation.translated_text,
+            translation.source_language,
+            translation.target_language,
+            translation.timestamp,
+        )
+
+    def remove(self, doc_id: str) -> bool:
+        """Remove a document from the index."""
+        with self._lock:
+            if doc_id not in self._texts:
+                return False
+            self._remove(doc_id)
+            return True
+
+    def _remove(self, doc_id: str) -> None:
+        for field, tokens in zip(FIELDS, self._tokens.pop(doc_id)):
+            postings = self._postings[field]
+            vocab = self._vocab[field]
+            for token in tokens:
+                ids = postings.get(token)
+                if ids is None:
+                    continue
+                ids.discard(doc_id)
+                if not ids:
+                    del postings[token]
+                    pos = bisect.bisect_left(vocab, token)
+                    if pos < len(vocab) and vocab[pos] == token:
+                        del vocab[pos]
+
+        del self._texts[doc_id]
+        source, target = self._languages.pop(doc_id)
+        for key in (("source", source), ("target", target)):
+            ids = self._by_language.get(key)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self._by_language[key]
+
+        epoch = self._timestamps.pop(doc_id)
+        pos = bisect.bisect_left(self._by_time, (epoch, doc_id))
+        if pos < len(self._by_time) and self._by_time[pos] == (epoch, doc_id):
+            del self._by_time[pos]
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._reset()
+
+    def rebuild(self, translations: Iterable) -> None:
+        """Replace index contents with the given translations."""
+        unique = {translation.id: translation for translation in translations}
+        with self._lock:
+            self._reset()
+            for translation in unique.values():
+                self._add(
+                    translation.id,
+                    translation.original_text,
+                    translation.translated_text,
+                    translation.source_language,
+                    translation.target_language,
+                    translation.timestamp,
+                    bulk=True,
+                )
+            for vocab in self._vocab.values():
+                vocab.sort()
+            self._by_time.sort()
+
+    def search(
+        self,
+        query: str = "",
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        since: Timestamp = None,
+        until: Timestamp = None,
+        limit: Optional[int] = None,
+        fields: Sequence[str] = FIELDS,
+        prefix: bool = False,
+        phrase: bool = False,
+        within: Optional[Sequence[str]] = None,
+    ) -> List[str]:
+        """
+        Search the index.
+
+        Args:
+            query: Query string; see ``parse_query`` for the syntax
+            source_language: Only match this source language
+            target_language: Only match this target language
+            since: Only match documents at or after this time
+            until: Only match documents at or before this time
+            limit: Maximum number of results
+            fields: Text fields to search ("original", "translated")
+            prefix: Match bare terms as prefixes
+            phrase: Treat the whole query as a single phrase
+            within: Only check these document IDs (narrowing a previous
+                result); matches are returned in the given order
+
+        Returns:
+            Matching document IDs, most recent first
+        """
+        clauses = parse_query(query, prefix=prefix, phrase=phrase)
+        low = _to_epoch(since) if since is not None else None
+        high = _to_epoch(until) if until is not None else None
+
+        with self._lock:
+            if within is not None:
+                return self._filter_within(
+                    within, clauses, source_language, target_language, low, high, limit, fields
+                )
+
+            candidates: Optional[Set[str]] = None
+            for clause in clauses:
+                matched = self._match_clause(clause, fields)
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    return []
+
+            for key in (("source", source_language), ("target", target_language)):
+                if key[1] is None:
+                    continue
+                ids = self._by_language.get(key, set())
+                candidates = set(ids) if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+
+            if candidates is None:
+                return self._scan_by_time(low, high, limit)
+
+            timestamps = self._timestamps
+            if low is not None or high is not None:
+                candidates = {
+                    doc_id
+                    for doc_id in candidates
+                    if (low is None or timestamps[doc_id] >= low)
+                    and (high is None or timestamps[doc_id] <= high)
+                }
+
+            key = lambda doc_id: (timestamps[doc_id], doc_id)  # noqa: E731
+            if limit is not None:
+                return heapq.nlargest(limit, candidates, key=key)
+            return sorted(candidates, key=key, reverse=True)
+
+    def _filter_within(
+        self,
+        within: Sequence[str],
+        clauses: List[_Clause],
+        source_language: Optional[str],
+        target_language: Optional[str],
+        low: Optional[float],
+        high: Optional[float],
+        limit: Optional[int],
+        fields: Sequence[str],
+    ) -> List[str]:
+        """Check candidates one by one; cost is bounded by ``len(within)``."""
+        positions = [FIELDS.index(field) for field in fields]
+        result = []
+        for doc_id in within:
+            languages = self._languages.get(doc_id)
+            if languages is None:
+                continue
+            if source_language is not None and languages[0] != source_language:
+                continue
+            if target_language is not None and languages[1] != target_language:
+                continue
+            epoch = self._timestamps[doc_id]
+            if (low is not None and epoch < low) or (high is not None and epoch > high):
+                continue
+            if all(self._doc_matches_clause(doc_id, clause, positions) for clause in clauses):
+                result.append(doc_id)
+                if limit is not None and len(result) >= limit:
+                    break
+        return result
+
+    def _doc_matches_clause(self, doc_id: str, clause: _Clause, positions: List[int]) -> bool:
+        field_tokens = self._tokens[doc_id]
+        texts = self._texts[doc_id]
+        last = len(clause.terms) - 1
+        for index, term in enumerate(clause.terms):
+            if clause.prefix and index == last:
+                found = any(
+                    token.startswith(term) for pos in positions for token in field_tokens[pos]
+                )
+            else:
+                found = any(term in field_tokens[pos] for pos in positions)
+            if not found:
+                return False
+        if clause.phrase is not None:
+            return any(clause.phrase in texts[pos] for pos in positions)
+        return True
+
+    def _scan_by_time(
+        self, low: Optional[float], high: Optional[float], limit: Optional[int]
+    ) -> List[str]:
+        """Range scan over the time-ordered list, newest first."""
+        start = 0 if low is None else bisect.bisect_left(self._by_time, (low, ""))
+        if high is None:
+            end = len(self._by_time)
+        else:
+            end = bisect.bisect_left(self._by_time, (high, chr(0x10FFFF)))
+        if limit is not None:
+            start = max(start, end - limit)
+        return [doc_id for _, doc_id in reversed(self._by_time[start:end])]
+
+    def _lookup(self, field: str, term: str, prefix: bool) -> Set[str]:
+        postings = self._postings[field]
+        if not prefix:
+            return postings.get(term, set())
+
+        vocab = self._vocab[field]
+        result: Set[str] = set()
+        pos = bisect.bisect_left(vocab, term)
+        while pos < len(vocab) and vocab[pos].startswith(term):
+            result |= postings[vocab[pos]]
+            pos += 1
+        return result
+
+    def _match_clause(self, clause: _Clause, fields: Sequence[str]) -> Set[str]:
+        matched: Optional[Set[str]] = None
+        last = len(clause.terms) - 1
+        for index, term in enumerate(clause.terms):
+            is_prefix = clause.prefix and index == last
+            ids: Set[str] = set()
+            for field in fields:
+                ids |= self._lookup(field, term, is_prefix)
+            matched = ids if matched is None else matched & ids
+            if not matched:
+                return set()
+
+        if matched is None:
+            return set()
+
+        if clause.phrase is not None:
+            positions = [FIELDS.index(field) for field in fields]
+            phrase_text = clause.phrase
+            matched = {
+                doc_id
+                for doc_id in matched
+                if any(phrase_text in self._texts[doc_id][pos] for pos in positions)
+            }
+        return matched
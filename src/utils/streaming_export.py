@@ -0,0 +1,541 @@
+"""
+Streaming exporters for translation history.
+
+Writers consume any iterable of records (legacy ``models.Translation``,
+domain ``Translation`` entities or plain dicts) and write them in fixed-size
+chunks, so peak memory does not depend on the export size. Each chunk
+reports progress and checks for cancellation; output goes to a temporary
+file that replaces the target only when the export completes.
+
+Because the number of records is not known up front, summary data such as
+the record count is written after the records (JSON ``export_info`` is the
+last key, XML ``metadata`` the last element).
+"""
+
+import csv
+import io
+import json
+import os
+import zipfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+from xml.sax.saxutils import escape as xml_escape
+
+from src.utils.logger import logger
+
+# (written, total) - total is None when the input has no len()
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+DEFAULT_CHUNK_SIZE = 500
+EXPORT_VERSION = "2.0"
+
+TRANSLATION_COLUMNS = (
+    "timestamp",
+    "original_text",
+    "translated_text",
+    "source_language",
+    "target_language",
+    "confidence",
+)
+TRANSLATION_LABELS = (
+    "Timestamp",
+    "Original Text",
+    "Translated Text",
+    "Source Language",
+    "Target Language",
+    "Confidence",
+)
+
+
+class ExportCancelledError(Exception):
+    """Export was cancelled; the partial output has been removed."""
+
+
+def translation_record(translation: Any) -> Dict[str, Any]:
+    """
+    Convert a translation to a flat export record.
+
+    Accepts ``src.models.translation.Translation``, the domain entity
+    (``original``/``translated``/``language_pair``) and plain dicts.
+    """
+    if isinstance(translation, dict):
+        record = dict(translation)
+        record.setdefault("original_text", record.get("original"))
+        record.setdefault("translated_text", record.get("translated"))
+        return record
+
+    timestamp = getattr(translation, "timestamp", None)
+    if hasattr(translation, "original_text"):
+        original = translation.original_text
+        translated = translation.translated_text
+        source = translation.source_language
+        target = translation.target_language
+    else:
+        original = translation.original.content
+        translated = translation.translated.content
+        source = translation.language_pair.source.code
+        target = translation.language_pair.target.code
+
+    return {
+        "timestamp": timestamp.isoformat() if timestamp else None,
+        "original_text": original,
+        "translated_text": translated,
+        "source_language": source,
+        "target_language": target,
+        "confidence": getattr(translation, "confidence", None),
+    }
+
+
+def escape_html(text: Any) -> str:
+    """Escape HTML special characters."""
+    if not text:
+        return ""
+    return (
+        str(text)
+        .replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace(">", "&gt;")
+        .replace('"', "&quot;")
+        .replace("'", "&#x27;")
+    )
+
+
+class StreamingWriter(ABC):
+    """
+    Base class for chunked export writers.
+
+    Subclasses render a header, one string per record and a footer; the base
+    class handles chunking, progress, cancellation and the atomic rename.
+    """
+
+    format_name = ""
+    newline: Optional[str] = None
+
+    def __init__(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress_callback: Optional[ProgressCallback] = None,
+        cancel_event: Optional[Any] = None,
+        record_factory: Callable[[Any], Dict[str, Any]] = translation_record,
+    ):
+        """
+        Args:
+            chunk_size: Records rendered per write/progress/cancel step
+            progress_callback: Called as (written, total) after every chunk
+            cancel_event: Object with is_set() (e.g. threading.Event)
+            record_factory: Converts input items to flat dicts
+        """
+        self.chunk_size = max(1, chunk_size)
+        self.progress_callback = progress_callback
+        self.cancel_event = cancel_event
+        self.record_factory = record_factory
+
+    def write(
+        self,
+        items: Iterable[Any],
+        file_path: str,
+        total: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """
+        Stream items to file_path.
+
+        Args:
+            items: Records to export (consumed once)
+            file_path: Target file
+            total: Expected number of records for progress (default: len(items))
+            extra: Format-specific additional data (e.g. JSON top-level keys)
+
+        Returns:
+            Number of records written
+
+        Raises:
+            ExportCancelledError: If cancel_event was set during the export
+        """
+        if total is None and hasattr(items, "__len__"):
+            total = len(items)
+
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+        count = 0
+        try:
+            with self._open(tmp_path) as stream:
+                stream.write(self._header(extra))
+                chunk: List[str] = []
+                for item in items:
+                    chunk.append(self._record(self.record_factory(item), count))
+                    count += 1
+                    if len(chunk) >= self.chunk_size:
+                        self._flush(stream, chunk, count, total)
+                        chunk = []
+                self._flush(stream, chunk, count, total)
+                stream.write(self._footer(count, extra))
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        logger.debug(f"Streamed {count} records to {path} ({self.format_name})")
+        return count
+
+    def _flush(self, stream: TextIO, chunk: List[str], count: int, total: Optional[int]) -> None:
+        if chunk:
+            stream.write("".join(chunk))
+        if self.progress_callback:
+            self.progress_callback(count, total)
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ExportCancelledError(f"Export cancelled after {count} records")
+
+    @contextmanager
+    def _open(self, path: Path) -> Iterator[TextIO]:
+        with open(path, "w", encoding="utf-8", newline=self.newline) as stream:
+            yield stream
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        return ""
+
+    @abstractmethod
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        """Render one record."""
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        return ""
+
+    @staticmethod
+    def _export_info(format_name: str, count: int) -> Dict[str, Any]:
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "count": count,
+            "format": format_name,
+            "version": EXPORT_VERSION,
+        }
+
+
+class JsonStreamWriter(StreamingWriter):
+    """
+    JSON document: {"translations": [...], <extra keys>, "export_info": {...}}.
+
+    With array_key=None a bare JSON array of records is written instead.
+    """
+
+    format_name = "json"
+
+    def __init__(self, *args, array_key: Optional[str] = "translations", **kwargs):
+        super().__init__(*args, **kwargs)
+        self.array_key = array_key
+        self._indent = "\n    " if array_key else "\n  "
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        if self.array_key is None:
+            return "["
+        return "{\n  " + json.dumps(self.array_key) + ": ["
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        separator = self._indent if index == 0 else "," + self._indent
+        return separator + json.dumps(record, ensure_ascii=False, default=str)
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        if self.array_key is None:
+            return "\n]\n" if count else "]\n"
+        parts = ["\n  ]" if count else "]"]
+        tail = dict(extra or {})
+        info = self._export_info(self.format_name, count)
+        info.update(tail.pop("export_info", {}))
+        tail["export_info"] = info
+        for key, value in tail.items():
+            body = json.dumps(value, ensure_ascii=False, indent=2, default=str)
+            parts.append(f",\n  {json.dumps(key)}: " + body.replace("\n", "\n  "))
+        parts.append("\n}\n")
+        return "".join(parts)
+
+
+class NdjsonStreamWriter(StreamingWriter):
+    """Newline-delimited JSON, one record per line."""
+
+    format_name = "ndjson"
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        return json.dumps(record, ensure_ascii=False, default=str) + "\n"
+
+
+class CsvStreamWriter(StreamingWriter):
+    """CSV with a header row."""
+
+    format_name = "csv"
+    newline = ""
+
+    def __init__(
+        self,
+        *args,
+        columns: Sequence[str] = TRANSLATION_COLUMNS,
+        labels: Optional[Sequence[str]] = TRANSLATION_LABELS,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.columns = tuple(columns)
+        self.labels = tuple(labels) if labels else self.columns
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+
+    def _row(self, values: Sequence[Any]) -> str:
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._writer.writerow(values)
+        return self._buffer.getvalue()
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        return self._row(self.labels)
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        return self._row(["" if record.get(c) is None else record.get(c) for c in self.columns])
+
+
+class XmlStreamWriter(StreamingWriter):
+    """
+    XML export: <translation> elements inside <translations>.
+
+    Unlike the old in-memory XML export, <metadata> follows <translations>
+    because the record count is only known at the end.
+    """
+
+    format_name = "xml"
+
+    def __init__(self, *args, columns: Sequence[str] = TRANSLATION_COLUMNS, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.columns = tuple(columns)
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        return (
+            "<?xml version='1.0' encoding='utf-8'?>\n"
+            "<screen_translator_export>\n  <translations>\n"
+        )
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        fields = "".join(
+            f"      <{c}>{xml_escape(str(record[c]))}</{c}>\n"
+            for c in self.columns
+            if record.get(c) is not None
+        )
+        return f"    <translation>\n{fields}    </translation>\n"
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        info = self._export_info(self.format_name, count)
+        metadata = "".join(f"    <{k}>{xml_escape(str(v))}</{k}>\n" for k, v in info.items())
+        return (
+            f"  </translations>\n  <metadata>\n{metadata}  </metadata>\n"
+            "</screen_translator_export>\n"
+        )
+
+
+class HtmlStreamWriter(StreamingWriter):
+    """Standalone HTML page with one block per translation."""
+
+    format_name = "html"
+
+    STYLE = """        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f5f5f5; padding: 20px; border-radius: 5px; }
+        .translation { border: 1px solid #ddd; margin: 15px 0; padding: 15px; }
+        .original { background-color: #e3f2fd; padding: 10px; margin-bottom: 10px; }
+        .translated { background-color: #e8f5e8; padding: 10px; }
+        .metadata { font-size: 0.9em; color: #666; margin-bottom: 10px; }
+        .confidence { color: #ff9800; font-weight: bold; }
+"""
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        title = escape_html((extra or {}).get("title", "Screen Translator Export"))
+        return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{title}</title>
+    <style>
+{self.STYLE}    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>{title}</h1>
+        <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+    </div>
+"""
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        confidence = record.get("confidence")
+        confidence_html = (
+            f" | Confidence: <span class='confidence'>{confidence:.1f}%</span>"
+            if confidence is not None
+            else ""
+        )
+        timestamp = record.get("timestamp")
+        time_html = timestamp[11:19] if timestamp else "Unknown"
+        return f"""
+    <div class="translation">
+        <div class="metadata">
+            #{index + 1} | {time_html} | {escape_html(record.get('source_language'))} → \
+{escape_html(record.get('target_language'))}{confidence_html}
+        </div>
+        <div class="original">
+            <strong>Original:</strong><br>
+            {escape_html(record.get('original_text'))}
+        </div>
+        <div class="translated">
+            <strong>Translation:</strong><br>
+            {escape_html(record.get('translated_text'))}
+        </div>
+    </div>
+"""
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        return f"""
+    <p>Total translations: {count}</p>
+</body>
+</html>
+"""
+
+
+class TxtStreamWriter(StreamingWriter):
+    """Human-readable plain text export."""
+
+    format_name = "txt"
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        generated = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        return f"Screen Translator Export - {generated}\n" + "=" * 60 + "\n\n"
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        timestamp = record.get("timestamp")
+        lines = [
+            f"Translation #{index + 1}\n",
+            f"Time: {timestamp[11:19] if timestamp else 'Unknown'}\n",
+            f"Language: {record.get('source_language')} → {record.get('target_language')}\n",
+        ]
+        if record.get("confidence") is not None:
+            lines.append(f"Confidence: {record['confidence']:.1f}%\n")
+        lines.append(f"\nOriginal:\n{record.get('original_text')}\n")
+        lines.append(f"\nTranslation:\n{record.get('translated_text')}\n")
+        lines.append("-" * 40 + "\n\n")
+        return "".join(lines)
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        return f"Total translations: {count}\n"
+
+
+class XlsxStreamWriter(StreamingWriter):
+    """
+    Minimal single-sheet XLSX writer (inline strings) without pandas/openpyxl.
+
+    The sheet XML is streamed into the zip entry chunk by chunk.
+    """
+
+    format_name = "xlsx"
+
+    _CONTENT_TYPES = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        "</Types>"
+    )
+    _ROOT_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+        '2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        "</Relationships>"
+    )
+    _WORKBOOK = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )
+    _WORKBOOK_RELS = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+        '2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        "</Relationships>"
+    )
+
+    def __init__(
+        self,
+        *args,
+        columns: Sequence[str] = TRANSLATION_COLUMNS,
+        labels: Optional[Sequence[str]] = TRANSLATION_LABELS,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.columns = tuple(columns)
+        self.labels = tuple(labels) if labels else self.columns
+
+    @contextmanager
+    def _open(self, path: Path) -> Iterator[TextIO]:
+        with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr("[Content_Types].xml", self._CONTENT_TYPES)
+            archive.writestr("_rels/.rels", self._ROOT_RELS)
+            archive.writestr("xl/workbook.xml", self._WORKBOOK)
+            archive.writestr("xl/_rels/workbook.xml.rels", self._WORKBOOK_RELS)
+            with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as raw:
+                with io.TextIOWrapper(raw, encoding="utf-8") as stream:
+                    yield stream
+
+    @staticmethod
+    def _row(values: Sequence[Any], row_number: int) -> str:
+        cells = []
+        for value in values:
+            if value is None or value == "":
+                cells.append("<c/>")
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                cells.append(f"<c><v>{value}</v></c>")
+            else:
+                text = xml_escape(str(value))
+                cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        return f'<row r="{row_number}">{"".join(cells)}</row>'
+
+    def _header(self, extra: Optional[Dict[str, Any]]) -> str:
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            "<sheetData>" + self._row(self.labels, 1)
+        )
+
+    def _record(self, record: Dict[str, Any], index: int) -> str:
+        return self._row([record.get(c) for c in self.columns], index + 2)
+
+    def _footer(self, count: int, extra: Optional[Dict[str, Any]]) -> str:
+        return "</sheetData></worksheet>"
+
+
+STREAM_WRITERS: Dict[str, type] = {
+    "json": JsonStreamWriter,
+    "ndjson": NdjsonStreamWriter,
+    "csv": CsvStreamWriter,
+    "xml": XmlStreamWriter,
+    "html": HtmlStreamWriter,
+    "txt": TxtStreamWriter,
+    "xlsx": XlsxStreamWriter,
+}
+
+
+def get_stream_writer(format_type: str, **options) -> StreamingWriter:
+    """
+    Create a streaming writer for a format.
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    try:
+        writer_class = STREAM_WRITERS[format_type]
+    except KeyError:
+        raise ValueError(f"Unsupported export format: {format_type}") from None
+    return writer_class(**options)
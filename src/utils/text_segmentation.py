@@ -0,0 +1,195 @@
+"""
+Text segmentation for translating long texts in chunks.
+
+Text is split at paragraph boundaries (blank lines) first. Paragraphs longer
+than the backend limit are packed from sentences, and over-long sentences
+from clauses, words and finally fixed-size pieces. Sentence detection knows
+the CJK terminators (。！？), which are not followed by spaces.
+
+Chunks never span paragraphs, so editing one paragraph leaves the chunks of
+the other paragraphs unchanged. Separators are kept, so joining the
+segments reproduces the input exactly.
+
+Short chunks can be packed into one backend request (joined by blank lines)
+and split again at the blank lines of the translation.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+# Google Translate rejects requests above 5000 characters
+DEFAULT_MAX_CHARS = 4500
+
+# Joins chunks packed into one request; chunks never contain blank lines
+REQUEST_SEPARATOR = "\n\n"
+
+_PARAGRAPH_RE = re.compile(r"([ \t　]*\n(?:[ \t　]*\n)+\s*)")
+_SENTENCE_RE = re.compile(
+    r"[.!?…]+[\"'”’»)\]]*(\s+)(?![\sa-z])"
+    r"|[。！？]+[」』”’）)]*(\s*)"
+)
+_CLAUSE_RE = re.compile(r"[,;:、，；：]+(\s*)")
+_WORD_RE = re.compile(r"(\s+)")
+_CJK_RE = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯＀-￯]")
+
+# (text, separator that follows it)
+Piece = Tuple[str, str]
+
+
+@dataclass(frozen=True)
+class Segment:
+    """Chunk of text and the whitespace that follows it in the original."""
+
+    text: str
+    separator: str = ""
+
+
+def contains_cjk(text: str) -> bool:
+    """Check if text contains Chinese, Japanese or Korean characters."""
+    return _CJK_RE.search(text) is not None
+
+
+def _split(text: str, pattern: "re.Pattern[str]") -> List[Piece]:
+    """Split after each match; the captured whitespace becomes the separator."""
+    pieces = []
+    start = 0
+    for match in pattern.finditer(text):
+        whitespace = next((group for group in match.groups() if group is not None), "")
+        end = match.end() - len(whitespace)
+        if end > start and match.end() < len(text):
+            pieces.append((text[start:end], whitespace))
+            start = match.end()
+    pieces.append((text[start:], ""))
+    return pieces
+
+
+def split_paragraphs(text: str) -> List[Piece]:
+    """Split text at blank lines."""
+    return _split(text, _PARAGRAPH_RE)
+
+
+def split_sentences(text: str) -> List[Piece]:
+    """Split text into sentences (Latin and CJK terminators)."""
+    return _split(text, _SENTENCE_RE)
+
+
+def _split_clauses(text: str) -> List[Piece]:
+    return _split(text, _CLAUSE_RE)
+
+
+def _split_words(text: str) -> List[Piece]:
+    return _split(text, _WORD_RE)
+
+
+def _split_fixed(text: str, max_chars: int) -> List[Piece]:
+    return [(text[i : i + max_chars], "") for i in range(0, len(text), max_chars)]
+
+
+# Finer splitters, tried in order for pieces that are still too long
+_SPLITTERS: Sequence[Callable[[str], List[Piece]]] = (_split_clauses, _split_words)
+
+
+def _pack(pieces: List[Piece], max_chars: int, level: int = 0) -> List[Piece]:
+    """Greedily join pieces into chunks of at most max_chars."""
+    chunks: List[Piece] = []
+    text, separator = "", ""
+
+    for piece, piece_separator in pieces:
+        if len(piece) > max_chars:
+            if text:
+                chunks.append((text, separator))
+                text, separator = "", ""
+            if level < len(_SPLITTERS):
+                parts = _SPLITTERS[level](piece)
+            else:
+                parts = _split_fixed(piece, max_chars)
+            last_text, last_separator = parts[-1]
+            parts[-1] = (last_text, last_separator + piece_separator)
+            chunks.extend(_pack(parts, max_chars, level + 1))
+            continue
+
+        if text and len(text) + len(separator) + len(piece) > max_chars:
+            chunks.append((text, separator))
+            text, separator = "", ""
+        text = text + separator + piece if text else piece
+        separator = piece_separator
+
+    if text:
+        chunks.append((text, separator))
+    return chunks
+
+
+def segment_text(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> List[Segment]:
+    """
+    Split text into chunks of at most max_chars characters.
+
+    Args:
+        text: Text to split
+        max_chars: Backend request size limit
+
+    Returns:
+        Segments such that ``join_segments([s.text for s in segments], segments)``
+        equals ``text``; chunk texts carry no surrounding whitespace, and a
+        leading whitespace-only segment has empty text
+    """
+    if max_chars < 1:
+        raise ValueError("max_chars must be positive")
+
+    content = text.strip()
+    leading = text[: len(text) - len(text.lstrip())]
+    trailing = text[len(leading) + len(content) :]
+
+    segments: List[Segment] = [Segment("", leading)] if leading else []
+    if content:
+        for paragraph, paragraph_separator in split_paragraphs(content):
+            if len(paragraph) <= max_chars:
+                chunks = [(paragraph, "")]
+            else:
+                chunks = _pack(split_sentences(paragraph), max_chars)
+            last_text, last_separator = chunks[-1]
+            chunks[-1] = (last_text, last_separator + paragraph_separator)
+            segments.extend(Segment(chunk, separator) for chunk, separator in chunks)
+
+    if trailing:
+        last = segments.pop() if segments else Segment("")
+        segments.append(Segment(last.text, last.separator + trailing))
+    return segments
+
+
+def join_segments(translations: Sequence[str], segments: Sequence[Segment]) -> str:
+    """Reassemble translated chunks with the original separators."""
+    return "".join(
+        translated + segment.separator for translated, segment in zip(translations, segments)
+    )
+
+
+def pack_chunks(chunks: Sequence[str], max_chars: int = DEFAULT_MAX_CHARS) -> List[List[str]]:
+    """
+    Group consecutive chunks into requests of at most max_chars characters.
+
+    A request's text is its chunks joined by REQUEST_SEPARATOR; a chunk
+    longer than max_chars gets a request of its own.
+    """
+    groups: List[List[str]] = []
+    size = 0
+    for chunk in chunks:
+        if groups and size + len(REQUEST_SEPARATOR) + len(chunk) <= max_chars:
+            groups[-1].append(chunk)
+            size += len(REQUEST_SEPARATOR) + len(chunk)
+        else:
+            groups.append([chunk])
+            size = len(chunk)
+    return groups
+
+
+def unpack_chunks(translated: str, count: int) -> Optional[List[str]]:
+    """
+    Split the translation of a packed request back into its chunks.
+
+    Returns:
+        count translated chunks, or None if the translation does not have
+        exactly one paragraph per chunk
+    """
+    parts = [text for text, _ in split_paragraphs(translated.strip())]
+    return parts if len(parts) == count else None
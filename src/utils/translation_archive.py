@@ -0,0 +1,449 @@
+"""
+Compact columnar archive for translation records.
+
+File layout (little-endian)::
+
+    header   b"STRA" | u8 version | u32 meta_len | meta (JSON: schema, metadata)
+    blocks   u8 codec | u32 raw_len | u32 stored_len | payload (codec-compressed)
+    index    per block: u64 offset | u32 stored_len | u32 record_count
+    trailer  u32 block_count | u64 index_offset | b"STRE"
+
+A block payload stores ``record_count`` and a u32 offset per column followed
+by the columns. Every column starts with a null flag (and a null bitmap if
+set). Strings are length-prefixed tables, low-cardinality strings (language
+codes) are deduplicated into a per-block table plus indices, and timestamps
+are delta-encoded microseconds. Blocks are compressed independently, so the
+reader can seek to any block via the index and decode only the requested
+columns without touching the rest of the file.
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_right
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import lzma
+except ImportError:  # Python built without liblzma
+    lzma = None
+
+MAGIC = b"STRA"
+TRAILER_MAGIC = b"STRE"
+FORMAT_VERSION = 1
+ARCHIVE_EXTENSION = ".stra"
+DEFAULT_BLOCK_SIZE = 1024
+
+_BLOCK_HEADER = struct.Struct("<BII")
+_INDEX_ENTRY = struct.Struct("<QII")
+_TRAILER = struct.Struct("<IQ4s")
+_EPOCH = datetime(1970, 1, 1)
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+class ColumnType(Enum):
+    """Column encodings."""
+
+    STRING = "str"  # Length-prefixed string table
+    DICT = "dict"  # Deduplicated strings + indices
+    TIMESTAMP = "timestamp"  # Delta-encoded microseconds
+    FLOAT = "float"
+    INT = "int"
+    BOOL = "bool"
+
+
+Schema = Sequence[Tuple[str, ColumnType]]
+
+# Flat records produced by streaming_export.translation_record
+TRANSLATION_SCHEMA: Schema = (
+    ("timestamp", ColumnType.TIMESTAMP),
+    ("original_text", ColumnType.STRING),
+    ("translated_text", ColumnType.STRING),
+    ("source_language", ColumnType.DICT),
+    ("target_language", ColumnType.DICT),
+    ("confidence", ColumnType.FLOAT),
+)
+
+
+class Codec(Enum):
+    """Block compression."""
+
+    NONE = 0
+    ZLIB = 1
+    LZMA = 2
+
+
+class ArchiveError(Exception):
+    """Archive file is malformed or uses an unsupported feature."""
+
+
+def is_archive(file_path: str) -> bool:
+    """Check whether a file starts with the archive magic."""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def _pack(typecode: str, values: Iterable[Any]) -> bytes:
+    data = array(typecode, values)
+    if _BIG_ENDIAN:
+        data.byteswap()
+    return data.tobytes()
+
+
+def _unpack(typecode: str, payload: bytes, pos: int, count: int) -> Tuple[array, int]:
+    data = array(typecode)
+    end = pos + count * data.itemsize
+    data.frombytes(payload[pos:end])
+    if _BIG_ENDIAN:
+        data.byteswap()
+    return data, end
+
+
+def _to_micros(value: Any) -> int:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        # Stored naive; aware values are normalised to UTC
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _compress(codec: Codec, raw: bytes, level: int) -> bytes:
+    if codec is Codec.ZLIB:
+        return zlib.compress(raw, level)
+    if codec is Codec.LZMA:
+        if lzma is None:
+            raise ArchiveError("lzma codec is not available")
+        return lzma.compress(raw)
+    return raw
+
+
+def _decompress(codec: Codec, stored: bytes) -> bytes:
+    if codec is Codec.ZLIB:
+        return zlib.decompress(stored)
+    if codec is Codec.LZMA:
+        if lzma is None:
+            raise ArchiveError("lzma codec is not available")
+        return lzma.decompress(stored)
+    return stored
+
+
+def _encode_strings(values: Sequence[Optional[str]]) -> bytes:
+    encoded = [b"" if v is None else str(v).encode("utf-8") for v in values]
+    return _pack("I", map(len, encoded)) + b"".join(encoded)
+
+
+def _decode_strings(payload: bytes, pos: int, count: int) -> List[str]:
+    lengths, pos = _unpack("I", payload, pos, count)
+    strings = []
+    for length in lengths:
+        strings.append(payload[pos : pos + length].decode("utf-8"))
+        pos += length
+    return strings
+
+
+def _encode_column(column_type: ColumnType, values: List[Any]) -> bytes:
+    nulls = [v is None for v in values]
+    if any(nulls):
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i, is_null in enumerate(nulls):
+            if is_null:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        head = b"\x01" + bytes(bitmap)
+    else:
+        head = b"\x00"
+
+    if column_type is ColumnType.STRING:
+        body = _encode_strings(values)
+    elif column_type is ColumnType.DICT:
+        table: Dict[str, int] = {}
+        indices = [table.setdefault("" if v is None else str(v), len(table)) for v in values]
+        typecode = "H" if len(table) <= 0xFFFF else "I"
+        body = (
+            struct.pack("<I", len(table))
+            + _encode_strings(list(table))
+            + typecode.encode("ascii")
+            + _pack(typecode, indices)
+        )
+    elif column_type is ColumnType.TIMESTAMP:
+        deltas = []
+        previous = 0
+        for value in values:
+            micros = previous if value is None else _to_micros(value)
+            deltas.append(micros - previous)
+            previous = micros
+        body = _pack("q", deltas)
+    elif column_type is ColumnType.FLOAT:
+        body = _pack("d", (0.0 if v is None else float(v) for v in values))
+    elif column_type is ColumnType.INT:
+        body = _pack("q", (0 if v is None else int(v) for v in values))
+    else:
+        body = bytes(0 if v is None else int(bool(v)) for v in values)
+    return head + body
+
+
+def _decode_column(column_type: ColumnType, payload: bytes, pos: int, count: int) -> List[Any]:
+    nulls: Optional[bytes] = None
+    if payload[pos]:
+        nulls = payload[pos + 1 : pos + 1 + (count + 7) // 8]
+        pos += len(nulls)
+    pos += 1
+
+    if column_type is ColumnType.STRING:
+        values: List[Any] = _decode_strings(payload, pos, count)
+    elif column_type is ColumnType.DICT:
+        (table_size,) = struct.unpack_from("<I", payload, pos)
+        table = _decode_strings(payload, pos + 4, table_size)
+        pos += 4 + 4 * table_size + sum(len(s.encode("utf-8")) for s in table)
+        typecode = chr(payload[pos])
+        indices, _ = _unpack(typecode, payload, pos + 1, count)
+        values = [table[i] for i in indices]
+    elif column_type is ColumnType.TIMESTAMP:
+        deltas, _ = _unpack("q", payload, pos, count)
+        values = []
+        micros = 0
+        for delta in deltas:
+            micros += delta
+            values.append(_EPOCH + timedelta(microseconds=micros))
+    elif column_type is ColumnType.FLOAT:
+        values = list(_unpack("d", payload, pos, count)[0])
+    elif column_type is ColumnType.INT:
+        values = list(_unpack("q", payload, pos, count)[0])
+    else:
+        values = [bool(b) for b in payload[pos : pos + count]]
+
+    if nulls is not None:
+        for i in range(count):
+            if nulls[i >> 3] & (1 << (i & 7)):
+                values[i] = None
+    return values
+
+
+class ArchiveWriter:
+    """
+    Write records to an archive block by block.
+
+    Output goes to a temporary file that replaces file_path on close();
+    if the writer is used as a context manager and an exception escapes,
+    the partial file is removed.
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        schema: Schema = TRANSLATION_SCHEMA,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        codec: Codec = Codec.ZLIB,
+        level: int = 6,
+        metadata: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Args:
+            file_path: Target archive
+            schema: Column names and encodings; missing record keys are stored as null
+            block_size: Records per block (unit of compression and random access)
+            codec: Block compression
+            level: zlib compression level
+            metadata: JSON-serializable data stored in the header
+        """
+        self.path = Path(file_path)
+        self.schema = tuple((name, ColumnType(kind)) for name, kind in schema)
+        self.block_size = max(1, block_size)
+        self.codec = Codec(codec)
+        self.level = level
+        self.count = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        self._file = open(self._tmp_path, "wb")
+        self._index: List[Tuple[int, int, int]] = []
+        self._pending: List[Dict[str, Any]] = []
+
+        meta = json.dumps(
+            {
+                "schema": [[name, kind.value] for name, kind in self.schema],
+                "metadata": metadata or {},
+            },
+            ensure_ascii=False,
+            default=str,
+        ).encode("utf-8")
+        self._file.write(MAGIC + struct.pack("<BI", FORMAT_VERSION, len(meta)) + meta)
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Append one record."""
+        self._pending.append(record)
+        self.count += 1
+        if len(self._pending) >= self.block_size:
+            self.flush_block()
+
+    def write_many(self, records: Iterable[Dict[str, Any]]) -> int:
+        """Append records; returns the number written."""
+        before = self.count
+        for record in records:
+            self.write(record)
+        return self.count - before
+
+    def flush_block(self) -> None:
+        """Encode and write the pending records as one block."""
+        if not self._pending:
+            return
+
+        records, self._pending = self._pending, []
+        columns = [
+            _encode_column(kind, [r.get(name) for r in records]) for name, kind in self.schema
+        ]
+        offsets = []
+        position = 4 + 4 * len(columns)
+        for column in columns:
+            offsets.append(position)
+            position += len(column)
+        raw = struct.pack(f"<I{len(columns)}I", len(records), *offsets) + b"".join(columns)
+
+        stored = _compress(self.codec, raw, self.level)
+        offset = self._file.tell()
+        self._file.write(_BLOCK_HEADER.pack(self.codec.value, len(raw), len(stored)) + stored)
+        self._index.append((offset, _BLOCK_HEADER.size + len(stored), len(records)))
+
+    def close(self) -> None:
+        """Write the block index and move the archive into place."""
+        if self._file.closed:
+            return
+        self.flush_block()
+        index_offset = self._file.tell()
+        for entry in self._index:
+            self._file.write(_INDEX_ENTRY.pack(*entry))
+        self._file.write(_TRAILER.pack(len(self._index), index_offset, TRAILER_MAGIC))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def discard(self) -> None:
+        """Abort writing and remove the partial file."""
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ArchiveWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class ArchiveReader:
+    """Random-access reader; only the blocks (and columns) asked for are decoded."""
+
+    def __init__(self, file_path: str):
+        self.path = Path(file_path)
+        self._file = open(self.path, "rb")
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_header(self) -> None:
+        head = self._file.read(len(MAGIC) + 5)
+        if head[:4] != MAGIC:
+            raise ArchiveError(f"{self.path} is not a translation archive")
+        version, meta_len = struct.unpack("<BI", head[4:])
+        if version > FORMAT_VERSION:
+            raise ArchiveError(f"Unsupported archive version {version}")
+        meta = json.loads(self._file.read(meta_len).decode("utf-8"))
+        self.schema = tuple((name, ColumnType(kind)) for name, kind in meta["schema"])
+        self.metadata: Dict[str, Any] = meta.get("metadata", {})
+        self._columns = {name: i for i, (name, _) in enumerate(self.schema)}
+
+        self._file.seek(-_TRAILER.size, os.SEEK_END)
+        block_count, index_offset, magic = _TRAILER.unpack(self._file.read(_TRAILER.size))
+        if magic != TRAILER_MAGIC:
+            raise ArchiveError(f"{self.path} is truncated")
+        self._file.seek(index_offset)
+        raw_index = self._file.read(block_count * _INDEX_ENTRY.size)
+        self._index = [
+            _INDEX_ENTRY.unpack_from(raw_index, i * _INDEX_ENTRY.size) for i in range(block_count)
+        ]
+
+        # Cumulative record counts for record -> block lookup
+        self._starts = []
+        total = 0
+        for _, _, count in self._index:
+            self._starts.append(total)
+            total += count
+        self._total = total
+
+    @property
+    def block_count(self) -> int:
+        """Number of blocks."""
+        return len(self._index)
+
+    def __len__(self) -> int:
+        return self._total
+
+    def read_columns(
+        self, block: int, columns: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Decode selected columns of one block.
+
+        Args:
+            block: Block number
+            columns: Column names (default: all)
+
+        Returns:
+            Column name -> list of values
+        """
+        offset, stored_len, _ = self._index[block]
+        self._file.seek(offset)
+        data = self._file.read(stored_len)
+        codec, raw_len, _ = _BLOCK_HEADER.unpack_from(data)
+        payload = _decompress(Codec(codec), data[_BLOCK_HEADER.size :])
+        if len(payload) != raw_len:
+            raise ArchiveError(f"Block {block} of {self.path} is corrupted")
+
+        count = struct.unpack_from("<I", payload)[0]
+        offsets = struct.unpack_from(f"<{len(self.schema)}I", payload, 4)
+        names = columns if columns is not None else [name for name, _ in self.schema]
+        result = {}
+        for name in names:
+            i = self._columns[name]
+            result[name] = _decode_column(self.schema[i][1], payload, offsets[i], count)
+        return result
+
+    def read_block(self, block: int, columns: Optional[Sequence[str]] = None) -> List[Dict]:
+        """Decode one block into records."""
+        decoded = self.read_columns(block, columns)
+        names = list(decoded)
+        return [dict(zip(names, values)) for values in zip(*decoded.values())]
+
+    def iter_records(self, columns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over all records, holding one decoded block at a time."""
+        for block in range(self.block_count):
+            yield from self.read_block(block, columns)
+
+    def get(self, position: int) -> Dict[str, Any]:
+        """Get record by position, decoding only its block."""
+        if not 0 <= position < self._total:
+            raise IndexError(position)
+        block = bisect_right(self._starts, position) - 1
+        return self.read_block(block)[position - self._starts[block]]
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()